@@ -95,6 +95,9 @@ class Settings(BaseSettings):
     DEFAULT_USER_CONCURRENT_LIMIT: int = Field(default=3)
     GLOBAL_CONCURRENT_LIMIT: int = Field(default=50)
     DEFAULT_DAILY_QUOTA: int = Field(default=1000)
+    #Async graph mode: analyses await LLM calls on the event loop instead of holding a pool thread
+    ANALYSIS_ASYNC_GRAPH: bool = Field(default=False)
+    ANALYSIS_ASYNC_MAX_CONCURRENCY: int = Field(default=20)
 
     #Rate limit
     RATE_LIMIT_ENABLED: bool = Field(default=True)
@@ -105,6 +108,14 @@ class Settings(BaseSettings):
     LOG_FORMAT: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     LOG_FILE: str = Field(default="logs/tradingagents.log")
 
+    #Operation log buffered writer: documents are batched with insert_many off the response path
+    OPLOG_BATCH_SIZE: int = Field(default=200, ge=1)
+    OPLOG_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, gt=0)
+    OPLOG_BUFFER_MAX: int = Field(default=10000, ge=1)
+    #What to do when the buffer is full: drop_oldest / drop_newest / block (wait up to OPLOG_BLOCK_TIMEOUT_SECONDS)
+    OPLOG_OVERFLOW_POLICY: str = Field(default="drop_oldest")
+    OPLOG_BLOCK_TIMEOUT_SECONDS: float = Field(default=0.5, ge=0)
+
     #Proxy Configuration
     #To configure domain names (domestic data sources) that require bypassing agents
     #Comma-separated multiple domain names
@@ -280,6 +291,10 @@ class Settings(BaseSettings):
     NEWS_SYNC_HOURS_BACK: int = Field(default=24)
     NEWS_SYNC_MAX_PER_SOURCE: int = Field(default=50)
 
+    #Local trading calendar (CN/HK/US), refreshed from Tushare/AKShare and persisted under TRADINGAGENTS_DATA_DIR
+    TRADING_CALENDAR_REFRESH_ENABLED: bool = Field(default=True)
+    TRADING_CALENDAR_REFRESH_CRON: str = Field(default="30 5 * * *")  #Every day at 05:30
+
     @property
     def is_production(self) -> bool:
         """Production environment"""
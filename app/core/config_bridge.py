@@ -420,6 +420,7 @@ def _bridge_system_settings() -> int:
             'ta_hk_max_retries': 'TA_HK_MAX_RETRIES',
             'ta_hk_rate_limit_wait_seconds': 'TA_HK_RATE_LIMIT_WAIT_SECONDS',
             'ta_hk_cache_ttl_seconds': 'TA_HK_CACHE_TTL_SECONDS',
+            'ta_hk_cache_max_entries': 'TA_HK_CACHE_MAX_ENTRIES',
             'ta_use_app_cache': 'TA_USE_APP_CACHE',
         }
 
@@ -579,6 +580,7 @@ def clear_bridged_config():
         'TA_HK_MAX_RETRIES',
         'TA_HK_RATE_LIMIT_WAIT_SECONDS',
         'TA_HK_CACHE_TTL_SECONDS',
+        'TA_HK_CACHE_MAX_ENTRIES',
         'TA_USE_APP_CACHE',
     ]
     keys_to_clear.extend(ta_runtime_keys)
@@ -382,6 +382,20 @@ async def create_database_indexes_async(db):
         await market_quotes.create_index([("amount", -1)])
         await market_quotes.create_index([("updated_at", -1)])
 
+        #Index to analysis reports (keyset pagination and prefix search of the report list)
+        analysis_reports = db["analysis_reports"]
+        await analysis_reports.create_index([("created_at", -1), ("_id", -1)])
+        await analysis_reports.create_index([("stock_symbol", 1), ("created_at", -1)])
+        await analysis_reports.create_index([("market_type", 1), ("created_at", -1)])
+        await analysis_reports.create_index([("stock_name", 1)])
+        await analysis_reports.create_index([("analysis_id", 1)])
+
+        #Index to token usage and its daily rollups (usage statistics dashboard)
+        await db["token_usage"].create_index([("timestamp", -1)])
+        await db["token_usage_daily"].create_index(
+            [("date", 1), ("provider", 1), ("model_name", 1), ("currency", 1)], unique=True
+        )
+
         logger.info("✅ Database index created")
 
     except Exception as e:
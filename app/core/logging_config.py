@@ -4,7 +4,7 @@ import sys
 from pathlib import Path
 import os
 import platform
-import inspect
+from typing import Any, Dict, Optional
 
 from app.core.logging_context import LoggingContextFilter, trace_id_var
 
@@ -28,22 +28,47 @@ except Exception:
     except Exception:
         toml_loader = None
 
-_CLASSNAME_FACTORY_INSTALLED = False
-_ORIGINAL_RECORD_FACTORY = logging.getLogRecordFactory()
+_CLASSNAME_FACTORY_MARKER = "_tradingagents_classname_factory"
+
+#Per code object: None for frames that never carry a class (logging internals,
+#plain functions), otherwise the name of the first argument ('self' / 'cls')
+_FRAME_KIND_CACHE: Dict[Any, Optional[str]] = {}
+_FRAME_KIND_CACHE_LIMIT = 20000
+
+
+def _classify_code(frame) -> Optional[str]:
+    code = frame.f_code
+    try:
+        return _FRAME_KIND_CACHE[code]
+    except KeyError:
+        pass
+    kind = None
+    if not frame.f_globals.get("__name__", "").startswith("logging"):
+        if code.co_argcount > 0 and code.co_varnames[0] in ("self", "cls"):
+            kind = code.co_varnames[0]
+    if len(_FRAME_KIND_CACHE) >= _FRAME_KIND_CACHE_LIMIT:
+        _FRAME_KIND_CACHE.clear()
+    _FRAME_KIND_CACHE[code] = kind
+    return kind
 
 
 def _find_classname_from_stack() -> str:
-    frame = inspect.currentframe()
+    """Return the class of the nearest method frame on the stack.
+
+    Frames are classified once per code object, so the common case (plain
+    functions and logging internals) is a dict lookup instead of materialising
+    ``f_locals`` for every frame.
+    """
+    frame = sys._getframe(1)
     try:
         while frame:
-            module_name = frame.f_globals.get("__name__", "")
-            if module_name.startswith("logging"):
-                frame = frame.f_back
-                continue
-            if "self" in frame.f_locals:
-                return frame.f_locals["self"].__class__.__name__
-            if "cls" in frame.f_locals and isinstance(frame.f_locals["cls"], type):
-                return frame.f_locals["cls"].__name__
+            kind = _classify_code(frame)
+            if kind is not None:
+                owner = frame.f_locals.get(kind)
+                if kind == "cls" and isinstance(owner, type):
+                    return owner.__name__
+                if kind == "self" and owner is not None:
+                    return owner.__class__.__name__
             frame = frame.f_back
     finally:
         del frame
@@ -51,18 +76,24 @@ def _find_classname_from_stack() -> str:
 
 
 def _install_classname_record_factory() -> None:
-    global _CLASSNAME_FACTORY_INSTALLED
-    if _CLASSNAME_FACTORY_INSTALLED:
+    """Install the ``classname`` record factory once per process.
+
+    Uses the same marker as ``tradingagents.utils.logging_manager`` so only one
+    classname factory is ever installed, and reloading this module never wraps
+    the installed factory again.
+    """
+    current = logging.getLogRecordFactory()
+    if getattr(current, _CLASSNAME_FACTORY_MARKER, False):
         return
 
     def record_factory(*args, **kwargs):
-        record = _ORIGINAL_RECORD_FACTORY(*args, **kwargs)
+        record = current(*args, **kwargs)
         if not hasattr(record, "classname"):
             record.classname = _find_classname_from_stack()
         return record
 
+    setattr(record_factory, _CLASSNAME_FACTORY_MARKER, True)
     logging.setLogRecordFactory(record_factory)
-    _CLASSNAME_FACTORY_INSTALLED = True
 
 
 def resolve_logging_cfg_path() -> Path:
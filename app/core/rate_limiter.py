@@ -2,6 +2,8 @@
 To control the API call frequency to avoid going beyond the limit of the data source
 """
 import asyncio
+import bisect
+import threading
 import time
 import logging
 from collections import deque
@@ -13,7 +15,9 @@ logger = logging.getLogger(__name__)
 class RateLimiter:
     """Slide window speed limiter
 
-    Use slide window algorithm to accurately control API call frequency
+    Use slide window algorithm to accurately control API call frequency.
+    Slots are reserved under a threading lock and the wait happens outside it, so one
+    limiter can be shared by threads that each run their own event loop.
     """
     
     def __init__(self, max_calls: int, time_window: float, name: str = "RateLimiter"):
@@ -27,8 +31,8 @@ class RateLimiter:
         self.max_calls = max_calls
         self.time_window = time_window
         self.name = name
-        self.calls = deque()  #Storage Call Timestamp
-        self.lock = asyncio.Lock()  #Make sure it's clear.
+        self.calls = deque()  #Storage Call Timestamp (reserved slots may lie in the future)
+        self.lock = threading.Lock()  #Not an asyncio.Lock: those are bound to one event loop
         
         #Statistical information
         self.total_calls = 0
@@ -41,36 +45,33 @@ class RateLimiter:
         """Access to call permission
         If you exceed the speed limit, you wait until you can call.
         """
-        async with self.lock:
+        wait_time = self._reserve_slot()
+        if wait_time > 0:
+            logger.debug(f"⏳ {self.name}Speed limit, wait{wait_time:.2f}sec")
+            await asyncio.sleep(wait_time)
+
+    def _reserve_slot(self) -> float:
+        """Record the next allowed call time and return how long to wait for it"""
+        with self.lock:
             now = time.time()
-            
+
             #Remove old call records outside the time window
             while self.calls and self.calls[0] <= now - self.time_window:
                 self.calls.popleft()
-            
-            #Wait if the maximum number of calls within the current window is reached
+
+            #When the window is full, the call is allowed once the max_calls-th latest call leaves it
+            slot = now
             if len(self.calls) >= self.max_calls:
-                #Calculate the time required to wait
-                oldest_call = self.calls[0]
-                wait_time = oldest_call + self.time_window - now + 0.01  #A little buffer.
-                
-                if wait_time > 0:
-                    self.total_waits += 1
-                    self.total_wait_time += wait_time
-                    
-                    logger.debug(f"⏳ {self.name}Speed limit, wait{wait_time:.2f}sec")
-                    await asyncio.sleep(wait_time)
-                    
-                    #Retrieving current time
-                    now = time.time()
-                    
-                    #Clean up old records again.
-                    while self.calls and self.calls[0] <= now - self.time_window:
-                        self.calls.popleft()
-            
-            #Record this call
-            self.calls.append(now)
+                slot = max(now, self.calls[-self.max_calls] + self.time_window + 0.01)  #A little buffer.
+
+            #Record this call (kept sorted: earlier callers may hold slots later than now)
+            bisect.insort(self.calls, slot)
             self.total_calls += 1
+            wait_time = slot - now
+            if wait_time > 0:
+                self.total_waits += 1
+                self.total_wait_time += wait_time
+            return wait_time
     
     def get_stats(self) -> dict:
         """Access to statistical information"""
@@ -179,6 +180,7 @@ class BaoStockRateLimiter(RateLimiter):
 
 
 #Examples of global speed limitrs
+_limiter_lock = threading.Lock()
 _tushare_limiter: Optional[TushareRateLimiter] = None
 _akshare_limiter: Optional[AKShareRateLimiter] = None
 _baostock_limiter: Optional[BaoStockRateLimiter] = None
@@ -188,7 +190,9 @@ def get_tushare_rate_limiter(tier: str = "standard", safety_margin: float = 0.8)
     """Get a Tushare speed limiter (single case)"""
     global _tushare_limiter
     if _tushare_limiter is None:
-        _tushare_limiter = TushareRateLimiter(tier=tier, safety_margin=safety_margin)
+        with _limiter_lock:
+            if _tushare_limiter is None:
+                _tushare_limiter = TushareRateLimiter(tier=tier, safety_margin=safety_margin)
     return _tushare_limiter
 
 
@@ -196,7 +200,9 @@ def get_akshare_rate_limiter() -> AKShareRateLimiter:
     """Get AKShare Speed Limiter (single)"""
     global _akshare_limiter
     if _akshare_limiter is None:
-        _akshare_limiter = AKShareRateLimiter()
+        with _limiter_lock:
+            if _akshare_limiter is None:
+                _akshare_limiter = AKShareRateLimiter()
     return _akshare_limiter
 
 
@@ -204,7 +210,9 @@ def get_baostock_rate_limiter() -> BaoStockRateLimiter:
     """Get the BaoStock Speed Limiter (single case)"""
     global _baostock_limiter
     if _baostock_limiter is None:
-        _baostock_limiter = BaoStockRateLimiter()
+        with _limiter_lock:
+            if _baostock_limiter is None:
+                _baostock_limiter = BaoStockRateLimiter()
     return _baostock_limiter
 
 
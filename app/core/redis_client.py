@@ -3,7 +3,7 @@
 
 import redis.asyncio as redis
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 from .config import SETTINGS
 
 logger = logging.getLogger(__name__)
@@ -100,11 +100,26 @@ class RedisKeys:
     ANALYSIS_CACHE = "analysis:{cache_key}"
 
 
+#INCR each key; set its TTL only when the window starts (or if it was lost), so windows are fixed, not sliding
+_INCREMENT_COUNTERS_LUA = """
+local results = {}
+for i, key in ipairs(KEYS) do
+    local count = redis.call('INCR', key)
+    if count == 1 or redis.call('TTL', key) < 0 then
+        redis.call('EXPIRE', key, ARGV[i])
+    end
+    results[i] = count
+end
+return results
+"""
+
+
 class RedisService:
     """Redis service seal Category"""
     
     def __init__(self):
         self.redis = get_redis()
+        self._increment_script = None
     
     async def set_with_ttl(self, key: str, value: str, ttl: int = 3600):
         """Set key value with TTL"""
@@ -135,6 +150,15 @@ class RedisService:
         results = await pipe.execute()
         return results[0]
     
+    async def increment_counters_with_ttl(self, counters: List[Tuple[str, int]]) -> List[int]:
+        """Increment several counters in one round trip (Lua); the TTL is set when a counter is created"""
+        if self._increment_script is None:
+            self._increment_script = self.redis.register_script(_INCREMENT_COUNTERS_LUA)
+        keys = [key for key, _ in counters]
+        ttls = [int(ttl) for _, ttl in counters]
+        results = await self._increment_script(keys=keys, args=ttls)
+        return [int(value) for value in results]
+
     async def add_to_queue(self, queue_key: str, item: dict):
         """Add Queue Items"""
         import json
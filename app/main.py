@@ -27,7 +27,7 @@ from pathlib import Path
 from app.core.config import SETTINGS
 from app.core.database import init_database_async, close_database_async
 from app.core.logging_config import setup_logging
-from app.routers import auth_db as auth, analysis, screening, queue, sse, health, favorites, config, reports, database, operation_logs, tags, tushare_init, akshare_init, baostock_init, historical_data, multi_period_sync, financial_data, news_data, social_media, internal_messages, usage_statistics, model_capabilities, cache, logs
+from app.routers import auth_db as auth, analysis, screening, queue, sse, health, favorites, config, reports, database, operation_logs, tags, tushare_init, akshare_init, baostock_init, historical_data, multi_period_sync, financial_data, news_data, social_media, internal_messages, usage_statistics, model_capabilities, cache, logs, metrics
 from app.routers import sync as sync_router, multi_source_sync
 from app.routers import stocks as stocks_router
 from app.routers import stock_data as stock_data_router
@@ -63,6 +63,7 @@ from app.worker.baostock_sync_service import (
 # from app.worker.hk_sync_service import ...
 # from app.worker.us_sync_service import ...
 from app.middleware.operation_log_middleware import OperationLogMiddleware
+from app.middleware.access_log import AccessLogMiddleware
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -268,6 +269,17 @@ async def lifespan(app: FastAPI):
 
     logger.info("TradingAgents FastAPI backend started")
 
+    #-----------------------------------------------------------------------------------------------------
+    #Warm the CPU process pool (if enabled) so that the first analysis does not pay for worker start-up
+    #-----------------------------------------------------------------------------------------------------
+    try:
+        from tradingagents.utils.process_pool import get_cpu_pool
+        cpu_pool = get_cpu_pool()
+        if cpu_pool is not None:
+            asyncio.create_task(asyncio.to_thread(cpu_pool.warm_up))
+    except Exception as e:
+        logger.warning(f"Process pool warm-up failed (ignored): {e}")
+
     #-----------------------------------------------------------------------------------------------------
     #Start-up period: If necessary, a closing snapshot of the previous trading date should be added at the break
     #-----------------------------------------------------------------------------------------------------
@@ -604,6 +616,28 @@ async def lifespan(app: FastAPI):
         else:
             logger.info(f"📰Syncs of news data configured (selected units only):{SETTINGS.NEWS_SYNC_CRON}")
 
+        #Trading calendar: refresh once at start-up (when stale) and then daily
+        async def run_trading_calendar_refresh(force: bool = True):
+            from tradingagents.dataflows.trading_calendar import get_trading_calendar
+            try:
+                result = await asyncio.to_thread(get_trading_calendar().refresh, None, force)
+                logger.info(f"📅 Trading calendar refreshed:{result}")
+            except Exception as e:
+                logger.error(f"Trading calendar refresh failed:{e}", exc_info=True)
+
+        scheduler.add_job(
+            run_trading_calendar_refresh,
+            CronTrigger.from_crontab(SETTINGS.TRADING_CALENDAR_REFRESH_CRON, timezone=SETTINGS.TIMEZONE),
+            id="trading_calendar_refresh",
+            name="交易日历更新（A股/港股/美股）"
+        )
+        if SETTINGS.TRADING_CALENDAR_REFRESH_ENABLED:
+            asyncio.create_task(run_trading_calendar_refresh(force=False))
+            logger.info(f"📅 Trading calendar refresh configured:{SETTINGS.TRADING_CALENDAR_REFRESH_CRON}")
+        else:
+            scheduler.pause_job("trading_calendar_refresh")
+            logger.info(f"Trading calendar refresh has been added but suspended:{SETTINGS.TRADING_CALENDAR_REFRESH_CRON}")
+
         #-----------------------------------------------------------------------------------------------------
         #Start the scheduler
         scheduler.start()
@@ -632,6 +666,25 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"UserService cleanup error: {e}")
 
+        try:
+            from app.services.progress.hub import shutdown_progress_hub
+            await shutdown_progress_hub()
+        except Exception as e:
+            logger.warning(f"Progress hub shutdown error: {e}")
+
+        #Flush buffered operation logs before the database connection closes
+        try:
+            from app.services.operation_log_service import shutdown_operation_log_writer
+            await shutdown_operation_log_writer()
+        except Exception as e:
+            logger.warning(f"Operation log writer shutdown error: {e}")
+
+        try:
+            from tradingagents.utils.process_pool import shutdown_cpu_pool
+            await asyncio.to_thread(shutdown_cpu_pool)
+        except Exception as e:
+            logger.warning(f"Process pool shutdown error: {e}")
+
         await close_database_async()
         logger.info("TradingAgents FastAPI backend stopped")
 
@@ -668,27 +721,7 @@ app.add_middleware(OperationLogMiddleware)
 
 
 #Requested Log Intermediate
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-
-    #Skip health check and static file request logs
-    if request.url.path in ["/health", "/favicon.ico"] or request.url.path.startswith("/static"):
-        response = await call_next(request)
-        return response
-
-    #Record requests using webpi logger
-    logger = logging.getLogger("webapi")
-    logger.info(f"🔄 {request.method} {request.url.path}- Start processing.")
-
-    response = await call_next(request)
-    process_time = time.time() - start_time
-
-    #Recording request completed
-    status_emoji = "✅" if response.status_code < 400 else "❌"
-    logger.info(f"{status_emoji} {request.method} {request.url.path}- Status:{response.status_code}- Time-consuming:{process_time:.3f}s")
-
-    return response
+app.add_middleware(AccessLogMiddleware)
 
 
 #Global anomalies
@@ -764,6 +797,7 @@ app.include_router(financial_data.router, tags=["financial-data"])
 app.include_router(news_data.router, tags=["news-data"])
 app.include_router(social_media.router, tags=["social-media"])
 app.include_router(internal_messages.router, tags=["internal-messages"])
+app.include_router(metrics.router, tags=["metrics"])
 
 
 @app.get("/")
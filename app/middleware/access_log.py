@@ -0,0 +1,42 @@
+"""Requested log middle
+Record the start and completion of each request in the webapi log
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("webapi")
+
+
+class AccessLogMiddleware:
+    """Requested log middle (pure ASGI, streamed responses are not buffered)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        #Skip health check and static file request logs
+        if scope["type"] != "http" or path in ("/health", "/favicon.ico") or path.startswith("/static"):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.time()
+        method = scope["method"]
+        status_code = 500
+        logger.info(f"🔄 {method} {path}- Start processing.")
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        #Recording request completed
+        process_time = time.time() - start_time
+        status_emoji = "✅" if status_code < 400 else "❌"
+        logger.info(f"{status_emoji} {method} {path}- Status:{status_code}- Time-consuming:{process_time:.3f}s")
@@ -1,32 +1,48 @@
 """Error Processing Middle
 """
 
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
-import traceback
-from typing import Callable
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Global error processing middle"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class ErrorHandlerMiddleware:
+    """Global error processing middle (pure ASGI, responses are streamed through unchanged)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            return await self.handle_error(request, exc)
-    
+            #Once headers are sent a JSON error can no longer be returned
+            if response_started:
+                raise
+            response = await self.handle_error(Request(scope), exc)
+            await response(scope, receive, send)
+
     async def handle_error(self, request: Request, exc: Exception) -> JSONResponse:
         """Deal with anomalies and return standardized errors Response"""
-        
+
         #Get Request ID
         request_id = getattr(request.state, "request_id", "unknown")
-        
+
         #Log Error Log
         logger.error(
             f"Request abnormal - ID:{request_id}, "
@@ -35,7 +51,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             f"Unusual:{str(exc)}",
             exc_info=True
         )
-        
+
         #Returns different bugs according to unusual type Response
         if isinstance(exc, ValueError):
             return JSONResponse(
@@ -48,7 +64,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     }
                 }
             )
-        
+
         elif isinstance(exc, PermissionError):
             return JSONResponse(
                 status_code=403,
@@ -60,7 +76,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     }
                 }
             )
-        
+
         elif isinstance(exc, FileNotFoundError):
             return JSONResponse(
                 status_code=404,
@@ -72,7 +88,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                     }
                 }
             )
-        
+
         else:
             #Unknown anomaly
             return JSONResponse(
@@ -6,8 +6,8 @@ import time
 import json
 import logging
 from typing import Optional, Dict, Any
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.services.operation_log_service import log_operation
 from app.models.operationlog_models import ActionType
@@ -23,11 +23,15 @@ def set_operation_log_enabled(flag: bool) -> None:
 
 
 
-class OperationLogMiddleware(BaseHTTPMiddleware):
-    """Operation log record middle"""
+class OperationLogMiddleware:
+    """Operation log record middle
 
-    def __init__(self, app, skip_paths: Optional[list] = None):
-        super().__init__(app)
+    Pure ASGI: the response is streamed through untouched and only the status code
+    is observed; the log document is queued after the response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: Optional[list] = None):
+        self.app = app
         #Skip the log path
         self.skip_paths = skip_paths or [
             "/health",
@@ -53,10 +57,17 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
             "/api/reports/": ActionType.REPORT_GENERATION,
         }
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         #Check if skipping records is required
         if self._should_skip_logging(request):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         #Record start time
         start_time = time.time()
@@ -70,20 +81,28 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         #Access to user information (if certified)
         user_info = await self._get_user_info(request)
 
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         #Processing of requests
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
 
         #Time-consuming calculation
         duration_ms = int((time.time() - start_time) * 1000)
 
-        #Step Record Operations Log
+        #Record Operations Log (queued for the buffered writer, not written inline)
         if user_info:
             try:
                 await self._log_operation(
                     user_info=user_info,
                     method=method,
                     path=path,
-                    response=response,
+                    status_code=status_code,
                     duration_ms=duration_ms,
                     ip_address=ip_address,
                     user_agent=user_agent,
@@ -92,8 +111,6 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
             except Exception as e:
                 logger.error(f"Log operation log failed:{e}")
 
-        return response
-
     def _should_skip_logging(self, request: Request) -> bool:
         """Judge whether logs should be skipped"""
         #Skip directly when global closing
@@ -231,7 +248,7 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         user_info: Dict[str, Any],
         method: str,
         path: str,
-        response: Response,
+        status_code: int,
         duration_ms: int,
         ip_address: str,
         user_agent: str,
@@ -240,7 +257,7 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         """Log Operations Log"""
         try:
             #Judge whether the operation was successful
-            success = 200 <= response.status_code < 400
+            success = 200 <= status_code < 400
 
             #Get Operations Type and Description
             action_type = self._get_action_type(path)
@@ -250,14 +267,14 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
             details = {
                 "method": method,
                 "path": path,
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "query_params": dict(request.query_params) if request.query_params else None,
             }
 
             #Get the wrong information (if any)
             error_message = None
             if not success:
-                error_message = f"HTTP {response.status_code}"
+                error_message = f"HTTP {status_code}"
 
             #Log Operations Log
             await log_operation(
@@ -271,7 +288,8 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
                 duration_ms=duration_ms,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                session_id=user_info.get("session_id")
+                session_id=user_info.get("session_id"),
+                wait=False  #Buffered: the audit write is batched off the response path
             )
 
         except Exception as e:
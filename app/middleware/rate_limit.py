@@ -1,175 +1,161 @@
 """Intermediate Speed Limit
 Prevent API abuse and achieve user and end point speed limits
+
+Pure ASGI middleware: the per-minute rate limit and the daily quota are checked
+together with a single Redis round trip, and responses (including SSE/exports)
+are passed through untouched.
 """
 
-from fastapi import Request, Response, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+import datetime
 import logging
-from typing import Callable, Dict, Optional
-from core.redis_client import get_redis_service, RedisKeys
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.redis_client import get_redis_service, RedisKeys
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_WINDOW_SECONDS = 60
+DAILY_QUOTA_TTL_SECONDS = 86400
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Intermediate Speed Limit"""
-    
-    def __init__(self, app, default_rate_limit: int = 100):
-        super().__init__(app)
+class RateLimitMiddleware:
+    """Intermediate speed limit and daily quota"""
+
+    #Skip health checks and static resources
+    skip_prefixes: Tuple[str, ...] = ("/api/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_rate_limit: Optional[int] = 100,
+        daily_quota: Optional[int] = None,
+        quota_endpoints: Optional[Set[str]] = None
+    ):
+        self.app = app
+        #None disables the per-minute limit (quota only)
         self.default_rate_limit = default_rate_limit
-        
+        #None disables the daily quota (rate limit only)
+        self.daily_quota = daily_quota
+
         #Rate limit configuration for different ends
-        self.endpoint_limits = {
+        self.endpoint_limits: Dict[str, int] = {
             "/api/analysis/single": 10,      #Single unit analysis: 10 per minute
             "/api/analysis/batch": 5,        #Batch analysis: 5 per minute
             "/api/screening/filter": 20,     #Stock screening: 20 times a minute
             "/api/auth/login": 5,            #Login: 5 times a minute
             "/api/auth/register": 3,         #Registration: 3 times a minute
         }
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        #Skip health checks and static resources
-        if request.url.path.startswith(("/api/health", "/docs", "/redoc", "/openapi.json")):
-            return await call_next(request)
-        
-        #Get User ID (if certified)
-        user_id = getattr(request.state, "user_id", None)
-        if not user_id:
-            #Use IP address for uncertified users
-            user_id = f"ip:{request.client.host}" if request.client else "unknown"
-        
-        #Check speed limit
-        try:
-            await self.check_rate_limit(user_id, request.url.path)
-        except HTTPException:
-            raise
-        except Exception as exc:
-            logger.error(f"Rate limit check failed:{exc}")
-            #If Redis is not available, allow permission.
-        
-        return await call_next(request)
-    
-    async def check_rate_limit(self, user_id: str, endpoint: str):
-        """Check speed limit"""
-        redis_service = get_redis_service()
-        
-        #Retrieving peer speed limit
-        rate_limit = self.endpoint_limits.get(endpoint, self.default_rate_limit)
-        
-        #Build Redis Key
-        rate_key = RedisKeys.USER_RATE_LIMIT.format(
-            user_id=user_id,
-            endpoint=endpoint.replace("/", "_")
-        )
-        
-        #Get the current count
-        current_count = await redis_service.increment_with_ttl(rate_key, ttl=60)
-        
-        #Check if the limit is exceeded
-        if current_count > rate_limit:
-            logger.warning(
-                f"Rate limit trigger - user:{user_id}, "
-                f"End:{endpoint}, "
-                f"Current count:{current_count}, "
-                f"Limits:{rate_limit}"
-            )
-            
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
-                        "message": f"请求过于频繁，请稍后重试",
-                        "rate_limit": rate_limit,
-                        "current_count": current_count,
-                        "reset_time": 60
-                    }
-                }
-            )
-        
-        logger.debug(
-            f"Speed limit check pass - user:{user_id}, "
-            f"End:{endpoint}, "
-            f"Current count:{current_count}/{rate_limit}"
-        )
-
-
-class QuotaMiddleware(BaseHTTPMiddleware):
-    """Medium daily quota"""
-    
-    def __init__(self, app, daily_quota: int = 1000):
-        super().__init__(app)
-        self.daily_quota = daily_quota
-        
+
         #Endpoint to include quota
-        self.quota_endpoints = {
+        self.quota_endpoints = quota_endpoints or {
             "/api/analysis/single",
             "/api/analysis/batch",
             "/api/screening/filter"
         }
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        #Check only the end points that require quotas
-        if request.url.path not in self.quota_endpoints:
-            return await call_next(request)
-        
-        #Get User ID
-        user_id = getattr(request.state, "user_id", None)
-        if not user_id:
-            #Uncertified users are not subject to quota
-            return await call_next(request)
-        
-        #Check daily quota
-        try:
-            await self.check_daily_quota(user_id)
-        except HTTPException:
-            raise
-        except Exception as exc:
-            logger.error(f"Quota check failed:{exc}")
-            #If Redis is not available, allow permission.
-        
-        return await call_next(request)
-    
-    async def check_daily_quota(self, user_id: str):
-        """Check daily quota"""
-        import datetime
-        
-        redis_service = get_redis_service()
-        
-        #Can not open message
-        today = datetime.date.today().isoformat()
-        
-        #Build Redis Key
-        quota_key = RedisKeys.USER_DAILY_QUOTA.format(
-            user_id=user_id,
-            date=today
-        )
-        
-        #Get Usage Today
-        current_usage = await redis_service.increment_with_ttl(quota_key, ttl=86400)  #TTL 24 hours
-        
-        #Check if the quota is exceeded
-        if current_usage > self.daily_quota:
-            logger.warning(
-                f"Daily quota exceeding - user:{user_id}, "
-                f"Used today:{current_usage}, "
-                f"Quota:{self.daily_quota}"
-            )
-            
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "error": {
-                        "code": "DAILY_QUOTA_EXCEEDED",
-                        "message": "今日配额已用完，请明天再试",
-                        "daily_quota": self.daily_quota,
-                        "current_usage": current_usage,
-                        "reset_date": today
-                    }
-                }
-            )
-        
-        logger.debug(
-            f"Quota check passed - User:{user_id}, "
-            f"Used today:{current_usage}/{self.daily_quota}"
-        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        user_id = scope.get("state", {}).get("user_id")
+        counters = self._build_counters(scope, user_id, path)
+
+        if counters:
+            try:
+                counts = await get_redis_service().increment_counters_with_ttl(
+                    [(key, ttl) for _, key, ttl in counters]
+                )
+            except Exception as exc:
+                #If Redis is not available, allow permission.
+                logger.error(f"Rate limit check failed:{exc}")
+            else:
+                rejection = self._check_counts(user_id, path, counters, counts)
+                if rejection is not None:
+                    await rejection(scope, receive, send)
+                    return
+
+        await self.app(scope, receive, send)
+
+    def _build_counters(self, scope: Scope, user_id: Optional[str], path: str) -> List[Tuple[str, str, int]]:
+        """Counters to increment for this request as (kind, redis key, ttl)"""
+        counters: List[Tuple[str, str, int]] = []
+
+        if self.default_rate_limit is not None:
+            #Use IP address for uncertified users
+            client = scope.get("client")
+            identity = user_id or (f"ip:{client[0]}" if client else "unknown")
+            counters.append((
+                "rate",
+                RedisKeys.USER_RATE_LIMIT.format(user_id=identity, endpoint=path.replace("/", "_")),
+                RATE_LIMIT_WINDOW_SECONDS,
+            ))
+
+        #Uncertified users are not subject to quota
+        if self.daily_quota is not None and user_id and path in self.quota_endpoints:
+            counters.append((
+                "quota",
+                RedisKeys.USER_DAILY_QUOTA.format(user_id=user_id, date=datetime.date.today().isoformat()),
+                DAILY_QUOTA_TTL_SECONDS,
+            ))
+
+        return counters
+
+    def _check_counts(
+        self,
+        user_id: Optional[str],
+        path: str,
+        counters: List[Tuple[str, str, int]],
+        counts: List[int]
+    ) -> Optional[JSONResponse]:
+        for (kind, _, _), count in zip(counters, counts):
+            if kind == "rate":
+                rate_limit = self.endpoint_limits.get(path, self.default_rate_limit)
+                if count > rate_limit:
+                    logger.warning(
+                        f"Rate limit trigger - user:{user_id}, "
+                        f"End:{path}, "
+                        f"Current count:{count}, "
+                        f"Limits:{rate_limit}"
+                    )
+                    return self._reject({
+                        "code": "RATE_LIMIT_EXCEEDED",
+                        "message": "请求过于频繁，请稍后重试",
+                        "rate_limit": rate_limit,
+                        "current_count": count,
+                        "reset_time": RATE_LIMIT_WINDOW_SECONDS
+                    }, retry_after=RATE_LIMIT_WINDOW_SECONDS)
+            elif count > self.daily_quota:
+                today = datetime.date.today().isoformat()
+                logger.warning(
+                    f"Daily quota exceeding - user:{user_id}, "
+                    f"Used today:{count}, "
+                    f"Quota:{self.daily_quota}"
+                )
+                return self._reject({
+                    "code": "DAILY_QUOTA_EXCEEDED",
+                    "message": "今日配额已用完，请明天再试",
+                    "daily_quota": self.daily_quota,
+                    "current_usage": count,
+                    "reset_date": today
+                })
+
+        logger.debug(f"Speed limit check pass - user:{user_id}, End:{path}, Counts:{counts}")
+        return None
+
+    @staticmethod
+    def _reject(error: Dict, retry_after: Optional[int] = None) -> JSONResponse:
+        #Same body shape as an HTTPException(status_code=429, detail=...) raised by a route
+        headers = {"Retry-After": str(retry_after)} if retry_after else None
+        return JSONResponse(status_code=429, content={"detail": {"error": error}}, headers=headers)
+
+
+class QuotaMiddleware(RateLimitMiddleware):
+    """Medium daily quota (quota only; use RateLimitMiddleware(daily_quota=...) to check both in one call)"""
+
+    def __init__(self, app: ASGIApp, daily_quota: int = 1000):
+        super().__init__(app, default_rate_limit=None, daily_quota=daily_quota)
@@ -3,66 +3,73 @@
 - Write track id to logging constextvars, so all logs are automatically taken out
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uuid
 import time
 import logging
-from typing import Callable
 
 from app.core.logging_context import trace_id_var
 
 logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Request for ID and log middle (trace id)"""
+class RequestIDMiddleware:
+    """Request for ID and log middle (trace id), pure ASGI so streamed bodies pass straight through"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
         #Generate request ID/trace id
         trace_id = str(uuid.uuid4())
-        request.state.request_id = trace_id  #Compatible existing field names
-        request.state.trace_id = trace_id
+        state = scope.setdefault("state", {})
+        state["request_id"] = trace_id  #Compatible existing field names
+        state["trace_id"] = trace_id
 
         #Write track id to contactvars
         token = trace_id_var.set(trace_id)
 
         #Record request start time
         start_time = time.time()
+        status_code = None
 
         #Record request information
+        client = scope.get("client")
         logger.info(
             f"- Trace id:{trace_id}, "
-            f"Methodology:{request.method}, Path:{request.url.path}, "
-            f"Client:{request.client.host if request.client else 'unknown'}"
+            f"Methodology:{scope['method']}, Path:{scope['path']}, "
+            f"Client:{client[0] if client else 'unknown'}"
         )
 
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                #Add Response Header
+                headers = MutableHeaders(scope=message)
+                headers["X-Trace-ID"] = trace_id
+                headers["X-Request-ID"] = trace_id  #Compatibility
+                headers["X-Process-Time"] = f"{time.time() - start_time:.3f}"
+            await send(message)
+
         try:
             #Processing of requests
-            response = await call_next(request)
-
-            #Calculate processing time
-            process_time = time.time() - start_time
-
-            #Add Response Header
-            response.headers["X-Trace-ID"] = trace_id
-            response.headers["X-Request-ID"] = trace_id  #Compatibility
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
+            await self.app(scope, receive, send_wrapper)
 
             #Record requested completion information
             logger.info(
-                f"- Trace id:{trace_id}, status code:{response.status_code}, processing time:{process_time:.3f}s"
+                f"- Trace id:{trace_id}, status code:{status_code}, processing time:{time.time() - start_time:.3f}s"
             )
 
-            return response
-
         except Exception as exc:
-            #Calculate processing time
-            process_time = time.time() - start_time
-
             #Record requested abnormal information
             logger.error(
-                f"Request abnormal - trace id:{trace_id}, processing time:{process_time:.3f}s, anomaly:{str(exc)}"
+                f"Request abnormal - trace id:{trace_id}, processing time:{time.time() - start_time:.3f}s, anomaly:{str(exc)}"
             )
             raise
 
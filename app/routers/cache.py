@@ -38,7 +38,9 @@ async def get_cache_stats(current_user: dict = Depends(get_current_user)):
                 "maxSize": 1024 * 1024 * 1024,  # 1GB
                 "stockDataCount": stats.get('stock_data_count', 0),
                 "newsDataCount": stats.get('news_count', 0),
-                "analysisDataCount": stats.get('fundamentals_count', 0)
+                "analysisDataCount": stats.get('fundamentals_count', 0),
+                #In-process hot tier: hits/misses/bytes (None when disabled)
+                "hotCache": stats.get('hot_cache')
             },
             message="获取缓存统计成功"
         )
@@ -22,6 +22,7 @@ class BackupRequest(BaseModel):
     """Backup Request"""
     name: str
     collections: List[str] = []  #Empty list means all backup collections
+    incremental: bool = False  #Only documents updated since the last streaming backup
 
 class ImportRequest(BaseModel):
     """Import Request"""
@@ -130,7 +131,8 @@ async def create_backup(
         backup_info = await database_service.create_backup(
             name=request.name,
             collections=request.collections,
-            user_id=current_user['id']
+            user_id=current_user['id'],
+            incremental=request.incremental
         )
         return {
             "success": True,
@@ -178,12 +180,11 @@ async def import_data(
         logger.info(f"Format:{format}")
         logger.info(f"Overwrite mode:{overwrite}")
 
-        #Read File Contents
-        content = await file.read()
-        logger.info(f"File size:{len(content)}Bytes")
+        #Pass the spooled upload file through, NDJSON backups are imported as a stream
+        logger.info(f"File size:{file.size}Bytes")
 
         result = await database_service.import_data(
-            content=content,
+            content=file.file,
             collection=collection,
             format=format,
             overwrite=overwrite,
@@ -2,6 +2,7 @@
 Provide log query, filter and export functions
 """
 
+import asyncio
 import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -100,7 +101,9 @@ async def read_log_file(
         logger.info(f"User {current_user['username']}Read log files:{request.filename}")
         
         service = get_log_export_service()
-        content = service.read_log_file(
+        #File scanning runs in a worker thread to keep the event loop responsive
+        content = await asyncio.to_thread(
+            service.read_log_file,
             filename=request.filename,
             lines=request.lines,
             level=request.level,
@@ -138,7 +141,8 @@ async def export_logs(
         logger.info(f"User {current_user['username']}Export Log File")
         
         service = get_log_export_service()
-        export_path = service.export_logs(
+        export_path = await asyncio.to_thread(
+            service.export_logs,
             filenames=request.filenames,
             level=request.level,
             start_time=request.start_time,
@@ -182,7 +186,7 @@ async def get_log_statistics(
         logger.info(f"User {current_user['username']}Query log statistics")
         
         service = get_log_export_service()
-        stats = service.get_log_statistics(days=days)
+        stats = await asyncio.to_thread(service.get_log_statistics, days=days)
         
         return stats
         
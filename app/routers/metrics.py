@@ -0,0 +1,23 @@
+"""
+Prometheus-style metrics endpoint
+Exports the process-wide registry (per-node LLM latency/tokens, tool durations, retries)
+"""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+
+from app.core.config import SETTINGS
+from tradingagents.utils.metrics_registry import CONTENT_TYPE, get_metrics_registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (text exposition format 0.0.4)"""
+    if not SETTINGS.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="指标导出未启用")
+    #Make sure the graph metric families are exported (with HELP/TYPE) before the first run
+    from tradingagents.graph.run_metrics import get_graph_metrics
+    get_graph_metrics()
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
@@ -1,7 +1,9 @@
 """Analytical reports manage API routers
 """
 import os
+import re
 import json
+import base64
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -114,6 +116,133 @@ class ReportListResponse(BaseModel):
     page: int
     page_size: int
 
+#Fields needed by the report list (the module bodies in "reports" are never transferred)
+_REPORT_LIST_PROJECTION = {
+    "analysis_id": 1,
+    "stock_symbol": 1,
+    "stock_name": 1,
+    "market_type": 1,
+    "model_info": 1,
+    "status": 1,
+    "created_at": 1,
+    "analysis_date": 1,
+    "analysts": 1,
+    "research_depth": 1,
+    "summary": 1,
+    "source": 1,
+    "task_id": 1,
+    "report_size": 1,
+    #Legacy documents have no report_size, let the server compute it
+    "reports_bson_size": {"$bsonSize": "$reports"},
+}
+
+
+def _encode_list_cursor(created_at: datetime, oid) -> str:
+    """Encode the (created_at, _id) position of the last row into an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{oid}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_list_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a list cursor into a keyset condition (rows strictly after the cursor)"""
+    from bson import ObjectId
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at_str, oid_str = raw.rsplit("|", 1)
+        created_at = datetime.fromisoformat(created_at_str)
+        oid = ObjectId(oid_str)
+    except Exception:
+        raise HTTPException(status_code=400, detail="无效的分页游标")
+
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": oid}},
+        ]
+    }
+
+
+#Report module keys (market_report, bull_researcher, ...)
+_MODULE_NAME_RE = re.compile(r"^[a-z_]+$")
+
+
+def _build_search_condition(search_keyword: str, search_mode: str = "contains") -> Dict[str, Any]:
+    """Search condition on stock symbol, stock name, analysis id (and summary)
+
+    ``contains`` (default) is a case-insensitive substring match, as before, and also
+    covers the summary; it scans the collection. ``prefix`` only matches the start of
+    symbol, name and analysis id, which the indexes on those fields can serve; the
+    keyword is tried as typed, upper- and lower-cased, so codes still match in any case.
+    """
+    keyword = search_keyword.strip()
+    if search_mode == "prefix":
+        return {"$or": [
+            {field: {"$regex": f"^{re.escape(variant)}"}}
+            for field in ("stock_symbol", "stock_name", "analysis_id")
+            for variant in dict.fromkeys([keyword, keyword.upper(), keyword.lower()])
+        ]}
+    pattern = re.escape(keyword)
+    return {"$or": [
+        {field: {"$regex": pattern, "$options": "i"}}
+        for field in ("stock_symbol", "stock_name", "analysis_id", "summary")
+    ]}
+
+
+async def get_stock_names_batch(db, stock_codes: List[str]) -> Dict[str, str]:
+    """Get stock names for many codes with a single query
+    Priority: Cache - > MongoDB (data source priority) - > Default return stock code
+    """
+    names: Dict[str, str] = {}
+    missing = []
+    for code in stock_codes:
+        if code in _stock_name_cache:
+            names[code] = _stock_name_cache[code]
+        elif code:
+            missing.append(code)
+
+    if not missing:
+        return names
+
+    try:
+        from ..core.unified_config import UnifiedConfigManager
+
+        data_source_configs = UnifiedConfigManager().get_data_source_configs()
+        enabled_sources = [
+            ds.type.lower() for ds in data_source_configs
+            if ds.enabled and ds.type.lower() in ['tushare', 'akshare', 'baostock']
+        ] or ['tushare', 'akshare', 'baostock']
+        source_rank = {source: i for i, source in enumerate(enabled_sources)}
+
+        code6_map = {str(code).zfill(6): code for code in missing}
+        cursor = db.stock_basic_info.find(
+            {"$or": [{"code": {"$in": list(code6_map)}}, {"symbol": {"$in": list(code6_map)}}]},
+            {"code": 1, "symbol": 1, "name": 1, "source": 1}
+        )
+
+        #Keep the name from the highest priority source (documents without source come last)
+        best: Dict[str, tuple] = {}
+        async for doc in cursor:
+            code6 = doc.get("code") if doc.get("code") in code6_map else doc.get("symbol")
+            if code6 not in code6_map or not doc.get("name"):
+                continue
+            rank = source_rank.get(doc.get("source"), len(source_rank))
+            if code6 not in best or rank < best[code6][0]:
+                best[code6] = (rank, doc["name"])
+
+        for code6, code in code6_map.items():
+            name = best[code6][1] if code6 in best else code
+            _stock_name_cache[code] = name
+            names[code] = name
+
+    except Exception as e:
+        logger.warning(f"Failed to get stock names in batch: {e}")
+        for code in missing:
+            names.setdefault(code, code)
+
+    return names
+
+
 @router.get("/list", response_model=Dict[str, Any])
 async def get_reports_list(
     page: int = Query(1, ge=1, description="页码"),
@@ -123,32 +252,36 @@ async def get_reports_list(
     start_date: Optional[str] = Query(None, description="开始日期"),
     end_date: Optional[str] = Query(None, description="结束日期"),
     stock_code: Optional[str] = Query(None, description="股票代码"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页返回的 next_cursor，优先于 page）"),
+    search_mode: str = Query("contains", pattern="^(contains|prefix)$",
+                             description="搜索方式：contains 子串匹配（含摘要，默认），prefix 前缀匹配（走索引，更快）"),
+    include_total: bool = Query(True, description="是否返回总数"),
     user: dict = Depends(get_current_user)
 ):
-    """Get List of Analytical Reports"""
+    """Get List of Analytical Reports
+
+    Only summary fields are read. Pass the returned next_cursor to fetch the next page
+    with keyset (created_at, _id) pagination instead of skip().
+    """
     try:
         logger.info(f"Can not get folder: %s: %s{user['id']}, page number={page}, per page ={page_size}market ={market_filter}")
 
         db = get_mongo_db_async()
 
         #Build query conditions
-        query = {}
+        conditions = []
 
         #Search keywords
-        if search_keyword:
-            query["$or"] = [
-                {"stock_symbol": {"$regex": search_keyword, "$options": "i"}},
-                {"analysis_id": {"$regex": search_keyword, "$options": "i"}},
-                {"summary": {"$regex": search_keyword, "$options": "i"}}
-            ]
+        if search_keyword and search_keyword.strip():
+            conditions.append(_build_search_condition(search_keyword, search_mode))
 
         #Market screening
         if market_filter:
-            query["market_type"] = market_filter
+            conditions.append({"market_type": market_filter})
 
         #Stock code filter
         if stock_code:
-            query["stock_symbol"] = stock_code
+            conditions.append({"stock_symbol": stock_code})
 
         #Date range filter
         if start_date or end_date:
@@ -157,25 +290,40 @@ async def get_reports_list(
                 date_query["$gte"] = start_date
             if end_date:
                 date_query["$lte"] = end_date
-            query["analysis_date"] = date_query
+            conditions.append({"analysis_date": date_query})
 
+        query = {"$and": conditions} if conditions else {}
         logger.info(f"Other Organiser{query}")
 
         #Total calculated
-        total = await db.analysis_reports.count_documents(query)
+        total = await db.analysis_reports.count_documents(query) if include_total else None
 
-        #Page Break Query
-        skip = (page - 1) * page_size
-        cursor = db.analysis_reports.find(query).sort("created_at", -1).skip(skip).limit(page_size)
+        #Page Break Query: keyset when a cursor is given, skip() for direct page jumps
+        if cursor:
+            page_query = {"$and": conditions + [_decode_list_cursor(cursor)]}
+            skip = 0
+        else:
+            page_query = query
+            skip = (page - 1) * page_size
+
+        docs_cursor = (
+            db.analysis_reports.find(page_query, _REPORT_LIST_PROJECTION)
+            .sort([("created_at", -1), ("_id", -1)])
+            .skip(skip)
+            .limit(page_size)
+        )
+        docs = [doc async for doc in docs_cursor]
+
+        #🔥 Prefer to the name of the stock stored in MongoDB, look up the rest in one query
+        stock_names = await get_stock_names_batch(
+            db, list({doc.get("stock_symbol", "") for doc in docs if not doc.get("stock_name")})
+        )
 
         reports = []
-        async for doc in cursor:
+        for doc in docs:
             #Convert to the format required for the front end
             stock_code = doc.get("stock_symbol", "")
-            #🔥 Prefer to the name of the stock stored in MongoDB or, if not, query
-            stock_name = doc.get("stock_name")
-            if not stock_name:
-                stock_name = get_stock_name(stock_code)
+            stock_name = doc.get("stock_name") or stock_names.get(stock_code, stock_code)
 
             #🔥 Market type of acquisition, if not extrapolated by stock code
             market_type = doc.get("market_type")
@@ -210,12 +358,16 @@ async def get_reports_list(
                 "analysts": doc.get("analysts", []),
                 "research_depth": doc.get("research_depth", 1),
                 "summary": doc.get("summary", ""),
-                "file_size": len(str(doc.get("reports", {}))),  #Estimated Size
+                "file_size": doc.get("report_size") or doc.get("reports_bson_size") or 0,  #Estimated Size
                 "source": doc.get("source", "unknown"),
                 "task_id": doc.get("task_id", "")
             }
             reports.append(report)
 
+        next_cursor = None
+        if len(docs) == page_size and isinstance(docs[-1].get("created_at"), datetime):
+            next_cursor = _encode_list_cursor(docs[-1]["created_at"], docs[-1]["_id"])
+
         logger.info(f"Other Organiser{total}returns ={len(reports)}")
 
         return {
@@ -224,11 +376,14 @@ async def get_reports_list(
                 "reports": reports,
                 "total": total,
                 "page": page,
-                "page_size": page_size
+                "page_size": page_size,
+                "next_cursor": next_cursor
             },
             "message": "报告列表获取成功"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Could not close temporary folder: %s{e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -357,6 +512,9 @@ async def get_report_module_content(
     user: dict = Depends(get_current_user)
 ):
     """Get the contents of the specific module of the report"""
+    #The module name becomes a projection path, so only plain report keys are accepted
+    if not _MODULE_NAME_RE.match(module):
+        raise HTTPException(status_code=400, detail=f"无效的模块名称: {module}")
     try:
         logger.info(f"For the report module:{report_id}/{module}")
 
@@ -364,7 +522,7 @@ async def get_report_module_content(
 
         #Query report (multiple ID support)
         query = _build_report_query(report_id)
-        doc = await db.analysis_reports.find_one(query)
+        doc = await db.analysis_reports.find_one(query, {f"reports.{module}": 1})
 
         if not doc:
             raise HTTPException(status_code=404, detail="报告不存在")
@@ -6,219 +6,153 @@ import logging
 import time
 
 from app.routers.auth_db import get_current_user
-from app.core.database import get_redis_client_async
 from app.core.config import SETTINGS
 
+from app.services.progress.hub import get_progress_hub
+from app.services.queue import TASK_PROGRESS_CHANNEL_PREFIX, BATCH_PROGRESS_CHANNEL_PREFIX
 from app.services.queue_service import get_queue_service, QueueService
 
 router = APIRouter()
 logger = logging.getLogger("webapi.sse")
 
 
+async def _load_sse_settings() -> dict:
+    """Dynamic SSE settings (system settings first, static config as fallback)"""
+    try:
+        from app.services.config_provider import CONFIG_PROVIDER as config_provider
+        eff = await config_provider.get_effective_system_settings()
+        return {
+            "poll_timeout": float(eff.get("sse_poll_timeout_seconds", 1.0)),
+            "heartbeat_every": int(eff.get("sse_heartbeat_interval_seconds", 10)),
+            "max_idle_seconds": int(eff.get("sse_task_max_idle_seconds", 300)),
+            "batch_resync_interval": float(eff.get("sse_batch_poll_interval_seconds", 2)),
+            "batch_max_idle_seconds": int(eff.get("sse_batch_max_idle_seconds", 600)),
+        }
+    except Exception:
+        return {
+            "poll_timeout": float(getattr(SETTINGS, "SSE_POLL_TIMEOUT_SECONDS", 1.0)),
+            "heartbeat_every": int(getattr(SETTINGS, "SSE_HEARTBEAT_INTERVAL_SECONDS", 10)),
+            "max_idle_seconds": int(getattr(SETTINGS, "SSE_TASK_MAX_IDLE_SECONDS", 300)),
+            "batch_resync_interval": float(getattr(SETTINGS, "SSE_BATCH_POLL_INTERVAL_SECONDS", 2.0)),
+            "batch_max_idle_seconds": int(getattr(SETTINGS, "SSE_BATCH_MAX_IDLE_SECONDS", 600)),
+        }
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 async def task_progress_generator(task_id: str, user_id: str):
-    """Generate SSE events for task progress updates"""
-    r = get_redis_client_async()
-    pubsub = None
-    channel = f"task_progress:{task_id}"
+    """Generate SSE events for task progress updates
+
+    Messages come from the process-wide progress hub, so clients share one Redis
+    pubsub connection instead of opening one each.
+    """
+    channel = TASK_PROGRESS_CHANNEL_PREFIX + task_id
 
     try:
-        # Load dynamic SSE settings
-        try:
-            from app.services.config_provider import CONFIG_PROVIDER as config_provider
-            eff = await config_provider.get_effective_system_settings()
-            poll_timeout = float(eff.get("sse_poll_timeout_seconds", 1.0))
-            heartbeat_every = int(eff.get("sse_heartbeat_interval_seconds", 10))
-            max_idle_seconds = int(eff.get("sse_task_max_idle_seconds", 300))
-        except Exception:
-            poll_timeout = float(getattr(SETTINGS, "SSE_POLL_TIMEOUT_SECONDS", 1.0))
-            heartbeat_every = int(getattr(SETTINGS, "SSE_HEARTBEAT_INTERVAL_SECONDS", 10))
-            max_idle_seconds = int(getattr(SETTINGS, "SSE_TASK_MAX_IDLE_SECONDS", 300))
-
-        #Fix: Create PubSub Connection
-        pubsub = r.pubsub()
-        logger.info(f"[SSE-Task] Create PubSub Connection:{task_id}, user={user_id}")
-
-        #Fixing: Subscription Channels (possible failure, need to ensure that pubsub is cleaned)
-        try:
-            await pubsub.subscribe(channel)
-            logger.info(f"[SSE-Task] Subscription channel successfully:{channel}")
+        settings = await _load_sse_settings()
+        poll_timeout = settings["poll_timeout"]
+        heartbeat_every = settings["heartbeat_every"]
+        max_idle_seconds = settings["max_idle_seconds"]
+
+        async with get_progress_hub().subscribe(channel) as queue:
+            logger.info(f"[SSE-Task] Subscribed via progress hub:{task_id}, user={user_id}")
             # Send initial connection confirmation
-            yield f"event: connected\ndata: {{\"task_id\": \"{task_id}\", \"message\": \"已连接进度流\"}}\n\n"
-        except Exception as subscribe_error:
-            #🔥 Cleanup pubsub connection as soon as the subscription fails
-            logger.error(f"[SSE-Task]{subscribe_error}")
-            try:
-                await pubsub.close()
-                logger.info(f"Could not close temporary folder: %s")
-            except Exception as close_error:
-                logger.error(f"Could not close temporary folder: %s{close_error}")
-            #Releasing anomalies for except processing
-            raise
-
-        # Listen for progress updates
-        idle_elapsed = 0.0
-        last_hb = time.monotonic()
-
-        while idle_elapsed < max_idle_seconds:
-            try:
-                message = await asyncio.wait_for(pubsub.get_message(ignore_subscribe_messages=True), timeout=poll_timeout)
-                if message and message['type'] == 'message':
-                    # Reset idle timer on valid message
-                    idle_elapsed = 0.0
-                    try:
-                        progress_data = json.loads(message['data'])
-                        yield f"event: progress\ndata: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON in progress message: {message['data']}")
-                else:
+            yield _sse_event("connected", {"task_id": task_id, "message": "已连接进度流"})
+
+            # Listen for progress updates
+            idle_elapsed = 0.0
+            last_hb = time.monotonic()
+
+            while idle_elapsed < max_idle_seconds:
+                try:
+                    raw = await asyncio.wait_for(queue.get(), timeout=poll_timeout)
+                except asyncio.TimeoutError:
                     # No update: accumulate idle time and send heartbeat if due
                     idle_elapsed += poll_timeout
                     now = time.monotonic()
                     if now - last_hb >= heartbeat_every:
-                        yield f"event: heartbeat\ndata: {{\"timestamp\": \"{asyncio.get_event_loop().time()}\"}}\n\n"
+                        yield _sse_event("heartbeat", {"timestamp": str(asyncio.get_running_loop().time())})
                         last_hb = now
+                    continue
 
-            except asyncio.TimeoutError:
-                idle_elapsed += poll_timeout
-                continue
+                # Reset idle timer on valid message
+                idle_elapsed = 0.0
+                try:
+                    yield _sse_event("progress", json.loads(raw))
+                except json.JSONDecodeError:
+                    logger.warning(f"Invalid JSON in progress message: {raw}")
 
     except Exception as e:
         logger.exception(f"SSE error for task {task_id}: {e}")
-        yield f"event: error\ndata: {{\"error\": \"连接异常: {str(e)}\"}}\n\n"
+        yield _sse_event("error", {"error": f"连接异常: {str(e)}"})
     finally:
-        #Rehabilitation: ensure that connections are released in all circumstances
-        if pubsub:
-            logger.info(f"[SSE-Task] Cleanup PubSub Connection:{task_id}")
-
-            #Close in stages to ensure that the connection is closed even if unsubscribe fails
-            try:
-                await pubsub.unsubscribe(channel)
-                logger.debug(f"[SSE-Task]{channel}")
-            except Exception as e:
-                logger.warning(f"⚠️ [SSE-Task] Unsubscription failed (continue to close the connection):{e}")
-
-            try:
-                await pubsub.close()
-                logger.info(f"[SSE-Task] PubSub connection closed:{task_id}")
-            except Exception as e:
-                logger.error(f"Could not close temporary folder: %s{e}", exc_info=True)
-                #Even if closing failed, try to reset the connection
-                try:
-                    await pubsub.reset()
-                    logger.info(f"[SSE-Task] PubSub connection has been reset:{task_id}")
-                except Exception as reset_error:
-                    logger.error(f"[SSE-Task] Reset the PubSub connection also failed:{reset_error}")
+        logger.info(f"[SSE-Task] Stream closed:{task_id}")
 
 
 async def batch_progress_generator(batch_id: str, user_id: str):
-    """Generate SSE events for batch progress updates"""
+    """Generate SSE events for batch progress updates
+
+    Batch progress is pushed: every task state change updates the batch counters and
+    publishes an aggregated event, which is relayed here. Only the counters are
+    re-read (one hash) when nothing arrived for a while, to recover from lost messages.
+    """
     svc = get_queue_service()
+    channel = BATCH_PROGRESS_CHANNEL_PREFIX + batch_id
 
     try:
-        # Load dynamic SSE settings for batch stream
-        try:
-            from app.services.config_provider import CONFIG_PROVIDER as config_provider
-            eff = await config_provider.get_effective_system_settings()
-            batch_poll_interval = float(eff.get("sse_batch_poll_interval_seconds", 2))
-            batch_max_idle_seconds = int(eff.get("sse_batch_max_idle_seconds", 600))
-        except Exception:
-            batch_poll_interval = float(getattr(SETTINGS, "SSE_BATCH_POLL_INTERVAL_SECONDS", 2.0))
-            batch_max_idle_seconds = int(getattr(SETTINGS, "SSE_BATCH_MAX_IDLE_SECONDS", 600))
-
-        # Send initial connection confirmation
-        yield f"event: connected\ndata: {{\"batch_id\": \"{batch_id}\", \"message\": \"已连接批次进度流\"}}\n\n"
-
-        idle_elapsed = 0.0
-
-        while idle_elapsed < batch_max_idle_seconds:
-            try:
-                # Get current batch status
-                batch_data = await svc.get_batch(batch_id)
-                if not batch_data:
-                    yield f"event: error\ndata: {{\"error\": \"批次不存在\"}}\n\n"
-                    break
-
-                # Check if batch belongs to user
-                if batch_data.get("user") != user_id:
-                    yield f"event: error\ndata: {{\"error\": \"无权限访问此批次\"}}\n\n"
-                    break
-
-                # Calculate batch progress based on task statuses
-                task_ids = batch_data.get("tasks", [])
-                if not task_ids:
-                    yield f"event: progress\ndata: {{\"batch_id\": \"{batch_id}\", \"message\": \"批次无任务\", \"progress\": 0}}\n\n"
-                    await asyncio.sleep(batch_poll_interval)
-                    idle_elapsed += batch_poll_interval
-                    continue
+        settings = await _load_sse_settings()
+        heartbeat_every = settings["heartbeat_every"]
+        resync_interval = max(settings["batch_resync_interval"], float(heartbeat_every))
+        batch_max_idle_seconds = settings["batch_max_idle_seconds"]
+
+        batch_data = await svc.get_batch(batch_id)
+        if not batch_data:
+            yield _sse_event("error", {"error": "批次不存在"})
+            return
+        # Check if batch belongs to user
+        if batch_data.get("user") != user_id:
+            yield _sse_event("error", {"error": "无权限访问此批次"})
+            return
+
+        # Subscribe before reading the snapshot so no state change falls in between
+        async with get_progress_hub().subscribe(channel) as queue:
+            # Send initial connection confirmation
+            yield _sse_event("connected", {"batch_id": batch_id, "message": "已连接批次进度流"})
+
+            snapshot = await svc.get_batch_progress(batch_id)
+            idle_elapsed = 0.0
 
-                completed_count = 0
-                failed_count = 0
-                processing_count = 0
-
-                for task_id in task_ids:
-                    task_data = await svc.get_task(task_id)
-                    if task_data:
-                        status = task_data.get("status", "queued")
-                        if status == "completed":
-                            completed_count += 1
-                        elif status == "failed":
-                            failed_count += 1
-                        elif status == "processing":
-                            processing_count += 1
-
-                total_tasks = len(task_ids)
-                finished_tasks = completed_count + failed_count
-                progress = round((finished_tasks / total_tasks) * 100, 1) if total_tasks > 0 else 0
-
-                # Determine batch status
-                if finished_tasks == total_tasks:
-                    if failed_count == 0:
-                        batch_status = "completed"
-                        message = f"批次完成: {completed_count}/{total_tasks} 成功"
-                    elif completed_count == 0:
-                        batch_status = "failed"
-                        message = f"批次失败: {failed_count}/{total_tasks} 失败"
-                    else:
-                        batch_status = "partial"
-                        message = f"批次部分成功: {completed_count} 成功, {failed_count} 失败"
-                elif processing_count > 0 or finished_tasks < total_tasks:
-                    batch_status = "processing"
-                    message = f"批次处理中: {finished_tasks}/{total_tasks} 已完成, {processing_count} 处理中"
+            while snapshot is not None:
+                if snapshot.get("total_tasks", 0) == 0:
+                    yield _sse_event("progress", {"batch_id": batch_id, "message": "批次无任务", "progress": 0})
                 else:
-                    batch_status = "queued"
-                    message = f"批次排队中: {total_tasks} 任务待处理"
-
-                progress_data = {
-                    "batch_id": batch_id,
-                    "status": batch_status,
-                    "message": message,
-                    "progress": progress,
-                    "total_tasks": total_tasks,
-                    "completed": completed_count,
-                    "failed": failed_count,
-                    "processing": processing_count,
-                    "timestamp": asyncio.get_event_loop().time()
-                }
-
-                yield f"event: progress\ndata: {json.dumps(progress_data, ensure_ascii=False)}\n\n"
+                    yield _sse_event("progress", snapshot)
 
                 # Break if batch is finished
-                if batch_status in ["completed", "failed", "partial"]:
-                    yield f"event: finished\ndata: {{\"batch_id\": \"{batch_id}\", \"final_status\": \"{batch_status}\"}}\n\n"
-                    break
+                if snapshot.get("finished"):
+                    yield _sse_event("finished", {"batch_id": batch_id, "final_status": snapshot["status"]})
+                    return
 
-                # Wait before next update
-                await asyncio.sleep(batch_poll_interval)
-                idle_elapsed += batch_poll_interval
+                if idle_elapsed >= batch_max_idle_seconds:
+                    return
+                try:
+                    raw = await asyncio.wait_for(queue.get(), timeout=resync_interval)
+                    snapshot = json.loads(raw)
+                    idle_elapsed = 0.0
+                except asyncio.TimeoutError:
+                    idle_elapsed += resync_interval
+                    snapshot = await svc.get_batch_progress(batch_id)
+                except json.JSONDecodeError:
+                    logger.warning(f"Invalid JSON in batch progress message: {raw}")
+                    snapshot = await svc.get_batch_progress(batch_id)
 
-            except Exception as e:
-                logger.exception(f"Batch progress error: {e}")
-                yield f"event: error\ndata: {{\"error\": \"获取批次状态失败: {str(e)}\"}}\n\n"
-                break
+            yield _sse_event("error", {"error": "批次不存在"})
 
     except Exception as e:
         logger.exception(f"SSE batch error for {batch_id}: {e}")
-        yield f"event: error\ndata: {{\"error\": \"连接异常: {str(e)}\"}}\n\n"
+        yield _sse_event("error", {"error": f"连接异常: {str(e)}"})
 
 
 @router.get("/tasks/{task_id}")
@@ -9,6 +9,7 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, HTTPExcept
 from datetime import datetime
 
 from app.services.auth_service import AuthService
+from app.services.progress.hub import get_progress_hub
 
 router = APIRouter()
 logger = logging.getLogger("webapi.websocket")
@@ -221,21 +222,36 @@ async def websocket_task_progress_endpoint(
         }
     })
     
-    try:
-        #Here you can get task progress from the Redis or database
-        #Stay connected until the mission is completed
+    async def forward_progress(queue: asyncio.Queue):
+        """Relay progress messages from the shared progress hub"""
         while True:
+            raw = await queue.get()
             try:
-                data = await websocket.receive_text()
-                logger.debug(f"[WS-Task]{task_id}, data={data}")
-            except WebSocketDisconnect:
-                logger.info(f"[WS-Task] Client voluntarily disconnected:{task_id}")
-                break
-            except Exception as e:
-                logger.error(f"[WS-Task]{e}")
-                break
-    
+                progress_data = json.loads(raw)
+            except json.JSONDecodeError:
+                logger.warning(f"[WS-Task] Invalid JSON in progress message: {raw}")
+                continue
+            await websocket.send_json({"type": "progress", "data": progress_data})
+
+    forwarder = None
+    try:
+        async with get_progress_hub().subscribe(channel) as queue:
+            forwarder = asyncio.create_task(forward_progress(queue))
+            #Stay connected until the client leaves
+            while True:
+                try:
+                    data = await websocket.receive_text()
+                    logger.debug(f"[WS-Task]{task_id}, data={data}")
+                except WebSocketDisconnect:
+                    logger.info(f"[WS-Task] Client voluntarily disconnected:{task_id}")
+                    break
+                except Exception as e:
+                    logger.error(f"[WS-Task]{e}")
+                    break
+
     finally:
+        if forwarder is not None:
+            forwarder.cancel()
         logger.info(f"[WS-Task] Disconnected:{task_id}")
 
 
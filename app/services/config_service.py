@@ -497,6 +497,7 @@ class ConfigService:
                 "ta_hk_max_retries": 3,
                 "ta_hk_rate_limit_wait_seconds": 60,
                 "ta_hk_cache_ttl_seconds": 86400,
+                "ta_hk_cache_max_entries": 20000,
                 #Add: TradingAgents Data Source Policy
                 #Whether to read first from the app cache (Mongo collection stock basic info / market quotes)
                 "ta_use_app_cache": False,
@@ -6,6 +6,8 @@ import logging
 from datetime import datetime, timedelta
 import pandas as pd
 
+from tradingagents.dataflows.providers.china.baostock_session import BaoStockLoginError, get_baostock_session
+
 from .base import DataSourceAdapter
 
 logger = logging.getLogger(__name__)
@@ -37,20 +39,15 @@ class BaoStockAdapter(DataSourceAdapter):
         if not self.is_available():
             return None
         try:
-            import baostock as bs
-            lg = bs.login()
-            if lg.error_code != '0':
-                logger.error(f"BaoStock: Login failed: {lg.error_msg}")
-                return None
+            #Queries run on the shared, serialized BaoStock session instead of a login per call
+            session = get_baostock_session()
             try:
                 logger.info("BaoStock: Querying stock basic info...")
-                rs = bs.query_stock_basic()
-                if rs.error_code != '0':
+                rs = session.query("query_stock_basic")
+                if not rs.ok:
                     logger.error(f"BaoStock: Query failed: {rs.error_msg}")
                     return None
-                data_list = []
-                while (rs.error_code == '0') & rs.next():
-                    data_list.append(rs.get_row_data())
+                data_list = rs.rows
                 if not data_list:
                     return None
 
@@ -100,11 +97,9 @@ class BaoStockAdapter(DataSourceAdapter):
 
                 #Access to industry information
                 logger.info("BaoStock: Querying stock industry info...")
-                industry_rs = bs.query_stock_industry()
-                if industry_rs.error_code == '0':
-                    industry_list = []
-                    while (industry_rs.error_code == '0') & industry_rs.next():
-                        industry_list.append(industry_rs.get_row_data())
+                industry_rs = session.query("query_stock_industry")
+                if industry_rs.ok:
+                    industry_list = industry_rs.rows
                     if industry_list:
                         industry_df = pd.DataFrame(industry_list, columns=industry_rs.fields)
 
@@ -135,8 +130,9 @@ class BaoStockAdapter(DataSourceAdapter):
                 df['list_date'] = ''
                 logger.info(f"BaoStock: Successfully fetched {len(df)} stocks")
                 return df[['symbol', 'name', 'ts_code', 'area', 'industry', 'market', 'list_date']]
-            finally:
-                bs.logout()
+            except BaoStockLoginError as e:
+                logger.error(f"BaoStock: Login failed: {e}")
+                return None
         except Exception as e:
             logger.error(f"BaoStock: Failed to fetch stock list: {e}")
             return None
@@ -151,21 +147,15 @@ class BaoStockAdapter(DataSourceAdapter):
         if not self.is_available():
             return None
         try:
-            import baostock as bs
             logger.info(f"BaoStock: Attempting to get valuation data for {trade_date}")
-            lg = bs.login()
-            if lg.error_code != '0':
-                logger.error(f"BaoStock: Login failed: {lg.error_msg}")
-                return None
+            session = get_baostock_session()
             try:
                 logger.info("BaoStock: Querying stock basic info...")
-                rs = bs.query_stock_basic()
-                if rs.error_code != '0':
+                rs = session.query("query_stock_basic")
+                if not rs.ok:
                     logger.error(f"BaoStock: Query stock list failed: {rs.error_msg}")
                     return None
-                stock_list = []
-                while (rs.error_code == '0') & rs.next():
-                    stock_list.append(rs.get_row_data())
+                stock_list = rs.rows
                 if not stock_list:
                     logger.warning("BaoStock: No stocks found")
                     return None
@@ -187,18 +177,17 @@ class BaoStockAdapter(DataSourceAdapter):
                         try:
                             formatted_date = f"{trade_date[:4]}-{trade_date[4:6]}-{trade_date[6:8]}"
                             #🔥 Access to valuation data and gross equity
-                            rs_valuation = bs.query_history_k_data_plus(
-                                code,
-                                "date,code,close,peTTM,pbMRQ,psTTM,pcfNcfTTM,isST",
+                            rs_valuation = session.query(
+                                "query_history_k_data_plus",
+                                code=code,
+                                fields="date,code,close,peTTM,pbMRQ,psTTM,pcfNcfTTM,isST",
                                 start_date=formatted_date,
                                 end_date=formatted_date,
                                 frequency="d",
                                 adjustflag="3",
                             )
-                            if rs_valuation.error_code == '0':
-                                valuation_data = []
-                                while (rs_valuation.error_code == '0') & rs_valuation.next():
-                                    valuation_data.append(rs_valuation.get_row_data())
+                            if rs_valuation.ok:
+                                valuation_data = rs_valuation.rows
                                 if valuation_data:
                                     row = valuation_data[0]
                                     symbol = code.replace('sh.', '').replace('sz.', '')
@@ -249,8 +238,9 @@ class BaoStockAdapter(DataSourceAdapter):
                 else:
                     logger.warning(f"BaoStock: No valuation data obtained (failed){failed_count}Only)")
                     return None
-            finally:
-                bs.logout()
+            except BaoStockLoginError as e:
+                logger.error(f"BaoStock: Login failed: {e}")
+                return None
         except Exception as e:
             logger.error(f"BaoStock: Failed to fetch valuation data for {trade_date}: {e}")
             return None
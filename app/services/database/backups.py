@@ -3,14 +3,16 @@ Backup, import, and export routines extracted from DatabaseService.
 """
 from __future__ import annotations
 
+import io
 import json
 import os
 import gzip
 import asyncio
 import subprocess
 import shutil
+import tempfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 import logging
 
 from bson import ObjectId
@@ -133,46 +135,119 @@ async def create_backup_native(name: str, backup_dir: str, collections: Optional
     }
 
 
-async def create_backup(name: str, backup_dir: str, collections: Optional[List[str]] = None, user_id: str | None = None) -> Dict[str, Any]:
-    """Create database backup (Python achieved, compatible but slow)
+#Header line that starts every collection member of a streaming (NDJSON) backup
+BACKUP_COLLECTION_HEADER = "__backup_collection__"
+#Documents buffered before each write / insert
+STREAM_BATCH_SIZE = 1000
 
-    For large data volume (>100MB), it is recommended to use file backup native() method
+
+def _dumps_line(doc: dict) -> str:
+    return json.dumps(serialize_document(doc), ensure_ascii=False, default=str)
+
+
+async def _dump_collection_ndjson(db, collection_name: str, part_path: str, query: Dict[str, Any]) -> int:
+    """Stream one collection into its own gzip member (header line + one document per line)"""
+    f = await asyncio.to_thread(gzip.open, part_path, "wt", encoding="utf-8")
+    count = 0
+    try:
+        header = json.dumps({BACKUP_COLLECTION_HEADER: collection_name})
+        lines: List[str] = [header]
+        async for doc in db[collection_name].find(query, batch_size=STREAM_BATCH_SIZE):
+            lines.append(_dumps_line(doc))
+            count += 1
+            if len(lines) >= STREAM_BATCH_SIZE:
+                await asyncio.to_thread(f.write, "\n".join(lines) + "\n")
+                lines = []
+        if lines:
+            await asyncio.to_thread(f.write, "\n".join(lines) + "\n")
+    finally:
+        await asyncio.to_thread(f.close)
+    return count
+
+
+def _concat_parts(part_paths: List[str], backup_path: str) -> int:
+    """Concatenate gzip members into the final backup file"""
+    with open(backup_path, "wb") as out:
+        for part_path in part_paths:
+            with open(part_path, "rb") as part:
+                shutil.copyfileobj(part, out, 1024 * 1024)
+            os.remove(part_path)
+    return os.path.getsize(backup_path)
+
+
+async def create_backup(
+    name: str,
+    backup_dir: str,
+    collections: Optional[List[str]] = None,
+    user_id: str | None = None,
+    *,
+    incremental: bool = False,
+    since: Optional[datetime] = None,
+    concurrency: int = 4,
+) -> Dict[str, Any]:
+    """Create database backup (Python achieved, streaming NDJSON)
+
+    Each collection is written as one gzip member of ``.ndjson.gz`` while its cursor is
+    iterated, so memory use does not depend on the database size. Up to ``concurrency``
+    collections are backed up in parallel into part files that are concatenated at the end
+    (a gzip file may consist of several members, readers see one continuous stream).
+
+    Incremental backups only contain documents whose ``updated_at`` is newer than ``since``
+    (by default the start time of the latest streaming backup). Collections without an
+    ``updated_at`` field contribute no documents to an incremental backup.
     """
     db = get_mongo_db_async()
 
     backup_id = str(ObjectId())
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    backup_filename = f"backup_{name}_{timestamp}.json.gz"
+    started_at = datetime.utcnow()
+    timestamp = started_at.strftime("%Y%m%d_%H%M%S")
+    backup_filename = f"backup_{name}_{timestamp}.ndjson.gz"
     backup_path = os.path.join(backup_dir, backup_filename)
 
     if not collections:
         collections = await db.list_collection_names()
+        collections = [c for c in collections if not c.startswith("system.")]
 
-    backup_data: Dict[str, Any] = {
-        "backup_id": backup_id,
-        "name": name,
-        "created_at": datetime.utcnow().isoformat(),
-        "created_by": user_id,
-        "collections": collections,
-        "data": {},
-    }
+    base_backup_id = None
+    if incremental and since is None:
+        last_backup = await db.database_backups.find_one(
+            {"backup_type": "streaming"}, sort=[("created_at", -1)]
+        )
+        if last_backup:
+            since = last_backup["created_at"]
+            base_backup_id = str(last_backup["_id"])
+        else:
+            logger.info("No previous streaming backup, incremental backup falls back to a full backup")
 
-    for collection_name in collections:
-        collection = db[collection_name]
-        documents: List[dict] = []
-        async for doc in collection.find():
-            documents.append(serialize_document(doc))
-        backup_data["data"][collection_name] = documents
+    query: Dict[str, Any] = {"updated_at": {"$gt": since}} if since else {}
 
     os.makedirs(backup_dir, exist_ok=True)
 
-    #Use asyncio.to theread to put the blocking I/O operation in the thread pool
-    def _write_backup():
-        with gzip.open(backup_path, "wt", encoding="utf-8") as f:
-            json.dump(backup_data, f, ensure_ascii=False, indent=2)
-        return os.path.getsize(backup_path)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _backup_one(index: int, collection_name: str):
+        async with semaphore:
+            part_path = f"{backup_path}.part{index}"
+            count = await _dump_collection_ndjson(db, collection_name, part_path, query)
+            logger.info(f"Backup set{collection_name}：{count}a document")
+            return part_path, count
+
+    try:
+        results = await asyncio.gather(*[
+            _backup_one(i, collection_name) for i, collection_name in enumerate(collections)
+        ])
+        file_size = await asyncio.to_thread(_concat_parts, [part for part, _ in results], backup_path)
+    except Exception:
+        #Clear failed backup parts
+        for i in range(len(collections)):
+            part_path = f"{backup_path}.part{i}"
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        raise
 
-    file_size = await asyncio.to_thread(_write_backup)
+    document_counts = {collection_name: count for collection_name, (_, count) in zip(collections, results)}
 
     backup_meta = {
         "_id": ObjectId(backup_id),
@@ -181,8 +256,14 @@ async def create_backup(name: str, backup_dir: str, collections: Optional[List[s
         "file_path": backup_path,
         "size": file_size,
         "collections": collections,
-        "created_at": datetime.utcnow(),
+        "document_counts": document_counts,
+        #Start time, so the next incremental backup also covers writes made during this one
+        "created_at": started_at,
         "created_by": user_id,
+        "backup_type": "streaming",
+        "incremental": since is not None,
+        "since": since,
+        "base_backup_id": base_backup_id,
     }
 
     await db.database_backups.insert_one(backup_meta)
@@ -194,7 +275,11 @@ async def create_backup(name: str, backup_dir: str, collections: Optional[List[s
         "file_path": backup_path,
         "size": file_size,
         "collections": collections,
+        "document_counts": document_counts,
         "created_at": backup_meta["created_at"].isoformat(),
+        "backup_type": "streaming",
+        "incremental": since is not None,
+        "since": since.isoformat() if since else None,
     }
 
 
@@ -210,6 +295,8 @@ async def list_backups() -> List[Dict[str, Any]]:
             "collections": backup["collections"],
             "created_at": backup["created_at"].isoformat(),
             "created_by": backup.get("created_by"),
+            "backup_type": backup.get("backup_type", "python"),
+            "incremental": backup.get("incremental", False),
         })
     return backups
 
@@ -259,19 +346,177 @@ def _convert_date_fields(doc: dict) -> dict:
     return doc
 
 
-async def import_data(content: bytes, collection: str, *, format: str = "json", overwrite: bool = False, filename: str | None = None) -> Dict[str, Any]:
+def _prepare_import_document(doc: dict) -> dict:
+    """Restore _id and date fields of a serialized document"""
+    if "_id" in doc and isinstance(doc["_id"], str):
+        try:
+            doc["_id"] = ObjectId(doc["_id"])
+        except Exception:
+            del doc["_id"]
+    return _convert_date_fields(doc)
+
+
+#Longest first line read to tell NDJSON from a JSON document
+_SNIFF_LINE_BYTES = 1024 * 1024
+
+
+def _open_upload(content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Seekable binary file that io.TextIOWrapper and gzip.GzipFile accept
+
+    Before Python 3.11 the SpooledTemporaryFile behind FastAPI uploads is not an
+    io.IOBase (no ``readable``), so it is spooled into a real temporary file first.
+    """
+    if isinstance(content, (bytes, bytearray)):
+        return io.BytesIO(content)
+    content.seek(0)
+    if isinstance(content, io.IOBase):
+        return content
+    spooled = tempfile.TemporaryFile()
+    shutil.copyfileobj(content, spooled, 1024 * 1024)
+    spooled.seek(0)
+    return spooled
+
+
+def _decompressed(fileobj: BinaryIO) -> BinaryIO:
+    """The upload from its start, gunzipped when it is gzip-compressed"""
+    fileobj.seek(0)
+    head = fileobj.read(2)
+    fileobj.seek(0)
+    return gzip.GzipFile(fileobj=fileobj, mode="rb") if head == b"\x1f\x8b" else fileobj
+
+
+def _is_ndjson_upload(fileobj: BinaryIO, filename: str | None) -> bool:
+    """Whether the upload is NDJSON (streaming backup or JSON Lines) rather than one JSON document
+
+    Plain files are recognised by name. Gzip files are decompressed first: a streaming
+    backup starts with a complete JSON object on its first line, whereas a compressed
+    JSON export starts with ``[`` or with an object spanning several lines.
+    """
+    name = (filename or "").lower()
+    stream = _decompressed(fileobj)
+    try:
+        if stream is fileobj:
+            return name.endswith((".ndjson", ".jsonl"))
+        line = b""
+        while not line.strip():
+            line = stream.readline(_SNIFF_LINE_BYTES)
+            if not line:
+                return False
+        line = line.strip()
+        if not line.startswith(b"{"):
+            return False
+        try:
+            return isinstance(json.loads(line), dict)
+        except ValueError:
+            return False
+    finally:
+        fileobj.seek(0)
+
+
+def _read_lines(stream, limit: int) -> List[str]:
+    lines: List[str] = []
+    for line in stream:
+        lines.append(line)
+        if len(lines) >= limit:
+            break
+    return lines
+
+
+async def _import_ndjson_stream(fileobj, collection: str, *, overwrite: bool, filename: str | None, format: str) -> Dict[str, Any]:
+    """Import an NDJSON stream (streaming backup or JSON Lines file) in batches
+
+    Header lines switch the target collection; documents before any header go to
+    ``collection``. Documents with an _id are upserted, so restoring a full backup
+    followed by its incremental backups yields the latest state.
+    """
+    from pymongo import InsertOne, ReplaceOne
+
+    db = get_mongo_db_async()
+
+    stream = io.TextIOWrapper(_decompressed(fileobj), encoding="utf-8")
+
+    counts: Dict[str, int] = {}
+    cleared: set = set()
+    current = collection
+    ops: List[Any] = []
+
+    async def _flush():
+        nonlocal ops
+        if not ops:
+            return
+        if overwrite and current not in cleared:
+            deleted = await db[current].delete_many({})
+            cleared.add(current)
+            logger.info(f"All right.{current}: Delete{deleted.deleted_count}a document")
+        res = await db[current].bulk_write(ops, ordered=False)
+        counts[current] = counts.get(current, 0) + res.inserted_count + res.upserted_count + res.modified_count
+        ops = []
+
+    while True:
+        lines = await asyncio.to_thread(_read_lines, stream, STREAM_BATCH_SIZE)
+        if not lines:
+            break
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            doc = json.loads(line)
+            if isinstance(doc, dict) and BACKUP_COLLECTION_HEADER in doc:
+                await _flush()
+                current = doc[BACKUP_COLLECTION_HEADER]
+                counts.setdefault(current, 0)
+                continue
+
+            doc = _prepare_import_document(doc)
+            if "_id" in doc:
+                ops.append(ReplaceOne({"_id": doc["_id"]}, doc, upsert=True))
+            else:
+                ops.append(InsertOne(doc))
+        await _flush()
+
+    for coll_name, count in counts.items():
+        logger.info(f"Import set{coll_name}：{count}a document")
+
+    return {
+        "mode": "stream",
+        "collections": list(counts),
+        "total_collections": len(counts),
+        "total_inserted": sum(counts.values()),
+        "filename": filename,
+        "format": format,
+        "overwrite": overwrite,
+    }
+
+
+async def import_data(content: Union[bytes, BinaryIO], collection: str, *, format: str = "json", overwrite: bool = False, filename: str | None = None) -> Dict[str, Any]:
     """Import Data to Database
 
     Two import modes are supported:
     Single-pool mode: Import data to specified pool
     Multi-pool mode: Import export files containing multiple pools (automated detection)
+
+    ``content`` may be bytes or a seekable binary file, optionally gzip-compressed.
+    Streaming backups (gzip NDJSON) and JSON Lines files are imported in batches
+    without loading the whole file.
     """
+    fileobj = await asyncio.to_thread(_open_upload, content)
+    try:
+        return await _import_upload(fileobj, collection, format=format, overwrite=overwrite, filename=filename)
+    finally:
+        if fileobj is not content and not isinstance(content, (bytes, bytearray)):
+            fileobj.close()
+
+
+async def _import_upload(fileobj: BinaryIO, collection: str, *, format: str, overwrite: bool, filename: str | None) -> Dict[str, Any]:
     db = get_mongo_db_async()
 
+    if await asyncio.to_thread(_is_ndjson_upload, fileobj, filename):
+        return await _import_ndjson_stream(fileobj, collection, overwrite=overwrite, filename=filename, format=format)
+
     if format.lower() == "json":
         #Use asyncio.to thread to place the blocked JSON resolution in the thread pool for execution
         def _parse_json():
-            return json.loads(content.decode("utf-8"))
+            return json.load(io.TextIOWrapper(_decompressed(fileobj), encoding="utf-8"))
 
         data = await asyncio.to_thread(_parse_json)
     else:
@@ -319,17 +564,9 @@ async def import_data(content: bytes, collection: str, *, format: str = "json",
                 deleted_count = await collection_obj.delete_many({})
                 logger.info(f"All right.{coll_name}: Delete{deleted_count.deleted_count}a document")
 
-            #Process  id fields and date fields
+            #Process  id fields and date fields (string - > datetime)
             for doc in documents:
-                #Convert  id
-                if "_id" in doc and isinstance(doc["_id"], str):
-                    try:
-                        doc["_id"] = ObjectId(doc["_id"])
-                    except Exception:
-                        del doc["_id"]
-
-                #🔥 Convert date fields (string - > datetime)
-                _convert_date_fields(doc)
+                _prepare_import_document(doc)
 
             #Insert Data
             if documents:
@@ -370,15 +607,8 @@ async def import_data(content: bytes, collection: str, *, format: str = "json",
             logger.info(f"All right.{collection}: Delete{deleted_count.deleted_count}a document")
 
         for doc in data:
-            #Convert  id
-            if "_id" in doc and isinstance(doc["_id"], str):
-                try:
-                    doc["_id"] = ObjectId(doc["_id"])
-                except Exception:
-                    del doc["_id"]
-
-            #🔥 Convert date fields (string - > datetime)
-            _convert_date_fields(doc)
+            #Process  id fields and date fields (string - > datetime)
+            _prepare_import_document(doc)
 
         inserted_count = 0
         if data:
@@ -440,6 +670,43 @@ def _sanitize_document(doc: Any) -> Any:
         return doc
 
 
+async def _iter_export_documents(db, collection_name: str, sanitize: bool):
+    """Yield serialized (and optionally sanitized) documents of a collection"""
+    #users group to export only empty arrays in desensitization mode (maintain structure, do not export actual user data)
+    if sanitize and collection_name == "users":
+        return
+    async for doc in db[collection_name].find(batch_size=STREAM_BATCH_SIZE):
+        doc = serialize_document(doc)
+        #If dissensitivity is enabled, clear all sensitive fields
+        yield _sanitize_document(doc) if sanitize else doc
+
+
+async def _export_json_streaming(db, collections: List[str], file_path: str, format: str, sanitize: bool) -> None:
+    """Write the multi-collection export JSON incrementally (same structure import_data reads)"""
+    export_info = {
+        "created_at": datetime.utcnow().isoformat(),
+        "collections": collections,
+        "format": format,
+    }
+    f = await asyncio.to_thread(open, file_path, "w", encoding="utf-8")
+    try:
+        await asyncio.to_thread(f.write, '{"export_info": ' + json.dumps(export_info, ensure_ascii=False) + ', "data": {')
+        for i, collection_name in enumerate(collections):
+            chunks: List[str] = [("," if i else "") + json.dumps(collection_name, ensure_ascii=False) + ": ["]
+            first = True
+            async for doc in _iter_export_documents(db, collection_name, sanitize):
+                chunks.append(("" if first else ",") + json.dumps(doc, ensure_ascii=False, default=str))
+                first = False
+                if len(chunks) >= STREAM_BATCH_SIZE:
+                    await asyncio.to_thread(f.write, "\n".join(chunks))
+                    chunks = []
+            chunks.append("]")
+            await asyncio.to_thread(f.write, "\n".join(chunks))
+        await asyncio.to_thread(f.write, "}}")
+    finally:
+        await asyncio.to_thread(f.close)
+
+
 async def export_data(collections: Optional[List[str]] = None, *, export_dir: str, format: str = "json", sanitize: bool = False) -> str:
     import pandas as pd
 
@@ -454,79 +721,80 @@ async def export_data(collections: Optional[List[str]] = None, *, export_dir: st
 
     os.makedirs(export_dir, exist_ok=True)
 
-    all_data: Dict[str, List[dict]] = {}
-    for collection_name in collections:
-        collection = db[collection_name]
-        docs: List[dict] = []
-
-        #users group to export only empty arrays in desensitization mode (maintain structure, do not export actual user data)
-        if sanitize and collection_name == "users":
-            all_data[collection_name] = []
-            continue
-
-        #🔥Diverse Query Results
-        async for doc in collection.find():
-            docs.append(serialize_document(doc))
-        all_data[collection_name] = docs
-
-    #If dissensitivity is enabled, clear all sensitive fields
-    if sanitize:
-        all_data = _sanitize_document(all_data)
-
     if format.lower() == "json":
+        #Streamed: documents are written as the cursors are iterated
         filename = f"export_{timestamp}.json"
         file_path = os.path.join(export_dir, filename)
-        export_data_dict = {
-            "export_info": {
-                "created_at": datetime.utcnow().isoformat(),
-                "collections": collections,
-                "format": format,
-            },
-            "data": all_data,
-        }
-
-        #Use asyncio.to theread to put the blocking I/O operation in the thread pool
-        def _write_json():
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data_dict, f, ensure_ascii=False, indent=2)
-
-        await asyncio.to_thread(_write_json)
+        await _export_json_streaming(db, collections, file_path, format, sanitize)
         return file_path
 
     if format.lower() == "csv":
+        #Rows are appended per collection; the header is the union of the columns seen so far
         filename = f"export_{timestamp}.csv"
         file_path = os.path.join(export_dir, filename)
-        rows: List[dict] = []
-        for collection_name, documents in all_data.items():
-            for doc in documents:
-                row = {**doc}
-                row["_collection"] = collection_name
-                rows.append(row)
-
-        #Use asyncio.to theread to put the blocking I/O operation in the thread pool
-        def _write_csv():
-            if rows:
-                pd.DataFrame(rows).to_csv(file_path, index=False, encoding="utf-8-sig")
-            else:
-                pd.DataFrame().to_csv(file_path, index=False, encoding="utf-8-sig")
-
-        await asyncio.to_thread(_write_csv)
+        columns: List[str] = []
+        part_path = f"{file_path}.rows"
+
+        with open(part_path, "w", encoding="utf-8", newline="") as rows_file:
+            for collection_name in collections:
+                batch: List[dict] = []
+                async for doc in _iter_export_documents(db, collection_name, sanitize):
+                    batch.append({**doc, "_collection": collection_name})
+                    if len(batch) >= STREAM_BATCH_SIZE:
+                        columns = await asyncio.to_thread(_append_csv_rows, rows_file, batch, columns)
+                        batch = []
+                if batch:
+                    columns = await asyncio.to_thread(_append_csv_rows, rows_file, batch, columns)
+
+        await asyncio.to_thread(_finalize_csv, part_path, file_path, columns)
         return file_path
 
     if format.lower() in ["xlsx", "excel"]:
+        #Excel workbooks are built in memory by openpyxl, one collection at a time
         filename = f"export_{timestamp}.xlsx"
         file_path = os.path.join(export_dir, filename)
 
-        #Use asyncio.to theread to put the blocking I/O operation in the thread pool
-        def _write_excel():
-            with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                for collection_name, documents in all_data.items():
-                    df = pd.DataFrame(documents) if documents else pd.DataFrame()
-                    sheet = collection_name[:31]
-                    df.to_excel(writer, sheet_name=sheet, index=False)
-
-        await asyncio.to_thread(_write_excel)
+        writer = pd.ExcelWriter(file_path, engine="openpyxl")
+        try:
+            for collection_name in collections:
+                documents = [doc async for doc in _iter_export_documents(db, collection_name, sanitize)]
+                df = pd.DataFrame(documents) if documents else pd.DataFrame()
+                sheet = collection_name[:31]
+                await asyncio.to_thread(df.to_excel, writer, sheet_name=sheet, index=False)
+        finally:
+            await asyncio.to_thread(writer.close)
         return file_path
 
     raise Exception(f"不支持的导出格式: {format}")
 
+
+def _append_csv_rows(rows_file, batch: List[dict], columns: List[str]) -> List[str]:
+    """Append rows as JSON lines and extend the known column list"""
+    known = set(columns)
+    for row in batch:
+        for key in row:
+            if key not in known:
+                known.add(key)
+                columns.append(key)
+        rows_file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+    return columns
+
+
+def _finalize_csv(part_path: str, file_path: str, columns: List[str]) -> None:
+    """Convert the buffered rows into the final CSV once all columns are known"""
+    import csv
+
+    try:
+        with open(part_path, "r", encoding="utf-8") as rows_file, \
+                open(file_path, "w", encoding="utf-8-sig", newline="") as out:
+            writer = csv.DictWriter(out, fieldnames=columns, extrasaction="ignore")
+            if columns:
+                writer.writeheader()
+            for line in rows_file:
+                row = json.loads(line)
+                writer.writerow({
+                    k: json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list)) else v
+                    for k, v in row.items()
+                })
+    finally:
+        os.remove(part_path)
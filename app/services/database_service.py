@@ -8,7 +8,7 @@ import gzip
 import shutil
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 from bson import ObjectId
 import motor.motor_asyncio
 import redis.asyncio as redis
@@ -120,14 +120,15 @@ class DatabaseService:
         """Test Redis connection (commissioned submodule)"""
         return await _db_status.test_redis_connection()
 
-    async def create_backup(self, name: str, collections: List[str] = None, user_id: str = None) -> Dict[str, Any]:
+    async def create_backup(self, name: str, collections: List[str] = None, user_id: str = None,
+                            incremental: bool = False) -> Dict[str, Any]:
         """Create database backup (auto-select best method)
 
         - If mongodump is available, use original backup (quick)
-        - Otherwise use Python.
+        - Otherwise, or for incremental backups, use the streaming Python backup.
         """
         #Check if mongodump is available
-        if _db_backups._check_mongodump_available():
+        if not incremental and _db_backups._check_mongodump_available():
             logger.info("✅ with original backup from mongodump (recommended)")
             return await _db_backups.create_backup_native(
                 name=name,
@@ -136,13 +137,14 @@ class DatabaseService:
                 user_id=user_id
             )
         else:
-            logger.warning("⚠️mongodump is not available, using Python backup (slower)")
-            logger.warning("Suggested installation of MongoDB Data Tools to obtain faster backup speed")
+            if not incremental:
+                logger.warning("⚠️mongodump is not available, using streaming Python backup")
             return await _db_backups.create_backup(
                 name=name,
                 backup_dir=self.backup_dir,
                 collections=collections,
-                user_id=user_id
+                user_id=user_id,
+                incremental=incremental
             )
 
     async def list_backups(self) -> List[Dict[str, Any]]:
@@ -165,7 +167,7 @@ class DatabaseService:
         """Clear Operations Log (commissioned submodule)"""
         return await _db_cleanup.cleanup_operation_logs(days)
 
-    async def import_data(self, content: bytes, collection: str, format: str = "json",
+    async def import_data(self, content: Union[bytes, BinaryIO], collection: str, format: str = "json",
                          overwrite: bool = False, filename: str = None) -> Dict[str, Any]:
         """Import data (commissioned submodule)"""
         return await _db_backups.import_data(content, collection, format=format, overwrite=overwrite, filename=filename)
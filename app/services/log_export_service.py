@@ -2,18 +2,170 @@
 Provide query, filter and export functions for log files
 """
 
+import bisect
 import logging
 import os
+import shutil
+import threading
 import zipfile
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 import re
 import json
 
 logger = logging.getLogger("webapi")
 
 
+#Log lines start with "YYYY-MM-DD HH:MM:SS"
+_LOG_TIME_RE = re.compile(rb'(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})')
+_TAIL_BLOCK_SIZE = 64 * 1024
+_COUNT_CHUNK_SIZE = 1024 * 1024
+
+
+def _normalize_time(value: Optional[str]) -> Optional[str]:
+    """Normalize ISO / log timestamps to the comparable "YYYY-MM-DD HH:MM:SS" form"""
+    if not value:
+        return None
+    return value.strip().replace("T", " ")[:19]
+
+
+def _line_time(line: bytes) -> Optional[str]:
+    match = _LOG_TIME_RE.search(line, 0, 64)
+    if not match:
+        return None
+    return match.group(1).decode("ascii").replace("T", " ")
+
+
+def tail_lines(file_path: Path, lines: int) -> List[str]:
+    """Return the last ``lines`` lines by reading blocks backwards from the end of the file"""
+    if lines <= 0:
+        return []
+
+    with open(file_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buffer = b""
+        #One extra newline is needed to make sure the first returned line is complete
+        while pos > 0 and buffer.count(b"\n") <= lines:
+            read_size = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            buffer = f.read(read_size) + buffer
+
+    result = buffer.splitlines()
+    if pos > 0:
+        result = result[1:]
+    return [line.decode("utf-8", errors="ignore") for line in result[-lines:]]
+
+
+class LogFileIndex:
+    """Sparse timestamp -> byte offset index of one log file
+
+    A checkpoint (first timestamp at or after every ``interval`` bytes) is recorded so
+    time range queries can binary search to a nearby offset instead of scanning the
+    whole file. The index is extended incrementally as the file grows and rebuilt when
+    the file is rotated or truncated. The total line count is maintained alongside.
+    """
+
+    def __init__(self, file_path: Path, interval: int = 256 * 1024):
+        self.file_path = file_path
+        self.interval = interval
+        self.times: List[str] = []
+        self.offsets: List[int] = []
+        self.size = 0
+        self.line_count = 0
+        self.inode = None
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self.times = []
+        self.offsets = []
+        self.size = 0
+        self.line_count = 0
+
+    def _probe(self, f, pos: int, limit: int):
+        """Find the first timestamped line starting at or after pos"""
+        if pos > 0:
+            f.seek(pos - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        else:
+            f.seek(0)
+
+        for _ in range(200):
+            offset = f.tell()
+            if offset >= limit:
+                return None
+            line = f.readline()
+            if not line:
+                return None
+            ts = _line_time(line)
+            if ts:
+                return ts, offset
+        return None
+
+    def refresh(self) -> "LogFileIndex":
+        with self._lock:
+            stat = self.file_path.stat()
+            if stat.st_ino != self.inode or stat.st_size < self.size:
+                self._reset()
+                self.inode = stat.st_ino
+
+            if stat.st_size == self.size:
+                return self
+
+            with open(self.file_path, "rb") as f:
+                f.seek(self.size)
+                remaining = stat.st_size - self.size
+                while remaining > 0:
+                    chunk = f.read(min(_COUNT_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.line_count += chunk.count(b"\n")
+                    remaining -= len(chunk)
+
+                next_pos = self.offsets[-1] + self.interval if self.offsets else 0
+                while next_pos < stat.st_size:
+                    entry = self._probe(f, next_pos, stat.st_size)
+                    if entry is None:
+                        break
+                    ts, offset = entry
+                    #Keep the checkpoints sorted so they can be bisected
+                    if not self.times or ts >= self.times[-1]:
+                        self.times.append(ts)
+                        self.offsets.append(offset)
+                    next_pos = offset + self.interval
+
+            self.size = stat.st_size
+            return self
+
+    def seek_offset(self, start_time: Optional[str]) -> int:
+        """Offset of a checkpoint at or before the first line with time >= start_time"""
+        if not start_time or not self.times:
+            return 0
+        i = bisect.bisect_left(self.times, start_time) - 1
+        return self.offsets[i] if i >= 0 else 0
+
+    def iter_range(self, start_time: Optional[str], end_time: Optional[str]) -> Iterator[str]:
+        """Yield lines within [start_time, end_time]; continuation lines inherit the last timestamp"""
+        offset = self.seek_offset(start_time)
+        current_time = None
+        with open(self.file_path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                ts = _line_time(raw)
+                if ts:
+                    current_time = ts
+                if current_time is not None:
+                    if start_time and current_time < start_time:
+                        continue
+                    if end_time and current_time > end_time:
+                        break
+                yield raw.decode("utf-8", errors="ignore").rstrip("\r\n")
+
+
 class LogExportService:
     """Log Export Service"""
 
@@ -24,6 +176,8 @@ class LogExportService:
             log dir: logfile directory
         """
         self.log_dir = Path(log_dir)
+        self._indexes: Dict[str, LogFileIndex] = {}
+        self._indexes_lock = threading.Lock()
         logger.info(f"[LogExport Service] Initialization log export service")
         logger.info(f"[LogExportService]{log_dir}")
         logger.info(f"[LogExport Service]{self.log_dir}")
@@ -144,31 +298,38 @@ class LogExportService:
             Log contents and statistical information
         """
         file_path = self.log_dir / filename
-        
+
         if not file_path.exists():
             raise FileNotFoundError(f"日志文件不存在: {filename}")
-        
+
         try:
-            #Read File Contents
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-            
-            #Read specified lines from end
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            
-            #Apply Filter
-            filtered_lines = []
+            index = self.get_file_index(file_path)
+            start_time = _normalize_time(start_time)
+            end_time = _normalize_time(end_time)
+
+            if start_time or end_time:
+                #Seek to the time range through the index, keep the last N matching lines
+                candidate_lines = self._filter_lines(
+                    index.iter_range(start_time, end_time), level=level, keyword=keyword
+                )
+                recent_lines = list(deque(candidate_lines, maxlen=lines))
+                filtered_lines = recent_lines
+            else:
+                #Read specified lines from end
+                recent_lines = tail_lines(file_path, lines)
+                filtered_lines = list(self._filter_lines(recent_lines, level=level, keyword=keyword))
+
             stats = {
-                "total_lines": len(all_lines),
-                "filtered_lines": 0,
+                "total_lines": index.line_count,
+                "filtered_lines": len(filtered_lines),
                 "error_count": 0,
                 "warning_count": 0,
                 "info_count": 0,
                 "debug_count": 0
             }
-            
+
+            #Statistical log level
             for line in recent_lines:
-                #Statistical log level
                 if "ERROR" in line:
                     stats["error_count"] += 1
                 elif "WARNING" in line:
@@ -177,38 +338,51 @@ class LogExportService:
                     stats["info_count"] += 1
                 elif "DEBUG" in line:
                     stats["debug_count"] += 1
-                
-                #Apply filter conditions
-                if level and level.upper() not in line:
-                    continue
-                
-                if keyword and keyword.lower() not in line.lower():
-                    continue
-                
-                #Time filter (simply achieved, assuming log format YYY-MM-DD HH:MM:SS)
-                if start_time or end_time:
-                    time_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-                    if time_match:
-                        log_time = time_match.group()
-                        if start_time and log_time < start_time:
-                            continue
-                        if end_time and log_time > end_time:
-                            continue
-                
-                filtered_lines.append(line.rstrip())
-            
-            stats["filtered_lines"] = len(filtered_lines)
-            
+
             return {
                 "filename": filename,
-                "lines": filtered_lines,
+                "lines": [line.rstrip() for line in filtered_lines],
                 "stats": stats
             }
-            
+
         except Exception as e:
             logger.error(f"Could not close temporary folder: %s{e}")
             raise
 
+    def get_file_index(self, file_path: Path) -> LogFileIndex:
+        """Get (and incrementally refresh) the timestamp index of a log file"""
+        key = str(file_path.resolve())
+        with self._indexes_lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = LogFileIndex(file_path)
+                self._indexes[key] = index
+        return index.refresh()
+
+    @staticmethod
+    def _filter_lines(lines, level: Optional[str] = None, keyword: Optional[str] = None) -> Iterator[str]:
+        """Apply level / keyword filter conditions lazily"""
+        level_upper = level.upper() if level else None
+        keyword_lower = keyword.lower() if keyword else None
+        for line in lines:
+            if level_upper and level_upper not in line:
+                continue
+            if keyword_lower and keyword_lower not in line.lower():
+                continue
+            yield line
+
+    def _iter_filtered_file(
+        self,
+        file_path: Path,
+        level: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream all lines of a file matching the filter conditions"""
+        index = self.get_file_index(file_path)
+        lines = index.iter_range(_normalize_time(start_time), _normalize_time(end_time))
+        return self._filter_lines(lines, level=level)
+
     def export_logs(
         self,
         filenames: Optional[List[str]] = None,
@@ -249,27 +423,17 @@ class LogExportService:
             if format == "zip":
                 export_path = export_dir / f"logs_export_{timestamp}.zip"
                 
-                #Create ZIP file
+                #Create ZIP file, filtered contents are streamed straight into the archive
                 with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                     for file_path in files_to_export:
                         #If there are filter conditions, filter and add
                         if level or start_time or end_time:
-                            filtered_data = self.read_log_file(
-                                file_path.name,
-                                lines=999999,  #Read All Lines
-                                level=level,
-                                start_time=start_time,
-                                end_time=end_time
-                            )
-                            #Write filtered contents to temporary files
-                            temp_file = export_dir / f"temp_{file_path.name}"
-                            with open(temp_file, 'w', encoding='utf-8') as f:
-                                f.write('\n'.join(filtered_data['lines']))
-                            zipf.write(temp_file, file_path.name)
-                            temp_file.unlink()  #Remove Temporary File
+                            with zipf.open(file_path.name, 'w', force_zip64=True) as entry:
+                                for line in self._iter_filtered_file(file_path, level, start_time, end_time):
+                                    entry.write((line + '\n').encode('utf-8'))
                         else:
                             zipf.write(file_path, file_path.name)
-                
+
                 logger.info(f"The log has been successfully exported:{export_path}")
                 return str(export_path)
             
@@ -284,17 +448,11 @@ class LogExportService:
                         outf.write(f"{'='*80}\n\n")
                         
                         if level or start_time or end_time:
-                            filtered_data = self.read_log_file(
-                                file_path.name,
-                                lines=999999,
-                                level=level,
-                                start_time=start_time,
-                                end_time=end_time
-                            )
-                            outf.write('\n'.join(filtered_data['lines']))
+                            for line in self._iter_filtered_file(file_path, level, start_time, end_time):
+                                outf.write(line + '\n')
                         else:
                             with open(file_path, 'r', encoding='utf-8', errors='ignore') as inf:
-                                outf.write(inf.read())
+                                shutil.copyfileobj(inf, outf, 1024 * 1024)
                         
                         outf.write('\n\n')
                 
@@ -349,10 +507,8 @@ class LogExportService:
                     stats["error_files"] += 1
                     #Read Recent Errors
                     try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            error_lines = [line for line in lines[-100:] if "ERROR" in line]
-                            stats["recent_errors"].extend(error_lines[-10:])
+                        error_lines = [line for line in tail_lines(file_path, 100) if "ERROR" in line]
+                        stats["recent_errors"].extend(error_lines[-10:])
                     except Exception:
                         pass
             
@@ -10,6 +10,16 @@ from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 from app.core.database import get_database_async
+from tradingagents.dataflows.news.search_index import (
+    NEWS_TEXT_FIELDS,
+    RESULT_PROJECTION,
+    SEARCH_INDEX_KEYS,
+    SEARCH_INDEX_NAME,
+    build_search_fields,
+    keyword_filter,
+    schedule_backfill,
+    search_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +91,7 @@ class NewsDataService:
         self._db = None
         self._collection = None
         self._indexes_ensured = False
+        self._backfill_task = None
 
     async def _ensure_indexes(self):
         """Ensure the necessary index exists"""
@@ -128,7 +139,13 @@ class NewsDataService:
             #10. Update time index (data maintenance)
             await collection.create_index([("updated_at", -1)], name="updated_at_index", background=True)
 
+            #11. CJK-aware search index (bigram postings + symbol/time filters)
+            await collection.create_index(SEARCH_INDEX_KEYS, name=SEARCH_INDEX_NAME, background=True)
+
             self._indexes_ensured = True
+
+            #Postings for news saved before the search index existed (the task is kept so it is not collected)
+            self._backfill_task = schedule_backfill(collection, NEWS_TEXT_FIELDS)
             self.logger.info("News data index check completed")
         except Exception as e:
             #Index creation failure should not prevent service startup
@@ -390,7 +407,9 @@ class NewsDataService:
             "updated_at": now,
             "version": 1
         }
-        
+
+        #Search postings are written with the document, so the search index stays incremental
+        standardized.update(build_search_fields(standardized, NEWS_TEXT_FIELDS))
         return standardized
     
     def _get_full_symbol(self, symbol: str, market: str) -> str:
@@ -502,8 +521,10 @@ class NewsDataService:
                 self.logger.info(f"Add Query Conditions: Data source={params.data_source}")
 
             if params.keywords:
-                #Text Search
-                query["$text"] = {"$search": " ".join(params.keywords)}
+                #Keyword search on the CJK-aware search index
+                condition = keyword_filter(params.keywords)
+                if condition:
+                    query.update(condition)
                 self.logger.info(f"Add query condition: text search={params.keywords}")
 
             self.logger.info(f"Final search condition:{query}")
@@ -513,7 +534,7 @@ class NewsDataService:
             self.logger.info(f"Total records eligible in database:{total_count}")
 
             #Execute queries
-            cursor = collection.find(query)
+            cursor = collection.find(query, RESULT_PROJECTION)
 
             #Sort
             cursor = cursor.sort(params.sort_by, params.sort_order)
@@ -719,20 +740,11 @@ class NewsDataService:
         try:
             collection = self._get_collection()
 
-            #Build query conditions
-            query = {"$text": {"$search": query_text}}
+            #Symbol filter is pushed into the search index scan
+            filters = {"symbol": symbol} if symbol else {}
 
-            if symbol:
-                query["symbol"] = symbol
-
-            #Execute search, sort by relevance
-            cursor = collection.find(
-                query,
-                {"score": {"$meta": "textScore"}}
-            ).sort([("score", {"$meta": "textScore"})])
-
-            cursor = cursor.limit(limit)
-            results = await cursor.to_list(length=None)
+            #Execute search, sort by BM25 relevance
+            results = await search_async(collection, query_text, filters, limit=limit)
 
             #Convert ObjectId to a string to avoid serialization errors in JSON
             results = convert_objectid_to_str(results)
@@ -1,11 +1,15 @@
 """Operation log service
 """
 
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Deque, Dict, Any, List, Optional, Tuple
 from bson import ObjectId
+from pymongo.errors import AutoReconnect
 
+from app.core.config import SETTINGS
 from app.core.database import get_mongo_db_async
 from app.models.operationlog_models import (
     OperationLogCreate,
@@ -26,38 +30,57 @@ class OperationLogService:
     def __init__(self):
         self.collection_name = "operation_logs"
     
-    async def create_log(
+    def build_log_doc(
         self,
         user_id: str,
         username: str,
         log_data: OperationLogCreate,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build Operations Log Document (the _id is assigned client-side so buffered writes still return an id)"""
+        #🔥 With live data (without time zone information), MongoDB will be stored as it is and will not be converted to UTC
+        current_time = now_tz().replace(tzinfo=None)  #Remove time zone information, keep local time values
+        return {
+            "_id": ObjectId(),
+            "user_id": user_id,
+            "username": username,
+            "action_type": log_data.action_type,
+            "action": log_data.action,
+            "details": log_data.details or {},
+            "success": log_data.success,
+            "error_message": log_data.error_message,
+            "duration_ms": log_data.duration_ms,
+            "ip_address": ip_address or log_data.ip_address,
+            "user_agent": user_agent or log_data.user_agent,
+            "session_id": log_data.session_id,
+            "timestamp": current_time,  #give date, MongoDB store as it is
+            "created_at": current_time  #give date, MongoDB store as it is
+        }
+
+    async def create_log(
+        self,
+        user_id: str,
+        username: str,
+        log_data: OperationLogCreate,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        wait: bool = True
     ) -> str:
-        """Create Operations Log"""
+        """Create Operations Log
+
+        With ``wait=False`` the document is handed to the buffered writer and the
+        call returns immediately; the write happens in the next batch.
+        """
         try:
-            db = get_mongo_db_async()
+            log_doc = self.build_log_doc(user_id, username, log_data, ip_address, user_agent)
+
+            if not wait:
+                await get_operation_log_writer().submit(log_doc)
+                return str(log_doc["_id"])
 
-            #Build Log Document
-            #🔥 With live data (without time zone information), MongoDB will be stored as it is and will not be converted to UTC
-            current_time = now_tz().replace(tzinfo=None)  #Remove time zone information, keep local time values
-            log_doc = {
-                "user_id": user_id,
-                "username": username,
-                "action_type": log_data.action_type,
-                "action": log_data.action,
-                "details": log_data.details or {},
-                "success": log_data.success,
-                "error_message": log_data.error_message,
-                "duration_ms": log_data.duration_ms,
-                "ip_address": ip_address or log_data.ip_address,
-                "user_agent": user_agent or log_data.user_agent,
-                "session_id": log_data.session_id,
-                "timestamp": current_time,  #give date, MongoDB store as it is
-                "created_at": current_time  #give date, MongoDB store as it is
-            }
-            
             #Insert Database
+            db = get_mongo_db_async()
             result = await db[self.collection_name].insert_one(log_doc)
             
             logger.info(f"The operation log has been recorded:{username} - {log_data.action}")
@@ -241,8 +264,191 @@ class OperationLogService:
             return None
 
 
+class OperationLogWriter:
+    """Buffered operation log writer
+
+    Collects log documents in a bounded in-memory buffer and writes them with
+    unordered ``insert_many`` once ``batch_size`` documents are pending or every
+    ``flush_interval`` seconds, so request handlers never wait for MongoDB.
+
+    Overflow policies when the buffer is full:
+    - ``drop_oldest``: evict the oldest pending document (default)
+    - ``drop_newest``: reject the incoming document
+    - ``block``: wait up to ``block_timeout`` seconds for space, then reject
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(
+        self,
+        collection_name: str = "operation_logs",
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        overflow_policy: str = "drop_oldest",
+        block_timeout: float = 0.5
+    ):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.collection_name = collection_name
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffer = max(1, max_buffer)
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closing = False
+
+        self.stats = {"submitted": 0, "written": 0, "dropped": 0, "failed_batches": 0}
+
+    def _ensure_started(self) -> None:
+        """Start the flush task on the running loop (restarting it if the loop changed)"""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and self._loop is loop and not self._task.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._task = loop.create_task(self._run())
+
+    async def submit(self, doc: Dict[str, Any]) -> bool:
+        """Queue a document for writing; returns False if it was dropped"""
+        self._ensure_started()
+        self.stats["submitted"] += 1
+
+        if len(self._buffer) >= self.max_buffer:
+            if self.overflow_policy == "drop_oldest":
+                self._buffer.popleft()
+                self._count_dropped(1)
+            elif self.overflow_policy == "block":
+                if not await self._wait_for_space():
+                    self._count_dropped(1)
+                    return False
+            else:
+                self._count_dropped(1)
+                return False
+
+        self._buffer.append(doc)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def _wait_for_space(self) -> bool:
+        deadline = asyncio.get_running_loop().time() + self.block_timeout
+        while len(self._buffer) >= self.max_buffer:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return False
+            self._space.clear()
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._space.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    def _count_dropped(self, count: int) -> None:
+        before = self.stats["dropped"]
+        self.stats["dropped"] += count
+        #Warn on the first drop and then once per 1000 drops to avoid flooding the log
+        if before == 0 or before // 1000 != self.stats["dropped"] // 1000:
+            logger.warning(f"⚠️ Operation log buffer full, {self.stats['dropped']} documents dropped so far")
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Operation log flush failed:{e}")
+
+    async def flush(self) -> int:
+        """Write all pending documents; returns the number written"""
+        if self._flush_lock is None:
+            return 0
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if self._space is not None:
+                    self._space.set()
+                try:
+                    db = get_mongo_db_async()
+                    await db[self.collection_name].insert_many(batch, ordered=False)
+                    written += len(batch)
+                except AutoReconnect as e:
+                    #Database unreachable (includes server selection timeouts): put the batch back
+                    #(within the bound) and retry on the next tick
+                    self.stats["failed_batches"] += 1
+                    logger.error(f"Operation log batch write failed, will retry ({len(batch)} pending):{e}")
+                    if self._closing:
+                        self._count_dropped(len(batch))
+                        break
+                    room = max(self.max_buffer - len(self._buffer), 0)
+                    if room < len(batch):
+                        self._count_dropped(len(batch) - room)
+                    self._buffer.extendleft(reversed(batch[:room]))
+                    break
+                except Exception as e:
+                    #Unordered insert_many reports partial success. _id is set on the client, so duplicate
+                    #key errors mean an earlier attempt of this batch already wrote those documents
+                    inserted = _written_count_from_error(e)
+                    written += inserted
+                    if inserted < len(batch):
+                        self.stats["failed_batches"] += 1
+                        logger.error(f"Operation log batch write failed ({inserted}/{len(batch)} written):{e}")
+                        self._count_dropped(len(batch) - inserted)
+        self.stats["written"] += written
+        return written
+
+    async def stop(self) -> None:
+        """Flush pending documents and stop the background task (called on application shutdown)"""
+        if self._task is None:
+            return
+        self._closing = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        try:
+            await self._task
+        except Exception:
+            pass
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Operation log final flush failed:{e}")
+        if self._buffer:
+            self._count_dropped(len(self._buffer))
+            self._buffer.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "pending": len(self._buffer)}
+
+
+def _written_count_from_error(error: Exception) -> int:
+    """Documents of a failed insert_many that are in the collection (inserted now or by an earlier attempt)"""
+    details = getattr(error, "details", None)
+    if not isinstance(details, dict):
+        return 0
+    duplicates = sum(1 for err in details.get("writeErrors", []) if err.get("code") == 11000)
+    return int(details.get("nInserted", 0)) + duplicates
+
+
 #Examples of global services
 _operation_log_service: Optional[OperationLogService] = None
+_operation_log_writer: Optional[OperationLogWriter] = None
 
 
 def get_operation_log_service() -> OperationLogService:
@@ -253,6 +459,27 @@ def get_operation_log_service() -> OperationLogService:
     return _operation_log_service
 
 
+def get_operation_log_writer() -> OperationLogWriter:
+    """Get the buffered operation log writer"""
+    global _operation_log_writer
+    if _operation_log_writer is None:
+        _operation_log_writer = OperationLogWriter(
+            batch_size=SETTINGS.OPLOG_BATCH_SIZE,
+            flush_interval=SETTINGS.OPLOG_FLUSH_INTERVAL_SECONDS,
+            max_buffer=SETTINGS.OPLOG_BUFFER_MAX,
+            overflow_policy=SETTINGS.OPLOG_OVERFLOW_POLICY,
+            block_timeout=SETTINGS.OPLOG_BLOCK_TIMEOUT_SECONDS,
+        )
+    return _operation_log_writer
+
+
+async def shutdown_operation_log_writer() -> None:
+    """Flush buffered operation logs on shutdown"""
+    if _operation_log_writer is not None:
+        await _operation_log_writer.stop()
+        logger.info(f"Operation log writer stopped:{_operation_log_writer.get_stats()}")
+
+
 #Easy Functions
 async def log_operation(
     user_id: str,
@@ -265,9 +492,10 @@ async def log_operation(
     duration_ms: Optional[int] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
-    session_id: Optional[str] = None
+    session_id: Optional[str] = None,
+    wait: bool = True
 ) -> str:
-    """A simple function to record operations logs"""
+    """A simple function to record operations logs (``wait=False`` buffers the write)"""
     service = get_operation_log_service()
     log_data = OperationLogCreate(
         action_type=action_type,
@@ -280,4 +508,4 @@ async def log_operation(
         user_agent=user_agent,
         session_id=session_id
     )
-    return await service.create_log(user_id, username, log_data, ip_address, user_agent)
+    return await service.create_log(user_id, username, log_data, ip_address, user_agent, wait=wait)
@@ -9,3 +9,4 @@ from .log_handler import (
     unregister_analysis_tracker,
 )
 
+from .hub import ProgressHub, get_progress_hub, shutdown_progress_hub
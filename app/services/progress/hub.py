@@ -0,0 +1,156 @@
+"""Process-wide progress fan-out hub
+
+Every SSE/WebSocket client used to open its own Redis pubsub connection. The hub
+keeps a single pubsub per process instead: channels are subscribed while at least
+one consumer listens to them, and one reader task dispatches every message to the
+bounded queues of all consumers of that channel.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Set
+
+from app.core.database import get_redis_client_async
+
+logger = logging.getLogger(__name__)
+
+#Slow consumers lose their oldest messages instead of holding up the others
+DEFAULT_QUEUE_SIZE = 100
+#How long one get_message call waits before the reader checks its state again
+READ_TIMEOUT_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class ProgressHub:
+    """Multiplexes Redis pubsub channels to any number of in-process consumers"""
+
+    def __init__(self, redis_factory: Callable = get_redis_client_async, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self._redis_factory = redis_factory
+        self._queue_size = queue_size
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._consumers: Dict[str, Set[asyncio.Queue]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.dropped_messages = 0
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str, queue_size: Optional[int] = None) -> AsyncIterator[asyncio.Queue]:
+        """Listen to a channel; yields a queue receiving the raw message payloads"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or self._queue_size)
+        await self._add_consumer(channel, queue)
+        try:
+            yield queue
+        finally:
+            await self._remove_consumer(channel, queue)
+
+    async def _add_consumer(self, channel: str, queue: asyncio.Queue) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+        async with self._lock:
+            consumers = self._consumers.setdefault(channel, set())
+            consumers.add(queue)
+            if len(consumers) == 1:
+                try:
+                    if self._pubsub is None:
+                        self._pubsub = self._redis_factory().pubsub()
+                    await self._pubsub.subscribe(channel)
+                    logger.debug(f"[ProgressHub] Subscribed:{channel}")
+                except Exception:
+                    consumers.discard(queue)
+                    self._consumers.pop(channel, None)
+                    raise
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+            self._wakeup.set()
+
+    async def _remove_consumer(self, channel: str, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            consumers = self._consumers.get(channel)
+            if consumers is None:
+                return
+            consumers.discard(queue)
+            if consumers:
+                return
+            self._consumers.pop(channel, None)
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                    logger.debug(f"[ProgressHub] Unsubscribed:{channel}")
+                except Exception as e:
+                    logger.warning(f"⚠️ [ProgressHub] Unsubscribe failed:{channel}: {e}")
+
+    async def _read_loop(self) -> None:
+        backoff = 1.0
+        while True:
+            if not self._consumers:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=READ_TIMEOUT_SECONDS)
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                #redis-py reconnects and re-subscribes all channels on the next read
+                logger.warning(f"⚠️ [ProgressHub] Read failed, retrying in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                continue
+            if message and message.get("type") == "message":
+                self._dispatch(message.get("channel"), message.get("data"))
+
+    def _dispatch(self, channel, data) -> None:
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+        for queue in tuple(self._consumers.get(channel, ())):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_messages += 1
+            queue.put_nowait(data)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(self._consumers),
+            "consumers": sum(len(c) for c in self._consumers.values()),
+            "dropped_messages": self.dropped_messages,
+        }
+
+    async def stop(self) -> None:
+        """Stop the reader and release the pubsub connection"""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader = None
+        self._consumers.clear()
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ [ProgressHub] Closing pubsub failed: {e}")
+            self._pubsub = None
+
+
+_progress_hub: Optional[ProgressHub] = None
+
+
+def get_progress_hub() -> ProgressHub:
+    global _progress_hub
+    if _progress_hub is None:
+        _progress_hub = ProgressHub()
+    return _progress_hub
+
+
+async def shutdown_progress_hub() -> None:
+    global _progress_hub
+    if _progress_hub is not None:
+        await _progress_hub.stop()
+        _progress_hub = None
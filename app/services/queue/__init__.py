@@ -16,6 +16,9 @@ from .keys import (
     DEFAULT_USER_CONCURRENT_LIMIT,
     GLOBAL_CONCURRENT_LIMIT,
     VISIBILITY_TIMEOUT_SECONDS,
+    TASK_PROGRESS_CHANNEL_PREFIX,
+    BATCH_PROGRESS_CHANNEL_PREFIX,
+    BATCH_COUNTER_FIELDS,
 )
 
 from .helpers import (
@@ -25,5 +28,7 @@ from .helpers import (
     unmark_task_processing,
     set_visibility_timeout,
     clear_visibility_timeout,
+    batch_progress_snapshot,
+    transition_task_status,
 )
 
@@ -1,18 +1,53 @@
 """Queue the service 's auxiliary function (as it relates to the Redis operation) to facilitate thin commissioning in the main service.
 """
 from __future__ import annotations
+import json
+import logging
 import time
-from typing import Dict
+from typing import Any, Dict, Mapping, Optional
 from redis.asyncio import Redis
 
 from .keys import (
     READY_LIST,
     TASK_PREFIX,
+    BATCH_PREFIX,
     SET_PROCESSING,
     USER_PROCESSING_PREFIX,
     VISIBILITY_TIMEOUT_PREFIX,
+    BATCH_PROGRESS_CHANNEL_PREFIX,
+    BATCH_COUNTER_FIELDS,
 )
 
+logger = logging.getLogger(__name__)
+
+#Sets a task's status (plus extra fields) and moves it between the counters of its batch hash
+#in one step, so racing transitions of the same task cannot both be counted. The counters
+#follow the status stored on the task, not the one its caller read earlier.
+#KEYS[1] task hash, KEYS[2] batch hash (optional); ARGV[1] new status, ARGV[2] ",counter,fields,",
+#ARGV[3..] extra field/value pairs. Returns {applied} or {applied, batch hash...};
+#batches created before the counters existed (no "queued" field) are left alone.
+_TASK_TRANSITION_LUA = """
+local old = redis.call('HGET', KEYS[1], 'status')
+if old == ARGV[1] then
+    return {0}
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], unpack(ARGV, 3))
+if #KEYS < 2 or redis.call('HEXISTS', KEYS[2], 'queued') == 0 then
+    return {1}
+end
+if old and string.find(ARGV[2], ',' .. old .. ',', 1, true) then
+    redis.call('HINCRBY', KEYS[2], old, -1)
+end
+if string.find(ARGV[2], ',' .. ARGV[1] .. ',', 1, true) then
+    redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+end
+local result = redis.call('HGETALL', KEYS[2])
+table.insert(result, 1, 1)
+return result
+"""
+
+_COUNTER_FIELDS_ARG = "," + ",".join(BATCH_COUNTER_FIELDS) + ","
+
 
 async def check_user_concurrent_limit(r: Redis, user_id: str, limit: int) -> bool:
     """Check user and limit"""
@@ -58,3 +93,86 @@ async def clear_visibility_timeout(r: Redis, task_id: str) -> None:
     timeout_key = VISIBILITY_TIMEOUT_PREFIX + task_id
     await r.delete(timeout_key)
 
+
+def batch_progress_snapshot(batch_id: str, counters: Mapping[str, Any]) -> Dict[str, Any]:
+    """Aggregated batch progress event built from the per-status counters"""
+    counts = {field: max(0, int(counters.get(field) or 0)) for field in BATCH_COUNTER_FIELDS}
+    completed, failed, cancelled = counts["completed"], counts["failed"], counts["cancelled"]
+    processing = counts["processing"]
+    total_tasks = sum(counts.values())
+    finished_tasks = completed + failed + cancelled
+    progress = round((finished_tasks / total_tasks) * 100, 1) if total_tasks > 0 else 0
+
+    if total_tasks == 0:
+        batch_status, message = "queued", "批次无任务"
+    elif finished_tasks == total_tasks:
+        if completed == total_tasks:
+            batch_status = "completed"
+            message = f"批次完成: {completed}/{total_tasks} 成功"
+        elif completed == 0 and failed == 0:
+            batch_status = "cancelled"
+            message = f"批次已取消: {cancelled}/{total_tasks} 已取消"
+        elif completed == 0:
+            batch_status = "failed"
+            message = f"批次失败: {failed}/{total_tasks} 失败"
+        else:
+            batch_status = "partial"
+            message = f"批次部分成功: {completed} 成功, {failed + cancelled} 失败"
+    elif processing > 0 or finished_tasks > 0:
+        batch_status = "processing"
+        message = f"批次处理中: {finished_tasks}/{total_tasks} 已完成, {processing} 处理中"
+    else:
+        batch_status = "queued"
+        message = f"批次排队中: {total_tasks} 任务待处理"
+
+    return {
+        "batch_id": batch_id,
+        "status": batch_status,
+        "message": message,
+        "progress": progress,
+        "total_tasks": total_tasks,
+        "completed": completed,
+        "failed": failed,
+        "processing": processing,
+        "queued": counts["queued"],
+        "cancelled": cancelled,
+        "finished": total_tasks > 0 and finished_tasks == total_tasks,
+        "timestamp": time.time(),
+    }
+
+
+async def transition_task_status(
+    r: Redis,
+    task_id: str,
+    new_status: str,
+    batch_id: Optional[str] = None,
+    fields: Optional[Mapping[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Set a task's status and, for batch tasks, update the counters and push the aggregated progress
+
+    The status check-and-set and the counter update run in one Lua script, so readers
+    never have to look at the individual tasks and a task that is already in
+    ``new_status`` is not counted twice. The resulting snapshot is published on
+    ``batch_progress:<batch_id>``; publishing failures are logged and never break the task flow.
+
+    Returns:
+        The batch progress snapshot, or None (no batch, no change, or a batch without counters)
+    """
+    keys = [TASK_PREFIX + task_id] + ([BATCH_PREFIX + batch_id] if batch_id else [])
+    args = [new_status, _COUNTER_FIELDS_ARG]
+    for field, value in (fields or {}).items():
+        args.extend((field, str(value)))
+    result = await r.eval(_TASK_TRANSITION_LUA, len(keys), *keys, *args)
+    if not result or int(result[0]) == 0 or len(result) == 1:
+        return None
+    try:
+        flat = result[1:]
+        counters = dict(zip(flat[::2], flat[1::2]))
+        snapshot = batch_progress_snapshot(batch_id, counters)
+        if counters.get("status") != snapshot["status"]:
+            await r.hset(BATCH_PREFIX + batch_id, "status", snapshot["status"])
+        await r.publish(BATCH_PROGRESS_CHANNEL_PREFIX + batch_id, json.dumps(snapshot, ensure_ascii=False))
+        return snapshot
+    except Exception as e:
+        logger.warning(f"Batch progress update failed:{batch_id} {task_id}->{new_status}: {e}")
+        return None
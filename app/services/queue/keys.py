@@ -21,3 +21,10 @@ DEFAULT_USER_CONCURRENT_LIMIT = 3
 GLOBAL_CONCURRENT_LIMIT = 3  #The maximum co-production limit for open source is 3
 VISIBILITY_TIMEOUT_SECONDS = 300  #Five minutes.
 
+
+#Pub/Sub channels for progress streaming
+TASK_PROGRESS_CHANNEL_PREFIX = "task_progress:"
+BATCH_PROGRESS_CHANNEL_PREFIX = "batch_progress:"
+
+#Per-status task counters kept on the batch hash
+BATCH_COUNTER_FIELDS = ("queued", "processing", "completed", "failed", "cancelled")
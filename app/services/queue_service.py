@@ -28,12 +28,15 @@ from app.services.queue import (
     DEFAULT_USER_CONCURRENT_LIMIT,
     GLOBAL_CONCURRENT_LIMIT,
     VISIBILITY_TIMEOUT_SECONDS,
+    BATCH_COUNTER_FIELDS,
     check_user_concurrent_limit,
     check_global_concurrent_limit,
     mark_task_processing,
     unmark_task_processing,
     set_visibility_timeout,
     clear_visibility_timeout,
+    batch_progress_snapshot,
+    transition_task_status,
 )
 
 logger = logging.getLogger(__name__)
@@ -75,7 +78,6 @@ class QueueService:
             "id": task_id,
             "user": user_id,
             "symbol": symbol,
-            "status": "queued",
             "created_at": str(now),
             "params": json.dumps(params or {}),
             "enqueued_at": str(now)
@@ -84,8 +86,8 @@ class QueueService:
         if batch_id:
             mapping["batch_id"] = batch_id
 
-        #Can not open message
-        await self.r.hset(key, mapping=mapping)
+        #Task hash and batch counters are written together
+        await transition_task_status(self.r, task_id, "queued", batch_id, fields=mapping)
 
         #Add to FIFO queue
         await self.r.lpush(READY_LIST, task_id)
@@ -126,8 +128,7 @@ class QueueService:
             await self._set_visibility_timeout(task_id, worker_id)
 
             #Update Task Status
-            await self.r.hset(TASK_PREFIX + task_id, mapping={
-                "status": "processing",
+            await transition_task_status(self.r, task_id, "processing", task_data.get("batch_id"), fields={
                 "worker_id": worker_id,
                 "started_at": str(int(time.time()))
             })
@@ -157,8 +158,7 @@ class QueueService:
 
             #Update Task Status
             status = "completed" if success else "failed"
-            await self.r.hset(TASK_PREFIX + task_id, mapping={
-                "status": status,
+            await transition_task_status(self.r, task_id, status, task_data.get("batch_id"), fields={
                 "completed_at": str(int(time.time()))
             })
 
@@ -185,6 +185,8 @@ class QueueService:
             "status": "queued",
             "submitted": str(len(symbols)),
             "created_at": str(now),
+            #Per-status counters, maintained by transition_task_status on every task state change
+            **{field: "0" for field in BATCH_COUNTER_FIELDS},
         })
         for s in symbols:
             await self.enqueue_task(user_id=user_id, symbol=s, params=params, batch_id=batch_id)
@@ -221,6 +223,26 @@ class QueueService:
         data["tasks"] = list(await self.r.smembers(BATCH_TASKS_PREFIX + batch_id))
         return data
 
+    async def get_batch_progress(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregated batch progress from the batch counters
+
+        Batches created before the counters existed are counted once from their tasks
+        and the counters are stored, so later state changes keep them up to date.
+        """
+        key = BATCH_PREFIX + batch_id
+        data = await self.r.hgetall(key)
+        if not data:
+            return None
+        if "queued" not in data:
+            counters = {field: 0 for field in BATCH_COUNTER_FIELDS}
+            for task_id in await self.r.smembers(BATCH_TASKS_PREFIX + batch_id):
+                status = await self.r.hget(TASK_PREFIX + task_id, "status")
+                if status in counters:
+                    counters[status] += 1
+            await self.r.hset(key, mapping={field: str(value) for field, value in counters.items()})
+            data.update(counters)
+        return batch_progress_snapshot(batch_id, data)
+
     async def stats(self) -> Dict[str, int]:
         queued = await self.r.llen(READY_LIST)
         processing = await self.r.scard(SET_PROCESSING)
@@ -316,8 +338,7 @@ class QueueService:
             await self.r.lpush(READY_LIST, task_id)
 
             #Update Task Status
-            await self.r.hset(TASK_PREFIX + task_id, mapping={
-                "status": "queued",
+            await transition_task_status(self.r, task_id, "queued", task_data.get("batch_id"), fields={
                 "worker_id": "",
                 "requeued_at": str(int(time.time()))
             })
@@ -346,8 +367,7 @@ class QueueService:
                 await self.r.lrem(READY_LIST, 0, task_id)
 
             #Update Task Status
-            await self.r.hset(TASK_PREFIX + task_id, mapping={
-                "status": "cancelled",
+            await transition_task_status(self.r, task_id, "cancelled", task_data.get("batch_id"), fields={
                 "cancelled_at": str(int(time.time()))
             })
 
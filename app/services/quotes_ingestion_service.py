@@ -9,6 +9,7 @@ from pymongo import UpdateOne
 from app.core.config import SETTINGS
 from app.core.database import get_mongo_db_async
 from app.services.data_sources.manager import DataSourceManager
+from tradingagents.dataflows.trading_calendar import get_trading_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -310,8 +311,8 @@ class QuotesIngestionService:
         - significantly reduce the risk of missing closing prices
         """
         now = now or datetime.now(self.tz)
-        #Chile
-        if now.weekday() > 4:
+        #Weekends and exchange holidays
+        if not get_trading_calendar().is_trading_day(now.date(), "CN"):
             return False
         t = now.time()
         #Regular period of transactions at the point of surrender/deep exchange
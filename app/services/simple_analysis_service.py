@@ -26,6 +26,7 @@ from app.models.analysis_models import (
 from app.models.user import PyObjectId
 from app.models.notification_models import NotificationCreate
 from bson import ObjectId
+from app.core.config import SETTINGS
 from app.core.database import get_mongo_db_async
 from app.services.config_service import ConfigService
 from app.services.memory_state_manager import get_memory_state_manager, TaskStatus
@@ -580,6 +581,135 @@ def create_analysis_config(
     return config
 
 
+def _extract_state_reports(state: Any, detailed_analysis: Any = None) -> Dict[str, str]:
+    """Report texts of a finished analysis, keyed like the web report documents"""
+    reports = {}
+    try:
+        #Define all possible reporting fields
+        report_fields = [
+            'market_report',
+            'sentiment_report',
+            'news_report',
+            'fundamentals_report',
+            'investment_plan',
+            'trader_investment_plan',
+            'final_trade_decision'
+        ]
+
+        #Extract report from state
+        for field in report_fields:
+            if hasattr(state, field):
+                value = getattr(state, field, "")
+            elif isinstance(state, dict) and field in state:
+                value = state[field]
+            else:
+                value = ""
+
+            if isinstance(value, str) and len(value.strip()) > 10:  #Save only reports with actual content
+                reports[field] = value.strip()
+
+        #Addressing the status of the research team debate report
+        if hasattr(state, 'investment_debate_state') or (isinstance(state, dict) and 'investment_debate_state' in state):
+            debate_state = getattr(state, 'investment_debate_state', None) if hasattr(state, 'investment_debate_state') else state.get('investment_debate_state')
+            if debate_state:
+                #Extracting the history of multiple researchers
+                if hasattr(debate_state, 'bull_history'):
+                    bull_content = getattr(debate_state, 'bull_history', "")
+                elif isinstance(debate_state, dict) and 'bull_history' in debate_state:
+                    bull_content = debate_state['bull_history']
+                else:
+                    bull_content = ""
+
+                if bull_content and len(bull_content.strip()) > 10:
+                    reports['bull_researcher'] = bull_content.strip()
+
+                #Extracting the history of empty researchers
+                if hasattr(debate_state, 'bear_history'):
+                    bear_content = getattr(debate_state, 'bear_history', "")
+                elif isinstance(debate_state, dict) and 'bear_history' in debate_state:
+                    bear_content = debate_state['bear_history']
+                else:
+                    bear_content = ""
+
+                if bear_content and len(bear_content.strip()) > 10:
+                    reports['bear_researcher'] = bear_content.strip()
+
+                #Decision-making by extracting research managers
+                if hasattr(debate_state, 'judge_decision'):
+                    decision_content = getattr(debate_state, 'judge_decision', "")
+                elif isinstance(debate_state, dict) and 'judge_decision' in debate_state:
+                    decision_content = debate_state['judge_decision']
+                else:
+                    decision_content = str(debate_state)
+
+                if decision_content and len(decision_content.strip()) > 10:
+                    reports['research_team_decision'] = decision_content.strip()
+
+        #Process risk management team debate status report
+        if hasattr(state, 'risk_debate_state') or (isinstance(state, dict) and 'risk_debate_state' in state):
+            risk_state = getattr(state, 'risk_debate_state', None) if hasattr(state, 'risk_debate_state') else state.get('risk_debate_state')
+            if risk_state:
+                #Extracting the history of radical analysts
+                if hasattr(risk_state, 'risky_history'):
+                    risky_content = getattr(risk_state, 'risky_history', "")
+                elif isinstance(risk_state, dict) and 'risky_history' in risk_state:
+                    risky_content = risk_state['risky_history']
+                else:
+                    risky_content = ""
+
+                if risky_content and len(risky_content.strip()) > 10:
+                    reports['risky_analyst'] = risky_content.strip()
+
+                #Extract conservative analyst history
+                if hasattr(risk_state, 'safe_history'):
+                    safe_content = getattr(risk_state, 'safe_history', "")
+                elif isinstance(risk_state, dict) and 'safe_history' in risk_state:
+                    safe_content = risk_state['safe_history']
+                else:
+                    safe_content = ""
+
+                if safe_content and len(safe_content.strip()) > 10:
+                    reports['safe_analyst'] = safe_content.strip()
+
+                #Extract neutral analyst history
+                if hasattr(risk_state, 'neutral_history'):
+                    neutral_content = getattr(risk_state, 'neutral_history', "")
+                elif isinstance(risk_state, dict) and 'neutral_history' in risk_state:
+                    neutral_content = risk_state['neutral_history']
+                else:
+                    neutral_content = ""
+
+                if neutral_content and len(neutral_content.strip()) > 10:
+                    reports['neutral_analyst'] = neutral_content.strip()
+
+                #Decision-making by Portfolio Manager
+                if hasattr(risk_state, 'judge_decision'):
+                    risk_decision = getattr(risk_state, 'judge_decision', "")
+                elif isinstance(risk_state, dict) and 'judge_decision' in risk_state:
+                    risk_decision = risk_state['judge_decision']
+                else:
+                    risk_decision = str(risk_state)
+
+                if risk_decision and len(risk_decision.strip()) > 10:
+                    reports['risk_management_decision'] = risk_decision.strip()
+
+        logger.info(f"📊 From the state{len(reports)}Reports:{list(reports.keys())}")
+
+    except Exception as e:
+        logger.warning(f"⚠️ There was an error in handling reports in the state:{e}")
+        #Degraded to extract from detailed analysis
+        if detailed_analysis:
+            try:
+                if isinstance(detailed_analysis, dict):
+                    for key, value in detailed_analysis.items():
+                        if isinstance(value, str) and len(value) > 50:
+                            reports[key] = value
+                    logger.info(f"📊 Decline: extracted from detailed analysis{len(reports)}Report")
+            except Exception as fallback_error:
+                logger.warning(f"⚠️ The downgrading also failed:{fallback_error}")
+    return reports
+
+
 class SimpleAnalysisService:
     """Simplified stock analysis services"""
 
@@ -594,6 +724,8 @@ class SimpleAnalysisService:
         #Default to perform up to 3 analytical tasks simultaneously (adjusted for server resources)
         import concurrent.futures
         self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        #Async graph mode: the pool only runs setup and result processing, concurrency is capped here
+        self._async_analysis_slots = asyncio.Semaphore(SETTINGS.ANALYSIS_ASYNC_MAX_CONCURRENCY)
 
         logger.info(f"SimpleAnalysisService ExampleID:{id(self)}")
         logger.info(f"[service initialization] memory manager example ID:{id(self.memory_manager)}")
@@ -950,8 +1082,11 @@ class SimpleAnalysisService:
             #Synchronize MongoDB status update
             await self._update_task_status(task_id, AnalysisStatus.PROCESSING, 20)
 
-            #Implementation of actual analysis
-            result = await self._execute_analysis_sync(task_id, user_id, request, progress_tracker)
+            #Implementation of actual analysis (graph awaited on the event loop when async mode is enabled)
+            if SETTINGS.ANALYSIS_ASYNC_GRAPH:
+                result = await self._execute_analysis_async(task_id, user_id, request, progress_tracker)
+            else:
+                result = await self._execute_analysis_sync(task_id, user_id, request, progress_tracker)
 
             #Mark progress tracker completed (executed online)
             await asyncio.to_thread(progress_tracker.mark_completed)
@@ -1084,626 +1219,687 @@ class SimpleAnalysisService:
     ) -> Dict[str, Any]:
         """Synchronize the achievement of the analysis"""
         try:
-            #Reinitiation of log system during online process
-            from tradingagents.utils.logging_init import init_logging, get_logger
-            init_logging()
-            thread_logger = get_logger('analysis_thread')
+            run = self._prepare_analysis_run(task_id, user_id, request, progress_tracker)
 
-            thread_logger.info(f"🔄 [Thread Pool] Starting analysis: {task_id} - {request.stock_code}")
-            logger.info(f"[Line pool]{task_id} - {request.stock_code}")
+            #Implementation of physical analysis, transmission of progress back and task id
+            state, decision = run["trading_graph"].propagate(
+                request.stock_code,
+                run["analysis_date"],
+                progress_callback=run["progress_callback"],
+                task_id=task_id
+            )
 
-            #🔧 Computes accurate progress based on the step weights of Redis ProcessTracker
-            #Basic preparation stage (10%): 0.03 + 0.02 + 0.01 + 0.02 + 0.02 = 0.10
-            #Step index 0-4 corresponds to 0-10%
+            logger.info(f"Implementing graph.propagate")
+            return self._build_analysis_result(task_id, request, run, state, decision, progress_tracker)
 
-            #Step update progress (call in online pool)
-            def update_progress_sync(progress: int, message: str, step: str):
-                """Synchronize progress in the online pool"""
-                try:
-                    #Update Redis progress tracker also
-                    if progress_tracker:
-                        progress_tracker.update_progress({
-                            "progress_percentage": progress,
-                            "last_message": message
-                        })
+        except Exception as e:
+            logger.error(f"[Line pool]{task_id} - {e}")
+            raise self._format_analysis_error(request, e) from e
 
-                    #🔥 Update memory and MongoDB in sync to avoid cycle conflicts
-                    #1. Update task status of memory (use new event cycle)
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(
-                            self.memory_manager.update_task_status(
-                                task_id=task_id,
-                                status=TaskStatus.RUNNING,
-                                progress=progress,
-                                message=message,
-                                current_step=step
-                            )
+    async def _execute_analysis_async(
+        self,
+        task_id: str,
+        user_id: str,
+        request: SingleAnalysisRequest,
+        progress_tracker: Optional[RedisProgressTracker] = None
+    ) -> Dict[str, Any]:
+        """Run the graph on the event loop (graph.astream)
+
+        Only the setup and the result processing use the shared thread pool; while
+        the graph runs, LLM calls of researchers, managers, trader and risk
+        debaters are awaited on the loop, so the pool size no longer caps the
+        number of concurrent analyses.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._async_analysis_slots:
+                run = await loop.run_in_executor(
+                    self._thread_pool, self._prepare_analysis_run, task_id, user_id, request, progress_tracker
+                )
+                logger.info(f"[Async graph]{task_id} - {request.stock_code}")
+                state, decision = await run["trading_graph"].apropagate(
+                    request.stock_code,
+                    run["analysis_date"],
+                    progress_callback=run["progress_callback"],
+                    task_id=task_id
+                )
+                return await loop.run_in_executor(
+                    self._thread_pool, self._build_analysis_result, task_id, request, run, state, decision, progress_tracker
+                )
+        except Exception as e:
+            logger.error(f"[Async graph]{task_id} - {e}")
+            raise self._format_analysis_error(request, e) from e
+
+    def _prepare_analysis_run(
+        self,
+        task_id: str,
+        user_id: str,
+        request: SingleAnalysisRequest,
+        progress_tracker: Optional[RedisProgressTracker] = None
+    ) -> Dict[str, Any]:
+        """Model selection, analysis configuration, engine and progress callbacks"""
+        #Reinitiation of log system during online process
+        from tradingagents.utils.logging_init import init_logging, get_logger
+        init_logging()
+        thread_logger = get_logger('analysis_thread')
+
+        thread_logger.info(f"🔄 [Thread Pool] Starting analysis: {task_id} - {request.stock_code}")
+        logger.info(f"[Line pool]{task_id} - {request.stock_code}")
+
+        #🔧 Computes accurate progress based on the step weights of Redis ProcessTracker
+        #Basic preparation stage (10%): 0.03 + 0.02 + 0.01 + 0.02 + 0.02 = 0.10
+        #Step index 0-4 corresponds to 0-10%
+
+        #Step update progress (call in online pool)
+        def update_progress_sync(progress: int, message: str, step: str):
+            """Synchronize progress in the online pool"""
+            try:
+                #Update Redis progress tracker also
+                if progress_tracker:
+                    progress_tracker.update_progress({
+                        "progress_percentage": progress,
+                        "last_message": message
+                    })
+
+                #🔥 Update memory and MongoDB in sync to avoid cycle conflicts
+                #1. Update task status of memory (use new event cycle)
+                import asyncio
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                try:
+                    loop.run_until_complete(
+                        self.memory_manager.update_task_status(
+                            task_id=task_id,
+                            status=TaskStatus.RUNNING,
+                            progress=progress,
+                            message=message,
+                            current_step=step
                         )
-                    finally:
-                        loop.close()
-
-                    #Update MongoDB (use synchronisation of client, avoiding incident cycle conflicts)
-                    from pymongo import MongoClient
-                    from app.core.config import SETTINGS
-                    from datetime import datetime
-
-                    sync_client = MongoClient(SETTINGS.MONGO_URI)
-                    sync_db = sync_client[SETTINGS.MONGO_DB_NAME]
-
-                    sync_db.analysis_tasks.update_one(
-                        {"task_id": task_id},
-                        {
-                            "$set": {
-                                "progress": progress,
-                                "current_step": step,
-                                "message": message,
-                                "updated_at": datetime.utcnow()
-                            }
-                        }
                     )
-                    sync_client.close()
+                finally:
+                    loop.close()
 
-                except Exception as e:
-                    logger.warning(f"Progress update failed:{e}")
+                #Update MongoDB (use synchronisation of client, avoiding incident cycle conflicts)
+                from pymongo import MongoClient
+                from app.core.config import SETTINGS
+                from datetime import datetime
 
-            #Configure Phase - Corresponding Step 3 "⚙️ Parameter Settings" (6-8%)
-            update_progress_sync(7, "⚙️ 配置分析参数", "configuration")
+                sync_client = MongoClient(SETTINGS.MONGO_URI)
+                sync_db = sync_client[SETTINGS.MONGO_DB_NAME]
 
-            #Smart model selection logic
-            from app.services.model_capability_service import get_model_capability_service
-            capability_service = get_model_capability_service()
+                sync_db.analysis_tasks.update_one(
+                    {"task_id": task_id},
+                    {
+                        "$set": {
+                            "progress": progress,
+                            "current_step": step,
+                            "message": message,
+                            "updated_at": datetime.utcnow()
+                        }
+                    }
+                )
+                sync_client.close()
 
-            research_depth = request.parameters.research_depth if request.parameters else "标准"
+            except Exception as e:
+                logger.warning(f"Progress update failed:{e}")
 
-            #1. Check whether models have been specified at the front end
-            if (request.parameters and
-                hasattr(request.parameters, 'quick_analysis_model') and
-                hasattr(request.parameters, 'deep_analysis_model') and
-                request.parameters.quick_analysis_model and
-                request.parameters.deep_analysis_model):
+        #Configure Phase - Corresponding Step 3 "⚙️ Parameter Settings" (6-8%)
+        update_progress_sync(7, "⚙️ 配置分析参数", "configuration")
 
-                #Use the model specified at the frontend
-                quick_model = request.parameters.quick_analysis_model
-                deep_model = request.parameters.deep_analysis_model
+        #Smart model selection logic
+        from app.services.model_capability_service import get_model_capability_service
+        capability_service = get_model_capability_service()
 
-                logger.info(f"📝 [analytical service] User-designated model: Quick={quick_model}, deep={deep_model}")
+        research_depth = request.parameters.research_depth if request.parameters else "标准"
 
-                #Verify whether the model is appropriate
-                validation = capability_service.validate_model_pair(
-                    quick_model, deep_model, research_depth
-                )
+        #1. Check whether models have been specified at the front end
+        if (request.parameters and
+            hasattr(request.parameters, 'quick_analysis_model') and
+            hasattr(request.parameters, 'deep_analysis_model') and
+            request.parameters.quick_analysis_model and
+            request.parameters.deep_analysis_model):
 
-                if not validation["valid"]:
-                    #Record warning
-                    for warning in validation["warnings"]:
-                        logger.warning(warning)
+            #Use the model specified at the frontend
+            quick_model = request.parameters.quick_analysis_model
+            deep_model = request.parameters.deep_analysis_model
 
-                    #If the model is inappropriate, switch to the recommended model.
-                    logger.info(f"Automatically switch to recommended model...")
-                    quick_model, deep_model = capability_service.recommend_models_for_depth(
-                        research_depth
-                    )
-                    logger.info(f"Quick ={quick_model}, deep={deep_model}")
-                else:
-                    #Even if it's verified, the warning message is recorded.
-                    for warning in validation["warnings"]:
-                        logger.info(warning)
-                    logger.info(f"✅ The user selected the model to verify: quick={quick_model}, deep={deep_model}")
+            logger.info(f"📝 [analytical service] User-designated model: Quick={quick_model}, deep={deep_model}")
 
-            else:
-                #2. Automatically recommend models
+            #Verify whether the model is appropriate
+            validation = capability_service.validate_model_pair(
+                quick_model, deep_model, research_depth
+            )
+
+            if not validation["valid"]:
+                #Record warning
+                for warning in validation["warnings"]:
+                    logger.warning(warning)
+
+                #If the model is inappropriate, switch to the recommended model.
+                logger.info(f"Automatically switch to recommended model...")
                 quick_model, deep_model = capability_service.recommend_models_for_depth(
                     research_depth
                 )
-                logger.info(f"Auto-recommended model: Quick={quick_model}, deep={deep_model}")
+                logger.info(f"Quick ={quick_model}, deep={deep_model}")
+            else:
+                #Even if it's verified, the warning message is recorded.
+                for warning in validation["warnings"]:
+                    logger.info(warning)
+                logger.info(f"✅ The user selected the model to verify: quick={quick_model}, deep={deep_model}")
 
-            #🔧 Find the respective suppliers and API URLs according to fast and depth models
-            quick_provider_info = get_provider_and_url_by_model_sync(quick_model)
-            deep_provider_info = get_provider_and_url_by_model_sync(deep_model)
+        else:
+            #2. Automatically recommend models
+            quick_model, deep_model = capability_service.recommend_models_for_depth(
+                research_depth
+            )
+            logger.info(f"Auto-recommended model: Quick={quick_model}, deep={deep_model}")
 
-            quick_provider = quick_provider_info["provider"]
-            deep_provider = deep_provider_info["provider"]
-            quick_backend_url = quick_provider_info["backend_url"]
-            deep_backend_url = deep_provider_info["backend_url"]
+        #🔧 Find the respective suppliers and API URLs according to fast and depth models
+        quick_provider_info = get_provider_and_url_by_model_sync(quick_model)
+        deep_provider_info = get_provider_and_url_by_model_sync(deep_model)
 
-            logger.info(f"[Supplier Searching ]{quick_model}Corresponding suppliers:{quick_provider}")
-            logger.info(f"[API Address]{quick_backend_url}")
-            logger.info(f"Depth model{deep_model}Corresponding suppliers:{deep_provider}")
-            logger.info(f"[API Address]{deep_backend_url}")
+        quick_provider = quick_provider_info["provider"]
+        deep_provider = deep_provider_info["provider"]
+        quick_backend_url = quick_provider_info["backend_url"]
+        deep_backend_url = deep_provider_info["backend_url"]
+
+        logger.info(f"[Supplier Searching ]{quick_model}Corresponding suppliers:{quick_provider}")
+        logger.info(f"[API Address]{quick_backend_url}")
+        logger.info(f"Depth model{deep_model}Corresponding suppliers:{deep_provider}")
+        logger.info(f"[API Address]{deep_backend_url}")
+
+        #Check if two models come from the same plant.
+        if quick_provider == deep_provider:
+            logger.info(f"Two models from the same plant:{quick_provider}")
+        else:
+            logger.info(f"✅ [Mixed Mode] Quick Model{quick_provider}) and Depth Model ( ){deep_provider}From different manufacturers")
+
+        #Market acquisition type
+        market_type = request.parameters.market_type if request.parameters else "A股"
+        logger.info(f"Use of market types:{market_type}")
+
+        #Create analytical configuration (support hybrid mode)
+        config = create_analysis_config(
+            research_depth=research_depth,
+            selected_analysts=request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"],
+            quick_model=quick_model,
+            deep_model=deep_model,
+            llm_provider=quick_provider,  #Vendors mainly using fast-track models
+            market_type=market_type  #Market type with frontend
+        )
 
-            #Check if two models come from the same plant.
-            if quick_provider == deep_provider:
-                logger.info(f"Two models from the same plant:{quick_provider}")
+        #Add Mixed Mode Configuration
+        config["quick_provider"] = quick_provider
+        config["deep_provider"] = deep_provider
+        config["quick_backend_url"] = quick_backend_url
+        config["deep_backend_url"] = deep_backend_url
+        config["backend_url"] = quick_backend_url  #Maintain backward compatibility
+
+        #Could not close temporary folder: %s
+        logger.info(f"Rapid models in configuration:{config.get('quick_think_llm')}")
+        logger.info(f"🔍 [model validation] deep model in configuration:{config.get('deep_think_llm')}")
+        logger.info(f"The LLM supplier in the configuration:{config.get('llm_provider')}")
+
+        #Initialisation Analysis Engine - Corresponding Step 4 "🚀 Start Engine" (8-10%)
+        update_progress_sync(9, "🚀 初始化AI分析引擎", "engine_initialization")
+        trading_graph = self._get_trading_graph(config)
+
+        #Could not close temporary folder: %s
+        logger.info(f"[engine validation]{trading_graph.config.get('quick_think_llm')}")
+        logger.info(f"[engine validation]{trading_graph.config.get('deep_think_llm')}")
+
+        #Prepare to analyze the data.
+        start_time = datetime.now()
+
+        #🔧 Use the analysis date passed from the frontend, if not the current date
+        if request.parameters and hasattr(request.parameters, 'analysis_date') and request.parameters.analysis_date:
+            #The frontend passes a datetime object or string
+            if isinstance(request.parameters.analysis_date, datetime):
+                analysis_date = request.parameters.analysis_date.strftime("%Y-%m-%d")
+            elif isinstance(request.parameters.analysis_date, str):
+                analysis_date = request.parameters.analysis_date
             else:
-                logger.info(f"✅ [Mixed Mode] Quick Model{quick_provider}) and Depth Model ( ){deep_provider}From different manufacturers")
+                analysis_date = datetime.now().strftime("%Y-%m-%d")
+            logger.info(f"📅 Use the analysis date specified at the frontend:{analysis_date}")
+        else:
+            analysis_date = datetime.now().strftime("%Y-%m-%d")
+            logger.info(f"Use the current date as the date of analysis:{analysis_date}")
 
-            #Market acquisition type
-            market_type = request.parameters.market_type if request.parameters else "A股"
-            logger.info(f"Use of market types:{market_type}")
-
-            #Create analytical configuration (support hybrid mode)
-            config = create_analysis_config(
-                research_depth=research_depth,
-                selected_analysts=request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"],
-                quick_model=quick_model,
-                deep_model=deep_model,
-                llm_provider=quick_provider,  #Vendors mainly using fast-track models
-                market_type=market_type  #Market type with frontend
-            )
+        #🔧 Smart date range processing: capture the latest 10 days of data, automate weekends/leaves Day
+        #This ensures that even weekends or holidays will be able to get data on the last trading day.
+        from tradingagents.utils.dataflow_utils import get_trading_date_range
+        data_start_date, data_end_date = get_trading_date_range(analysis_date, lookback_days=10)
 
-            #Add Mixed Mode Configuration
-            config["quick_provider"] = quick_provider
-            config["deep_provider"] = deep_provider
-            config["quick_backend_url"] = quick_backend_url
-            config["deep_backend_url"] = deep_backend_url
-            config["backend_url"] = quick_backend_url  #Maintain backward compatibility
+        logger.info(f"Analysis of target dates:{analysis_date}")
+        logger.info(f"Data search range:{data_start_date}to{data_end_date}(During the last 10 days)")
+        logger.info(f"Note: Access to data for 10 days automatically addresses weekends, holidays and data delays")
 
-            #Could not close temporary folder: %s
-            logger.info(f"Rapid models in configuration:{config.get('quick_think_llm')}")
-            logger.info(f"🔍 [model validation] deep model in configuration:{config.get('deep_think_llm')}")
-            logger.info(f"The LLM supplier in the configuration:{config.get('llm_provider')}")
+        #Start analysis - 10% progress, coming to analyst stage
+        #Note: Do not manually set too much progress, let graph process callback update actual analysis progress
+        update_progress_sync(10, "🤖 开始多智能体协作分析", "agent_analysis")
 
-            #Initialisation Analysis Engine - Corresponding Step 4 "🚀 Start Engine" (8-10%)
-            update_progress_sync(9, "🚀 初始化AI分析引擎", "engine_initialization")
-            trading_graph = self._get_trading_graph(config)
+        #Starts a walker to simulate progress update
+        import threading
+        import time
 
-            #Could not close temporary folder: %s
-            logger.info(f"[engine validation]{trading_graph.config.get('quick_think_llm')}")
-            logger.info(f"[engine validation]{trading_graph.config.get('deep_think_llm')}")
-
-            #Prepare to analyze the data.
-            start_time = datetime.now()
-
-            #🔧 Use the analysis date passed from the frontend, if not the current date
-            if request.parameters and hasattr(request.parameters, 'analysis_date') and request.parameters.analysis_date:
-                #The frontend passes a datetime object or string
-                if isinstance(request.parameters.analysis_date, datetime):
-                    analysis_date = request.parameters.analysis_date.strftime("%Y-%m-%d")
-                elif isinstance(request.parameters.analysis_date, str):
-                    analysis_date = request.parameters.analysis_date
+        def simulate_progress():
+            """Simulate internal progress of TradingAgendas"""
+            try:
+                if not progress_tracker:
+                    return
+
+                #Analyst phase - adjusted for the number of analysts selected
+                analysts = request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"]
+
+                #Simulation analyst execution
+                for i, analyst in enumerate(analysts):
+                    time.sleep(15)  #About 15 seconds per analyst.
+                    if analyst == "market":
+                        progress_tracker.update_progress("📊 市场分析师正在分析")
+                    elif analyst == "fundamentals":
+                        progress_tracker.update_progress("💼 基本面分析师正在分析")
+                    elif analyst == "news":
+                        progress_tracker.update_progress("📰 新闻分析师正在分析")
+                    elif analyst == "social":
+                        progress_tracker.update_progress("💬 社交媒体分析师正在分析")
+
+                #Research team phase
+                time.sleep(10)
+                progress_tracker.update_progress("🐂 看涨研究员构建论据")
+
+                time.sleep(8)
+                progress_tracker.update_progress("🐻 看跌研究员识别风险")
+
+                #Debate stage -- cycle of debate based on five levels
+                research_depth = request.parameters.research_depth if request.parameters else "标准"
+                if research_depth == "快速":
+                    debate_rounds = 1
+                elif research_depth == "基础":
+                    debate_rounds = 1
+                elif research_depth == "标准":
+                    debate_rounds = 1
+                elif research_depth == "深度":
+                    debate_rounds = 2
+                elif research_depth == "全面":
+                    debate_rounds = 3
                 else:
-                    analysis_date = datetime.now().strftime("%Y-%m-%d")
-                logger.info(f"📅 Use the analysis date specified at the frontend:{analysis_date}")
-            else:
-                analysis_date = datetime.now().strftime("%Y-%m-%d")
-                logger.info(f"Use the current date as the date of analysis:{analysis_date}")
+                    debate_rounds = 1  #Default
 
-            #🔧 Smart date range processing: capture the latest 10 days of data, automate weekends/leaves Day
-            #This ensures that even weekends or holidays will be able to get data on the last trading day.
-            from tradingagents.utils.dataflow_utils import get_trading_date_range
-            data_start_date, data_end_date = get_trading_date_range(analysis_date, lookback_days=10)
+                for round_num in range(debate_rounds):
+                    time.sleep(12)
+                    progress_tracker.update_progress(f"🎯 研究辩论 第{round_num+1}轮")
 
-            logger.info(f"Analysis of target dates:{analysis_date}")
-            logger.info(f"Data search range:{data_start_date}to{data_end_date}(During the last 10 days)")
-            logger.info(f"Note: Access to data for 10 days automatically addresses weekends, holidays and data delays")
+                time.sleep(8)
+                progress_tracker.update_progress("👔 研究经理形成共识")
 
-            #Start analysis - 10% progress, coming to analyst stage
-            #Note: Do not manually set too much progress, let graph process callback update actual analysis progress
-            update_progress_sync(10, "🤖 开始多智能体协作分析", "agent_analysis")
+                #Traders phase
+                time.sleep(10)
+                progress_tracker.update_progress("💼 交易员制定策略")
 
-            #Starts a walker to simulate progress update
-            import threading
-            import time
+                #Risk management phase
+                time.sleep(8)
+                progress_tracker.update_progress("🔥 激进风险评估")
 
-            def simulate_progress():
-                """Simulate internal progress of TradingAgendas"""
-                try:
-                    if not progress_tracker:
-                        return
-
-                    #Analyst phase - adjusted for the number of analysts selected
-                    analysts = request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"]
-
-                    #Simulation analyst execution
-                    for i, analyst in enumerate(analysts):
-                        time.sleep(15)  #About 15 seconds per analyst.
-                        if analyst == "market":
-                            progress_tracker.update_progress("📊 市场分析师正在分析")
-                        elif analyst == "fundamentals":
-                            progress_tracker.update_progress("💼 基本面分析师正在分析")
-                        elif analyst == "news":
-                            progress_tracker.update_progress("📰 新闻分析师正在分析")
-                        elif analyst == "social":
-                            progress_tracker.update_progress("💬 社交媒体分析师正在分析")
-
-                    #Research team phase
-                    time.sleep(10)
-                    progress_tracker.update_progress("🐂 看涨研究员构建论据")
-
-                    time.sleep(8)
-                    progress_tracker.update_progress("🐻 看跌研究员识别风险")
-
-                    #Debate stage -- cycle of debate based on five levels
-                    research_depth = request.parameters.research_depth if request.parameters else "标准"
-                    if research_depth == "快速":
-                        debate_rounds = 1
-                    elif research_depth == "基础":
-                        debate_rounds = 1
-                    elif research_depth == "标准":
-                        debate_rounds = 1
-                    elif research_depth == "深度":
-                        debate_rounds = 2
-                    elif research_depth == "全面":
-                        debate_rounds = 3
-                    else:
-                        debate_rounds = 1  #Default
+                time.sleep(6)
+                progress_tracker.update_progress("🛡️ 保守风险评估")
 
-                    for round_num in range(debate_rounds):
-                        time.sleep(12)
-                        progress_tracker.update_progress(f"🎯 研究辩论 第{round_num+1}轮")
+                time.sleep(6)
+                progress_tracker.update_progress("⚖️ 中性风险评估")
 
-                    time.sleep(8)
-                    progress_tracker.update_progress("👔 研究经理形成共识")
+                time.sleep(8)
+                progress_tracker.update_progress("🎯 风险经理制定策略")
 
-                    #Traders phase
-                    time.sleep(10)
-                    progress_tracker.update_progress("💼 交易员制定策略")
+                #Final phase
+                time.sleep(5)
+                progress_tracker.update_progress("📡 信号处理")
 
-                    #Risk management phase
-                    time.sleep(8)
-                    progress_tracker.update_progress("🔥 激进风险评估")
+            except Exception as e:
+                logger.warning(f"Progress simulation failed:{e}")
+
+        #Start progress simulation thread
+        progress_thread = threading.Thread(target=simulate_progress, daemon=True)
+        progress_thread.start()
+
+        #Defines a progress correction function to receive real-time progress from LangGraph
+        #Node progress map (equivalent to the step weight of RedisProgressTracker)
+        node_progress_map = {
+            #Analyst stage (10%)
+            "📊 市场分析师": 27.5,      #10% + 17.5% (Assuming 2 analysts)
+            "💼 基本面分析师": 45,       # 10% + 35%
+            "📰 新闻分析师": 27.5,       #If there were three analysts,
+            "💬 社交媒体分析师": 27.5,   #If there were four analysts...
+            #Research debate stage (45% 70%)
+            "🐂 看涨研究员": 51.25,      # 45% + 6.25%
+            "🐻 看跌研究员": 57.5,       # 45% + 12.5%
+            "👔 研究经理": 70,           # 45% + 25%
+            #Traders stage (70% → 78%)
+            "💼 交易员决策": 78,         # 70% + 8%
+            #Risk assessment phase (78% → 93%)
+            "🔥 激进风险评估": 81.75,    # 78% + 3.75%
+            "🛡️ 保守风险评估": 85.5,    # 78% + 7.5%
+            "⚖️ 中性风险评估": 89.25,   # 78% + 11.25%
+            "🎯 风险经理": 93,           # 78% + 15%
+            #Final phase (93% → 100%)
+            "📊 生成报告": 97,           # 93% + 4%
+        }
 
-                    time.sleep(6)
-                    progress_tracker.update_progress("🛡️ 保守风险评估")
+        def graph_progress_callback(message: str):
+            """Received LangGraph progress update
 
-                    time.sleep(6)
-                    progress_tracker.update_progress("⚖️ 中性风险评估")
+            Ensure that the step weights of RedisProgressTracker are consistent with the percentage of progress directly mapped by node name
+            Note: Update only as progress increases and avoid covering the virtual step progress of RedisProgressTracker
+            """
+            try:
+                logger.info(f"[Graph progress is called] message={message}")
+                if not progress_tracker:
+                    logger.warning(f"Noone can update progress")
+                    return
 
-                    time.sleep(8)
-                    progress_tracker.update_progress("🎯 风险经理制定策略")
+                #Find the percentage of progress corresponding to nodes
+                progress_pct = node_progress_map.get(message)
 
-                    #Final phase
-                    time.sleep(5)
-                    progress_tracker.update_progress("📡 信号处理")
+                if progress_pct is not None:
+                    #Get the current progress (using process data properties)
+                    current_progress = progress_tracker.progress_data.get('progress_percentage', 0)
 
-                except Exception as e:
-                    logger.warning(f"Progress simulation failed:{e}")
-
-            #Start progress simulation thread
-            progress_thread = threading.Thread(target=simulate_progress, daemon=True)
-            progress_thread.start()
-
-            #Defines a progress correction function to receive real-time progress from LangGraph
-            #Node progress map (equivalent to the step weight of RedisProgressTracker)
-            node_progress_map = {
-                #Analyst stage (10%)
-                "📊 市场分析师": 27.5,      #10% + 17.5% (Assuming 2 analysts)
-                "💼 基本面分析师": 45,       # 10% + 35%
-                "📰 新闻分析师": 27.5,       #If there were three analysts,
-                "💬 社交媒体分析师": 27.5,   #If there were four analysts...
-                #Research debate stage (45% 70%)
-                "🐂 看涨研究员": 51.25,      # 45% + 6.25%
-                "🐻 看跌研究员": 57.5,       # 45% + 12.5%
-                "👔 研究经理": 70,           # 45% + 25%
-                #Traders stage (70% → 78%)
-                "💼 交易员决策": 78,         # 70% + 8%
-                #Risk assessment phase (78% → 93%)
-                "🔥 激进风险评估": 81.75,    # 78% + 3.75%
-                "🛡️ 保守风险评估": 85.5,    # 78% + 7.5%
-                "⚖️ 中性风险评估": 89.25,   # 78% + 11.25%
-                "🎯 风险经理": 93,           # 78% + 15%
-                #Final phase (93% → 100%)
-                "📊 生成报告": 97,           # 93% + 4%
-            }
+                    #Update only as progress increases, avoiding covering the progress of virtual steps
+                    if int(progress_pct) > current_progress:
+                        #Update Redis Progress Tracker
+                        progress_tracker.update_progress({
+                            'progress_percentage': int(progress_pct),
+                            'last_message': message
+                        })
+                        logger.info(f"[Graph progress]{current_progress}% → {int(progress_pct)}% - {message}")
 
-            def graph_progress_callback(message: str):
-                """Received LangGraph progress update
+                        #Also update memory and MongoDB
+                        try:
+                            import asyncio
+                            from datetime import datetime
 
-                Ensure that the step weights of RedisProgressTracker are consistent with the percentage of progress directly mapped by node name
-                Note: Update only as progress increases and avoid covering the virtual step progress of RedisProgressTracker
-                """
-                try:
-                    logger.info(f"[Graph progress is called] message={message}")
-                    if not progress_tracker:
-                        logger.warning(f"Noone can update progress")
-                        return
-
-                    #Find the percentage of progress corresponding to nodes
-                    progress_pct = node_progress_map.get(message)
-
-                    if progress_pct is not None:
-                        #Get the current progress (using process data properties)
-                        current_progress = progress_tracker.progress_data.get('progress_percentage', 0)
-
-                        #Update only as progress increases, avoiding covering the progress of virtual steps
-                        if int(progress_pct) > current_progress:
-                            #Update Redis Progress Tracker
-                            progress_tracker.update_progress({
-                                'progress_percentage': int(progress_pct),
-                                'last_message': message
-                            })
-                            logger.info(f"[Graph progress]{current_progress}% → {int(progress_pct)}% - {message}")
-
-                            #Also update memory and MongoDB
+                            #Try to fetch the currently running cycle of events
                             try:
-                                import asyncio
-                                from datetime import datetime
+                                loop = asyncio.get_running_loop()
+                                #If in the event cycle, use Create task
+                                asyncio.create_task(
+                                    self._update_progress_async(task_id, int(progress_pct), message)
+                                )
+                                logger.debug(f"[Graph progress]{int(progress_pct)}%")
+                            except RuntimeError:
+                                #No running cycle, update MongoDB using sync
+                                from pymongo import MongoClient
+                                from app.core.config import SETTINGS
+
+                                #Create a simultaneous MongoDB client
+                                sync_client = MongoClient(SETTINGS.MONGO_URI)
+                                sync_db = sync_client[SETTINGS.MONGO_DB_NAME]
+
+                                #Synchronize MongoDB
+                                sync_db.analysis_tasks.update_one(
+                                    {"task_id": task_id},
+                                    {
+                                        "$set": {
+                                            "progress": int(progress_pct),
+                                            "current_step": message,
+                                            "message": message,
+                                            "updated_at": datetime.utcnow()
+                                        }
+                                    }
+                                )
+                                sync_client.close()
 
-                                #Try to fetch the currently running cycle of events
+                                #Step up memory (create new event cycle)
+                                loop = asyncio.new_event_loop()
+                                asyncio.set_event_loop(loop)
                                 try:
-                                    loop = asyncio.get_running_loop()
-                                    #If in the event cycle, use Create task
-                                    asyncio.create_task(
-                                        self._update_progress_async(task_id, int(progress_pct), message)
-                                    )
-                                    logger.debug(f"[Graph progress]{int(progress_pct)}%")
-                                except RuntimeError:
-                                    #No running cycle, update MongoDB using sync
-                                    from pymongo import MongoClient
-                                    from app.core.config import SETTINGS
-
-                                    #Create a simultaneous MongoDB client
-                                    sync_client = MongoClient(SETTINGS.MONGO_URI)
-                                    sync_db = sync_client[SETTINGS.MONGO_DB_NAME]
-
-                                    #Synchronize MongoDB
-                                    sync_db.analysis_tasks.update_one(
-                                        {"task_id": task_id},
-                                        {
-                                            "$set": {
-                                                "progress": int(progress_pct),
-                                                "current_step": message,
-                                                "message": message,
-                                                "updated_at": datetime.utcnow()
-                                            }
-                                        }
-                                    )
-                                    sync_client.close()
-
-                                    #Step up memory (create new event cycle)
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                    try:
-                                        loop.run_until_complete(
-                                            self.memory_manager.update_task_status(
-                                                task_id=task_id,
-                                                status=TaskStatus.RUNNING,
-                                                progress=int(progress_pct),
-                                                message=message,
-                                                current_step=message
-                                            )
+                                    loop.run_until_complete(
+                                        self.memory_manager.update_task_status(
+                                            task_id=task_id,
+                                            status=TaskStatus.RUNNING,
+                                            progress=int(progress_pct),
+                                            message=message,
+                                            current_step=message
                                         )
-                                    finally:
-                                        loop.close()
+                                    )
+                                finally:
+                                    loop.close()
 
-                                    logger.debug(f"[Graph progresses]{int(progress_pct)}%")
-                            except Exception as sync_err:
-                                logger.warning(f"Synchronising update failed:{sync_err}")
-                        else:
-                            #No progress, only updates
-                            progress_tracker.update_progress({
-                                'last_message': message
-                            })
-                            logger.info(f"[Graph progress]{current_progress}% >= {int(progress_pct)}Other Organiser, only updates:{message}")
+                                logger.debug(f"[Graph progresses]{int(progress_pct)}%")
+                        except Exception as sync_err:
+                            logger.warning(f"Synchronising update failed:{sync_err}")
                     else:
-                        #Unknown Node, update only
-                        logger.warning(f"[Graph progress] Unknown node:{message}, only update messages")
+                        #No progress, only updates
                         progress_tracker.update_progress({
                             'last_message': message
                         })
+                        logger.info(f"[Graph progress]{current_progress}% >= {int(progress_pct)}Other Organiser, only updates:{message}")
+                else:
+                    #Unknown Node, update only
+                    logger.warning(f"[Graph progress] Unknown node:{message}, only update messages")
+                    progress_tracker.update_progress({
+                        'last_message': message
+                    })
 
-                except Exception as e:
-                    logger.error(f"Graph progress has failed:{e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Graph progress has failed:{e}", exc_info=True)
 
-            logger.info(f"Get ready to call...{graph_progress_callback}")
+        logger.info(f"Get ready to call...{graph_progress_callback}")
 
-            #Implementation of physical analysis, transmission of progress back and task id
-            state, decision = trading_graph.propagate(
-                request.stock_code,
-                analysis_date,
-                progress_callback=graph_progress_callback,
-                task_id=task_id
-            )
+        return {
+            "trading_graph": trading_graph,
+            "analysis_date": analysis_date,
+            "start_time": start_time,
+            "progress_callback": graph_progress_callback,
+            "update_progress": update_progress_sync,
+        }
 
-            logger.info(f"Implementing graph.propagate")
+    def _build_analysis_result(
+        self,
+        task_id: str,
+        request: SingleAnalysisRequest,
+        run: Dict[str, Any],
+        state: Dict[str, Any],
+        decision: Any,
+        progress_tracker: Optional[RedisProgressTracker] = None
+    ) -> Dict[str, Any]:
+        """Extract reports, format the decision and build the task result"""
+        analysis_date = run["analysis_date"]
+        start_time = run["start_time"]
+        update_progress_sync = run["update_progress"]
+
+        #Debugging: Checking the structure of the development
+        logger.info(f"[DBUG] Decision type:{type(decision)}")
+        logger.info(f"[DEBUG] Decision:{decision}")
+        if isinstance(decision, dict):
+            logger.info(f"[DEBUG] Decision:{list(decision.keys())}")
+        elif hasattr(decision, '__dict__'):
+            logger.info(f"[DEBUG] Commission Properties:{list(vars(decision).keys())}")
+
+        #Process result
+        if progress_tracker:
+            progress_tracker.update_progress("📊 处理分析结果")
+        update_progress_sync(90, "处理分析结果...", "result_processing")
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+
+        #Extract reports fields from state
+        reports = {}
+        try:
+            #Define all possible reporting fields
+            report_fields = [
+                'market_report',
+                'sentiment_report',
+                'news_report',
+                'fundamentals_report',
+                'investment_plan',
+                'trader_investment_plan',
+                'final_trade_decision'
+            ]
+
+            #Extract report from state
+            for field in report_fields:
+                if hasattr(state, field):
+                    value = getattr(state, field, "")
+                elif isinstance(state, dict) and field in state:
+                    value = state[field]
+                else:
+                    value = ""
 
-            #Debugging: Checking the structure of the development
-            logger.info(f"[DBUG] Decision type:{type(decision)}")
-            logger.info(f"[DEBUG] Decision:{decision}")
-            if isinstance(decision, dict):
-                logger.info(f"[DEBUG] Decision:{list(decision.keys())}")
-            elif hasattr(decision, '__dict__'):
-                logger.info(f"[DEBUG] Commission Properties:{list(vars(decision).keys())}")
+                if isinstance(value, str) and len(value.strip()) > 10:  #Save only reports with actual content
+                    reports[field] = value.strip()
+                    logger.info(f"[REPORTS]{field}- Length:{len(value.strip())}")
+                else:
+                    logger.debug(f"[REPORTS] Skip the report:{field}- It's empty or too short.")
+
+            #Addressing the status of the research team debate report
+            if hasattr(state, 'investment_debate_state') or (isinstance(state, dict) and 'investment_debate_state' in state):
+                debate_state = getattr(state, 'investment_debate_state', None) if hasattr(state, 'investment_debate_state') else state.get('investment_debate_state')
+                if debate_state:
+                    #Extracting the history of multiple researchers
+                    if hasattr(debate_state, 'bull_history'):
+                        bull_content = getattr(debate_state, 'bull_history', "")
+                    elif isinstance(debate_state, dict) and 'bull_history' in debate_state:
+                        bull_content = debate_state['bull_history']
+                    else:
+                        bull_content = ""
 
-            #Process result
-            if progress_tracker:
-                progress_tracker.update_progress("📊 处理分析结果")
-            update_progress_sync(90, "处理分析结果...", "result_processing")
+                    if bull_content and len(bull_content.strip()) > 10:
+                        reports['bull_researcher'] = bull_content.strip()
+                        logger.info(f"[REPORTS] Extracting report: bull researcher - Length:{len(bull_content.strip())}")
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+                    #Extracting the history of empty researchers
+                    if hasattr(debate_state, 'bear_history'):
+                        bear_content = getattr(debate_state, 'bear_history', "")
+                    elif isinstance(debate_state, dict) and 'bear_history' in debate_state:
+                        bear_content = debate_state['bear_history']
+                    else:
+                        bear_content = ""
 
-            #Extract reports fields from state
-            reports = {}
-            try:
-                #Define all possible reporting fields
-                report_fields = [
-                    'market_report',
-                    'sentiment_report',
-                    'news_report',
-                    'fundamentals_report',
-                    'investment_plan',
-                    'trader_investment_plan',
-                    'final_trade_decision'
-                ]
+                    if bear_content and len(bear_content.strip()) > 10:
+                        reports['bear_researcher'] = bear_content.strip()
+                        logger.info(f"[REPORTS]{len(bear_content.strip())}")
 
-                #Extract report from state
-                for field in report_fields:
-                    if hasattr(state, field):
-                        value = getattr(state, field, "")
-                    elif isinstance(state, dict) and field in state:
-                        value = state[field]
+                    #Decision-making by extracting research managers
+                    if hasattr(debate_state, 'judge_decision'):
+                        decision_content = getattr(debate_state, 'judge_decision', "")
+                    elif isinstance(debate_state, dict) and 'judge_decision' in debate_state:
+                        decision_content = debate_state['judge_decision']
                     else:
-                        value = ""
-
-                    if isinstance(value, str) and len(value.strip()) > 10:  #Save only reports with actual content
-                        reports[field] = value.strip()
-                        logger.info(f"[REPORTS]{field}- Length:{len(value.strip())}")
+                        decision_content = str(debate_state)
+
+                    if decision_content and len(decision_content.strip()) > 10:
+                        reports['research_team_decision'] = decision_content.strip()
+                        logger.info(f"[REPORTS]{len(decision_content.strip())}")
+
+            #Process risk management team debate status report
+            if hasattr(state, 'risk_debate_state') or (isinstance(state, dict) and 'risk_debate_state' in state):
+                risk_state = getattr(state, 'risk_debate_state', None) if hasattr(state, 'risk_debate_state') else state.get('risk_debate_state')
+                if risk_state:
+                    #Extracting the history of radical analysts
+                    if hasattr(risk_state, 'risky_history'):
+                        risky_content = getattr(risk_state, 'risky_history', "")
+                    elif isinstance(risk_state, dict) and 'risky_history' in risk_state:
+                        risky_content = risk_state['risky_history']
                     else:
-                        logger.debug(f"[REPORTS] Skip the report:{field}- It's empty or too short.")
-
-                #Addressing the status of the research team debate report
-                if hasattr(state, 'investment_debate_state') or (isinstance(state, dict) and 'investment_debate_state' in state):
-                    debate_state = getattr(state, 'investment_debate_state', None) if hasattr(state, 'investment_debate_state') else state.get('investment_debate_state')
-                    if debate_state:
-                        #Extracting the history of multiple researchers
-                        if hasattr(debate_state, 'bull_history'):
-                            bull_content = getattr(debate_state, 'bull_history', "")
-                        elif isinstance(debate_state, dict) and 'bull_history' in debate_state:
-                            bull_content = debate_state['bull_history']
-                        else:
-                            bull_content = ""
-
-                        if bull_content and len(bull_content.strip()) > 10:
-                            reports['bull_researcher'] = bull_content.strip()
-                            logger.info(f"[REPORTS] Extracting report: bull researcher - Length:{len(bull_content.strip())}")
-
-                        #Extracting the history of empty researchers
-                        if hasattr(debate_state, 'bear_history'):
-                            bear_content = getattr(debate_state, 'bear_history', "")
-                        elif isinstance(debate_state, dict) and 'bear_history' in debate_state:
-                            bear_content = debate_state['bear_history']
-                        else:
-                            bear_content = ""
-
-                        if bear_content and len(bear_content.strip()) > 10:
-                            reports['bear_researcher'] = bear_content.strip()
-                            logger.info(f"[REPORTS]{len(bear_content.strip())}")
-
-                        #Decision-making by extracting research managers
-                        if hasattr(debate_state, 'judge_decision'):
-                            decision_content = getattr(debate_state, 'judge_decision', "")
-                        elif isinstance(debate_state, dict) and 'judge_decision' in debate_state:
-                            decision_content = debate_state['judge_decision']
-                        else:
-                            decision_content = str(debate_state)
-
-                        if decision_content and len(decision_content.strip()) > 10:
-                            reports['research_team_decision'] = decision_content.strip()
-                            logger.info(f"[REPORTS]{len(decision_content.strip())}")
-
-                #Process risk management team debate status report
-                if hasattr(state, 'risk_debate_state') or (isinstance(state, dict) and 'risk_debate_state' in state):
-                    risk_state = getattr(state, 'risk_debate_state', None) if hasattr(state, 'risk_debate_state') else state.get('risk_debate_state')
-                    if risk_state:
-                        #Extracting the history of radical analysts
-                        if hasattr(risk_state, 'risky_history'):
-                            risky_content = getattr(risk_state, 'risky_history', "")
-                        elif isinstance(risk_state, dict) and 'risky_history' in risk_state:
-                            risky_content = risk_state['risky_history']
-                        else:
-                            risky_content = ""
+                        risky_content = ""
 
-                        if risky_content and len(risky_content.strip()) > 10:
-                            reports['risky_analyst'] = risky_content.strip()
-                            logger.info(f"[REPORTS] Extracting report: risky analyst - Length:{len(risky_content.strip())}")
+                    if risky_content and len(risky_content.strip()) > 10:
+                        reports['risky_analyst'] = risky_content.strip()
+                        logger.info(f"[REPORTS] Extracting report: risky analyst - Length:{len(risky_content.strip())}")
 
-                        #Extract conservative analyst history
-                        if hasattr(risk_state, 'safe_history'):
-                            safe_content = getattr(risk_state, 'safe_history', "")
-                        elif isinstance(risk_state, dict) and 'safe_history' in risk_state:
-                            safe_content = risk_state['safe_history']
-                        else:
-                            safe_content = ""
+                    #Extract conservative analyst history
+                    if hasattr(risk_state, 'safe_history'):
+                        safe_content = getattr(risk_state, 'safe_history', "")
+                    elif isinstance(risk_state, dict) and 'safe_history' in risk_state:
+                        safe_content = risk_state['safe_history']
+                    else:
+                        safe_content = ""
 
-                        if safe_content and len(safe_content.strip()) > 10:
-                            reports['safe_analyst'] = safe_content.strip()
-                            logger.info(f"[REPORTS]{len(safe_content.strip())}")
+                    if safe_content and len(safe_content.strip()) > 10:
+                        reports['safe_analyst'] = safe_content.strip()
+                        logger.info(f"[REPORTS]{len(safe_content.strip())}")
 
-                        #Extract neutral analyst history
-                        if hasattr(risk_state, 'neutral_history'):
-                            neutral_content = getattr(risk_state, 'neutral_history', "")
-                        elif isinstance(risk_state, dict) and 'neutral_history' in risk_state:
-                            neutral_content = risk_state['neutral_history']
-                        else:
-                            neutral_content = ""
+                    #Extract neutral analyst history
+                    if hasattr(risk_state, 'neutral_history'):
+                        neutral_content = getattr(risk_state, 'neutral_history', "")
+                    elif isinstance(risk_state, dict) and 'neutral_history' in risk_state:
+                        neutral_content = risk_state['neutral_history']
+                    else:
+                        neutral_content = ""
 
-                        if neutral_content and len(neutral_content.strip()) > 10:
-                            reports['neutral_analyst'] = neutral_content.strip()
-                            logger.info(f"[REPORTS]{len(neutral_content.strip())}")
+                    if neutral_content and len(neutral_content.strip()) > 10:
+                        reports['neutral_analyst'] = neutral_content.strip()
+                        logger.info(f"[REPORTS]{len(neutral_content.strip())}")
 
-                        #Decision-making by Portfolio Manager
-                        if hasattr(risk_state, 'judge_decision'):
-                            risk_decision = getattr(risk_state, 'judge_decision', "")
-                        elif isinstance(risk_state, dict) and 'judge_decision' in risk_state:
-                            risk_decision = risk_state['judge_decision']
-                        else:
-                            risk_decision = str(risk_state)
+                    #Decision-making by Portfolio Manager
+                    if hasattr(risk_state, 'judge_decision'):
+                        risk_decision = getattr(risk_state, 'judge_decision', "")
+                    elif isinstance(risk_state, dict) and 'judge_decision' in risk_state:
+                        risk_decision = risk_state['judge_decision']
+                    else:
+                        risk_decision = str(risk_state)
 
-                        if risk_decision and len(risk_decision.strip()) > 10:
-                            reports['risk_management_decision'] = risk_decision.strip()
-                            logger.info(f"[REPORTS] Extracting report: risk manage description - Length:{len(risk_decision.strip())}")
+                    if risk_decision and len(risk_decision.strip()) > 10:
+                        reports['risk_management_decision'] = risk_decision.strip()
+                        logger.info(f"[REPORTS] Extracting report: risk manage description - Length:{len(risk_decision.strip())}")
 
-                logger.info(f"[REPORTS]{len(reports)}Reports:{list(reports.keys())}")
+            logger.info(f"[REPORTS]{len(reports)}Reports:{list(reports.keys())}")
 
-            except Exception as e:
-                logger.warning(f"There was an error extracting reports:{e}")
-                #Degraded to extract from detailed analysis
-                try:
-                    if isinstance(decision, dict):
-                        for key, value in decision.items():
-                            if isinstance(value, str) and len(value) > 50:
-                                reports[key] = value
-                        logger.info(f"📊 Downscaling: extracting from development{len(reports)}Report")
-                except Exception as fallback_error:
-                    logger.warning(f"The downgrading also failed:{fallback_error}")
-
-            #🔥Formatization of data (reference web directory realization)
-            formatted_decision = {}
+        except Exception as e:
+            logger.warning(f"There was an error extracting reports:{e}")
+            #Degraded to extract from detailed analysis
             try:
                 if isinstance(decision, dict):
-                    #Processing target prices
-                    target_price = decision.get('target_price')
-                    if target_price is not None and target_price != 'N/A':
-                        try:
-                            if isinstance(target_price, str):
-                                #Remove currency symbols and spaces
-                                clean_price = target_price.replace('$', '').replace('¥', '').replace('￥', '').strip()
-                                target_price = float(clean_price) if clean_price and clean_price != 'None' else None
-                            elif isinstance(target_price, (int, float)):
-                                target_price = float(target_price)
-                            else:
-                                target_price = None
-                        except (ValueError, TypeError):
+                    for key, value in decision.items():
+                        if isinstance(value, str) and len(value) > 50:
+                            reports[key] = value
+                    logger.info(f"📊 Downscaling: extracting from development{len(reports)}Report")
+            except Exception as fallback_error:
+                logger.warning(f"The downgrading also failed:{fallback_error}")
+
+        #🔥Formatization of data (reference web directory realization)
+        formatted_decision = {}
+        try:
+            if isinstance(decision, dict):
+                #Processing target prices
+                target_price = decision.get('target_price')
+                if target_price is not None and target_price != 'N/A':
+                    try:
+                        if isinstance(target_price, str):
+                            #Remove currency symbols and spaces
+                            clean_price = target_price.replace('$', '').replace('¥', '').replace('￥', '').strip()
+                            target_price = float(clean_price) if clean_price and clean_price != 'None' else None
+                        elif isinstance(target_price, (int, float)):
+                            target_price = float(target_price)
+                        else:
                             target_price = None
-                    else:
+                    except (ValueError, TypeError):
                         target_price = None
+                else:
+                    target_price = None
+
+                #For investment proposal in English read Chinese
+                action_translation = {
+                    'BUY': '买入',
+                    'SELL': '卖出',
+                    'HOLD': '持有',
+                    'buy': '买入',
+                    'sell': '卖出',
+                    'hold': '持有'
+                }
+                action = decision.get('action', '持有')
+                chinese_action = action_translation.get(action, action)
 
-                    #For investment proposal in English read Chinese
-                    action_translation = {
-                        'BUY': '买入',
-                        'SELL': '卖出',
-                        'HOLD': '持有',
-                        'buy': '买入',
-                        'sell': '卖出',
-                        'hold': '持有'
-                    }
-                    action = decision.get('action', '持有')
-                    chinese_action = action_translation.get(action, action)
-
-                    formatted_decision = {
-                        'action': chinese_action,
-                        'confidence': decision.get('confidence', 0.5),
-                        'risk_score': decision.get('risk_score', 0.3),
-                        'target_price': target_price,
-                        'reasoning': decision.get('reasoning', '暂无分析推理')
-                    }
+                formatted_decision = {
+                    'action': chinese_action,
+                    'confidence': decision.get('confidence', 0.5),
+                    'risk_score': decision.get('risk_score', 0.3),
+                    'target_price': target_price,
+                    'reasoning': decision.get('reasoning', '暂无分析推理')
+                }
 
-                    logger.info(f"[DBUG] formatted decision:{formatted_decision}")
-                else:
-                    #Deal with other types
-                    formatted_decision = {
-                        'action': '持有',
-                        'confidence': 0.5,
-                        'risk_score': 0.3,
-                        'target_price': None,
-                        'reasoning': '暂无分析推理'
-                    }
-                    logger.warning(f"⚠️ Decision is not a dictionary type:{type(decision)}")
-            except Exception as e:
-                logger.error(f"Formatting failure:{e}")
+                logger.info(f"[DBUG] formatted decision:{formatted_decision}")
+            else:
+                #Deal with other types
                 formatted_decision = {
                     'action': '持有',
                     'confidence': 0.5,
@@ -1711,132 +1907,141 @@ class SimpleAnalysisService:
                     'target_price': None,
                     'reasoning': '暂无分析推理'
                 }
-
-            #🔥 Generates summary and recommendation in a web catalogue
-            summary = ""
-            recommendation = ""
-
-            #1. Prioritize the extraction of summy from the final trade deciation in the reports (consistent with the web directory)
-            if isinstance(reports, dict) and 'final_trade_decision' in reports:
-                final_decision_content = reports['final_trade_decision']
-                if isinstance(final_decision_content, str) and len(final_decision_content) > 50:
-                    #Extract the first 200 characters as summary (fully consistent with the web directory)
-                    summary = final_decision_content[:200].replace('#', '').replace('*', '').strip()
-                    if len(final_decision_content) > 200:
-                        summary += "..."
-                    logger.info(f"[SUMMARY] extracts a summary from final trade description:{len(summary)}Character")
-
-            #If no financial trade description, extract from state
-            if not summary and isinstance(state, dict):
-                final_decision = state.get('final_trade_decision', '')
-                if isinstance(final_decision, str) and len(final_decision) > 50:
-                    summary = final_decision[:200].replace('#', '').replace('*', '').strip()
-                    if len(final_decision) > 200:
-                        summary += "..."
-                    logger.info(f"[SUMMARY] Extract from state.final trade description:{len(summary)}Character")
-
-            #3. Generating recommendation
-            if isinstance(formatted_decision, dict):
-                action = formatted_decision.get('action', '持有')
-                target_price = formatted_decision.get('target_price')
-                reasoning = formatted_decision.get('reasoning', '')
-
-                #Generate investment recommendations
-                recommendation = f"投资建议：{action}。"
-                if target_price:
-                    recommendation += f"目标价格：{target_price}元。"
-                if reasoning:
-                    recommendation += f"决策依据：{reasoning}"
-                logger.info(f"[RECOMENDATION]{len(recommendation)}Character")
-
-            #If not, extract from other reports
-            if not summary and isinstance(reports, dict):
-                #Try extracting summaries from other reports
-                for report_name, content in reports.items():
-                    if isinstance(content, str) and len(content) > 100:
-                        summary = content[:200].replace('#', '').replace('*', '').strip()
-                        if len(content) > 200:
-                            summary += "..."
-                        logger.info(f"[SUMMARY]{report_name}Extract summary:{len(summary)}Character")
-                        break
-
-            #5. Final standby options
-            if not summary:
-                summary = f"对{request.stock_code}的分析已完成，请查看详细报告。"
-                logger.warning(f"[SUMMARY]")
-
-            if not recommendation:
-                recommendation = f"请参考详细分析报告做出投资决策。"
-                logger.warning(f"[RECOMENDATION]")
-
-            #Extract model information from decision-making
-            model_info = decision.get('model_info', 'Unknown') if isinstance(decision, dict) else 'Unknown'
-
-            #Build Results
-            result = {
-                "analysis_id": str(uuid.uuid4()),
-                "stock_code": request.stock_code,
-                "stock_symbol": request.stock_code,  #Add a stock symbol field to maintain compatibility
-                "analysis_date": analysis_date,
-                "summary": summary,
-                "recommendation": recommendation,
-                "confidence_score": formatted_decision.get("confidence", 0.0) if isinstance(formatted_decision, dict) else 0.0,
-                "risk_level": "中等",  #Based on risk score
-                "key_points": [],  #The key points can be extracted from reasoning.
-                "detailed_analysis": decision,
-                "execution_time": execution_time,
-                "tokens_used": decision.get("tokens_used", 0) if isinstance(decision, dict) else 0,
-                "state": state,
-                #Add Analyst Information
-                "analysts": request.parameters.selected_analysts if request.parameters else [],
-                "research_depth": request.parameters.research_depth if request.parameters else "快速",
-                #Add extracted report
-                "reports": reports,
-                #🔥Key fixation: add formatted decision field!
-                "decision": formatted_decision,
-                #Add Model Information Fields
-                "model_info": model_info,
-                #Performance indicator data
-                "performance_metrics": state.get("performance_metrics", {}) if isinstance(state, dict) else {}
+                logger.warning(f"⚠️ Decision is not a dictionary type:{type(decision)}")
+        except Exception as e:
+            logger.error(f"Formatting failure:{e}")
+            formatted_decision = {
+                'action': '持有',
+                'confidence': 0.5,
+                'risk_score': 0.3,
+                'target_price': None,
+                'reasoning': '暂无分析推理'
             }
 
-            logger.info(f"The analysis is complete:{task_id}- Time-consuming.{execution_time:.2f}sec")
-
-            #Debugging: check return structure
-            logger.info(f"[DEBUG] Returning key:{list(result.keys())}")
-            logger.info(f"[DEBUG] returns the data found in the report:{bool(result.get('decision'))}")
-            if result.get('decision'):
-                decision = result['decision']
-                logger.info(f"[DEBUG] returns the content:{decision}")
-
-            return result
-
-        except Exception as e:
-            logger.error(f"[Line pool]{task_id} - {e}")
+        #🔥 Generates summary and recommendation in a web catalogue
+        summary = ""
+        recommendation = ""
+
+        #1. Prioritize the extraction of summy from the final trade deciation in the reports (consistent with the web directory)
+        if isinstance(reports, dict) and 'final_trade_decision' in reports:
+            final_decision_content = reports['final_trade_decision']
+            if isinstance(final_decision_content, str) and len(final_decision_content) > 50:
+                #Extract the first 200 characters as summary (fully consistent with the web directory)
+                summary = final_decision_content[:200].replace('#', '').replace('*', '').strip()
+                if len(final_decision_content) > 200:
+                    summary += "..."
+                logger.info(f"[SUMMARY] extracts a summary from final trade description:{len(summary)}Character")
+
+        #If no financial trade description, extract from state
+        if not summary and isinstance(state, dict):
+            final_decision = state.get('final_trade_decision', '')
+            if isinstance(final_decision, str) and len(final_decision) > 50:
+                summary = final_decision[:200].replace('#', '').replace('*', '').strip()
+                if len(final_decision) > 200:
+                    summary += "..."
+                logger.info(f"[SUMMARY] Extract from state.final trade description:{len(summary)}Character")
+
+        #3. Generating recommendation
+        if isinstance(formatted_decision, dict):
+            action = formatted_decision.get('action', '持有')
+            target_price = formatted_decision.get('target_price')
+            reasoning = formatted_decision.get('reasoning', '')
+
+            #Generate investment recommendations
+            recommendation = f"投资建议：{action}。"
+            if target_price:
+                recommendation += f"目标价格：{target_price}元。"
+            if reasoning:
+                recommendation += f"决策依据：{reasoning}"
+            logger.info(f"[RECOMENDATION]{len(recommendation)}Character")
+
+        #If not, extract from other reports
+        if not summary and isinstance(reports, dict):
+            #Try extracting summaries from other reports
+            for report_name, content in reports.items():
+                if isinstance(content, str) and len(content) > 100:
+                    summary = content[:200].replace('#', '').replace('*', '').strip()
+                    if len(content) > 200:
+                        summary += "..."
+                    logger.info(f"[SUMMARY]{report_name}Extract summary:{len(summary)}Character")
+                    break
+
+        #5. Final standby options
+        if not summary:
+            summary = f"对{request.stock_code}的分析已完成，请查看详细报告。"
+            logger.warning(f"[SUMMARY]")
+
+        if not recommendation:
+            recommendation = f"请参考详细分析报告做出投资决策。"
+            logger.warning(f"[RECOMENDATION]")
+
+        #Extract model information from decision-making
+        model_info = decision.get('model_info', 'Unknown') if isinstance(decision, dict) else 'Unknown'
+
+        #Build Results
+        result = {
+            "analysis_id": str(uuid.uuid4()),
+            "stock_code": request.stock_code,
+            "stock_symbol": request.stock_code,  #Add a stock symbol field to maintain compatibility
+            "analysis_date": analysis_date,
+            "summary": summary,
+            "recommendation": recommendation,
+            "confidence_score": formatted_decision.get("confidence", 0.0) if isinstance(formatted_decision, dict) else 0.0,
+            "risk_level": "中等",  #Based on risk score
+            "key_points": [],  #The key points can be extracted from reasoning.
+            "detailed_analysis": decision,
+            "execution_time": execution_time,
+            "tokens_used": decision.get("tokens_used", 0) if isinstance(decision, dict) else 0,
+            "state": state,
+            #Add Analyst Information
+            "analysts": request.parameters.selected_analysts if request.parameters else [],
+            "research_depth": request.parameters.research_depth if request.parameters else "快速",
+            #Add extracted report
+            "reports": reports,
+            #🔥Key fixation: add formatted decision field!
+            "decision": formatted_decision,
+            #Add Model Information Fields
+            "model_info": model_info,
+            #Performance indicator data
+            "performance_metrics": state.get("performance_metrics", {}) if isinstance(state, dict) else {}
+        }
 
-            #Format error messages as user-friendly tips
-            from ..utils.error_formatter import ErrorFormatter
+        logger.info(f"The analysis is complete:{task_id}- Time-consuming.{execution_time:.2f}sec")
 
-            #Gather context information
-            error_context = {}
-            if request and hasattr(request, 'parameters') and request.parameters:
-                if hasattr(request.parameters, 'quick_model'):
-                    error_context['model'] = request.parameters.quick_model
-                if hasattr(request.parameters, 'deep_model'):
-                    error_context['model'] = request.parameters.deep_model
+        #Debugging: check return structure
+        logger.info(f"[DEBUG] Returning key:{list(result.keys())}")
+        logger.info(f"[DEBUG] returns the data found in the report:{bool(result.get('decision'))}")
+        if result.get('decision'):
+            decision = result['decision']
+            logger.info(f"[DEBUG] returns the content:{decision}")
 
-            #Format error
-            formatted_error = ErrorFormatter.format_error(str(e), error_context)
+        return result
 
-            #Build user-friendly error messages
-            user_friendly_error = (
-                f"{formatted_error['title']}\n\n"
-                f"{formatted_error['message']}\n\n"
-                f"💡 {formatted_error['suggestion']}"
-            )
+    def _format_analysis_error(self, request: SingleAnalysisRequest, e: Exception) -> Exception:
+        """User-friendly exception for a failed analysis"""
+        #Format error messages as user-friendly tips
+        from ..utils.error_formatter import ErrorFormatter
+
+        #Gather context information
+        error_context = {}
+        if request and hasattr(request, 'parameters') and request.parameters:
+            if hasattr(request.parameters, 'quick_model'):
+                error_context['model'] = request.parameters.quick_model
+            if hasattr(request.parameters, 'deep_model'):
+                error_context['model'] = request.parameters.deep_model
+
+        #Format error
+        formatted_error = ErrorFormatter.format_error(str(e), error_context)
+
+        #Build user-friendly error messages
+        user_friendly_error = (
+            f"{formatted_error['title']}\n\n"
+            f"{formatted_error['message']}\n\n"
+            f"💡 {formatted_error['suggestion']}"
+        )
 
-            #Throw an anomaly containing friendly error information
-            raise Exception(user_friendly_error) from e
+        #An anomaly containing friendly error information, raised by the caller
+        return Exception(user_friendly_error)
 
     async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get Task Status"""
@@ -2388,190 +2593,28 @@ class SimpleAnalysisService:
             #Process reports fields - extract all analyses from state
             reports = {}
             if 'state' in result:
-                try:
-                    state = result['state']
-
-                    #Define all possible reporting fields
-                    report_fields = [
-                        'market_report',
-                        'sentiment_report',
-                        'news_report',
-                        'fundamentals_report',
-                        'investment_plan',
-                        'trader_investment_plan',
-                        'final_trade_decision'
-                    ]
-
-                    #Extract report from state
-                    for field in report_fields:
-                        if hasattr(state, field):
-                            value = getattr(state, field, "")
-                        elif isinstance(state, dict) and field in state:
-                            value = state[field]
-                        else:
-                            value = ""
-
-                        if isinstance(value, str) and len(value.strip()) > 10:  #Save only reports with actual content
-                            reports[field] = value.strip()
-
-                    #Addressing the status of the research team debate report
-                    if hasattr(state, 'investment_debate_state') or (isinstance(state, dict) and 'investment_debate_state' in state):
-                        debate_state = getattr(state, 'investment_debate_state', None) if hasattr(state, 'investment_debate_state') else state.get('investment_debate_state')
-                        if debate_state:
-                            #Extracting the history of multiple researchers
-                            if hasattr(debate_state, 'bull_history'):
-                                bull_content = getattr(debate_state, 'bull_history', "")
-                            elif isinstance(debate_state, dict) and 'bull_history' in debate_state:
-                                bull_content = debate_state['bull_history']
-                            else:
-                                bull_content = ""
-
-                            if bull_content and len(bull_content.strip()) > 10:
-                                reports['bull_researcher'] = bull_content.strip()
-
-                            #Extracting the history of empty researchers
-                            if hasattr(debate_state, 'bear_history'):
-                                bear_content = getattr(debate_state, 'bear_history', "")
-                            elif isinstance(debate_state, dict) and 'bear_history' in debate_state:
-                                bear_content = debate_state['bear_history']
-                            else:
-                                bear_content = ""
-
-                            if bear_content and len(bear_content.strip()) > 10:
-                                reports['bear_researcher'] = bear_content.strip()
-
-                            #Decision-making by extracting research managers
-                            if hasattr(debate_state, 'judge_decision'):
-                                decision_content = getattr(debate_state, 'judge_decision', "")
-                            elif isinstance(debate_state, dict) and 'judge_decision' in debate_state:
-                                decision_content = debate_state['judge_decision']
-                            else:
-                                decision_content = str(debate_state)
-
-                            if decision_content and len(decision_content.strip()) > 10:
-                                reports['research_team_decision'] = decision_content.strip()
-
-                    #Process risk management team debate status report
-                    if hasattr(state, 'risk_debate_state') or (isinstance(state, dict) and 'risk_debate_state' in state):
-                        risk_state = getattr(state, 'risk_debate_state', None) if hasattr(state, 'risk_debate_state') else state.get('risk_debate_state')
-                        if risk_state:
-                            #Extracting the history of radical analysts
-                            if hasattr(risk_state, 'risky_history'):
-                                risky_content = getattr(risk_state, 'risky_history', "")
-                            elif isinstance(risk_state, dict) and 'risky_history' in risk_state:
-                                risky_content = risk_state['risky_history']
-                            else:
-                                risky_content = ""
-
-                            if risky_content and len(risky_content.strip()) > 10:
-                                reports['risky_analyst'] = risky_content.strip()
-
-                            #Extract conservative analyst history
-                            if hasattr(risk_state, 'safe_history'):
-                                safe_content = getattr(risk_state, 'safe_history', "")
-                            elif isinstance(risk_state, dict) and 'safe_history' in risk_state:
-                                safe_content = risk_state['safe_history']
-                            else:
-                                safe_content = ""
-
-                            if safe_content and len(safe_content.strip()) > 10:
-                                reports['safe_analyst'] = safe_content.strip()
-
-                            #Extract neutral analyst history
-                            if hasattr(risk_state, 'neutral_history'):
-                                neutral_content = getattr(risk_state, 'neutral_history', "")
-                            elif isinstance(risk_state, dict) and 'neutral_history' in risk_state:
-                                neutral_content = risk_state['neutral_history']
-                            else:
-                                neutral_content = ""
-
-                            if neutral_content and len(neutral_content.strip()) > 10:
-                                reports['neutral_analyst'] = neutral_content.strip()
-
-                            #Decision-making by Portfolio Manager
-                            if hasattr(risk_state, 'judge_decision'):
-                                risk_decision = getattr(risk_state, 'judge_decision', "")
-                            elif isinstance(risk_state, dict) and 'judge_decision' in risk_state:
-                                risk_decision = risk_state['judge_decision']
-                            else:
-                                risk_decision = str(risk_state)
-
-                            if risk_decision and len(risk_decision.strip()) > 10:
-                                reports['risk_management_decision'] = risk_decision.strip()
-
-                    logger.info(f"📊 From the state{len(reports)}Reports:{list(reports.keys())}")
+                reports = _extract_state_reports(result['state'], result.get('detailed_analysis'))
 
-                except Exception as e:
-                    logger.warning(f"⚠️ There was an error in handling reports in the state:{e}")
-                    #Degraded to extract from detailed analysis
-                    if 'detailed_analysis' in result:
-                        try:
-                            detailed_analysis = result['detailed_analysis']
-                            if isinstance(detailed_analysis, dict):
-                                for key, value in detailed_analysis.items():
-                                    if isinstance(value, str) and len(value) > 50:
-                                        reports[key] = value
-                                logger.info(f"📊 Decline: extracted from detailed analysis{len(reports)}Report")
-                        except Exception as fallback_error:
-                            logger.warning(f"⚠️ The downgrading also failed:{fallback_error}")
-
-            #🔥Infer market type based on stock code
-            from tradingagents.utils.stock_utils import StockUtils
-            market_info = StockUtils.get_market_info(stock_symbol)
+            #🔥Market type and stock name from the company profile the run already resolved
             market_type_map = {
                 "china_a": "A股",
                 "hong_kong": "港股",
                 "us": "美股",
                 "unknown": "A股"  #Default to Unit A
             }
-            market_type = market_type_map.get(market_info.get("market", "unknown"), "A股")
-            logger.info(f"📊 Infer market type:{stock_symbol} -> {market_type}")
-
-            #Can not open message
-            stock_name = stock_symbol  #Default use of stock code
             try:
-                if market_info.get("market") == "china_a":
-                    #Unit A: Access to stock information using a unified interface
-                    from tradingagents.dataflows.interface import get_china_stock_info_unified
-                    stock_info = get_china_stock_info_unified(stock_symbol)
-                    logger.debug(f"📊 Can not open message{stock_info[:200] if stock_info else 'None'}...")
-
-                    if stock_info and "股票名称:" in stock_info:
-                        stock_name = stock_info.split("股票名称:")[1].split("\n")[0].strip()
-                        logger.info(f"✅ For the name of Unit A:{stock_symbol} -> {stock_name}")
-                    else:
-                        #Downscaling: attempt to obtain directly from the data source manager
-                        logger.warning(f"⚠️ Could not close temporary folder: %s{stock_symbol}, try to downgrade")
-                        try:
-                            from tradingagents.dataflows.data_source_manager import get_china_stock_info_unified as get_info_dict
-                            info_dict = get_info_dict(stock_symbol)
-                            if info_dict and info_dict.get('name'):
-                                stock_name = info_dict['name']
-                                logger.info(f"✅ The downgrading programme successfully acquired the name of the stock:{stock_symbol} -> {stock_name}")
-                        except Exception as fallback_e:
-                            logger.error(f"❌ The demotion programme also failed:{fallback_e}")
-
-                elif market_info.get("market") == "hong_kong":
-                    #Port Unit: use of improved Port Unit tools
-                    try:
-                        from tradingagents.dataflows.providers.hk.improved_hk import get_hk_company_name_improved
-                        stock_name = get_hk_company_name_improved(stock_symbol)
-                        logger.info(f"📊 For the name of the Port Unit:{stock_symbol} -> {stock_name}")
-                    except Exception:
-                        clean_ticker = stock_symbol.replace('.HK', '').replace('.hk', '')
-                        stock_name = f"港股{clean_ticker}"
-                elif market_info.get("market") == "us":
-                    #United States share: using simple mapping
-                    us_stock_names = {
-                        'AAPL': '苹果公司', 'TSLA': '特斯拉', 'NVDA': '英伟达',
-                        'MSFT': '微软', 'GOOGL': '谷歌', 'AMZN': '亚马逊',
-                        'META': 'Meta', 'NFLX': '奈飞'
-                    }
-                    stock_name = us_stock_names.get(stock_symbol.upper(), f"美股{stock_symbol}")
-                    logger.info(f"📊 For United States share names:{stock_symbol} -> {stock_name}")
+                run_state = result.get('state')
+                profile = run_state.get('company_profile') if isinstance(run_state, dict) else None
+                if not profile:
+                    from tradingagents.agents.utils.company_profile import resolve_company_profile
+                    profile = await asyncio.to_thread(resolve_company_profile, stock_symbol)
+                stock_name = profile.get('name') or stock_symbol
+                market_type = market_type_map.get(profile.get('market', 'unknown'), "A股")
             except Exception as e:
-                logger.warning(f"⚠️ Could not close temporary folder: %s{stock_symbol} - {e}")
+                logger.warning(f"⚠️ Could not resolve stock name:{stock_symbol} - {e}")
                 stock_name = stock_symbol
+                market_type = "A股"
+            logger.info(f"📊 Stock profile:{stock_symbol} -> {stock_name} ({market_type})")
 
             #Build document (consistent with MongoDBReportManager in web directory)
             document = {
@@ -2592,6 +2635,7 @@ class SimpleAnalysisService:
 
                 #Contents of report
                 "reports": reports,
+                "report_size": len(str(reports)),  #Lets the report list skip loading the report bodies
 
                 #🔥Key fixation: add formatted decision field!
                 "decision": result.get("decision", {}),
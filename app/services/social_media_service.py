@@ -9,6 +9,15 @@ from pymongo import ReplaceOne
 from pymongo.errors import BulkWriteError
 
 from app.core.database import get_database_async
+from tradingagents.dataflows.news.search_index import (
+    RESULT_PROJECTION,
+    SEARCH_INDEX_KEYS,
+    SEARCH_INDEX_NAME,
+    SOCIAL_TEXT_FIELDS,
+    build_search_fields,
+    schedule_backfill,
+    search_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +67,7 @@ class SocialMediaService:
     def __init__(self):
         self.db = None
         self.collection = None
+        self._backfill_task = None
         self.logger = logging.getLogger(self.__class__.__name__)
     
     async def initialize(self):
@@ -65,11 +75,22 @@ class SocialMediaService:
         try:
             self.db = get_database_async()
             self.collection = self.db.social_media_messages
+            await self._ensure_search_index()
             self.logger.info("The social media data service was successfully initiated")
         except Exception as e:
             self.logger.error(f"The initialization of the social media data service failed:{e}")
             raise
     
+    async def _ensure_search_index(self):
+        """CJK-aware search index (bigram postings + symbol/time filters)"""
+        try:
+            await self.collection.create_index(SEARCH_INDEX_KEYS, name=SEARCH_INDEX_NAME, background=True)
+            #Postings for messages saved before the search index existed (the task is kept so it is not collected)
+            self._backfill_task = schedule_backfill(self.collection, SOCIAL_TEXT_FIELDS)
+        except Exception as e:
+            #Index creation failure should not prevent service startup
+            self.logger.warning(f"Warning (possibly exists) when creating search index:{e}")
+
     async def _get_collection(self):
         """Get Collective Examples"""
         if self.collection is None:
@@ -100,6 +121,8 @@ class SocialMediaService:
                 #Add Timetamp
                 message["created_at"] = datetime.utcnow()
                 message["updated_at"] = datetime.utcnow()
+                #Search postings are written with the message (incremental search index)
+                message.update(build_search_fields(message, SOCIAL_TEXT_FIELDS))
                 
                 #Use message id and platform as unique identifiers
                 filter_dict = {
@@ -192,7 +215,7 @@ class SocialMediaService:
                 query["hashtags"] = {"$in": params.hashtags}
             
             #Execute queries
-            cursor = collection.find(query)
+            cursor = collection.find(query, RESULT_PROJECTION)
             
             #Sort
             cursor = cursor.sort(params.sort_by, params.sort_order)
@@ -237,24 +260,17 @@ class SocialMediaService:
         try:
             collection = await self._get_collection()
             
-            #Build search conditions
-            search_query = {
-                "$text": {"$search": query}
-            }
+            #Build filter conditions (pushed into the search index scan)
+            filters = {}
             
             if symbol:
-                search_query["symbol"] = symbol
+                filters["symbol"] = symbol
             
             if platform:
-                search_query["platform"] = platform
-            
-            #Execute Search
-            cursor = collection.find(
-                search_query,
-                {"score": {"$meta": "textScore"}}
-            ).sort([("score", {"$meta": "textScore"})])
+                filters["platform"] = platform
             
-            messages = await cursor.limit(limit).to_list(length=limit)
+            #Execute search, sort by BM25 relevance
+            messages = await search_async(collection, query, filters, limit=limit)
             
             self.logger.debug(f"Other Organiser{len(messages)}Can not open message")
             return messages
@@ -7,11 +7,18 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
+from pymongo.errors import DuplicateKeyError
+
 from app.core.database import get_mongo_db_async
 from app.models.config_models import UsageRecord, UsageStatistics
+from tradingagents.config.usage_models import ROLLUP_COLLECTION, ROLLUP_KEY_FIELDS, build_rollup_update
 
 logger = logging.getLogger("app.services.usage_statistics_service")
 
+#Marks that rollups were built from the raw records written before they existed
+MIGRATIONS_COLLECTION = "system_migrations"
+ROLLUP_BACKFILL_MIGRATION = "token_usage_daily_backfill"
+
 
 class UsageStatisticsService:
     """Use of statistical services"""
@@ -19,6 +26,9 @@ class UsageStatisticsService:
     def __init__(self):
         #Use the group names of tradencies
         self.collection_name = "token_usage"
+        #One document per (date, provider, model, currency), maintained on insert
+        self.rollup_collection_name = ROLLUP_COLLECTION
+        self._rollups_ready = False
     
     async def add_usage_record(self, record: UsageRecord) -> bool:
         """Add Usage Record"""
@@ -29,12 +39,28 @@ class UsageStatisticsService:
             record_dict = record.model_dump(exclude={"id"})
             result = await collection.insert_one(record_dict)
 
+            #Maintain the daily rollup incrementally
+            await self._apply_rollup(db, record_dict)
+
             logger.info(f"Use record successful:{record.provider}/{record.model_name}")
             return True
         except Exception as e:
             logger.error(f"Could not close temporary folder: %s{e}")
             return False
     
+    async def _apply_rollup(self, db, record_dict: Dict[str, Any]) -> None:
+        rollup_filter, rollup_update = build_rollup_update(record_dict)
+        rollups = db[self.rollup_collection_name]
+        try:
+            try:
+                await rollups.update_one(rollup_filter, rollup_update, upsert=True)
+            except DuplicateKeyError:
+                #A concurrent upsert created the document first; the retry updates it
+                await rollups.update_one(rollup_filter, rollup_update, upsert=True)
+        except Exception as e:
+            #The raw record is stored; rebuild_daily_rollups can repair the rollup
+            logger.warning(f"Daily usage rollup update failed:{e}")
+
     async def get_usage_records(
         self,
         provider: Optional[str] = None,
@@ -81,110 +107,189 @@ class UsageStatisticsService:
         provider: Optional[str] = None,
         model_name: Optional[str] = None
     ) -> UsageStatistics:
-        """Access to usage statistics"""
+        """Access to usage statistics
+
+        Whole days are read from the daily rollups; only the partial first day of the
+        window is aggregated from raw records (server-side $group).
+        """
         try:
             db = get_mongo_db_async()
-            collection = db[self.collection_name]
-            
+            await self.ensure_daily_rollups()
+
             #Calculate the time frame
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
-            
-            #Build query conditions
-            query = {
-                "timestamp": {
-                    "$gte": start_date.isoformat(),
-                    "$lte": end_date.isoformat()
-                }
+            first_full_day = (start_date + timedelta(days=1)).date().isoformat()
+
+            rollup_query: Dict[str, Any] = {"date": {"$gte": first_full_day}}
+            raw_match: Dict[str, Any] = {
+                "timestamp": {"$gte": start_date.isoformat(), "$lt": first_full_day}
             }
             if provider:
-                query["provider"] = provider
+                rollup_query["provider"] = provider
+                raw_match["provider"] = provider
             if model_name:
-                query["model_name"] = model_name
-            
-            #Get all records
-            cursor = collection.find(query)
-            records = []
-            async for doc in cursor:
-                records.append(doc)
-            
-            #Statistics
-            stats = UsageStatistics()
-            stats.total_requests = len(records)
+                rollup_query["model_name"] = model_name
+                raw_match["model_name"] = model_name
 
-            #Cost by currency
-            cost_by_currency = defaultdict(float)
+            rows: List[Dict[str, Any]] = []
+            async for doc in db[self.rollup_collection_name].find(rollup_query, {"_id": 0, "updated_at": 0}):
+                rows.append(doc)
+            async for doc in db[self.collection_name].aggregate(self._rollup_pipeline(raw_match)):
+                rows.append({**doc.pop("_id"), **doc})
 
-            by_provider = defaultdict(lambda: {
-                "requests": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cost": 0.0,
-                "cost_by_currency": defaultdict(float)
-            })
-            by_model = defaultdict(lambda: {
-                "requests": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "cost": 0.0,
-                "cost_by_currency": defaultdict(float)
-            })
-            by_date = defaultdict(lambda: {
+            stats = self._fold_rollup_rows(rows)
+            logger.info(f"✅ for statistical success:{stats.total_requests}Notes")
+            return stats
+        except Exception as e:
+            logger.error(f"Access to statistics failed:{e}")
+            return UsageStatistics()
+
+    @staticmethod
+    def _rollup_pipeline(match: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Group raw records into daily rollup rows (date, provider, model, currency)"""
+        return [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {
+                        "date": {"$substrCP": ["$timestamp", 0, 10]},
+                        "provider": {"$ifNull": ["$provider", "unknown"]},
+                        "model_name": {"$ifNull": ["$model_name", "unknown"]},
+                        "currency": {"$ifNull": ["$currency", "CNY"]},
+                    },
+                    "requests": {"$sum": 1},
+                    "input_tokens": {"$sum": {"$ifNull": ["$input_tokens", 0]}},
+                    "output_tokens": {"$sum": {"$ifNull": ["$output_tokens", 0]}},
+                    "cost": {"$sum": {"$ifNull": ["$cost", 0]}},
+                }
+            },
+        ]
+
+    @staticmethod
+    def _fold_rollup_rows(rows: List[Dict[str, Any]]) -> UsageStatistics:
+        """Combine rollup rows into the provider/model/date breakdown"""
+        stats = UsageStatistics()
+
+        def _bucket():
+            return {
                 "requests": 0,
                 "input_tokens": 0,
                 "output_tokens": 0,
                 "cost": 0.0,
                 "cost_by_currency": defaultdict(float)
-            })
+            }
+
+        #Cost by currency
+        cost_by_currency = defaultdict(float)
+        by_provider = defaultdict(_bucket)
+        by_model = defaultdict(_bucket)
+        by_date = defaultdict(_bucket)
+
+        for row in rows:
+            requests = row.get("requests", 0)
+            input_tokens = row.get("input_tokens", 0)
+            output_tokens = row.get("output_tokens", 0)
+            cost = row.get("cost", 0.0)
+            currency = row.get("currency", "CNY")
+
+            #Total
+            stats.total_requests += requests
+            stats.total_input_tokens += input_tokens
+            stats.total_output_tokens += output_tokens
+            stats.total_cost += cost  #Keep backward compatibility
+            cost_by_currency[currency] += cost
+
+            provider_key = row.get("provider", "unknown")
+            model_key = f"{provider_key}/{row.get('model_name', 'unknown')}"
+            #By supplier / By Model / By date
+            for bucket in (by_provider[provider_key], by_model[model_key], by_date[row.get("date", "")]):
+                bucket["requests"] += requests
+                bucket["input_tokens"] += input_tokens
+                bucket["output_tokens"] += output_tokens
+                bucket["cost"] += cost
+                bucket["cost_by_currency"][currency] += cost
+
+        by_date.pop("", None)
+
+        #Convert default to normal dict (including embedded host by currence)
+        stats.cost_by_currency = dict(cost_by_currency)
+        stats.by_provider = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in by_provider.items()}
+        stats.by_model = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in by_model.items()}
+        stats.by_date = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in sorted(by_date.items())}
+        return stats
+
+    async def ensure_daily_rollups(self) -> None:
+        """Build the rollups from all raw records once (upgrade from older versions)
+
+        Inserts after the upgrade already create rollup documents, so whether the
+        backfill ran is recorded in a migration marker rather than inferred from them.
+        """
+        if self._rollups_ready:
+            return
+        db = get_mongo_db_async()
+        migrations = db[MIGRATIONS_COLLECTION]
+        if await migrations.find_one({"_id": ROLLUP_BACKFILL_MIGRATION}) is None:
+            if await db[self.collection_name].find_one({}, {"_id": 1}) is not None:
+                await self.rebuild_daily_rollups()
+            await migrations.update_one(
+                {"_id": ROLLUP_BACKFILL_MIGRATION},
+                {"$set": {"completed_at": datetime.now()}},
+                upsert=True,
+            )
+        self._rollups_ready = True
+
+    async def rebuild_daily_rollups(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> int:
+        """Recompute rollups from raw records for the dates [start_date, end_date] (YYYY-MM-DD, inclusive)"""
+        db = get_mongo_db_async()
+        rollups = db[self.rollup_collection_name]
+        #$merge needs a unique index on its "on" fields
+        await rollups.create_index([(field, 1) for field in ROLLUP_KEY_FIELDS], unique=True)
+
+        date_filter: Dict[str, Any] = {}
+        timestamp_filter: Dict[str, Any] = {}
+        if start_date:
+            date_filter["$gte"] = start_date
+            timestamp_filter["$gte"] = start_date
+        if end_date:
+            date_filter["$lte"] = end_date
+            #Every timestamp of end_date sorts before end_date + "~"
+            timestamp_filter["$lt"] = end_date + "~"
+
+        await rollups.delete_many({"date": date_filter} if date_filter else {})
+
+        match = {"timestamp": timestamp_filter} if timestamp_filter else {}
+        pipeline = self._rollup_pipeline(match) + [
+            {
+                "$project": {
+                    "_id": 0,
+                    "date": "$_id.date",
+                    "provider": "$_id.provider",
+                    "model_name": "$_id.model_name",
+                    "currency": "$_id.currency",
+                    "requests": 1,
+                    "input_tokens": 1,
+                    "output_tokens": 1,
+                    "cost": 1,
+                    "updated_at": "$$NOW",
+                }
+            },
+            {
+                "$merge": {
+                    "into": self.rollup_collection_name,
+                    "on": list(ROLLUP_KEY_FIELDS),
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+        async for _ in db[self.collection_name].aggregate(pipeline):
+            pass
+
+        count = await rollups.count_documents({"date": date_filter} if date_filter else {})
+        logger.info(f"Daily usage rollups rebuilt:{count} documents ({start_date or '*'} ~ {end_date or '*'})")
+        return count
 
-            for record in records:
-                cost = record.get("cost", 0.0)
-                currency = record.get("currency", "CNY")
-
-                #Total
-                stats.total_input_tokens += record.get("input_tokens", 0)
-                stats.total_output_tokens += record.get("output_tokens", 0)
-                stats.total_cost += cost  #Keep backward compatibility
-                cost_by_currency[currency] += cost
-
-                #By supplier
-                provider_key = record.get("provider", "unknown")
-                by_provider[provider_key]["requests"] += 1
-                by_provider[provider_key]["input_tokens"] += record.get("input_tokens", 0)
-                by_provider[provider_key]["output_tokens"] += record.get("output_tokens", 0)
-                by_provider[provider_key]["cost"] += cost
-                by_provider[provider_key]["cost_by_currency"][currency] += cost
-
-                #By Model
-                model_key = f"{record.get('provider', 'unknown')}/{record.get('model_name', 'unknown')}"
-                by_model[model_key]["requests"] += 1
-                by_model[model_key]["input_tokens"] += record.get("input_tokens", 0)
-                by_model[model_key]["output_tokens"] += record.get("output_tokens", 0)
-                by_model[model_key]["cost"] += cost
-                by_model[model_key]["cost_by_currency"][currency] += cost
-
-                #By date
-                timestamp = record.get("timestamp", "")
-                if timestamp:
-                    date_key = timestamp[:10]  # YYYY-MM-DD
-                    by_date[date_key]["requests"] += 1
-                    by_date[date_key]["input_tokens"] += record.get("input_tokens", 0)
-                    by_date[date_key]["output_tokens"] += record.get("output_tokens", 0)
-                    by_date[date_key]["cost"] += cost
-                    by_date[date_key]["cost_by_currency"][currency] += cost
-
-            #Convert default to normal dict (including embedded host by currence)
-            stats.cost_by_currency = dict(cost_by_currency)
-            stats.by_provider = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in by_provider.items()}
-            stats.by_model = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in by_model.items()}
-            stats.by_date = {k: {**v, "cost_by_currency": dict(v["cost_by_currency"])} for k, v in by_date.items()}
-            
-            logger.info(f"✅ for statistical success:{stats.total_requests}Notes")
-            return stats
-        except Exception as e:
-            logger.error(f"Access to statistics failed:{e}")
-            return UsageStatistics()
-    
     async def get_cost_by_provider(self, days: int = 7) -> Dict[str, float]:
         """Access to cost statistics by supplier"""
         stats = await self.get_usage_statistics(days=days)
@@ -224,6 +329,12 @@ class UsageStatisticsService:
             })
             
             deleted_count = result.deleted_count
+
+            #Drop rollups of fully deleted days and recompute the partially deleted cutoff day
+            cutoff_day = cutoff_date.date().isoformat()
+            await db[self.rollup_collection_name].delete_many({"date": {"$lt": cutoff_day}})
+            await self.rebuild_daily_rollups(start_date=cutoff_day, end_date=cutoff_day)
+
             logger.info(f"Delete the old record successfully:{deleted_count}Article")
             return deleted_count
         except Exception as e:
@@ -8,6 +8,14 @@ from typing import Optional
 from zoneinfo import ZoneInfo
 
 from app.core.config import SETTINGS
+from tradingagents.dataflows.trading_calendar import get_trading_calendar
+
+
+def is_trading_day(now: Optional[datetime] = None) -> bool:
+    """Whether the given day is an A-share trading day (weekends and exchange holidays excluded)"""
+    tz = ZoneInfo(SETTINGS.TIMEZONE)
+    now = now or datetime.now(tz)
+    return get_trading_calendar().is_trading_day(now.date(), "CN")
 
 
 def is_trading_time(now: Optional[datetime] = None) -> bool:
@@ -32,8 +40,8 @@ def is_trading_time(now: Optional[datetime] = None) -> bool:
     tz = ZoneInfo(SETTINGS.TIMEZONE)
     now = now or datetime.now(tz)
     
-    #Chile
-    if now.weekday() > 4:
+    #Weekends and holidays
+    if not is_trading_day(now):
         return False
     
     t = now.time()
@@ -64,8 +72,8 @@ def is_strict_trading_time(now: Optional[datetime] = None) -> bool:
     tz = ZoneInfo(SETTINGS.TIMEZONE)
     now = now or datetime.now(tz)
     
-    #Chile
-    if now.weekday() > 4:
+    #Weekends and holidays
+    if not is_trading_day(now):
         return False
     
     t = now.time()
@@ -91,8 +99,8 @@ def is_pre_market_time(now: Optional[datetime] = None) -> bool:
     tz = ZoneInfo(SETTINGS.TIMEZONE)
     now = now or datetime.now(tz)
     
-    #Chile
-    if now.weekday() > 4:
+    #Weekends and holidays
+    if not is_trading_day(now):
         return False
     
     t = now.time()
@@ -114,8 +122,8 @@ def is_after_market_time(now: Optional[datetime] = None) -> bool:
     tz = ZoneInfo(SETTINGS.TIMEZONE)
     now = now or datetime.now(tz)
     
-    #Chile
-    if now.weekday() > 4:
+    #Weekends and holidays
+    if not is_trading_day(now):
         return False
     
     t = now.time()
@@ -143,8 +151,8 @@ def get_trading_status(now: Optional[datetime] = None) -> str:
     tz = ZoneInfo(SETTINGS.TIMEZONE)
     now = now or datetime.now(tz)
     
-    #Weekend
-    if now.weekday() > 4:
+    #Weekends and holidays
+    if not is_trading_day(now):
         return "closed"
     
     t = now.time()
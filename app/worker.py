@@ -21,6 +21,7 @@ sys.path.insert(0, str(project_root))
 from app.core.logging_config import setup_logging
 from app.core.database import init_database_async, close_database_async, get_redis_client_async
 from app.core.config import SETTINGS
+from app.services.queue import transition_task_status
 
 # Redis keys (must match queue_service)
 READY_LIST = "qa:ready"
@@ -63,7 +64,8 @@ async def process_task(task_id: str) -> None:
 
     # Mark processing
     now = int(time.time())
-    await r.hset(key, mapping={"status": "processing", "started_at": str(now)})
+    batch_id = data.get("batch_id")
+    await transition_task_status(r, task_id, "processing", batch_id, fields={"started_at": str(now)})
     await r.sadd(SET_PROCESSING, task_id)
     logger.info(f"Processing task {task_id} | user={data.get('user')} symbol={data.get('symbol')}")
 
@@ -156,8 +158,7 @@ async def process_task(task_id: str) -> None:
 
         # Mark completed/failed
         finished = int(time.time())
-        await r.hset(key, mapping={
-            "status": status,
+        await transition_task_status(r, task_id, status, batch_id, fields={
             "completed_at": str(finished),
             "result": json.dumps(result, ensure_ascii=False),
         })
@@ -172,8 +173,7 @@ async def process_task(task_id: str) -> None:
     except Exception as e:
         logger.exception(f"Task {task_id} processing failed: {e}")
         finished = int(time.time())
-        await r.hset(key, mapping={
-            "status": "failed",
+        await transition_task_status(r, task_id, "failed", batch_id, fields={
             "completed_at": str(finished),
             "error": str(e),
         })
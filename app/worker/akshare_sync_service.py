@@ -31,6 +31,7 @@ class AKShareSyncService:
         self.db = None
         self.batch_size = 100
         self.rate_limit_delay = 0.2  #Delay recommended by Akshare
+        self.financial_concurrency = 4  #Symbols fetched concurrently during financial sync
     
     async def initialize(self):
         """Initializing Sync Service"""
@@ -826,46 +827,46 @@ class AKShareSyncService:
             return stats
 
     async def _process_financial_batch(self, batch: List[str]) -> Dict[str, Any]:
-        """Processing of financial data batches"""
+        """Processing of financial data batches
+
+        Symbols are processed concurrently (bounded by financial_concurrency); the
+        provider applies the AKShare rate limiter to every statement request.
+        """
         batch_stats = {
             "success_count": 0,
             "error_count": 0,
             "errors": []
         }
+        semaphore = asyncio.Semaphore(self.financial_concurrency)
 
-        for symbol in batch:
-            try:
-                #Access to financial data
+        async def process_symbol(symbol: str):
+            async with semaphore:
+                #Access to financial data (shared with other callers through the provider's keyed cache)
                 financial_data = await self.provider.get_financial_data(symbol)
-
-                if financial_data:
-                    #Use of harmonized financial data services for data preservation
-                    success = await self._save_financial_data(symbol, financial_data)
-                    if success:
-                        batch_stats["success_count"] += 1
-                        logger.debug(f"✅ {symbol}Financial data retention success")
-                    else:
-                        batch_stats["error_count"] += 1
-                        batch_stats["errors"].append({
-                            "code": symbol,
-                            "error": "财务数据保存失败",
-                            "context": "_process_financial_batch"
-                        })
-                else:
-                    batch_stats["error_count"] += 1
-                    batch_stats["errors"].append({
-                        "code": symbol,
-                        "error": "财务数据为空",
-                        "context": "_process_financial_batch"
-                    })
-
-            except Exception as e:
-                batch_stats["error_count"] += 1
-                batch_stats["errors"].append({
-                    "code": symbol,
-                    "error": str(e),
-                    "context": "_process_financial_batch"
-                })
+                if not financial_data:
+                    return "财务数据为空"
+
+                #Use of harmonized financial data services for data preservation
+                success = await self._save_financial_data(symbol, financial_data)
+                if not success:
+                    return "财务数据保存失败"
+
+                logger.debug(f"✅ {symbol}Financial data retention success")
+                return None
+
+        results = await asyncio.gather(*[process_symbol(symbol) for symbol in batch], return_exceptions=True)
+
+        for symbol, result in zip(batch, results):
+            if result is None:
+                batch_stats["success_count"] += 1
+                continue
+
+            batch_stats["error_count"] += 1
+            batch_stats["errors"].append({
+                "code": symbol,
+                "error": str(result),
+                "context": "_process_financial_batch"
+            })
 
         return batch_stats
 
@@ -473,40 +473,13 @@ class TushareSyncService:
 
     def _is_trading_time(self) -> bool:
         """Determines whether the current transaction time is
-        Unit A trading time:
-        Monday to Friday.
+        Unit A trading time (exchange holidays are skipped via the local trading calendar):
         - 9.30-11.30 a.m.
-        - 15:00 to 15:00
-
-        Note: This method does not check holidays and only check periods
+        - 13:00 to 15:00
         """
-        from datetime import datetime
-        import pytz
-
-        #Use Shanghai Time Zone
-        tz = pytz.timezone('Asia/Shanghai')
-        now = datetime.now(tz)
-
-        #Check for weekends.
-        if now.weekday() >= 5:  #5 = Saturday, 6 = Sunday
-            return False
-
-        #Check period
-        current_time = now.time()
-
-        #Morning transactions: 9.30 - 11.30 a.m.
-        morning_start = datetime.strptime("09:30", "%H:%M").time()
-        morning_end = datetime.strptime("11:30", "%H:%M").time()
-
-        #Afternoon to 13:15
-        afternoon_start = datetime.strptime("13:00", "%H:%M").time()
-        afternoon_end = datetime.strptime("15:00", "%H:%M").time()
-
-        #To determine whether or not it's within the transaction time frame
-        is_morning = morning_start <= current_time <= morning_end
-        is_afternoon = afternoon_start <= current_time <= afternoon_end
+        from tradingagents.dataflows.trading_calendar import get_trading_calendar
 
-        return is_morning or is_afternoon
+        return get_trading_calendar().is_open(market="CN")
 
     async def _get_and_save_quotes(self, symbol: str) -> bool:
         """Get and save individual stock lines"""
@@ -35,6 +35,7 @@ from cli.utils import (
     select_research_depth,
     select_shallow_thinking_agent,
 )
+from tradingagents.agents.utils.company_profile import resolve_company_profile
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.utils.logging_manager import get_logger
@@ -1239,7 +1240,8 @@ def run_analysis():
 
         # Initialize state and get graph args
         init_agent_state = graph.propagator.create_initial_state(
-            selections["ticker"], selections["analysis_date"]
+            selections["ticker"], selections["analysis_date"],
+            resolve_company_profile(selections["ticker"])
         )
         args = graph.propagator.get_graph_args()
 
@@ -1570,7 +1572,8 @@ def run_analysis():
 
         # Get final state and decision
         final_state = trace[-1]
-        decision = graph.process_signal(final_state["final_trade_decision"], selections['ticker'])
+        decision = graph.process_signal(final_state["final_trade_decision"], selections['ticker'],
+                                        final_state.get("company_profile"))
 
         ui.show_success("🤖 投资信号处理完成")
 
@@ -13,6 +13,22 @@ export interface CacheStats {
   stockDataCount: number
   newsDataCount: number
   analysisDataCount: number
+  hotCache?: HotCacheStats | null
+}
+
+/**
+ * 进程内热缓存统计
+ */
+export interface HotCacheStats {
+  hits: number
+  misses: number
+  hit_rate: number | null
+  entries: number
+  bytes: number
+  max_bytes: number
+  evictions: number
+  evicted_bytes: number
+  expired: number
 }
 
 /**
@@ -0,0 +1,9 @@
+"""Offline performance benchmarks for the core hot paths
+
+- synthetic: deterministic OHLCV / financial statement / news generators
+- standins: in-memory MongoDB and Redis replacements (no services needed)
+- harness: timing, JSON result files and baseline comparison
+- cases: the benchmark cases themselves
+
+Entry point: ``python scripts/benchmarks/run_benchmarks.py``
+"""
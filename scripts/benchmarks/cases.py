@@ -0,0 +1,333 @@
+"""Benchmark cases for the core hot paths
+
+Each case works on synthetic data from ``synthetic`` and, where the code path talks
+to MongoDB or Redis, on the in-memory stand-ins from ``standins``. Patches are
+registered on the caller's ExitStack and stay active until the run is over.
+"""
+
+import itertools
+import tempfile
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from scripts.benchmarks.harness import Benchmark
+from scripts.benchmarks import synthetic
+from scripts.benchmarks.standins import InMemoryDatabase, StandInDatabaseManager
+
+
+@dataclass
+class BenchParams:
+    """Workload sizes; results are only comparable between runs with the same parameters"""
+
+    rows: int = 1250            #Bars per synthetic price series (about five years)
+    symbols: int = 100          #Screening universe (the screening service caps it at 120)
+    cache_entries: int = 10000  #Entries written to the file cache
+    news: int = 5000            #Articles per dedup / indexing run
+    seed: int = 42
+
+    @classmethod
+    def quick(cls) -> "BenchParams":
+        return cls(rows=250, symbols=10, cache_entries=500, news=500)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@contextmanager
+def patched(target: Any, attribute: str, value: Any) -> Iterator[None]:
+    original = getattr(target, attribute)
+    setattr(target, attribute, value)
+    try:
+        yield
+    finally:
+        setattr(target, attribute, original)
+
+
+def _lazy(factory: Callable[[], Any]) -> Callable[[], Any]:
+    """Build shared fixtures on first use only (cases can be run selectively)"""
+    cache: Dict[str, Any] = {}
+
+    def get():
+        if "value" not in cache:
+            cache["value"] = factory()
+        return cache["value"]
+
+    return get
+
+
+def indicator_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    from tradingagents.tools.analysis.indicators import IndicatorSpec, add_all_indicators, compute_many
+
+    frames = [synthetic.make_ohlcv(params.rows, seed=params.seed + i) for i in range(10)]
+    specs = [
+        IndicatorSpec("ma", {"n": 5}), IndicatorSpec("ma", {"n": 10}), IndicatorSpec("ma", {"n": 20}),
+        IndicatorSpec("ema", {"n": 12}), IndicatorSpec("ema", {"n": 26}), IndicatorSpec("macd"),
+        IndicatorSpec("rsi", {"n": 14}), IndicatorSpec("boll", {"n": 20, "k": 2}),
+        IndicatorSpec("atr", {"n": 14}), IndicatorSpec("kdj", {"n": 9, "m1": 3, "m2": 3}),
+    ]
+
+    def run_compute_many():
+        for df in frames:
+            compute_many(df, specs)
+
+    def run_add_all(style: str):
+        def run():
+            for df in frames:
+                add_all_indicators(df.copy(), rsi_style=style)
+        return run
+
+    return [
+        Benchmark("indicators.compute_many", run_compute_many, group="indicators", items=len(frames)),
+        Benchmark("indicators.add_all_international", run_add_all("international"), group="indicators",
+                  items=len(frames)),
+        Benchmark("indicators.add_all_china", run_add_all("china"), group="indicators", items=len(frames)),
+    ]
+
+
+def screening_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    import app.core.database as database
+    import app.services.screening_service as screening
+
+    symbols = synthetic.make_symbols(params.symbols, seed=params.seed)
+    frames = {code: synthetic.make_ohlcv(params.rows, seed=params.seed + i) for i, code in enumerate(symbols)}
+
+    db = InMemoryDatabase()
+    db.stock_basic_info.insert_many([{"code": code, "market_info": {"market": "CN"}} for code in symbols])
+
+    class _Manager:
+        def get_stock_dataframe(self, symbol, start_date=None, end_date=None, period="daily"):
+            return frames[symbol]
+
+    stack.enter_context(patched(database, "get_mongo_db_async", lambda: db))
+    stack.enter_context(patched(screening, "get_data_source_manager", lambda: _Manager()))
+
+    service = screening.ScreeningService()
+    conditions = {"logic": "AND", "children": [
+        {"field": "close", "op": ">", "right_field": "ma20"},
+        {"field": "rsi14", "op": "<", "value": 80},
+        {"field": "macd_hist", "op": ">", "value": -100},
+    ]}
+    run_params = screening.ScreeningParams(limit=50, order_by=[{"field": "rsi14", "direction": "desc"}])
+
+    return [
+        Benchmark("screening.technical", lambda: service.run(conditions, run_params), group="screening",
+                  repeat=3, items=min(len(symbols), 120)),
+    ]
+
+
+def file_cache_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    from tradingagents.dataflows.cache.file_cache import StockDataCache
+
+    workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="bench_file_cache_")))
+    per_symbol = 10
+    symbols = synthetic.make_symbols(max(1, params.cache_entries // per_symbol), seed=params.seed)
+    sample = synthetic.make_ohlcv(60, seed=params.seed).to_string(index=False)
+    entries = [(symbol, f"2024-{month:02d}-01", f"2024-{month:02d}-28")
+               for symbol in symbols for month in range(1, per_symbol + 1)][:params.cache_entries]
+    state: Dict[str, Any] = {}
+
+    def populate(cache_dir: Path):
+        cache = StockDataCache(cache_dir=str(cache_dir))
+        state["keys"] = [cache.save_stock_data(s, sample, start, end, data_source="bench") for s, start, end in entries]
+        state["cache"] = cache
+        return cache
+
+    runs = itertools.count()
+    populated = _lazy(lambda: state.get("cache") or populate(workdir / "shared"))
+    lookups = entries[::max(1, len(entries) // 200)]
+    #Symbols that were never cached: the exact key misses and the whole metadata directory is scanned
+    cached = set(symbols)
+    missing = [s for s in synthetic.make_symbols(len(symbols) + 3, seed=params.seed + 1) if s not in cached][:3]
+
+    def find_exact():
+        cache = populated()
+        for symbol, start, end in lookups:
+            cache.find_cached_stock_data(symbol, start, end, data_source="bench", max_age_hours=24)
+
+    def find_miss():
+        cache = populated()
+        for symbol in missing:
+            cache.find_cached_stock_data(symbol, "2024-01-01", "2024-01-28", max_age_hours=24)
+
+    def load():
+        cache = populated()
+        for key in state["keys"][:500]:
+            cache.load_stock_data(key)
+
+    return [
+        Benchmark("file_cache.save", lambda: populate(workdir / f"save_{next(runs)}"), group="file_cache",
+                  repeat=1, warmup=0, items=len(entries)),
+        Benchmark("file_cache.find_exact", find_exact, setup=populated, group="file_cache", items=len(lookups)),
+        Benchmark("file_cache.find_miss_scan", find_miss, setup=populated, group="file_cache", repeat=3,
+                  items=len(missing)),
+        Benchmark("file_cache.load", load, setup=populated, group="file_cache", items=min(500, len(entries))),
+    ]
+
+
+def adaptive_cache_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    import tradingagents.dataflows.cache.adaptive as adaptive
+
+    workdir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="bench_adaptive_")))
+    frames = [synthetic.make_ohlcv(params.rows, seed=params.seed + i) for i in range(20)]
+    symbols = synthetic.make_symbols(len(frames), seed=params.seed)
+    cases: List[Benchmark] = []
+
+    for backend in ("redis", "mongodb", "file"):
+        manager = StandInDatabaseManager(primary_backend=backend)
+        with patched(adaptive, "get_database_manager", lambda: manager):
+            cache = adaptive.AdaptiveCacheSystem(cache_dir=str(workdir / backend))
+
+        def save(cache=cache, runs=itertools.count()):
+            #Fresh keys on every call: this measures writes of new entries, not overwrites
+            source = f"bench{next(runs)}"
+            return [cache.save_data(s, df, "2020-01-01", "2024-12-31", data_source=source)
+                    for s, df in zip(symbols, frames)]
+
+        saved = _lazy(save)
+
+        def load(cache=cache, saved=saved):
+            for key in saved():
+                cache.load_data(key)
+
+        def save_many(cache=cache, runs=itertools.count()):
+            source = f"bench_many{next(runs)}"
+            return cache.save_many(zip(symbols, frames), "2020-01-01", "2024-12-31", data_source=source)
+
+        saved_many = _lazy(save_many)
+
+        def load_many(cache=cache, saved_many=saved_many):
+            cache.load_many(saved_many())
+
+        cases.append(Benchmark(f"adaptive_cache.save_{backend}", save, group="adaptive_cache", items=len(frames)))
+        cases.append(Benchmark(f"adaptive_cache.load_{backend}", load, setup=saved, group="adaptive_cache",
+                               items=len(frames)))
+        cases.append(Benchmark(f"adaptive_cache.save_many_{backend}", save_many, group="adaptive_cache",
+                               items=len(frames)))
+        cases.append(Benchmark(f"adaptive_cache.load_many_{backend}", load_many, setup=saved_many,
+                               group="adaptive_cache", items=len(frames)))
+    return cases
+
+
+def dataframe_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    from tradingagents.dataflows.data_source_manager import DataSourceManager
+
+    manager = object.__new__(DataSourceManager)
+    frames = [synthetic.make_ohlcv(params.rows, seed=params.seed + i, style="akshare") for i in range(20)]
+
+    def standardize():
+        for df in frames:
+            manager._standardize_dataframe(df)
+
+    return [Benchmark("data_source.standardize_dataframe", standardize, group="data_source", items=len(frames))]
+
+
+def financial_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    import logging
+
+    try:
+        from tradingagents.dataflows.providers.china.tushare import TushareProvider
+    except Exception as e:
+        return [Benchmark("financials.ttm", lambda: None, group="financials", skip_reason=f"导入失败: {e}")]
+
+    provider = object.__new__(TushareProvider)
+    provider.logger = logging.getLogger("bench.tushare")
+    statements = [synthetic.make_income_statements(s, seed=params.seed + i)
+                  for i, s in enumerate(synthetic.make_symbols(params.symbols, seed=params.seed))]
+
+    def ttm():
+        for rows in statements:
+            #Mid-year period: exercises the base-period search
+            rows = [r for r in rows if not r["end_date"].endswith(("1231", "0930"))] or rows
+            provider._calculate_ttm_from_tushare(rows, "revenue")
+            provider._calculate_ttm_from_tushare(rows, "n_income_attr_p")
+
+    from tradingagents.dataflows.financial_metrics import compute_latest_metrics
+    by_symbol = {rows[0]["ts_code"]: rows for rows in statements}
+
+    def metrics_batch():
+        #TTM, growth and margins for every symbol in one vectorized pass (financial sync path)
+        compute_latest_metrics(by_symbol)
+
+    return [
+        Benchmark("financials.ttm", ttm, group="financials", items=len(statements)),
+        Benchmark("financials.metrics_batch", metrics_batch, group="financials", items=len(statements)),
+    ]
+
+
+def news_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    from app.worker.news_data_sync_service import NewsDataSyncService
+    from tradingagents.dataflows.news import search_index
+    from tradingagents.dataflows.news.realtime_news import NewsItem, RealtimeNewsAggregator
+
+    symbols = synthetic.make_symbols(50, seed=params.seed)
+    news = synthetic.make_news(params.news, symbols, seed=params.seed)
+    items = [NewsItem(title=n["title"], content=n["content"], source=n["source"], publish_time=n["publish_time"],
+                      url=n["url"], urgency="medium", relevance_score=0.5) for n in news]
+    sync_service = NewsDataSyncService()
+    aggregator = RealtimeNewsAggregator()
+
+    def build_postings():
+        for doc in news:
+            search_index.build_search_fields(doc)
+
+    return [
+        Benchmark("news.dedup_sync", lambda: sync_service._deduplicate_news(news), group="news", items=len(news)),
+        Benchmark("news.dedup_realtime", lambda: aggregator._deduplicate_news(items), group="news", items=len(items)),
+        Benchmark("news.build_search_fields", build_postings, group="news", repeat=3, items=len(news)),
+    ]
+
+
+def report_cases(params: BenchParams, stack: ExitStack) -> List[Benchmark]:
+    from app.utils.report_exporter import ReportExporter
+
+    exporter = ReportExporter()
+    docs = [synthetic.make_report_doc(s, seed=params.seed + i)
+            for i, s in enumerate(synthetic.make_symbols(20, seed=params.seed))]
+    markdown_docs = [exporter.generate_markdown_report(doc) for doc in docs]
+
+    def to_markdown():
+        for doc in docs:
+            exporter.generate_markdown_report(doc)
+
+    def to_html():
+        for content in markdown_docs:
+            exporter._markdown_to_html(content)
+
+    def to_docx():
+        for doc in docs[:3]:
+            exporter.generate_docx_report(doc)
+
+    return [
+        Benchmark("report.markdown", to_markdown, group="report", items=len(docs)),
+        Benchmark("report.html", to_html, group="report", items=len(docs),
+                  skip_reason=None if exporter.export_available else "markdown 未安装"),
+        Benchmark("report.docx", to_docx, group="report", repeat=3, items=3,
+                  skip_reason=None if exporter.pandoc_available else "pandoc 不可用"),
+    ]
+
+
+CASE_GROUPS: Dict[str, Callable[[BenchParams, ExitStack], List[Benchmark]]] = {
+    "indicators": indicator_cases,
+    "screening": screening_cases,
+    "file_cache": file_cache_cases,
+    "adaptive_cache": adaptive_cache_cases,
+    "data_source": dataframe_cases,
+    "financials": financial_cases,
+    "news": news_cases,
+    "report": report_cases,
+}
+
+
+def build_benchmarks(params: BenchParams, stack: ExitStack, groups: List[str] = None) -> List[Benchmark]:
+    """Instantiate the selected case groups (all by default)"""
+    benchmarks: List[Benchmark] = []
+    for name, factory in CASE_GROUPS.items():
+        if groups and name not in groups:
+            continue
+        try:
+            benchmarks.extend(factory(params, stack))
+        except Exception as e:
+            benchmarks.append(Benchmark(f"{name}.*", lambda: None, group=name, skip_reason=f"初始化失败: {e}"))
+    return benchmarks
@@ -0,0 +1,187 @@
+"""Timing harness, result files and baseline comparison
+
+A result file looks like::
+
+    {"meta": {...machine / version / parameters...},
+     "results": {"<case>": {"median_s": ..., "min_s": ..., "per_item_us": ..., ...}}}
+
+Cases are compared on their median time; a case regresses when it is slower than
+the baseline by more than its threshold (relative, e.g. 0.25 = 25%).
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+DEFAULT_THRESHOLD = 0.25
+#Differences below this many seconds are treated as noise whatever the ratio
+NOISE_FLOOR_SECONDS = 0.002
+
+
+@dataclass
+class Benchmark:
+    """One timed code path"""
+
+    name: str
+    func: Callable[[], Any]
+    group: str = ""
+    #Untimed preparation, run once before the warmup
+    setup: Optional[Callable[[], Any]] = None
+    repeat: int = 5
+    warmup: int = 1
+    #Work items processed per call (symbols, entries, articles...), for per-item times
+    items: int = 1
+    #Overrides the global regression threshold for noisy cases
+    threshold: Optional[float] = None
+    skip_reason: Optional[str] = None
+
+
+def measure(bench: Benchmark) -> Dict[str, Any]:
+    """Run one benchmark and summarise its timings"""
+    if bench.skip_reason:
+        return {"group": bench.group, "skipped": bench.skip_reason}
+    if bench.setup is not None:
+        bench.setup()
+    for _ in range(bench.warmup):
+        bench.func()
+    timings: List[float] = []
+    for _ in range(max(1, bench.repeat)):
+        start = time.perf_counter()
+        bench.func()
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    result = {
+        "group": bench.group,
+        "repeat": len(timings),
+        "items": bench.items,
+        "min_s": min(timings),
+        "median_s": median,
+        "mean_s": statistics.fmean(timings),
+        "stdev_s": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "per_item_us": median / max(1, bench.items) * 1e6,
+    }
+    if bench.threshold is not None:
+        result["threshold"] = bench.threshold
+    return result
+
+
+def run_all(benchmarks: Iterable[Benchmark], log: Callable[[str], Any] = print) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for bench in benchmarks:
+        try:
+            result = measure(bench)
+        except Exception as e:
+            result = {"group": bench.group, "error": f"{type(e).__name__}: {e}"}
+        results[bench.name] = result
+        log(format_result(bench.name, result))
+    return results
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    if "skipped" in result:
+        return f"  - {name:<36} skipped: {result['skipped']}"
+    if "error" in result:
+        return f"  ✗ {name:<36} error: {result['error']}"
+    return (f"  ✓ {name:<36} median {result['median_s'] * 1000:10.2f} ms"
+            f"  min {result['min_s'] * 1000:10.2f} ms  {result['per_item_us']:10.1f} µs/item")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+                             cwd=Path(__file__).resolve().parent)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def build_report(results: Dict[str, Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+    import numpy
+    import pandas
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "pandas": pandas.__version__,
+            "numpy": numpy.__version__,
+            "params": params,
+        },
+        "results": results,
+    }
+
+
+def save_report(report: Dict[str, Any], path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Compare two result files case by case
+
+    status: ok / regression / improved / new / removed / skipped
+    """
+    rows: List[Dict[str, Any]] = []
+    current_results = current.get("results", {})
+    baseline_results = baseline.get("results", {})
+    for name, result in current_results.items():
+        base = baseline_results.get(name)
+        row: Dict[str, Any] = {"name": name, "current_s": result.get("median_s"), "baseline_s": None, "ratio": None}
+        if "median_s" not in result:
+            row["status"] = "skipped"
+        elif not base or "median_s" not in base:
+            row["status"] = "new"
+        else:
+            limit = result.get("threshold", threshold)
+            row["baseline_s"] = base["median_s"]
+            row["ratio"] = result["median_s"] / base["median_s"] if base["median_s"] > 0 else None
+            delta = result["median_s"] - base["median_s"]
+            if row["ratio"] is None or abs(delta) < NOISE_FLOOR_SECONDS:
+                row["status"] = "ok"
+            elif row["ratio"] > 1 + limit:
+                row["status"] = "regression"
+            elif row["ratio"] < 1 / (1 + limit):
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    for name in baseline_results:
+        if name not in current_results:
+            rows.append({"name": name, "status": "removed", "current_s": None,
+                         "baseline_s": baseline_results[name].get("median_s"), "ratio": None})
+    return rows
+
+
+def params_mismatch(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """Parameters that differ between two runs (their timings are not comparable)"""
+    now = current.get("meta", {}).get("params", {})
+    before = baseline.get("meta", {}).get("params", {})
+    return {k: (before.get(k), now.get(k)) for k in set(now) | set(before) if now.get(k) != before.get(k)}
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    marks = {"regression": "✗", "improved": "↑", "ok": "✓", "new": "+", "removed": "-", "skipped": "·"}
+    lines = [f"  {'case':<38} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status"]
+    for row in rows:
+        base = f"{row['baseline_s'] * 1000:.2f}" if row.get("baseline_s") is not None else "-"
+        cur = f"{row['current_s'] * 1000:.2f}" if row.get("current_s") is not None else "-"
+        ratio = f"{row['ratio']:.2f}" if row.get("ratio") is not None else "-"
+        lines.append(f"{marks.get(row['status'], ' ')} {row['name']:<38} {base:>12} {cur:>12} {ratio:>7}  {row['status']}")
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+核心热点路径的离线性能基准
+合成数据 + 内存版 MongoDB/Redis，无需任何外部服务；结果写入 JSON，并可与基线比较。
+
+用法:
+    python scripts/benchmarks/run_benchmarks.py                     # 完整规模，写入 data/benchmarks/latest.json
+    python scripts/benchmarks/run_benchmarks.py --quick             # 小规模冒烟运行
+    python scripts/benchmarks/run_benchmarks.py --group indicators --group news
+    python scripts/benchmarks/run_benchmarks.py --save-baseline     # 把本次结果作为基线
+    python scripts/benchmarks/run_benchmarks.py --threshold 0.3     # 比基线慢 30% 以上视为回归
+
+存在基线文件时自动比较；有回归时退出码为 1，便于在 CI 中使用。
+基线与机器相关，只应在同一台机器、相同参数下比较。
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.benchmarks import harness
+from scripts.benchmarks.cases import CASE_GROUPS, BenchParams, build_benchmarks
+
+DEFAULT_OUTPUT = PROJECT_ROOT / "data" / "benchmarks" / "latest.json"
+DEFAULT_BASELINE = PROJECT_ROOT / "data" / "benchmarks" / "baseline.json"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="核心热点路径的离线性能基准")
+    parser.add_argument("--quick", action="store_true", help="小规模运行（冒烟测试）")
+    parser.add_argument("--group", action="append", choices=sorted(CASE_GROUPS), help="只运行指定分组，可重复")
+    parser.add_argument("--rows", type=int, help="每条合成行情的K线数量")
+    parser.add_argument("--symbols", type=int, help="选股股票池大小")
+    parser.add_argument("--cache-entries", type=int, help="文件缓存写入条目数")
+    parser.add_argument("--news", type=int, help="新闻去重/索引的文章数")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="结果 JSON 路径")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="基线 JSON 路径")
+    parser.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD,
+                        help="回归阈值（相对中位数，0.25 = 慢 25%%）")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果保存为基线")
+    args = parser.parse_args(argv)
+
+    params = BenchParams.quick() if args.quick else BenchParams()
+    for field in ("rows", "symbols", "cache_entries", "news"):
+        if getattr(args, field) is not None:
+            setattr(params, field, getattr(args, field))
+
+    #Measure the code paths, not the log handlers (cache misses are logged as errors)
+    logging.disable(logging.ERROR)
+
+    print(f"参数: {params.to_dict()}\n")
+    with ExitStack() as stack:
+        benchmarks = build_benchmarks(params, stack, args.group)
+        results = harness.run_all(benchmarks)
+
+    report = harness.build_report(results, params.to_dict())
+    print(f"\n结果已写入: {harness.save_report(report, args.output)}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(args.output, args.baseline)
+        print(f"基线已更新: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("未找到基线文件，跳过比较（使用 --save-baseline 生成）")
+        return 0
+
+    baseline = harness.load_report(args.baseline)
+    mismatch = harness.params_mismatch(report, baseline)
+    if mismatch:
+        print(f"⚠️ 参数与基线不同，结果不可比: {mismatch}")
+        return 0
+
+    rows = harness.compare(report, baseline, args.threshold)
+    print(f"\n与基线比较 ({args.baseline}, 阈值 {args.threshold:.0%}):")
+    print(harness.format_comparison(rows))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n❌ 性能回归: {', '.join(regressions)}")
+        return 1
+    print("\n✅ 无性能回归")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
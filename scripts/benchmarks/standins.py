@@ -0,0 +1,291 @@
+"""In-memory stand-ins for MongoDB and Redis
+
+They implement the small synchronous subset of the pymongo / redis-py APIs used by
+the benchmarked code paths, so the suite runs without any service and measures
+the application code rather than the network.
+"""
+
+import copy
+import fnmatch
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _get_path(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def matches(doc: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """Evaluate the query operators the benchmarked code uses ($or/$and/$in/$gte/$lte/$exists)"""
+    for field, cond in (query or {}).items():
+        if field == "$or":
+            if not any(matches(doc, sub) for sub in cond):
+                return False
+            continue
+        if field == "$and":
+            if not all(matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = _get_path(doc, field)
+        values = value if isinstance(value, list) else [value]
+        if isinstance(cond, dict) and any(key.startswith("$") for key in cond):
+            for op, arg in cond.items():
+                if op == "$in" and not any(v in arg for v in values):
+                    return False
+                if op == "$gte" and not (value is not None and value >= arg):
+                    return False
+                if op == "$lte" and not (value is not None and value <= arg):
+                    return False
+                if op == "$exists" and (value is not None) != bool(arg):
+                    return False
+        elif cond not in values:
+            return False
+    return True
+
+
+class InMemoryCursor:
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self._docs = docs
+
+    def sort(self, key, direction: int = 1) -> "InMemoryCursor":
+        self._docs.sort(key=lambda d: (_get_path(d, key) is None, _get_path(d, key)), reverse=direction == -1)
+        return self
+
+    def skip(self, count: int) -> "InMemoryCursor":
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count: int) -> "InMemoryCursor":
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._docs)
+
+
+class InMemoryCollection:
+    """Synchronous pymongo collection replacement keyed by ``_id``"""
+
+    def __init__(self, name: str = "collection"):
+        self.name = name
+        self.docs: Dict[Any, Dict[str, Any]] = {}
+        self._next_id = 0
+
+    def _project(self, doc: Dict[str, Any], projection: Optional[Dict[str, int]]) -> Dict[str, Any]:
+        if not projection:
+            return copy.deepcopy(doc)
+        if any(v for k, v in projection.items() if k != "_id"):
+            out = {k: copy.deepcopy(doc[k]) for k, v in projection.items() if v and k in doc}
+            if projection.get("_id", 1) and "_id" in doc:
+                out["_id"] = doc["_id"]
+            return out
+        return {k: copy.deepcopy(v) for k, v in doc.items() if projection.get(k, 1)}
+
+    def insert_one(self, doc: Dict[str, Any]) -> None:
+        doc = copy.deepcopy(doc)
+        if "_id" not in doc:
+            doc["_id"] = self._next_id
+            self._next_id += 1
+        self.docs[doc["_id"]] = doc
+
+    def insert_many(self, docs: List[Dict[str, Any]]) -> None:
+        for doc in docs:
+            self.insert_one(doc)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, int]] = None) -> InMemoryCursor:
+        return InMemoryCursor([self._project(d, projection) for d in self.docs.values() if matches(d, query)])
+
+    def find_one(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, int]] = None):
+        if query and set(query) == {"_id"} and not isinstance(query["_id"], dict):
+            doc = self.docs.get(query["_id"])
+            return None if doc is None else self._project(doc, projection)
+        return next(iter(self.find(query, projection)), None)
+
+    def replace_one(self, query: Dict[str, Any], doc: Dict[str, Any], upsert: bool = False) -> None:
+        existing = self.find_one(query, {"_id": 1})
+        if existing is None and not upsert:
+            return
+        doc = copy.deepcopy(doc)
+        doc["_id"] = existing["_id"] if existing else doc.get("_id", query.get("_id"))
+        self.docs[doc["_id"]] = doc
+
+    def delete_one(self, query: Dict[str, Any]) -> None:
+        existing = self.find_one(query, {"_id": 1})
+        if existing is not None:
+            self.docs.pop(existing["_id"], None)
+
+    def delete_many(self, query: Dict[str, Any]) -> None:
+        for doc_id in [d["_id"] for d in self.docs.values() if matches(d, query)]:
+            self.docs.pop(doc_id, None)
+
+    def bulk_write(self, requests: List[Any], ordered: bool = True) -> None:
+        #pymongo ReplaceOne keeps its arguments in _filter/_doc/_upsert
+        for request in requests:
+            self.replace_one(request._filter, request._doc, upsert=bool(request._upsert))
+
+    def count_documents(self, query: Optional[Dict[str, Any]] = None) -> int:
+        return sum(1 for d in self.docs.values() if matches(d, query))
+
+    def create_index(self, *args, **kwargs) -> str:
+        return "stand_in_index"
+
+
+class InMemoryDatabase:
+    def __init__(self, name: str = "tradingagents"):
+        self.name = name
+        self._collections: Dict[str, InMemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(name)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> InMemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+class InMemoryMongoClient:
+    def __init__(self):
+        self._databases: Dict[str, InMemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> InMemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = InMemoryDatabase(name)
+        return self._databases[name]
+
+    def __getattr__(self, name: str) -> InMemoryDatabase:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+class InMemoryRedis:
+    """Synchronous redis-py client replacement (strings with TTL, bytes in and out)"""
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode("utf-8")
+
+    def _alive(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._data.get(key) if self._alive(key) else None
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        self._data[key] = self._encode(value)
+        if ex:
+            self._expires[key] = time.monotonic() + ex
+        else:
+            self._expires.pop(key, None)
+        return True
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        return self.set(key, value, ex=ttl)
+
+    def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                removed += 1
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return removed
+
+    def exists(self, key: str) -> int:
+        return int(self._alive(key))
+
+    def keys(self, pattern: str = "*") -> List[bytes]:
+        return [k.encode() for k in list(self._data) if self._alive(k) and fnmatch.fnmatchcase(k, pattern)]
+
+    def ping(self) -> bool:
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryPipeline":
+        return InMemoryPipeline(self)
+
+
+class InMemoryPipeline:
+    """Buffers commands and runs them on ``execute``, like a redis-py pipeline"""
+
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+        self._commands: List[Any] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class StandInDatabaseManager:
+    """Replacement for tradingagents.config.database_manager.DatabaseManager"""
+
+    def __init__(self, primary_backend: str = "redis"):
+        self.mongodb_client = InMemoryMongoClient()
+        self.redis_client = InMemoryRedis()
+        self.primary_cache_backend = primary_backend
+
+    def get_mongodb_client(self) -> InMemoryMongoClient:
+        return self.mongodb_client
+
+    def get_redis_client(self) -> InMemoryRedis:
+        return self.redis_client
+
+    def is_mongodb_available(self) -> bool:
+        return True
+
+    def is_redis_available(self) -> bool:
+        return True
+
+    def is_database_available(self) -> bool:
+        return True
+
+    def get_database_config(self) -> Dict[str, Any]:
+        return {
+            "mongodb": {"database": "tradingagents"},
+            "redis": {},
+            "primary_backend": self.primary_cache_backend,
+            "mongodb_available": True,
+            "redis_available": True,
+            "cache": {
+                "primary_backend": self.primary_cache_backend,
+                "fallback_enabled": True,
+                "ttl_settings": {
+                    "us_stock_data": 7200,
+                    "china_stock_data": 3600,
+                    "us_news": 21600,
+                    "china_news": 14400,
+                    "us_fundamentals": 86400,
+                    "china_fundamentals": 43200,
+                },
+            },
+        }
@@ -0,0 +1,146 @@
+"""Deterministic synthetic market data
+
+Every generator takes a seed, so two runs (and a run against a baseline) work on
+exactly the same input.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+#Column names as returned by AKShare's daily quotes
+AKSHARE_COLUMNS = {
+    "date": "日期", "open": "开盘", "high": "最高", "low": "最低",
+    "close": "收盘", "vol": "成交量", "amount": "成交额",
+}
+
+_NEWS_SOURCES = ("东方财富", "新浪财经", "财联社", "证券时报", "finnhub")
+_NEWS_TOPICS = ("新能源汽车", "半导体", "光伏", "储能", "医药", "消费电子", "银行", "券商")
+_NEWS_EVENTS = ("发布半年报", "业绩预增", "获得大额订单", "股东减持", "回购股份", "产能扩张", "签署战略合作")
+
+
+def make_symbols(count: int, seed: int = 0) -> List[str]:
+    """Distinct 6-digit A-share codes spread over the SH/SZ boards"""
+    rng = np.random.default_rng(seed)
+    prefixes = ("000", "002", "300", "600", "601", "603", "688")
+    symbols: List[str] = []
+    seen = set()
+    while len(symbols) < count:
+        code = f"{prefixes[rng.integers(len(prefixes))]}{rng.integers(0, 1000):03d}"
+        if code not in seen:
+            seen.add(code)
+            symbols.append(code)
+    return symbols
+
+
+def make_ohlcv(rows: int, seed: int = 0, start: str = "2015-01-05", style: str = "standard") -> pd.DataFrame:
+    """Daily bars following a geometric random walk
+
+    style="standard" yields lower-case columns (date/open/high/low/close/vol/amount),
+    style="akshare" the Chinese column names of AKShare.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start=start, periods=rows)
+    returns = rng.normal(0.0003, 0.02, rows)
+    close = 10.0 * np.exp(np.cumsum(returns))
+    open_ = close * (1 + rng.normal(0, 0.005, rows))
+    spread = np.abs(rng.normal(0, 0.01, rows))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    vol = rng.integers(10_000, 5_000_000, rows).astype(float)
+    df = pd.DataFrame({
+        "date": dates,
+        "open": open_.round(2),
+        "high": high.round(2),
+        "low": low.round(2),
+        "close": close.round(2),
+        "vol": vol,
+        "amount": (vol * close * 100).round(2),
+    })
+    if style == "akshare":
+        df["date"] = df["date"].dt.strftime("%Y-%m-%d")
+        df = df.rename(columns=AKSHARE_COLUMNS)
+    return df
+
+
+def make_income_statements(symbol: str, years: int = 6, seed: int = 0) -> List[Dict[str, Any]]:
+    """Tushare-style income statements, newest first, with year-to-date cumulative values"""
+    rng = np.random.default_rng(seed)
+    base_revenue = float(rng.uniform(1e9, 5e10))
+    margin = float(rng.uniform(0.05, 0.25))
+    last_year = datetime.now().year - 1
+    statements: List[Dict[str, Any]] = []
+    for year in range(last_year - years + 1, last_year + 1):
+        quarterly = base_revenue / 4 * (1 + rng.normal(0.08, 0.05)) ** (year - last_year + years)
+        cumulative = 0.0
+        for quarter, month_day in enumerate(("0331", "0630", "0930", "1231"), start=1):
+            cumulative += quarterly * (1 + rng.normal(0, 0.03))
+            statements.append({
+                "ts_code": f"{symbol}.{'SH' if symbol.startswith('6') else 'SZ'}",
+                "end_date": f"{year}{month_day}",
+                "report_type": "1",
+                "revenue": round(cumulative, 2),
+                "total_revenue": round(cumulative * 1.01, 2),
+                "n_income": round(cumulative * margin, 2),
+                "n_income_attr_p": round(cumulative * margin * 0.95, 2),
+                "basic_eps": round(cumulative * margin / 1e9, 4),
+            })
+    statements.sort(key=lambda s: s["end_date"], reverse=True)
+    return statements
+
+
+def make_news(count: int, symbols: List[str], seed: int = 0, duplicate_ratio: float = 0.2) -> List[Dict[str, Any]]:
+    """News dicts shaped like the stock_news documents, with a share of re-published duplicates"""
+    rng = np.random.default_rng(seed)
+    now = datetime(2024, 6, 30, 15, 0)
+    news: List[Dict[str, Any]] = []
+    for i in range(count):
+        if news and rng.random() < duplicate_ratio:
+            #Same story picked up by another source
+            original = news[int(rng.integers(len(news)))]
+            news.append(dict(original, source=_NEWS_SOURCES[int(rng.integers(len(_NEWS_SOURCES)))]))
+            continue
+        symbol = symbols[int(rng.integers(len(symbols)))]
+        topic = _NEWS_TOPICS[int(rng.integers(len(_NEWS_TOPICS)))]
+        event = _NEWS_EVENTS[int(rng.integers(len(_NEWS_EVENTS)))]
+        title = f"{symbol} {topic}龙头{event}，机构称行业景气度持续提升（第{i}号）"
+        news.append({
+            "symbol": symbol,
+            "title": title,
+            "content": f"{title}。" + f"公司表示{topic}业务保持增长，{event}对全年业绩形成支撑。" * 8,
+            "summary": f"{topic}板块{event}",
+            "url": f"https://news.example.com/{symbol}/{i}",
+            "source": _NEWS_SOURCES[int(rng.integers(len(_NEWS_SOURCES)))],
+            "publish_time": now - timedelta(minutes=int(rng.integers(0, 60 * 24 * 30))),
+            "keywords": [topic, event],
+        })
+    return news
+
+
+def make_report_doc(symbol: str, paragraphs: int = 12, seed: int = 0) -> Dict[str, Any]:
+    """Analysis report document as stored in analysis_reports"""
+    rng = np.random.default_rng(seed)
+
+    def section(title: str) -> str:
+        lines = [f"### {title}", ""]
+        for p in range(paragraphs):
+            lines.append(f"- 指标{p}: {rng.uniform(-20, 20):.2f}%，较上期变化 {rng.uniform(-5, 5):.2f} 个百分点")
+        lines.append("")
+        lines.append("| 项目 | 2022 | 2023 | 2024 |")
+        lines.append("| --- | --- | --- | --- |")
+        for row in ("营业收入", "净利润", "ROE", "毛利率"):
+            lines.append(f"| {row} | " + " | ".join(f"{rng.uniform(1, 100):.2f}" for _ in range(3)) + " |")
+        return "\n".join(lines)
+
+    modules = ("company_overview", "financial_analysis", "technical_analysis", "market_analysis",
+               "risk_analysis", "valuation_analysis", "investment_recommendation")
+    return {
+        "stock_symbol": symbol,
+        "analysis_date": "2024-06-30",
+        "analysts": ["market", "fundamentals", "news"],
+        "research_depth": 3,
+        "summary": "综合来看公司基本面稳健，短期技术面偏强。",
+        "reports": {key: section(key) for key in modules},
+    }
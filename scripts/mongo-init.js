@@ -59,6 +59,7 @@ db.createCollection('sync_status');
 // 日志和统计
 db.createCollection('system_logs');
 db.createCollection('token_usage');
+db.createCollection('token_usage_daily');
 
 print('✓ 集合创建完成');
 
@@ -100,6 +101,7 @@ db.market_quotes.createIndex({ "updated_at": 1 });
 // 股票新闻索引
 db.stock_news.createIndex({ "code": 1, "published_at": -1 });
 db.stock_news.createIndex({ "title": "text", "content": "text" });
+db.stock_news.createIndex({ "search_terms": 1, "symbol": 1, "publish_time": -1 }, { name: "search_terms_symbol_time" });
 db.stock_news.createIndex({ "published_at": -1 });
 
 // 分析任务索引
@@ -114,6 +116,10 @@ db.analysis_reports.createIndex({ "symbol": 1, "created_at": -1 });
 db.analysis_reports.createIndex({ "user_id": 1, "created_at": -1 });
 db.analysis_reports.createIndex({ "market_type": 1, "created_at": -1 });
 db.analysis_reports.createIndex({ "created_at": -1 });
+db.analysis_reports.createIndex({ "created_at": -1, "_id": -1 });
+db.analysis_reports.createIndex({ "stock_symbol": 1, "created_at": -1 });
+db.analysis_reports.createIndex({ "stock_name": 1 });
+db.analysis_reports.createIndex({ "analysis_id": 1 });
 
 // 分析进度索引
 db.analysis_progress.createIndex({ "task_id": 1 }, { unique: true });
@@ -149,6 +155,7 @@ db.system_logs.createIndex({ "timestamp": -1 }, { expireAfterSeconds: 604800 });
 db.token_usage.createIndex({ "user_id": 1, "timestamp": -1 });
 db.token_usage.createIndex({ "model": 1, "timestamp": -1 });
 db.token_usage.createIndex({ "timestamp": -1 });
+db.token_usage_daily.createIndex({ "date": 1, "provider": 1, "model_name": 1, "currency": 1 }, { unique: true });
 
 print('✓ 索引创建完成');
 
@@ -105,6 +105,9 @@ async def create_social_media_collection():
             ("topics", "text")
         ]
         await collection.create_index(text_index, name="content_text_search")
+        # 中文检索使用二元分词倒排索引（search_terms，BM25 排序）
+        from tradingagents.dataflows.news.search_index import SEARCH_INDEX_KEYS, SEARCH_INDEX_NAME
+        await collection.create_index(SEARCH_INDEX_KEYS, name=SEARCH_INDEX_NAME)
         logger.info("✅ 创建全文搜索索引")
         
         # 11. 地理位置索引
@@ -221,6 +224,9 @@ async def create_internal_messages_collection():
             ("tags", "text")
         ]
         await collection.create_index(text_index, name="content_text_search")
+        # 中文检索使用二元分词倒排索引（search_terms，BM25 排序）
+        from tradingagents.dataflows.news.search_index import SEARCH_INDEX_KEYS, SEARCH_INDEX_NAME
+        await collection.create_index(SEARCH_INDEX_KEYS, name=SEARCH_INDEX_NAME)
         logger.info("✅ 创建全文搜索索引")
         
         # 12. 数据源索引
@@ -0,0 +1,76 @@
+import logging
+import logging.handlers
+from importlib import reload
+
+
+class _Worker:
+    def __init__(self, logger):
+        self.logger = logger
+
+    def work(self):
+        self.logger.warning("worker says hi")
+
+    @classmethod
+    def build(cls):
+        return logging.getLogRecordFactory()("x", logging.INFO, __file__, 1, "m", None, None)
+
+
+def _config(log_dir):
+    fmt = "%(levelname)s | %(classname)s | %(message)s"
+    return {
+        "level": "INFO",
+        "format": {"console": fmt, "file": fmt, "structured": "json"},
+        "handlers": {
+            "console": {"enabled": False, "colored": False, "level": "INFO"},
+            "file": {"enabled": True, "level": "DEBUG", "max_size": "1MB", "backup_count": 1, "directory": str(log_dir)},
+            "error": {"enabled": True, "level": "WARNING", "max_size": "1MB", "backup_count": 1,
+                      "directory": str(log_dir), "filename": "error.log"},
+            "structured": {"enabled": False, "level": "INFO", "directory": str(log_dir)},
+        },
+        "loggers": {},
+        "docker": {"enabled": False, "stdout_only": False},
+        "queue": {"enabled": True},
+    }
+
+
+def test_classname_factory_survives_module_reload():
+    from app.core import logging_config as lc
+    from tradingagents.utils import logging_manager as lm
+
+    lm._install_classname_record_factory()
+    factory = logging.getLogRecordFactory()
+    reload(lc)
+    reload(lc)
+    lc._install_classname_record_factory()
+    lm._install_classname_record_factory()
+
+    # Reloading must neither wrap the factory again nor make it call itself
+    assert logging.getLogRecordFactory() is factory
+    assert _Worker.build().classname == "_Worker"
+
+
+def test_queue_mode_writes_through_listener(tmp_path, monkeypatch):
+    from tradingagents.utils import logging_manager as lm
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    monkeypatch.setattr(lm, "_logger_manager", None)
+    try:
+        lm.setup_logging(_config(tmp_path))
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+        logger = logging.getLogger("test_logging_queue")
+        logger.info("plain info")
+        _Worker(logger).work()
+        lm.shutdown_logging()
+    finally:
+        lm.shutdown_logging()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    main_log = (tmp_path / "tradingagents.log").read_text(encoding="utf-8").splitlines()
+    error_log = (tmp_path / "error.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" | ")[0] for line in main_log] == ["INFO", "WARNING"]
+    assert main_log[1] == "WARNING | _Worker | worker says hi"
+    assert error_log == ["WARNING | _Worker | worker says hi"]
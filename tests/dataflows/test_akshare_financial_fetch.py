@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+
+class _FakeAk:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = {}
+
+    def _sheet(self, name, symbol):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(self.delay)
+        return pd.DataFrame([{"symbol": symbol, "sheet": name}])
+
+    def stock_financial_abstract(self, symbol):
+        return self._sheet("abstract", symbol)
+
+    def stock_balance_sheet_by_report_em(self, symbol):
+        return self._sheet("balance", symbol)
+
+    def stock_profit_sheet_by_report_em(self, symbol):
+        return self._sheet("profit", symbol)
+
+    def stock_cash_flow_sheet_by_report_em(self, symbol):
+        return pd.DataFrame()
+
+
+def _make_provider(fake_ak):
+    from tradingagents.dataflows.providers.china.akshare import AKShareProvider
+
+    provider = AKShareProvider.__new__(AKShareProvider)
+    provider.ak = fake_ak
+    provider.connected = True
+    provider._financial_cache = OrderedDict()
+    provider._financial_inflight = {}
+    provider._financial_lock = threading.Lock()
+    provider._rate_limiter = False  # no limiter in tests
+    return provider
+
+
+def test_financial_statements_are_fetched_concurrently():
+    fake_ak = _FakeAk(delay=0.2)
+    provider = _make_provider(fake_ak)
+
+    async def _run():
+        start = time.perf_counter()
+        data = await provider.get_financial_data("000001")
+        return data, time.perf_counter() - start
+
+    data, elapsed = asyncio.run(_run())
+
+    assert set(data) == {"main_indicators", "balance_sheet", "income_statement"}
+    # Sequential fetching would take >= 0.6s
+    assert elapsed < 0.5
+
+
+def test_concurrent_callers_share_fetch_and_cache():
+    fake_ak = _FakeAk(delay=0.05)
+    provider = _make_provider(fake_ak)
+
+    async def _run():
+        first, second = await asyncio.gather(
+            provider.get_financial_data("000001"),
+            provider.get_financial_data("000001"),
+        )
+        third = await provider.get_financial_data("000001")
+        return first, second, third
+
+    first, second, third = asyncio.run(_run())
+
+    assert first == second == third
+    assert fake_ak.calls == {"abstract": 1, "balance": 1, "profit": 1}
+
+    fresh = asyncio.run(provider.get_financial_data("000001", use_cache=False))
+    assert fresh == first
+    assert fake_ak.calls["abstract"] == 2
+
+
+def test_shared_limiter_works_across_threads_with_their_own_loops():
+    from app.core.rate_limiter import RateLimiter
+
+    fake_ak = _FakeAk(delay=0.05)
+    provider = _make_provider(fake_ak)
+    provider._rate_limiter = RateLimiter(max_calls=4, time_window=0.2, name="test")
+    results = {}
+
+    def analysis_thread(code):
+        # Each analysis thread runs its own event loop, like optimized_china_data does
+        results[code] = asyncio.run(provider.get_financial_data(code))
+
+    threads = [threading.Thread(target=analysis_thread, args=(code,)) for code in ("000001", "000002", "600000")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(len(data) == 3 for data in results.values()) and len(results) == 3
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+from tradingagents.dataflows.providers.china.baostock_session import BaoStockSessionManager
+
+
+class _FakeResultSet:
+    def __init__(self, rows, error_code='0', error_msg='success'):
+        self._rows = list(rows)
+        self.error_code = error_code
+        self.error_msg = error_msg
+        self.fields = ["code", "code_name"]
+
+    def next(self):
+        return bool(self._rows)
+
+    def get_row_data(self):
+        return self._rows.pop(0)
+
+
+class _FakeBaoStock:
+    def __init__(self, fail_codes=None):
+        self.logins = 0
+        self.logouts = 0
+        self._fail_codes = list(fail_codes or [])
+
+    def login(self):
+        self.logins += 1
+        return SimpleNamespace(error_code='0', error_msg='success')
+
+    def logout(self):
+        self.logouts += 1
+
+    def query_stock_basic(self, code=""):
+        if self._fail_codes:
+            return _FakeResultSet([], error_code=self._fail_codes.pop(0), error_msg='fail')
+        return _FakeResultSet([["sh.600000", "浦发银行"], ["sz.000001", "平安银行"]])
+
+
+def test_session_is_reused_across_queries():
+    bs = _FakeBaoStock()
+    session = BaoStockSessionManager(bs_module=bs)
+
+    for _ in range(5):
+        rs = session.query("query_stock_basic")
+        assert rs.ok
+        assert len(rs.rows) == 2
+
+    assert bs.logins == 1
+    assert bs.logouts == 0
+
+
+def test_session_relogin_on_not_logged_in_error():
+    bs = _FakeBaoStock(fail_codes=["10001001"])
+    session = BaoStockSessionManager(bs_module=bs)
+
+    rs = session.query("query_stock_basic")
+    assert rs.ok
+    assert bs.logins == 2
+    assert session.get_stats()["relogins"] == 1
+
+
+def test_non_session_errors_are_returned_without_relogin():
+    bs = _FakeBaoStock(fail_codes=["10004011"])
+    session = BaoStockSessionManager(bs_module=bs)
+
+    rs = session.query("query_stock_basic")
+    assert not rs.ok
+    assert rs.error_code == "10004011"
+    assert bs.logins == 1
+
+
+def test_idle_session_is_refreshed(monkeypatch):
+    import tradingagents.dataflows.providers.china.baostock_session as mod
+
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(mod.time, "monotonic", lambda: clock["now"])
+
+    bs = _FakeBaoStock()
+    session = BaoStockSessionManager(bs_module=bs, idle_timeout=60, max_age=0)
+
+    session.query("query_stock_basic")
+    clock["now"] += 30
+    session.query("query_stock_basic")
+    assert bs.logins == 1
+
+    clock["now"] += 120
+    session.query("query_stock_basic")
+    assert bs.logins == 2
+    assert bs.logouts == 1
+
+
+class _FakeStockListBaoStock(_FakeBaoStock):
+    def query_stock_basic(self, code=""):
+        rs = _FakeResultSet([["sh.600000", "浦发银行", "1999-11-10", "", "1", "1"]])
+        rs.fields = ["code", "code_name", "ipoDate", "outDate", "type", "status"]
+        return rs
+
+    def query_stock_industry(self):
+        rs = _FakeResultSet([["2024-01-02", "sh.600000", "浦发银行", "J66货币金融服务", "证监会行业分类"]])
+        rs.fields = ["updateDate", "code", "code_name", "industry", "industryClassification"]
+        return rs
+
+
+def test_adapter_and_manager_share_the_baostock_session(monkeypatch):
+    import app.services.data_sources.baostock_adapter as adapter_mod
+    from tradingagents.dataflows import data_source_manager
+    from tradingagents.dataflows.providers.china import baostock_session
+
+    bs = _FakeStockListBaoStock()
+    session = BaoStockSessionManager(bs_module=bs)
+    monkeypatch.setattr(adapter_mod, "get_baostock_session", lambda: session)
+    monkeypatch.setattr(baostock_session, "get_baostock_session", lambda: session)
+
+    adapter = adapter_mod.BaoStockAdapter()
+    monkeypatch.setattr(adapter, "is_available", lambda: True)
+    for _ in range(2):
+        df = adapter.get_stock_list()
+        assert df.iloc[0]["ts_code"] == "600000.SH"
+        assert df.iloc[0]["industry"] == "货币金融服务"
+
+    info = data_source_manager.DataSourceManager._get_baostock_stock_info(None, "600000")
+    assert info["name"] == "浦发银行"
+    assert (bs.logins, bs.logouts) == (1, 0)
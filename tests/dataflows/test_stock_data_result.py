@@ -0,0 +1,85 @@
+import pandas as pd
+
+from tradingagents.dataflows.data_result import StockDataResult
+
+
+def _frame():
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=30)
+    return pd.DataFrame({"date": dates, "open": 10.0, "high": 11.0, "low": 9.0, "close": 10.5, "vol": 1000})
+
+
+def _manager(monkeypatch):
+    import tradingagents.dataflows.data_source_manager as dsm
+
+    manager = object.__new__(dsm.DataSourceManager)
+    manager.current_source = dsm.ChinaDataSource.AKSHARE
+    manager.available_china_sources = [dsm.ChinaDataSource.AKSHARE, dsm.ChinaDataSource.BAOSTOCK]
+    monkeypatch.setattr(manager, "_get_data_source_priority_order", lambda symbol=None: manager.available_china_sources)
+    return manager
+
+
+def test_fallback_is_decided_on_status_and_text_is_rendered_lazily(monkeypatch):
+    manager = _manager(monkeypatch)
+    rendered = []
+
+    def _failing(symbol, start_date, end_date, period="daily"):
+        raise ConnectionError("akshare down")
+
+    def _baostock(symbol, start_date, end_date, period="daily"):
+        return manager._stock_result(_frame(), symbol, start_date, end_date, period, "baostock", "平安银行")
+
+    def _render(data, symbol, stock_name, start_date, end_date):
+        rendered.append(symbol)
+        return f"{stock_name}({symbol}) {len(data)} rows"
+
+    monkeypatch.setattr(manager, "_fetch_akshare_result", _failing)
+    monkeypatch.setattr(manager, "_fetch_baostock_result", _baostock)
+    monkeypatch.setattr(manager, "_format_stock_data_response", _render)
+
+    result = manager.get_stock_data_result("000001", "2024-01-01", "2024-02-01")
+    assert result.ok and result.source == "baostock" and result.rows == 30
+    assert rendered == []
+
+    assert result.to_text() == "平安银行(000001) 30 rows"
+    assert str(result) == result.to_text()
+    assert rendered == ["000001"]
+
+
+def test_all_sources_failing_returns_error_result(monkeypatch):
+    manager = _manager(monkeypatch)
+
+    def _empty(symbol, start_date, end_date, period="daily"):
+        return manager._stock_result(None, symbol, start_date, end_date, period, "akshare")
+
+    monkeypatch.setattr(manager, "_fetch_akshare_result", _empty)
+    monkeypatch.setattr(manager, "_fetch_baostock_result", _empty)
+
+    result = manager.get_stock_data_result("000001", "2024-01-01", "2024-02-01")
+    assert not result.ok
+    assert result.to_text().startswith("❌")
+    assert manager._try_fallback_sources("000001", "2024-01-01", "2024-02-01") == (
+        "❌ 所有数据源都无法获取000001的daily数据", None
+    )
+
+
+def test_completeness_checker_uses_dataframe_without_parsing(monkeypatch):
+    from tradingagents.dataflows.data_completeness_checker import DataCompletenessChecker
+
+    checker = DataCompletenessChecker()
+
+    def _no_parse(data):
+        raise AssertionError("structured results must not be re-parsed from text")
+
+    monkeypatch.setattr(checker, "_parse_data_to_dataframe", _no_parse)
+    monkeypatch.setattr(checker, "_get_latest_trade_date", lambda market="CN": None)
+
+    df = _frame()
+    result = StockDataResult(symbol="000001", data=df, source="tushare")
+    start, end = df["date"].min().strftime("%Y-%m-%d"), df["date"].max().strftime("%Y-%m-%d")
+    _, _, details = checker.check_data_completeness("000001", result, start, end)
+    assert details["data_rows"] == 30
+    assert details["latest_date_in_data"] == end
+
+    failed = StockDataResult.failure("000001", "boom")
+    is_complete, _, details = checker.check_data_completeness("000001", failed, start, end)
+    assert not is_complete and details["data_rows"] == 0
@@ -0,0 +1,63 @@
+from datetime import date, datetime
+
+import tradingagents.dataflows.trading_calendar as tc
+
+
+def _cn_calendar(tmp_path, monkeypatch):
+    """CN calendar with the 2024 National Day holiday (Oct 1-7) removed"""
+    start, end = date(2024, 9, 1), date(2024, 10, 31)
+    days = [d for d in tc.rule_based_trading_days("CN", start, end) if not date(2024, 10, 1) <= d <= date(2024, 10, 7)]
+
+    def _fake_loader(lo, hi):
+        return days
+
+    monkeypatch.setattr(tc, "REMOTE_LOADERS", {"CN": (("fake", _fake_loader),), "HK": (), "US": ()})
+    calendar = tc.TradingCalendar(tmp_path / "calendar.json")
+    assert calendar.refresh(["CN"])["CN"] == "fake"
+    return calendar
+
+
+def test_holiday_aware_queries(tmp_path, monkeypatch):
+    calendar = _cn_calendar(tmp_path, monkeypatch)
+
+    assert not calendar.is_trading_day("2024-10-02")
+    assert calendar.is_trading_day("20240930")
+    assert calendar.previous_trading_day(date(2024, 10, 8)) == date(2024, 9, 30)
+    assert calendar.previous_trading_day(date(2024, 10, 8), inclusive=True) == date(2024, 10, 8)
+    assert calendar.next_trading_day(date(2024, 9, 30)) == date(2024, 10, 8)
+    assert calendar.trading_days_between("2024-09-27", "2024-10-09") == [
+        date(2024, 9, 27), date(2024, 9, 30), date(2024, 10, 8), date(2024, 10, 9)
+    ]
+    assert calendar.count_trading_days("2024-09-27", "2024-10-09") == 4
+
+    #Before the close the latest trade date is the previous session
+    assert calendar.latest_trade_date("CN", datetime(2024, 10, 8, 10, 0)) == date(2024, 9, 30)
+    assert calendar.latest_trade_date("CN", datetime(2024, 10, 8, 15, 5)) == date(2024, 10, 8)
+    assert calendar.is_open(datetime(2024, 10, 8, 10, 0))
+    assert not calendar.is_open(datetime(2024, 10, 8, 12, 0))
+    assert not calendar.is_open(datetime(2024, 10, 3, 10, 0))
+    assert calendar.is_open(datetime(2024, 10, 8, 15, 20), close_buffer_minutes=30)
+
+
+def test_calendar_is_persisted_and_reloaded(tmp_path, monkeypatch):
+    _cn_calendar(tmp_path, monkeypatch)
+
+    def _unreachable(lo, hi):
+        raise AssertionError("persisted calendar must be used without remote access")
+
+    monkeypatch.setattr(tc, "REMOTE_LOADERS", {"CN": (("fake", _unreachable),)})
+    reloaded = tc.TradingCalendar(tmp_path / "calendar.json")
+    assert not reloaded.is_trading_day(date(2024, 10, 4))
+    assert reloaded.get_status()["CN"]["source"] == "fake"
+
+
+def test_rule_fallback_outside_loaded_window(tmp_path, monkeypatch):
+    calendar = _cn_calendar(tmp_path, monkeypatch)
+    #Outside the loaded window weekdays are used
+    assert calendar.next_trading_day(date(2024, 11, 1)) == date(2024, 11, 4)
+    #US falls back to NYSE holiday rules when no remote calendar is reachable
+    assert calendar.refresh(["US"])["US"] == "rules"
+    assert not calendar.is_trading_day(date(2024, 11, 28), "US")  #Thanksgiving
+    assert not calendar.is_trading_day(date(2024, 3, 29), "US")   #Good Friday
+    assert calendar.is_trading_day(date(2024, 11, 29), "US")
+    assert calendar.is_open(datetime(2024, 11, 29, 10, 0), "US")
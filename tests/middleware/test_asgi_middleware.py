@@ -0,0 +1,126 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.operation_log_middleware import OperationLogMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+
+
+class _FakeRedisService:
+    def __init__(self):
+        self.counts = {}
+        self.calls = []
+
+    async def increment_counters_with_ttl(self, counters):
+        self.calls.append(counters)
+        result = []
+        for key, _ttl in counters:
+            self.counts[key] = self.counts.get(key, 0) + 1
+            result.append(self.counts[key])
+        return result
+
+
+class _SetUser:
+    """Stands in for the auth layer that puts the user on request.state"""
+
+    def __init__(self, app, user=None):
+        self.app = app
+        self.user = user
+
+    async def __call__(self, scope, receive, send):
+        if self.user:
+            state = scope.setdefault("state", {})
+            state["user_id"] = self.user["id"]
+            state["user"] = self.user
+        await self.app(scope, receive, send)
+
+
+def test_rate_limit_and_quota_share_one_redis_call(monkeypatch):
+    import app.middleware.rate_limit as rate_limit
+
+    fake = _FakeRedisService()
+    monkeypatch.setattr(rate_limit, "get_redis_service", lambda: fake)
+
+    app = FastAPI()
+
+    @app.post("/api/analysis/single")
+    async def single():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, daily_quota=12)
+    app.add_middleware(_SetUser, user={"id": "u1"})
+    client = TestClient(app)
+
+    statuses = [client.post("/api/analysis/single").status_code for _ in range(11)]
+    assert statuses == [200] * 10 + [429]
+    # Each request made exactly one Redis call carrying both counters
+    assert len(fake.calls) == 11
+    assert all(len(call) == 2 for call in fake.calls)
+    assert [ttl for _, ttl in fake.calls[0]] == [60, 86400]
+
+    resp = client.post("/api/analysis/single")
+    assert resp.json()["detail"]["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert resp.headers["Retry-After"] == "60"
+
+
+def test_rate_limit_fails_open_without_redis(monkeypatch):
+    import app.middleware.rate_limit as rate_limit
+
+    def _broken():
+        raise RuntimeError("redis down")
+
+    monkeypatch.setattr(rate_limit, "get_redis_service", _broken)
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware)
+    assert TestClient(app).get("/api/ping").status_code == 200
+
+
+def test_streaming_response_passes_through_full_stack(monkeypatch):
+    import app.middleware.operation_log_middleware as oplog
+
+    logged = []
+
+    async def _fake_log_operation(**kwargs):
+        logged.append(kwargs)
+
+    monkeypatch.setattr(oplog, "log_operation", _fake_log_operation)
+
+    app = FastAPI()
+
+    @app.post("/api/reports/export")
+    async def export():
+        def _chunks():
+            for i in range(3):
+                yield f"chunk{i}\n"
+        return StreamingResponse(_chunks(), media_type="text/plain", status_code=201)
+
+    @app.post("/api/config/broken")
+    async def broken():
+        raise ValueError("bad value")
+
+    app.add_middleware(OperationLogMiddleware)
+    app.add_middleware(_SetUser, user={"id": "admin", "username": "admin"})
+    app.add_middleware(AccessLogMiddleware)
+    app.add_middleware(ErrorHandlerMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    client = TestClient(app)
+
+    resp = client.post("/api/reports/export")
+    assert resp.status_code == 201
+    assert resp.text == "chunk0\nchunk1\nchunk2\n"
+    assert resp.headers["X-Trace-ID"] == resp.headers["X-Request-ID"]
+    assert logged[0]["details"]["status_code"] == 201
+    assert logged[0]["wait"] is False
+
+    resp = client.post("/api/config/broken")
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert resp.json()["error"]["request_id"] == resp.headers["X-Trace-ID"]
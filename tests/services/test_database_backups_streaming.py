@@ -0,0 +1,219 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+
+class _AsyncIter:
+    def __init__(self, docs):
+        self._it = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _BulkResult:
+    def __init__(self, inserted, upserted):
+        self.inserted_count = inserted
+        self.upserted_count = upserted
+        self.modified_count = 0
+
+
+class _FakeColl:
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+
+    def find(self, query=None, batch_size=None):
+        since = ((query or {}).get("updated_at") or {}).get("$gt")
+        docs = [d for d in self.docs if since is None or d.get("updated_at", datetime.min) > since]
+        return _AsyncIter([dict(d) for d in docs])
+
+    async def find_one(self, query, sort=None):
+        docs = [d for d in self.docs if all(d.get(k) == v for k, v in query.items())]
+        if sort:
+            key, direction = sort[0]
+            docs.sort(key=lambda d: d[key], reverse=direction < 0)
+        return docs[0] if docs else None
+
+    async def insert_one(self, doc):
+        self.docs.append(doc)
+
+    async def insert_many(self, docs):
+        self.docs.extend(docs)
+
+        class _R:
+            inserted_ids = [d.get("_id") for d in docs]
+        return _R()
+
+    async def delete_many(self, query):
+        class _R:
+            deleted_count = len(self.docs)
+        self.docs = []
+        return _R()
+
+    async def bulk_write(self, ops, ordered=False):
+        inserted = upserted = 0
+        for op in ops:
+            doc = op._doc
+            existing = [d for d in self.docs if "_id" in doc and d.get("_id") == doc["_id"]]
+            if existing:
+                self.docs.remove(existing[0])
+            else:
+                upserted += 1
+            self.docs.append(doc)
+        return _BulkResult(inserted, upserted)
+
+
+class _FakeDB:
+    def __init__(self, collections):
+        self._colls = {name: _FakeColl(docs) for name, docs in collections.items()}
+        self._colls["database_backups"] = _FakeColl()
+
+    async def list_collection_names(self):
+        return [n for n in self._colls if n != "database_backups"]
+
+    def __getitem__(self, name):
+        return self._colls.setdefault(name, _FakeColl())
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+def _read_backup(path):
+    collections = {}
+    current = None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            doc = json.loads(line)
+            if "__backup_collection__" in doc:
+                current = doc["__backup_collection__"]
+                collections[current] = []
+            else:
+                collections[current].append(doc)
+    return collections
+
+
+def test_streaming_backup_incremental_and_restore(tmp_path, monkeypatch):
+    import app.services.database.backups as backups
+
+    t0 = datetime(2025, 1, 1)
+    users = [{"_id": ObjectId(), "name": f"u{i}", "updated_at": t0} for i in range(3)]
+    quotes = [{"_id": ObjectId(), "code": f"{i:06d}", "updated_at": t0} for i in range(2500)]
+    db = _FakeDB({"users": users, "stock_daily_quotes": quotes})
+    monkeypatch.setattr(backups, "get_mongo_db_async", lambda: db)
+
+    full = asyncio.run(backups.create_backup("full", str(tmp_path), concurrency=2))
+    assert full["backup_type"] == "streaming"
+    assert full["document_counts"] == {"users": 3, "stock_daily_quotes": 2500}
+
+    content = _read_backup(full["file_path"])
+    assert len(content["users"]) == 3
+    assert len(content["stock_daily_quotes"]) == 2500
+
+    # Only documents updated after the last backup go into the incremental backup
+    db["database_backups"].docs[0]["created_at"] = t0 + timedelta(hours=1)
+    db["users"].docs[0]["name"] = "changed"
+    db["users"].docs[0]["updated_at"] = t0 + timedelta(hours=2)
+
+    inc = asyncio.run(backups.create_backup("inc", str(tmp_path), incremental=True))
+    assert inc["incremental"] is True
+    assert inc["document_counts"] == {"users": 1, "stock_daily_quotes": 0}
+
+    # Restore the full backup then the incremental one into an empty database
+    restore_db = _FakeDB({})
+    monkeypatch.setattr(backups, "get_mongo_db_async", lambda: restore_db)
+    for backup in (full, inc):
+        with open(backup["file_path"], "rb") as f:
+            result = asyncio.run(backups.import_data(f, "unused", filename=backup["filename"]))
+        assert result["mode"] == "stream"
+
+    assert len(restore_db["stock_daily_quotes"].docs) == 2500
+    restored_users = {str(d["_id"]): d for d in restore_db["users"].docs}
+    assert len(restored_users) == 3
+    assert restored_users[str(users[0]["_id"])]["name"] == "changed"
+
+
+def test_streaming_json_export_is_importable(tmp_path, monkeypatch):
+    import app.services.database.backups as backups
+
+    db = _FakeDB({
+        "users": [{"_id": ObjectId(), "password": "secret"}],
+        "system_configs": [{"_id": ObjectId(), "api_key": "k", "max_tokens": 10}],
+    })
+    monkeypatch.setattr(backups, "get_mongo_db_async", lambda: db)
+
+    path = asyncio.run(backups.export_data(export_dir=str(tmp_path), format="json", sanitize=True))
+    with open(path, encoding="utf-8") as f:
+        exported = json.load(f)
+
+    assert exported["data"]["users"] == []
+    assert exported["data"]["system_configs"][0]["api_key"] == ""
+    assert exported["data"]["system_configs"][0]["max_tokens"] == 10
+
+
+def test_router_imports_plain_json_and_jsonl_uploads(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import app.routers.database as database_router
+    import app.services.database.backups as backups
+
+    db = _FakeDB({})
+    monkeypatch.setattr(backups, "get_mongo_db_async", lambda: db)
+    app = FastAPI()
+    app.include_router(database_router.router)
+    app.dependency_overrides[database_router.get_current_user] = lambda: {"username": "admin"}
+    client = TestClient(app)
+
+    array = json.dumps([{"code": "000001"}, {"code": "600519"}]).encode()
+    response = client.post("/database/import", params={"collection": "stocks"},
+                           files={"file": ("stocks.json", array, "application/json")})
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["inserted_count"] == 2
+
+    lines = b"\n".join(json.dumps({"code": c}).encode() for c in ("300750", "000858", "002594"))
+    response = client.post("/database/import", params={"collection": "lines"},
+                           files={"file": ("lines.jsonl", lines, "application/x-ndjson")})
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["mode"] == "stream"
+    assert len(db["stocks"].docs) == 2 and len(db["lines"].docs) == 3
+
+
+class _NotIOBase:
+    """File object without readable(), like SpooledTemporaryFile before Python 3.11"""
+
+    def __init__(self, data):
+        self._buffer = __import__("io").BytesIO(data)
+        self.read, self.seek, self.tell = self._buffer.read, self._buffer.seek, self._buffer.tell
+
+
+def test_gzip_uploads_are_sniffed_after_decompression(monkeypatch):
+    import app.services.database.backups as backups
+
+    db = _FakeDB({})
+    monkeypatch.setattr(backups, "get_mongo_db_async", lambda: db)
+
+    #Legacy compressed JSON array export
+    legacy = gzip.compress(json.dumps([{"code": "000001"}, {"code": "600519"}], indent=2).encode())
+    result = asyncio.run(backups.import_data(_NotIOBase(legacy), "legacy", filename="legacy.json.gz"))
+    assert result["mode"] == "single_collection" and result["inserted_count"] == 2
+
+    #Compressed multi-collection export: an object spread over several lines
+    export = gzip.compress(b'{"export_info": {"collections": ["a"]}, "data": {"a": [\n{"x": 1}]}}')
+    result = asyncio.run(backups.import_data(export, "unused", filename="export.json.gz"))
+    assert result["mode"] == "multi_collection" and result["total_inserted"] == 1
+
+    backup = gzip.compress(b'\n{"__backup_collection__": "users"}\n{"name": "u1"}\n{"name": "u2"}\n')
+    result = asyncio.run(backups.import_data(_NotIOBase(backup), "unused", filename="backup.ndjson.gz"))
+    assert result["mode"] == "stream" and result["collections"] == ["users"]
+    assert len(db["users"].docs) == 2
@@ -0,0 +1,66 @@
+import zipfile
+from datetime import datetime, timedelta
+
+
+def _write_log(path, start, count, level_every=10):
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(count):
+            ts = (start + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S")
+            level = "ERROR" if i % level_every == 0 else "INFO"
+            f.write(f"{ts},000 | webapi | {level:<8} | Svc | message {i}\n")
+            if level == "ERROR":
+                f.write("Traceback (most recent call last):\n")
+
+
+def test_tail_and_time_range_use_index(tmp_path):
+    from app.services.log_export_service import LogExportService, tail_lines
+
+    log_file = tmp_path / "webapi.log"
+    start = datetime(2025, 1, 1, 0, 0, 0)
+    _write_log(log_file, start, 20000)
+
+    service = LogExportService(log_dir=str(tmp_path))
+
+    tail = tail_lines(log_file, 3)
+    assert tail[-1].endswith("message 19999")
+    assert len(tail) == 3
+
+    result = service.read_log_file("webapi.log", lines=50)
+    assert len(result["lines"]) == 50
+    assert result["stats"]["total_lines"] == 22000
+
+    index = service.get_file_index(log_file)
+    assert len(index.offsets) > 1
+    # Seeking lands on a checkpoint before the requested time, not at the file start
+    assert index.seek_offset("2025-01-01 05:00:00") > 0
+
+    result = service.read_log_file(
+        "webapi.log", lines=1000,
+        start_time="2025-01-01T05:00:00", end_time="2025-01-01T05:00:09",
+    )
+    messages = [line for line in result["lines"] if "message" in line]
+    assert messages[0].endswith("message 18000")
+    assert messages[-1].endswith("message 18009")
+    # The traceback continuation line belongs to the ERROR record inside the range
+    assert "Traceback (most recent call last):" in result["lines"]
+
+    # Appending extends the index incrementally
+    _write_log(log_file, start + timedelta(seconds=20000), 10)
+    assert service.get_file_index(log_file).line_count == 22011
+
+
+def test_streaming_filtered_export(tmp_path, monkeypatch):
+    from app.services.log_export_service import LogExportService
+
+    monkeypatch.chdir(tmp_path)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    _write_log(log_dir / "worker.log", datetime(2025, 1, 1), 100)
+
+    service = LogExportService(log_dir=str(log_dir))
+    path = service.export_logs(level="ERROR", format="zip")
+
+    with zipfile.ZipFile(path) as zf:
+        content = zf.read("worker.log").decode("utf-8").splitlines()
+    assert len(content) == 10
+    assert all("ERROR" in line for line in content)
@@ -0,0 +1,196 @@
+import asyncio
+import re
+from datetime import datetime, timedelta
+
+from tradingagents.dataflows.news import search_index
+
+
+def _matches(doc, query):
+    for field, cond in query.items():
+        if field == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = doc.get(field)
+        values = value if isinstance(value, list) else [value]
+        if isinstance(cond, dict):
+            if "$in" in cond and not set(values) & set(cond["$in"]):
+                return False
+            if "$all" in cond and not set(cond["$all"]) <= set(values):
+                return False
+            if "$gte" in cond and not (value is not None and value >= cond["$gte"]):
+                return False
+            if "$exists" in cond and (field in doc) != cond["$exists"]:
+                return False
+            if "$regex" in cond and not any(
+                isinstance(v, str) and re.search(cond["$regex"], v, re.I) for v in values
+            ):
+                return False
+        elif cond not in values:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction=1):
+        self.docs.sort(key=lambda d: d.get(key), reverse=direction == -1)
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+    async def to_list(self, length=None):
+        return self.docs
+
+
+class _Aggregate(list):
+    async def to_list(self, length=None):
+        return list(self)
+
+
+class _FakeCollection:
+    full_name = "test.stock_news"
+
+    def __init__(self, docs):
+        self.docs = [dict(d, _id=i) for i, d in enumerate(docs)]
+
+    def find(self, query, projection=None):
+        found = [dict(d) for d in self.docs if _matches(d, query)]
+        if projection and all(v == 0 for v in projection.values()):
+            found = [{k: v for k, v in d.items() if k not in projection} for d in found]
+        return _Cursor(found)
+
+    def count_documents(self, query):
+        return len([d for d in self.docs if _matches(d, query)])
+
+    def aggregate(self, pipeline):
+        lengths = [d["search_len"] for d in self.docs if d.get("search_len")]
+        return _Aggregate([{"total": len(lengths), "avg_len": sum(lengths) / len(lengths)}] if lengths else [])
+
+
+class _AsyncCollection(_FakeCollection):
+    async def count_documents(self, query):
+        return super().count_documents(query)
+
+    async def create_index(self, keys, **kwargs):
+        pass
+
+
+def _news(title, content="", symbol="300750", days_ago=0):
+    doc = {"title": title, "content": content, "symbol": symbol,
+           "publish_time": datetime(2024, 6, 30) - timedelta(days=days_ago)}
+    doc.update(search_index.build_search_fields(doc))
+    return doc
+
+
+DOCS = [
+    _news("宁德时代新能源汽车电池出货量创新高", "新能源车需求旺盛，新能源板块走强", days_ago=1),
+    _news("宁德时代发布半年报", "营收同比增长", days_ago=0),
+    _news("比亚迪新能源汽车销量", "新能源汽车", symbol="002594", days_ago=2),
+    _news("CATL signs battery deal with Tesla", "", days_ago=3),
+]
+
+
+def test_tokenizer_segments_chinese_into_bigrams():
+    assert search_index.tokenize("新能源 CATL-2024") == ["新能", "能源", "catl-2024"]
+    assert search_index.tokenize_query("新能源 新能") == ["新能", "能源"]
+
+
+def test_bm25_search_matches_chinese_keywords_and_pushes_filters():
+    search_index._corpus_stats.clear()
+    collection = _FakeCollection(DOCS)
+
+    results = search_index.search_sync(collection, "新能源", limit=10)
+    assert {r["title"] for r in results} == {"宁德时代新能源汽车电池出货量创新高", "比亚迪新能源汽车销量"}
+    assert results[0]["score"] >= results[1]["score"]
+    assert all("search_terms" not in r and r["score"] > 0 for r in results)
+
+    results = search_index.search_sync(collection, "新能源", {"symbol": "300750"}, limit=10)
+    assert [r["title"] for r in results] == ["宁德时代新能源汽车电池出货量创新高"]
+    assert search_index.search_sync(collection, "catl", limit=5)[0]["title"].startswith("CATL")
+
+    #Without query terms only the explicit match-all mode returns documents, newest first
+    assert search_index.search_sync(collection, "", {"symbol": "300750"}) == []
+    newest = search_index.search_sync(collection, "", {"symbol": "300750"}, limit=1, match_all_if_empty=True)
+    assert newest[0]["title"] == "宁德时代发布半年报"
+
+
+def test_news_service_search_and_keyword_query():
+    import app.services.news_data_service as mod
+
+    search_index._corpus_stats.clear()
+    service = mod.NewsDataService()
+    collection = _AsyncCollection(DOCS)
+    service._collection = collection
+
+    results = asyncio.run(service.search_news("新能源汽车", symbol="002594"))
+    assert [r["title"] for r in results] == ["比亚迪新能源汽车销量"]
+
+    #query_news keyword filters need every term of a keyword
+    condition = search_index.keyword_filter(["电池出货"])
+    assert [d["title"] for d in collection.find(condition)] == ["宁德时代新能源汽车电池出货量创新高"]
+
+    #Keywords without index terms are matched as substrings rather than dropped
+    assert search_index.keyword_filter(["  "]) is None
+    condition = search_index.keyword_filter(["l"])
+    assert condition["$or"][0] == {"title": {"$regex": "l", "$options": "i"}}
+    assert [d["title"] for d in collection.find(condition)] == ["CATL signs battery deal with Tesla"]
+    assert search_index.keyword_filter(["C+"])["$or"][0]["title"]["$regex"] == re.escape("C+")
+
+    saved = service._standardize_news_data({"title": "储能业务增长", "symbol": "300750"}, "akshare", "CN",
+                                           datetime.utcnow())
+    assert "储能" in saved["search_terms"] and saved["search_len"] > 0
+
+
+def test_rare_terms_keep_their_candidates_when_common_terms_fill_the_budget():
+    search_index._corpus_stats.clear()
+    common = [_news(f"新能源板块第{i}次走强", days_ago=i) for i in range(30)]
+    collection = _FakeCollection(common + [_news("宁德时代新能源电池", days_ago=400)])
+
+    results = search_index.search_sync(collection, "宁德时代新能源", limit=3, candidate_limit=10)
+    assert results[0]["title"] == "宁德时代新能源电池"
+
+
+class _BackfillCollection(_AsyncCollection):
+    async def bulk_write(self, requests, ordered=True):
+        for request in requests:
+            doc = next(d for d in self.docs if d["_id"] == request._filter["_id"])
+            doc.update(request._doc["$set"])
+
+
+def test_social_service_backfills_messages_saved_before_the_index(caplog):
+    import app.services.social_media_service as mod
+
+    service = mod.SocialMediaService()
+    service.collection = _BackfillCollection([{"content": "储能业务增长", "hashtags": ["宁德时代"]}])
+
+    async def _run():
+        await service._ensure_search_index()
+        await service._backfill_task
+
+    asyncio.run(_run())
+    assert "储能" in service.collection.docs[0]["search_terms"]
+
+    #Failures of the background task are logged instead of being lost with it
+    class _Broken(_AsyncCollection):
+        async def bulk_write(self, requests, ordered=True):
+            raise RuntimeError("write refused")
+
+    async def _run_broken():
+        task = search_index.schedule_backfill(_Broken([{"title": "储能"}]))
+        await asyncio.wait([task])
+        await asyncio.sleep(0)
+
+    asyncio.run(_run_broken())
+    assert "write refused" in caplog.text
@@ -0,0 +1,136 @@
+import asyncio
+
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+
+class _FakeColl:
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    async def insert_many(self, docs, ordered=True):
+        assert ordered is False
+        if self.fail_times:
+            self.fail_times -= 1
+            raise AutoReconnect("mongo down")
+        self.batches.append([d["n"] for d in docs])
+
+
+class _FakeDB:
+    def __init__(self, coll):
+        self.coll = coll
+
+    def __getitem__(self, name):
+        assert name == "operation_logs"
+        return self.coll
+
+
+def _writer(monkeypatch, coll, **kwargs):
+    import app.services.operation_log_service as svc
+
+    monkeypatch.setattr(svc, "get_mongo_db_async", lambda: _FakeDB(coll))
+    return svc.OperationLogWriter(**kwargs)
+
+
+def test_writer_batches_by_size_and_flushes_on_stop(monkeypatch):
+    coll = _FakeColl()
+    writer = _writer(monkeypatch, coll, batch_size=200, flush_interval=60)
+
+    async def _run():
+        for n in range(450):
+            await writer.submit({"n": n})
+        await asyncio.sleep(0.01)
+        # A full batch wakes the writer without waiting for the 60s interval
+        assert [len(b) for b in coll.batches] == [200, 200, 50]
+        await writer.submit({"n": 450})
+        await writer.stop()
+
+    asyncio.run(_run())
+    # The tail is flushed on shutdown
+    assert [len(b) for b in coll.batches] == [200, 200, 50, 1]
+    assert writer.get_stats()["written"] == 451
+    assert writer.get_stats()["pending"] == 0
+
+
+def test_writer_flushes_on_interval(monkeypatch):
+    coll = _FakeColl()
+    writer = _writer(monkeypatch, coll, batch_size=100, flush_interval=0.05)
+
+    async def _run():
+        await writer.submit({"n": 1})
+        await asyncio.sleep(0.2)
+        assert coll.batches == [[1]]
+        await writer.stop()
+
+    asyncio.run(_run())
+
+
+def test_writer_drop_policies_bound_memory(monkeypatch):
+    async def _fill(writer):
+        results = [await writer.submit({"n": n}) for n in range(5)]
+        await writer.stop()
+        return results
+
+    coll = _FakeColl()
+    writer = _writer(monkeypatch, coll, batch_size=100, flush_interval=60, max_buffer=3)
+    assert asyncio.run(_fill(writer)) == [True] * 5
+    assert coll.batches == [[2, 3, 4]]
+    assert writer.get_stats()["dropped"] == 2
+
+    coll = _FakeColl()
+    writer = _writer(monkeypatch, coll, batch_size=100, flush_interval=60, max_buffer=3,
+                     overflow_policy="drop_newest")
+    assert asyncio.run(_fill(writer)) == [True, True, True, False, False]
+    assert coll.batches == [[0, 1, 2]]
+
+
+def test_writer_requeues_batch_when_database_unavailable(monkeypatch):
+    coll = _FakeColl(fail_times=1)
+    writer = _writer(monkeypatch, coll, batch_size=10, flush_interval=0.05)
+
+    async def _run():
+        for n in range(3):
+            await writer.submit({"n": n})
+        await asyncio.sleep(0.3)
+        await writer.stop()
+
+    asyncio.run(_run())
+    assert coll.batches == [[0, 1, 2]]
+    assert writer.get_stats()["failed_batches"] == 1
+    assert writer.get_stats()["dropped"] == 0
+
+
+class _LandedColl(_FakeColl):
+    """The first insert lands but its acknowledgement is lost; the retry hits duplicate keys"""
+
+    def __init__(self):
+        super().__init__()
+        self.stored = {}
+        self.lost_ack = True
+
+    async def insert_many(self, docs, ordered=True):
+        errors = [{"index": i, "code": 11000} for i, d in enumerate(docs) if d["n"] in self.stored]
+        for d in docs:
+            self.stored.setdefault(d["n"], d)
+        if self.lost_ack:
+            self.lost_ack = False
+            raise AutoReconnect("connection reset")
+        if errors:
+            raise BulkWriteError({"nInserted": len(docs) - len(errors), "writeErrors": errors})
+        self.batches.append([d["n"] for d in docs])
+
+
+def test_retried_batch_that_already_landed_counts_as_written(monkeypatch):
+    coll = _LandedColl()
+    writer = _writer(monkeypatch, coll, batch_size=10, flush_interval=0.05)
+
+    async def _run():
+        for n in range(3):
+            await writer.submit({"n": n})
+        await asyncio.sleep(0.3)
+        await writer.stop()
+
+    asyncio.run(_run())
+    stats = writer.get_stats()
+    assert sorted(coll.stored) == [0, 1, 2]
+    assert stats["written"] == 3 and stats["pending"] == 0 and stats["dropped"] == 0
@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services.progress.hub import ProgressHub
+from app.services.queue import BATCH_PREFIX, BATCH_TASKS_PREFIX, TASK_PREFIX
+from app.services.queue_service import QueueService
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.subscribe_calls = []
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.subscribe_calls.append(channel)
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel):
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.pubsubs = []
+
+    def pubsub(self):
+        self.pubsubs.append(_FakePubSub())
+        return self.pubsubs[-1]
+
+
+def _lua_redis():
+    """fakeredis with Lua, so the task transition script itself runs"""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    class _Redis(fakeredis.FakeAsyncRedis):
+        def __init__(self):
+            super().__init__(decode_responses=True)
+            self.published = []
+
+        async def publish(self, channel, message):
+            self.published.append((channel, json.loads(message)))
+            return await super().publish(channel, message)
+
+    return _Redis()
+
+
+def test_one_pubsub_is_shared_by_all_consumers():
+    async def scenario():
+        redis = _FakeRedis()
+        hub = ProgressHub(redis_factory=lambda: redis, queue_size=2)
+        async with hub.subscribe("task_progress:t1") as first, hub.subscribe("task_progress:t1") as second:
+            async with hub.subscribe("task_progress:t2") as other:
+                pubsub = redis.pubsubs[0]
+                assert pubsub.subscribe_calls == ["task_progress:t1", "task_progress:t2"]
+                for i in range(3):
+                    await pubsub.messages.put({"type": "message", "channel": "task_progress:t1", "data": f"m{i}"})
+                await asyncio.sleep(0.05)
+                #Full queues drop their oldest message
+                assert [first.get_nowait(), first.get_nowait()] == ["m1", "m2"]
+                assert second.qsize() == 2 and other.empty()
+            assert pubsub.channels == {"task_progress:t1"}
+        assert pubsub.channels == set() and len(redis.pubsubs) == 1
+        assert hub.get_stats()["dropped_messages"] == 2
+        await hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_batch_counters_follow_task_state_changes():
+    async def scenario():
+        redis = _lua_redis()
+        svc = QueueService(redis)
+        await redis.hset(BATCH_PREFIX + "b1", mapping={"id": "b1", "user": "u", "status": "queued",
+                                                       "queued": 0, "processing": 2, "completed": 0,
+                                                       "failed": 0, "cancelled": 0})
+        for task_id in ("t1", "t2"):
+            await redis.hset(TASK_PREFIX + task_id, mapping={"id": task_id, "user": "u", "batch_id": "b1",
+                                                            "status": "processing"})
+        await svc.ack_task("t1", success=True)
+        await svc.ack_task("t2", success=False)
+
+        channel, event = redis.published[-1]
+        assert channel == "batch_progress:b1"
+        assert event["status"] == "partial" and event["finished"] and event["progress"] == 100.0
+        assert await redis.hget(BATCH_PREFIX + "b1", "status") == "partial"
+
+        #Batches without counters are counted once from their tasks
+        await redis.hset(BATCH_PREFIX + "legacy", mapping={"id": "legacy", "user": "u", "status": "queued"})
+        await redis.sadd(BATCH_TASKS_PREFIX + "legacy", "t1", "t2")
+        snapshot = await svc.get_batch_progress("legacy")
+        assert (snapshot["completed"], snapshot["failed"], snapshot["total_tasks"]) == (1, 1, 2)
+        assert await redis.hget(BATCH_PREFIX + "legacy", "completed") == "1"
+
+    asyncio.run(scenario())
+
+
+def test_racing_transitions_of_one_task_are_counted_once():
+    async def scenario():
+        redis = _lua_redis()
+        svc = QueueService(redis)
+        await redis.hset(BATCH_PREFIX + "b1", mapping={"id": "b1", "user": "u", "status": "queued",
+                                                       "queued": 0, "processing": 1, "completed": 0,
+                                                       "failed": 0, "cancelled": 0})
+        await redis.hset(TASK_PREFIX + "t1", mapping={"id": "t1", "user": "u", "batch_id": "b1",
+                                                     "status": "processing"})
+        #Both acknowledgements read the task while it was still processing
+        await asyncio.gather(svc.ack_task("t1", success=True), svc.ack_task("t1", success=True))
+
+        batch = await redis.hgetall(BATCH_PREFIX + "b1")
+        assert (batch["processing"], batch["completed"]) == ("0", "1")
+        assert await redis.hget(TASK_PREFIX + "t1", "status") == "completed"
+
+        #A transition counts from the stored status, not from the caller's stale read
+        await svc.cancel_task("t1")
+        batch = await redis.hgetall(BATCH_PREFIX + "b1")
+        assert (batch["completed"], batch["cancelled"]) == ("0", "1")
+
+    asyncio.run(scenario())
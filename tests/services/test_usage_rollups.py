@@ -0,0 +1,211 @@
+import asyncio
+from datetime import datetime, timedelta
+
+KEY = ("date", "provider", "model_name", "currency")
+
+
+class _AsyncIter:
+    def __init__(self, docs):
+        self._it = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _matches(doc, query):
+    for field, cond in query.items():
+        value = doc.get(field)
+        if isinstance(cond, dict):
+            if "$gte" in cond and not value >= cond["$gte"]:
+                return False
+            if "$lt" in cond and not value < cond["$lt"]:
+                return False
+            if "$lte" in cond and not value <= cond["$lte"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class _FakeRaw:
+    def __init__(self, rollups):
+        self.docs = []
+        self.rollups = rollups
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def find_one(self, query, projection=None):
+        return self.docs[0] if self.docs else None
+
+    def find(self, *args, **kwargs):
+        raise AssertionError("statistics must not scan raw usage records")
+
+    def aggregate(self, pipeline):
+        match = pipeline[0]["$match"]
+        groups = {}
+        for doc in self.docs:
+            if not _matches(doc, match):
+                continue
+            key = (doc["timestamp"][:10], doc["provider"], doc["model_name"], doc.get("currency", "CNY"))
+            row = groups.setdefault(key, {"requests": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0})
+            row["requests"] += 1
+            row["input_tokens"] += doc["input_tokens"]
+            row["output_tokens"] += doc["output_tokens"]
+            row["cost"] += doc["cost"]
+        if "$merge" in pipeline[-1]:
+            for key, row in groups.items():
+                self.rollups.docs.append({**dict(zip(KEY, key)), **row})
+            return _AsyncIter([])
+        return _AsyncIter([{"_id": dict(zip(KEY, key)), **row} for key, row in groups.items()])
+
+
+class _FakeRollups:
+    def __init__(self):
+        self.docs = []
+
+    async def create_index(self, keys, unique=False):
+        pass
+
+    async def update_one(self, flt, update, upsert=False):
+        doc = next((d for d in self.docs if all(d.get(k) == v for k, v in flt.items())), None)
+        if doc is None:
+            doc = dict(flt)
+            self.docs.append(doc)
+        for field, inc in update["$inc"].items():
+            doc[field] = doc.get(field, 0) + inc
+        doc.update(update.get("$set", {}))
+
+    async def find_one(self, query, projection=None):
+        return self.docs[0] if self.docs else None
+
+    def find(self, query, projection=None):
+        return _AsyncIter([
+            {k: v for k, v in d.items() if k != "updated_at"} for d in self.docs if _matches(d, query)
+        ])
+
+    async def delete_many(self, query):
+        self.docs = [d for d in self.docs if not _matches(d, query)]
+
+    async def count_documents(self, query):
+        return len([d for d in self.docs if _matches(d, query)])
+
+
+class _FakeMigrations:
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query, projection=None):
+        return self.docs.get(query["_id"])
+
+    async def update_one(self, flt, update, upsert=False):
+        self.docs.setdefault(flt["_id"], {"_id": flt["_id"]}).update(update["$set"])
+
+
+class _FakeDB:
+    def __init__(self):
+        self.rollups = _FakeRollups()
+        self.raw = _FakeRaw(self.rollups)
+        self.migrations = _FakeMigrations()
+
+    def __getitem__(self, name):
+        return {"token_usage": self.raw, "token_usage_daily": self.rollups, "system_migrations": self.migrations}[name]
+
+
+def _record(ts, provider="dashscope", model="qwen-plus", cost=1.0, currency="CNY"):
+    from app.models.config_models import UsageRecord
+
+    return UsageRecord(
+        timestamp=ts.isoformat(), provider=provider, model_name=model,
+        input_tokens=100, output_tokens=50, cost=cost, currency=currency, session_id="s",
+    )
+
+
+def test_statistics_read_rollups_and_partial_first_day(monkeypatch):
+    import app.services.usage_statistics_service as mod
+
+    db = _FakeDB()
+    monkeypatch.setattr(mod, "get_mongo_db_async", lambda: db)
+    service = mod.UsageStatisticsService()
+
+    # Pin "now" to midday so the test never straddles midnight
+    now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(mod, "datetime", _Clock)
+    window_start = now - timedelta(days=7)
+    records = [
+        _record(now - timedelta(minutes=5)),
+        _record(now - timedelta(minutes=6)),
+        _record(now - timedelta(days=2), provider="openai", model="gpt-4o", cost=0.5, currency="USD"),
+        # On the first (partial) day of the window: one inside, one just before it
+        _record(window_start + timedelta(minutes=1), cost=2.0),
+        _record(window_start - timedelta(minutes=1), cost=100.0),
+    ]
+
+    async def _run():
+        for record in records:
+            assert await service.add_usage_record(record)
+        return await service.get_usage_statistics(days=7)
+
+    stats = asyncio.run(_run())
+
+    # Rollups hold one document per (day, provider, model, currency)
+    assert len({tuple(d[k] for k in KEY) for d in db.rollups.docs}) == len(db.rollups.docs) < len(records)
+    assert stats.total_requests == 4
+    assert stats.total_input_tokens == 400
+    assert stats.cost_by_currency == {"CNY": 4.0, "USD": 0.5}
+    assert stats.by_provider["openai"]["cost_by_currency"] == {"USD": 0.5}
+    assert stats.by_model["dashscope/qwen-plus"]["requests"] == 3
+    assert stats.by_date[now.date().isoformat()]["requests"] == 2
+
+    costs = asyncio.run(service.get_cost_by_provider(days=7))
+    assert costs == {"dashscope": 4.0, "openai": 0.5}
+
+
+def test_rollups_are_backfilled_from_existing_records(monkeypatch):
+    import app.services.usage_statistics_service as mod
+
+    db = _FakeDB()
+    monkeypatch.setattr(mod, "get_mongo_db_async", lambda: db)
+    now = datetime.now()
+    for days_ago in (1, 1, 3):
+        db.raw.docs.append(_record(now - timedelta(days=days_ago)).model_dump(exclude={"id"}))
+
+    stats = asyncio.run(mod.UsageStatisticsService().get_usage_statistics(days=7))
+
+    assert len(db.rollups.docs) == 2
+    assert stats.total_requests == 3
+    assert list(stats.by_date) == sorted(stats.by_date)
+
+
+def test_backfill_still_runs_after_the_first_post_upgrade_insert(monkeypatch):
+    import app.services.usage_statistics_service as mod
+
+    db = _FakeDB()
+    monkeypatch.setattr(mod, "get_mongo_db_async", lambda: db)
+    now = datetime.now()
+    for days_ago in (2, 3):
+        db.raw.docs.append(_record(now - timedelta(days=days_ago)).model_dump(exclude={"id"}))
+
+    async def _run():
+        # The insert creates a rollup for today before statistics are ever read
+        assert await mod.UsageStatisticsService().add_usage_record(_record(now - timedelta(minutes=1)))
+        first = await mod.UsageStatisticsService().get_usage_statistics(days=7)
+        second = await mod.UsageStatisticsService().get_usage_statistics(days=7)
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert first.total_requests == second.total_requests == 3
+    assert mod.ROLLUP_BACKFILL_MIGRATION in db.migrations.docs
@@ -0,0 +1,179 @@
+import asyncio
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            self._docs.sort(key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self._docs = self._docs[n:]
+        return self
+
+    def limit(self, n):
+        self._docs = self._docs[:n]
+        return self
+
+    def __aiter__(self):
+        self._it = iter(self._docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _match_keyset(doc, cond):
+    for alt in cond["$or"]:
+        if "_id" in alt:
+            if doc["created_at"] == alt["created_at"] and doc["_id"] < alt["_id"]["$lt"]:
+                return True
+        elif doc["created_at"] < alt["created_at"]["$lt"]:
+            return True
+    return False
+
+
+class _FakeReports:
+    def __init__(self, docs):
+        self.docs = docs
+        self.projections = []
+
+    async def count_documents(self, query):
+        return len(self.docs)
+
+    def find(self, query, projection=None):
+        self.projections.append(projection)
+        docs = self.docs
+        for cond in query.get("$and", []):
+            if "$or" in cond and "created_at" in str(cond):
+                docs = [d for d in docs if _match_keyset(d, cond)]
+        # Emulate the projection: the report bodies are never returned
+        return _FakeCursor([{k: v for k, v in d.items() if k != "reports"} for d in docs])
+
+
+class _FakeBasicInfo:
+    def __init__(self):
+        self.queries = 0
+
+    def find(self, query, projection=None):
+        self.queries += 1
+        return _FakeCursor([
+            {"code": "000001", "name": "平安银行", "source": "akshare"},
+            {"code": "000001", "name": "平安银行(tushare)", "source": "tushare"},
+        ])
+
+
+class _FakeDB:
+    def __init__(self, docs):
+        self.analysis_reports = _FakeReports(docs)
+        self.stock_basic_info = _FakeBasicInfo()
+
+
+def test_reports_list_uses_projection_keyset_and_batched_names(monkeypatch):
+    import app.routers.reports as reports_mod
+
+    base = datetime(2025, 1, 1)
+    docs = [
+        {
+            "_id": ObjectId(),
+            "stock_symbol": "000001",
+            "market_type": "A股",
+            "created_at": base + timedelta(minutes=i),
+            "reports": {"market_report": "x" * 1000},
+            "report_size": 1000,
+        }
+        for i in range(5)
+    ]
+    fake_db = _FakeDB(docs)
+    monkeypatch.setattr(reports_mod, "get_mongo_db_async", lambda: fake_db)
+    monkeypatch.setattr(reports_mod, "_stock_name_cache", {})
+
+    class _Source:
+        def __init__(self, type_):
+            self.type = type_
+            self.enabled = True
+
+    class _FakeConfig:
+        def get_data_source_configs(self):
+            return [_Source("tushare"), _Source("akshare")]
+
+    monkeypatch.setattr("app.core.unified_config.UnifiedConfigManager", _FakeConfig)
+
+    async def _list(cursor=None):
+        return await reports_mod.get_reports_list(
+            page=1, page_size=2, search_keyword=None, market_filter=None,
+            start_date=None, end_date=None, stock_code=None, cursor=cursor,
+            search_mode="contains", include_total=True, user={"id": "u1"},
+        )
+
+    first = asyncio.run(_list())["data"]
+    assert [r["created_at"] for r in first["reports"]] == sorted(
+        [r["created_at"] for r in first["reports"]], reverse=True
+    )
+    assert first["reports"][0]["stock_name"] == "平安银行(tushare)"
+    assert first["reports"][0]["file_size"] == 1000
+    assert "reports" not in fake_db.analysis_reports.projections[0]
+    assert first["next_cursor"]
+
+    second = asyncio.run(_list(first["next_cursor"]))["data"]
+    first_ids = {r["id"] for r in first["reports"]}
+    assert len(second["reports"]) == 2
+    assert not first_ids & {r["id"] for r in second["reports"]}
+
+    # Names were resolved once and cached
+    assert fake_db.stock_basic_info.queries == 1
+
+
+def test_search_condition_defaults_to_case_insensitive_substring():
+    from app.routers.reports import _build_search_condition
+
+    cond = _build_search_condition(" 平安.银 ")
+    assert cond == {"$or": [
+        {field: {"$regex": re.escape("平安.银"), "$options": "i"}}
+        for field in ("stock_symbol", "stock_name", "analysis_id", "summary")
+    ]}
+
+    prefix = _build_search_condition("sh60", "prefix")
+    patterns = {(field, alt[field]["$regex"]) for alt in prefix["$or"] for field in alt}
+    assert ("stock_symbol", "^SH60") in patterns
+    assert ("stock_name", "^sh60") in patterns
+    assert all(field != "summary" for field, _ in patterns)
+
+
+class _FakeModuleReports:
+    def __init__(self):
+        self.calls = []
+
+    async def find_one(self, query, projection=None):
+        self.calls.append(projection)
+        return {"reports": {"market_report": "# 市场分析"}}
+
+
+def test_report_module_content_projects_only_the_requested_module(monkeypatch):
+    import app.routers.reports as reports_mod
+
+    reports = _FakeModuleReports()
+    fake_db = type("DB", (), {"analysis_reports": reports})()
+    monkeypatch.setattr(reports_mod, "get_mongo_db_async", lambda: fake_db)
+
+    result = asyncio.run(reports_mod.get_report_module_content("a1", "market_report", user={"id": "u1"}))
+    assert result["data"]["content"] == "# 市场分析"
+    assert reports.calls == [{"reports.market_report": 1}]
+
+    for module in ("market_report.$", "$where", "a.b", "Market"):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(reports_mod.get_report_module_content("a1", module, user={"id": "u1"}))
+        assert exc.value.status_code == 400
+    assert len(reports.calls) == 1
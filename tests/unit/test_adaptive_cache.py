@@ -0,0 +1,188 @@
+import copy
+import pickle
+import time
+from collections import namedtuple
+
+import pandas as pd
+import pytest
+
+import tradingagents.dataflows.cache.adaptive as adaptive
+
+
+#In-memory stand-ins for the Redis client and the MongoDB cache collection, so no service is needed
+class _FakeRedis:
+    """The redis-py subset the adaptive cache uses (bytes values with TTL)"""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    def _alive(self, key):
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    def get(self, key):
+        return self.data.get(key) if self._alive(key) else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.expires[key] = time.monotonic() + ttl
+        return True
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def setex(self, key, ttl, value):
+        self._commands.append((key, ttl, value))
+        return self
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return [self._client.setex(*command) for command in commands]
+
+
+class _FakeCollection:
+    """The pymongo collection subset the adaptive cache uses, keyed by ``_id``"""
+
+    def __init__(self):
+        self.docs = {}
+
+    @staticmethod
+    def _ids(query):
+        cond = query["_id"]
+        return cond["$in"] if isinstance(cond, dict) else [cond]
+
+    def replace_one(self, query, doc, upsert=False):
+        if upsert or query["_id"] in self.docs:
+            self.docs[query["_id"]] = copy.deepcopy(doc)
+
+    def bulk_write(self, requests, ordered=True):
+        #Requests are _ReplaceOne tuples, see _cache
+        for request in requests:
+            self.replace_one(request.filter, request.replacement, upsert=request.upsert)
+
+    def find_one(self, query):
+        doc = self.docs.get(query["_id"])
+        return copy.deepcopy(doc) if doc is not None else None
+
+    def find(self, query):
+        return [copy.deepcopy(self.docs[i]) for i in self._ids(query) if i in self.docs]
+
+    def delete_one(self, query):
+        self.docs.pop(query["_id"], None)
+
+    def delete_many(self, query):
+        for doc_id in self._ids(query):
+            self.docs.pop(doc_id, None)
+
+
+class _FakeDatabaseManager:
+    """Replacement for tradingagents.config.database_manager.DatabaseManager"""
+
+    def __init__(self, primary_backend="redis"):
+        self.primary_backend = primary_backend
+        self.redis_client = _FakeRedis()
+        self.cache_collection = _FakeCollection()
+        #mongodb_client.tradingagents.cache
+        self.mongodb_client = type("Client", (), {"tradingagents": type("DB", (), {"cache": self.cache_collection})()})()
+
+    def get_redis_client(self):
+        return self.redis_client
+
+    def get_mongodb_client(self):
+        return self.mongodb_client
+
+    def is_database_available(self):
+        return True
+
+    def is_mongodb_available(self):
+        return True
+
+    def is_redis_available(self):
+        return True
+
+    def get_database_config(self):
+        return {
+            "primary_backend": self.primary_backend,
+            "cache": {
+                "primary_backend": self.primary_backend,
+                "fallback_enabled": True,
+                "ttl_settings": {"china_stock_data": 3600, "us_stock_data": 7200},
+            },
+        }
+
+
+#Stands in for pymongo.ReplaceOne, whose arguments are not public attributes
+_ReplaceOne = namedtuple("_ReplaceOne", "filter replacement upsert", defaults=(False,))
+
+
+def _cache(monkeypatch, tmp_path, backend, codec="zlib"):
+    monkeypatch.setenv("TA_CACHE_COMPRESSION", codec)
+    monkeypatch.setattr("pymongo.ReplaceOne", _ReplaceOne)
+    manager = _FakeDatabaseManager(primary_backend=backend)
+    monkeypatch.setattr(adaptive, "get_database_manager", lambda: manager)
+    return adaptive.AdaptiveCacheSystem(cache_dir=str(tmp_path / backend)), manager
+
+
+def _frame(rows):
+    return pd.DataFrame({"close": [float(i % 7) for i in range(rows)], "volume": list(range(rows))})
+
+
+@pytest.mark.parametrize("backend", ["redis", "mongodb", "file"])
+def test_batch_round_trip_matches_single_key_api(monkeypatch, tmp_path, backend):
+    cache, manager = _cache(monkeypatch, tmp_path, backend)
+    items = {"600519": _frame(2000), "000001": {"pe": 12.5}, "AAPL": _frame(20).iloc[:0]}
+
+    keys = cache.save_many(items, "2024-01-01", "2024-12-31")
+    assert keys == [cache._get_cache_key(s, "2024-01-01", "2024-12-31", "default", "stock_data") for s in items]
+    stored = {"redis": manager.redis_client.data, "mongodb": manager.cache_collection.docs}.get(backend)
+    assert stored is None or set(keys) <= set(stored)
+
+    missing = cache._get_cache_key("300750", "2024-01-01", "2024-12-31")
+    loaded = cache.load_many(keys + [missing])
+    assert set(loaded) == set(keys)
+    pd.testing.assert_frame_equal(loaded[keys[0]], items["600519"])
+    pd.testing.assert_frame_equal(cache.load_data(keys[0]), items["600519"])
+    assert loaded[keys[1]] == cache.load_data(keys[1]) == {"pe": 12.5}
+    assert loaded[keys[2]].empty
+
+    #Only the large payload crosses the threshold
+    compression = cache.get_cache_stats()["compression"]
+    assert compression["writes"] == 3 and compression["compressed_writes"] == 1
+    assert compression["stored_bytes"] < compression["raw_bytes"]
+
+
+def test_pipeline_failure_falls_back_to_files_and_legacy_pickles_still_load(monkeypatch, tmp_path):
+    cache, manager = _cache(monkeypatch, tmp_path, "redis", codec="none")
+    monkeypatch.setattr(manager.redis_client, "pipeline", lambda **kwargs: 1 / 0)
+
+    [key] = cache.save_many([("600519", {"pe": 30})])
+    assert (cache.cache_dir / f"{key}.pkl").exists()
+    assert cache.load_many([key]) == {key: {"pe": 30}}
+
+    #Uncompressed payloads written before this format existed
+    legacy_key = cache._get_cache_key("000001")
+    manager.redis_client.setex(legacy_key, 60, pickle.dumps({
+        "data": [1, 2], "metadata": {"symbol": "000001"}, "timestamp": "2024-01-01T00:00:00", "backend": "redis"}))
+    assert cache.load_many([legacy_key]) == {legacy_key: [1, 2]}
+
+
+def test_size_counters_are_exact_under_concurrent_writes(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache, _ = _cache(monkeypatch, tmp_path, "file", codec="none")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cache._encode_payload({"i": i}), range(4000)))
+    assert cache.get_cache_stats()["compression"]["writes"] == 4000
@@ -0,0 +1,47 @@
+from contextlib import ExitStack
+
+from scripts.benchmarks import harness
+from scripts.benchmarks.cases import BenchParams, build_benchmarks
+from scripts.benchmarks.standins import InMemoryCollection, InMemoryRedis
+
+
+def _report(**medians):
+    return {"meta": {"params": {"rows": 10}},
+            "results": {name: {"median_s": value} for name, value in medians.items()}}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = _report(fast=0.100, steady=0.100, slower=0.100, gone=0.1)
+    current = _report(fast=0.050, steady=0.110, slower=0.140, added=0.1)
+    current["results"]["noisy"] = {"median_s": 0.2, "threshold": 1.0}
+    baseline["results"]["noisy"] = {"median_s": 0.1}
+
+    status = {row["name"]: row["status"] for row in harness.compare(current, baseline, threshold=0.25)}
+    assert status == {"fast": "improved", "steady": "ok", "slower": "regression", "added": "new",
+                      "noisy": "ok", "gone": "removed"}
+    #Tiny absolute differences are noise
+    assert harness.compare(_report(a=0.0012), _report(a=0.0004))[0]["status"] == "ok"
+    assert harness.params_mismatch(current, {"meta": {"params": {"rows": 20}}}) == {"rows": (20, 10)}
+
+
+def test_standins_cover_query_and_ttl_basics():
+    collection = InMemoryCollection()
+    collection.insert_many([{"code": "000001", "market_info": {"market": "CN"}}, {"code": "AAPL", "market": "US"}])
+    query = {"$or": [{"market_info.market": "CN"}, {"market": {"$in": ["主板"]}}]}
+    assert [d["code"] for d in collection.find(query, {"code": 1, "_id": 0})] == ["000001"]
+
+    redis = InMemoryRedis()
+    redis.setex("k", 60, b"v")
+    assert redis.get("k") == b"v" and redis.exists("k") == 1
+
+
+def test_quick_cases_run_without_services():
+    params = BenchParams(rows=120, symbols=3, cache_entries=20, news=50)
+    with ExitStack() as stack:
+        benchmarks = build_benchmarks(params, stack, ["indicators", "news", "file_cache"])
+        for bench in benchmarks:
+            bench.repeat, bench.warmup = 1, 0
+        results = harness.run_all(benchmarks, log=lambda line: None)
+
+    assert "indicators.compute_many" in results and "file_cache.find_miss_scan" in results
+    assert all("median_s" in r for r in results.values()), results
@@ -0,0 +1,56 @@
+from tradingagents.agents.utils import company_profile as cp
+from tradingagents.dataflows.cache import app_adapter
+
+
+def test_profile_resolved_from_stock_basic_info_and_cached(monkeypatch):
+    cp.clear_company_profile_cache()
+    lookups = []
+
+    def fake_basics(code):
+        lookups.append(code)
+        return {"code": code, "name": "贵州茅台"}
+
+    monkeypatch.setattr(app_adapter, "get_basics_from_cache", fake_basics)
+
+    profile = cp.resolve_company_profile("600519")
+    assert profile["name"] == "贵州茅台" and profile["exchange"] == "上海证券交易所"
+    assert profile["currency_name"] == "人民币" and profile["is_china"]
+    assert cp.resolve_company_name("600519") == "贵州茅台"
+    assert lookups == ["600519"]
+
+    #Nodes read the profile propagate put into state, without touching the data layer
+    state = {"company_of_interest": "600519", "company_profile": {"name": "来自状态"}}
+    assert cp.get_company_profile(state)["name"] == "来自状态"
+    assert lookups == ["600519"]
+
+
+def test_unresolved_names_fall_back_without_caching(monkeypatch):
+    cp.clear_company_profile_cache()
+    calls = []
+
+    def failing_lookup(ticker, market_info):
+        calls.append(ticker)
+        raise RuntimeError("data source down")
+
+    monkeypatch.setattr(cp, "_lookup_company_name", failing_lookup)
+
+    assert cp.resolve_company_profile("000001")["name"] == "股票代码000001"
+    profile = cp.get_company_profile({"company_of_interest": "0700.HK"})
+    assert profile["name"] == "港股0700" and profile["exchange"] == "香港联合交易所"
+    cp.resolve_company_profile("000001")
+    assert calls == ["000001", "0700.HK", "000001"]
+
+
+def test_data_source_placeholder_names_are_not_cached(monkeypatch):
+    cp.clear_company_profile_cache()
+    answers = {"0700.HK": ["港股0700", "腾讯控股"], "000001": ["股票代码: 000001", "平安银行"]}
+
+    monkeypatch.setattr(cp, "_lookup_company_name", lambda ticker, market_info: answers[ticker].pop(0))
+
+    assert cp.resolve_company_name("0700.HK") == "港股0700"
+    assert cp.resolve_company_name("0700.HK") == "腾讯控股"
+    assert cp.resolve_company_name("000001") == "股票代码: 000001"
+    assert cp.resolve_company_name("000001") == "平安银行"
+    #Resolved names are served from the cache
+    assert cp.resolve_company_name("0700.HK") == "腾讯控股"
+    assert not cp._is_placeholder_name("港股通精选")
@@ -0,0 +1,56 @@
+from tradingagents.agents.utils.context_budget import (
+    COMPACTED_MARKER,
+    ContextBudget,
+    compact_text,
+    estimate_tokens,
+    prompt_context,
+)
+
+
+def _report(title, paragraphs=40):
+    filler = "公司经营稳定，管理层表示将继续推进既定战略，行业竞争格局暂未发生明显变化。" * 3
+    lines = [f"# {title}"]
+    for i in range(paragraphs):
+        lines.append(filler)
+        if i % 10 == 0:
+            lines.append(f"- 市盈率 {12 + i}.5 倍，营收同比增长 {i}%")
+    lines.append("## 结论：建议持有，目标价 15.80 元")
+    return "\n".join(lines)
+
+
+def test_compact_text_keeps_structure_within_budget():
+    text = _report("市场分析报告")
+    assert compact_text("短文本", 100) == "短文本"
+
+    digest = compact_text(text, 300)
+    assert estimate_tokens(digest) <= 300
+    assert digest.startswith("# 市场分析报告") and digest.endswith(COMPACTED_MARKER)
+    assert "市盈率 12.5 倍" in digest and "目标价 15.80 元" in digest
+
+
+def test_report_digests_are_bounded_and_reused():
+    budget = ContextBudget(max_tokens=4000)
+    state = {"market_report": _report("市场"), "news_report": _report("新闻"),
+             "fundamentals_report": _report("基本面"), "sentiment_report": "情绪平稳"}
+
+    digests = budget.report_digests(state)
+    assert sum(estimate_tokens(v) for v in digests.values()) <= budget.report_budget
+    assert digests["sentiment_report"] == "情绪平稳"
+    #Same reports, same allocation: served from the digest cache
+    assert budget.report_digests(state)["market_report"] is digests["market_report"]
+
+
+def test_history_digest_rolls_older_turns():
+    budget = ContextBudget(max_tokens=4000)
+    speech = "我认为估值仍有上行空间，理由是盈利增速领先同业。" * 20
+    history = "".join(f"\n{side} Analyst: 第{i}轮 {speech}" for i in range(1, 7) for side in ("Bull", "Bear"))
+
+    digest = budget.history_digest(history, 1500)
+    assert estimate_tokens(digest) <= 1500
+    assert digest.endswith(f"Bear Analyst: 第6轮 {speech}")
+    #Older turns survive as labelled digests
+    assert "Bull Analyst: 第1轮" in digest and COMPACTED_MARKER in digest
+
+    context = prompt_context(None, {"market_report": "报告"}, history)
+    assert context["history"] == history and context["market_report"] == "报告"
+    assert "market_report" not in prompt_context(budget, {}, "\nBull Analyst: 看涨", include_reports=False)
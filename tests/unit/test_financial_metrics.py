@@ -0,0 +1,54 @@
+import pytest
+
+from tradingagents.dataflows.financial_metrics import compute_latest_metrics
+
+
+def _statements(values, cost_ratio=0.6):
+    """Tushare-style YTD statements, newest first: {end_date: revenue}"""
+    return [
+        {"end_date": end_date, "revenue": revenue, "n_income_attr_p": revenue / 10,
+         "oper_cost": revenue * cost_ratio}
+        for end_date, revenue in sorted(values.items(), reverse=True)
+    ]
+
+
+def test_ttm_growth_and_margins_for_all_symbols_in_one_pass():
+    metrics = compute_latest_metrics({
+        #2025Q2: TTM = 2024 annual + (2025H1 - 2024H1)
+        "600519": _statements({"20250630": 600, "20250331": 250, "20241231": 1100,
+                               "20240630": 500, "20240331": 240}),
+        "000001": _statements({"20241231": 1000, "20240930": 700, "20240630": 400, "20231231": 800},
+                               cost_ratio=0.5),
+    })
+
+    a = metrics["600519"]
+    assert a["metrics_period"] == "20250630"
+    assert a["revenue_ttm"] == pytest.approx(1200)
+    assert a["net_profit_ttm"] == pytest.approx(120)
+    assert a["revenue_yoy"] == pytest.approx(20)
+    #Q2 single quarter 350 against Q1 250
+    assert a["revenue_single"] == pytest.approx(350)
+    assert a["revenue_qoq"] == pytest.approx(40)
+    assert a["net_margin_ttm"] == pytest.approx(10)
+    assert a["gross_margin_ttm"] == pytest.approx(40)
+
+    b = metrics["000001"]
+    assert b["revenue_ttm"] == pytest.approx(1000)
+    assert b["revenue_yoy"] == pytest.approx(25)
+    #Q4 single 300 against Q3 single 300
+    assert b["revenue_qoq"] == pytest.approx(0)
+    assert b["gross_margin_ttm"] == pytest.approx(50)
+
+
+def test_missing_periods_leave_metrics_empty():
+    metrics = compute_latest_metrics({
+        #No 2024 annual report yet: TTM cannot be computed
+        "600000": _statements({"20250331": 300, "20240331": 250}),
+        "600001": [{"end_date": "20250331", "revenue": "--", "n_income_attr_p": None}],
+    })
+
+    assert metrics["600000"]["revenue_ttm"] is None
+    assert metrics["600000"]["revenue_yoy"] == pytest.approx(20)
+    assert metrics["600000"]["revenue_qoq"] is None
+    assert metrics["600001"]["revenue_ttm"] is None and metrics["600001"]["revenue_yoy"] is None
+    assert compute_latest_metrics({}) == {}
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pandas as pd
+
+import tradingagents.dataflows.cache.integrated as integrated
+from tradingagents.dataflows.cache.hot_cache import HotCache, SessionTTLPolicy
+from tradingagents.dataflows.trading_calendar import TradingCalendar
+
+
+def _policy(tmp_path):
+    calendar = TradingCalendar(tmp_path / "calendar.json")
+    #Friday 2025-01-03 and Monday 2025-01-06 are the only trading days
+    calendar.set_trading_days("CN", ["20250103", "20250106"], "20250101", "20250131")
+    return SessionTTLPolicy(bar_minutes=5, close_buffer_minutes=30, news_minutes=30, calendar=calendar)
+
+
+def test_expiry_follows_bars_in_session_and_next_open_outside(tmp_path):
+    policy = _policy(tmp_path)
+
+    def expiry(moment, data_type="stock_data"):
+        return policy.expires_at("CN", data_type, datetime.fromisoformat(moment)).replace(tzinfo=None)
+
+    assert expiry("2025-01-06 10:02") == datetime(2025, 1, 6, 10, 5)
+    assert expiry("2025-01-06 11:28") == datetime(2025, 1, 6, 11, 30)
+    #Lunch break and pre-open wait for the next session
+    assert expiry("2025-01-06 12:10") == datetime(2025, 1, 6, 13, 0)
+    assert expiry("2025-01-06 08:00") == datetime(2025, 1, 6, 9, 30)
+    #Close buffer still ticks in bars, then closing data is held over the weekend
+    assert expiry("2025-01-03 15:12") == datetime(2025, 1, 3, 15, 15)
+    assert expiry("2025-01-03 15:45") == datetime(2025, 1, 6, 9, 30)
+    assert expiry("2025-01-04 20:00") == datetime(2025, 1, 6, 9, 30)
+    #News ignores the session
+    assert expiry("2025-01-04 20:10", "news_data") == datetime(2025, 1, 4, 20, 30)
+
+
+class _FixedPolicy:
+    bar_minutes = 5
+
+    def __init__(self, expires_at):
+        self._expires_at = expires_at
+
+    def expires_at(self, market, data_type="stock_data", now=None):
+        return self._expires_at
+
+
+def test_lru_bounded_by_bytes_with_metrics():
+    cache = HotCache(max_bytes=3000, policy=_FixedPolicy(datetime(2100, 1, 1)), max_entry_fraction=0.5)
+    frame = pd.DataFrame({"close": [1.0] * 100})
+    assert cache.put("a", frame, "600519", lookup=("stock_data", "600519"))
+
+    #Returned frames are copies, so callers cannot corrupt the cached value
+    returned = cache.get("a")
+    returned["close"] = 0.0
+    assert cache.get("a")["close"].iloc[0] == 1.0
+    assert cache.find(("stock_data", "600519")) == "a"
+
+    cache.put("b", "x" * 1000, "000001")
+    cache.put("c", "y" * 1000, "000002")
+    assert cache.get("a") is None and cache.find(("stock_data", "600519")) is None
+    assert not cache.put("big", "z" * 2000, "000003")
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["evictions"] == 1 and stats["rejected"] == 1
+    assert stats["entries"] == 2 and stats["bytes"] <= stats["max_bytes"]
+
+    expired = HotCache(max_bytes=3000, policy=_FixedPolicy(datetime(2000, 1, 1)))
+    expired.put("a", "value", "600519")
+    assert expired.get("a") is None and expired.stats()["expired"] == 1
+
+
+def test_integrated_manager_serves_repeat_lookups_from_hot_tier(monkeypatch, tmp_path):
+    monkeypatch.setattr(integrated, "ADAPTIVE_CACHE_AVAILABLE", False)
+    monkeypatch.setenv("TA_HOT_CACHE_ENABLED", "true")
+    manager = integrated.IntegratedCacheManager(str(tmp_path))
+    manager.hot_cache.policy = _FixedPolicy(datetime(2100, 1, 1))
+    frame = pd.DataFrame({"close": [10.0, 10.5]})
+
+    key = manager.save_stock_data("600519", frame, "2025-01-01", "2025-01-06", data_source="tushare")
+
+    def lower_tier(*args, **kwargs):
+        raise AssertionError("lower tier should not be read")
+
+    monkeypatch.setattr(manager.legacy_cache, "find_cached_stock_data", lower_tier)
+    monkeypatch.setattr(manager.legacy_cache, "load_stock_data", lower_tier)
+    assert manager.find_cached_stock_data("600519", "2025-01-01", "2025-01-06", data_source="tushare") == key
+    pd.testing.assert_frame_equal(manager.load_stock_data(key), frame)
+    assert manager.get_cache_stats()["hot_cache"]["hits"] == 1
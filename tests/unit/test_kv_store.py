@@ -0,0 +1,47 @@
+import threading
+
+import pandas as pd
+
+from tradingagents.dataflows.cache.kv_store import KeyValueStore
+
+
+def test_ttl_lru_eviction_and_dataframe_values(tmp_path):
+    store = KeyValueStore(str(tmp_path / "cache.sqlite3"), default_ttl=60, max_entries=3)
+    store.EVICT_EVERY_WRITES = 1
+
+    store.set("expired", "x", ttl=-1)
+    assert store.get("expired") is None and store.get("expired", "default") == "default"
+
+    frame = pd.DataFrame({"代码": ["00700"], "中文名称": ["腾讯控股"]})
+    store.set("spot", frame)
+    pd.testing.assert_frame_equal(store.get("spot"), frame)
+
+    #Reading "a" makes it recently used, so the least recently used "b" is evicted
+    store.TOUCH_INTERVAL_SECONDS = -1
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")
+    store.get("spot")
+    store.set("c", 3)
+    assert len(store) == 3
+    assert store.get("b") is None
+    assert [store.get(key) for key in ("a", "c")] == [1, 3]
+
+
+def test_concurrent_writers_share_one_file(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    #Separate connections stand in for the API and worker processes
+    stores = [KeyValueStore(path), KeyValueStore(path)]
+
+    def write(store, prefix):
+        for i in range(50):
+            store.set(f"{prefix}_{i}", {"i": i})
+
+    threads = [threading.Thread(target=write, args=(store, f"w{n}")) for n, store in enumerate(stores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stores[0]) == 100
+    assert stores[1].get("w0_49") == {"i": 49} and stores[0].get("w1_0") == {"i": 0}
@@ -0,0 +1,95 @@
+import asyncio
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from tradingagents.agents.utils.llm_node import LLMNode
+
+
+class _State(TypedDict, total=False):
+    question: str
+    answer: str
+
+
+def _fake_llm(calls, failures=0):
+    """Records whether it was called through invoke or ainvoke; fails the first calls"""
+    def respond(mode, prompt):
+        calls.append(mode)
+        if len(calls) <= failures:
+            raise TimeoutError("model timeout")
+        return f"{mode}:{prompt}"
+
+    async def arespond(prompt):
+        await asyncio.sleep(0)
+        return respond("async", prompt)
+
+    return RunnableLambda(lambda prompt: respond("sync", prompt), afunc=arespond)
+
+
+def _answer_node(llm):
+    def answer_node(state):
+        for attempt in range(3):
+            try:
+                response = yield llm, state["question"]
+                return {"answer": response}
+            except TimeoutError:
+                continue
+        return {"answer": "failed"}
+
+    return LLMNode(answer_node)
+
+
+def _graph(node):
+    graph = StateGraph(_State)
+    graph.add_node("answer", node)
+    graph.add_edge(START, "answer")
+    graph.add_edge("answer", END)
+    return graph.compile()
+
+
+def test_llm_node_sync_and_async_paths_share_the_body():
+    calls = []
+    node = _answer_node(_fake_llm(calls))
+
+    assert node({"question": "q"}) == {"answer": "sync:q"}
+    assert _graph(node).invoke({"question": "q"})["answer"] == "sync:q"
+    assert asyncio.run(_graph(node).ainvoke({"question": "q"}))["answer"] == "async:q"
+    assert calls == ["sync", "sync", "async"]
+
+
+def test_llm_errors_are_thrown_into_the_body():
+    calls = []
+    node = _answer_node(_fake_llm(calls, failures=2))
+
+    async def run():
+        return [chunk async for chunk in _graph(node).astream({"question": "q"}, stream_mode="updates")]
+
+    assert asyncio.run(run()) == [{"answer": {"answer": "async:q"}}]
+    assert calls == ["async", "async", "async"]
+
+
+def test_apropagate_sends_progress_updates_off_the_event_loop(monkeypatch):
+    import threading
+
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    class _Graph:
+        async def astream(self, state, **kwargs):
+            for node in ("Market Analyst", "Trader"):
+                yield {node: {"last_node": node}}
+
+    graph = TradingAgentsGraph.__new__(TradingAgentsGraph)
+    graph.graph = _Graph()
+    monkeypatch.setattr(graph, "_start_run", lambda *args: ({"company_of_interest": "600519"}, {}, None))
+    monkeypatch.setattr(graph, "_finish_run", lambda final_state, *args: final_state)
+    callback_threads = []
+    monkeypatch.setattr(graph, "_send_progress_update",
+                        lambda chunk, callback: callback_threads.append(threading.get_ident()))
+
+    async def _run():
+        return threading.get_ident(), await graph.apropagate("600519", "2025-01-06", progress_callback=print)
+
+    loop_thread, final_state = asyncio.run(_run())
+    assert final_state["last_node"] == "Trader"
+    assert len(callback_threads) == 2 and loop_thread not in callback_threads
@@ -0,0 +1,92 @@
+from typing import TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+
+from tradingagents.graph.run_metrics import NodeMetricsCallback, _GraphMetrics
+from tradingagents.utils.metrics_registry import MetricsRegistry
+
+
+class _State(TypedDict):
+    text: str
+
+
+@tool
+def lookup_price(symbol: str) -> str:
+    """Return a fake price"""
+    return f"{symbol}: 10.0"
+
+
+@tool
+def broken_tool(symbol: str) -> str:
+    """Always fails"""
+    raise RuntimeError("boom")
+
+
+def _build_graph():
+    llm = GenericFakeChatModel(messages=iter([
+        AIMessage(content="买入", usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}),
+    ]))
+
+    def analyst(state):
+        return {"text": llm.invoke(state["text"]).content}
+
+    def tools_market(state):
+        lookup_price.invoke({"symbol": "000001"})
+        try:
+            broken_tool.invoke({"symbol": "000001"})
+        except RuntimeError:
+            pass
+        return {"text": state["text"]}
+
+    graph = StateGraph(_State)
+    graph.add_node("analyst", analyst)
+    graph.add_node("tools_market", tools_market)
+    graph.add_edge(START, "analyst")
+    graph.add_edge("analyst", "tools_market")
+    graph.add_edge("tools_market", END)
+    return graph.compile()
+
+
+def test_callback_attributes_llm_and_tool_events_to_nodes():
+    registry = MetricsRegistry()
+    callback = NodeMetricsCallback(provider="DashScope", model_providers={"qwen-max": "dashscope"},
+                                   metrics=_GraphMetrics(registry))
+    list(_build_graph().stream({"text": "分析"}, config={"callbacks": [callback]}, stream_mode="updates"))
+
+    summary = callback.summary()
+    analyst, tools = summary["nodes"]["analyst"], summary["nodes"]["tools_market"]
+    assert (analyst["llm_calls"], analyst["input_tokens"], analyst["output_tokens"]) == (1, 120, 30)
+    assert analyst["node_runs"] == 1 and analyst["tool_calls"] == 0
+    assert (tools["tool_calls"], tools["tool_errors"], tools["llm_calls"]) == (2, 1, 0)
+    assert summary["tools"]["broken_tool"]["errors"] == 1
+    assert summary["totals"]["input_tokens"] == 120 and summary["totals"]["node_runs"] == 2
+
+    text = registry.render()
+    assert "# TYPE tradingagents_llm_latency_seconds histogram" in text
+    assert 'tradingagents_llm_tokens_total{node="analyst",provider="dashscope",' in text
+    assert 'direction="output"} 30' in text
+    assert 'tradingagents_tool_calls_total{node="tools_market",tool="broken_tool",status="error"} 1' in text
+    assert 'tradingagents_node_duration_seconds_count{node="analyst"} 1' in text
+
+
+def test_registry_renders_histogram_buckets_and_rejects_bad_labels():
+    registry = MetricsRegistry()
+    latency = registry.histogram("demo_seconds", "demo", ("node",), buckets=(1.0, 5.0))
+    latency.observe(0.5, node='a"b')
+    latency.observe(3.0, node='a"b')
+    assert registry.histogram("demo_seconds", "demo", ("node",)) is latency
+
+    lines = registry.render().splitlines()
+    assert 'demo_seconds_bucket{node="a\\"b",le="1"} 1' in lines
+    assert 'demo_seconds_bucket{node="a\\"b",le="5"} 2' in lines
+    assert 'demo_seconds_bucket{node="a\\"b",le="+Inf"} 2' in lines
+    assert 'demo_seconds_sum{node="a\\"b"} 3.5' in lines
+
+    with pytest.raises(ValueError):
+        latency.observe(1.0, tool="x")
+    with pytest.raises(ValueError):
+        registry.counter("demo_seconds", "demo", ("node",))
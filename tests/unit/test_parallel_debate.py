@@ -0,0 +1,80 @@
+import threading
+
+from langgraph.graph import END, START, StateGraph
+
+from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.parallel_debate import (
+    INVEST_JOIN_NODE,
+    create_invest_debate_join,
+    create_parallel_invest_debater,
+)
+
+
+def _fake_researcher(name, seen, barrier):
+    """Mimics bull/bear researcher output; the barrier only passes if both run concurrently"""
+    def node(state):
+        debate = state["investment_debate_state"]
+        seen.append((name, debate["count"], debate["current_response"]))
+        barrier.wait(timeout=5)
+        argument = f"{name} Analyst: r{debate['count'] // 2 + 1}"
+        return {"investment_debate_state": {
+            "history": debate["history"] + "\n" + argument,
+            "current_response": argument,
+            "count": debate["count"] + 1,
+        }}
+    return node
+
+
+def test_parallel_rounds_see_previous_round_and_merge_in_order():
+    seen, barrier = [], threading.Barrier(2)
+    logic = ConditionalLogic(max_debate_rounds=2)
+
+    graph = StateGraph(AgentState)
+    graph.add_node("Bull Researcher", create_parallel_invest_debater(_fake_researcher("Bull", seen, barrier), "Bull", "Bear"))
+    graph.add_node("Bear Researcher", create_parallel_invest_debater(_fake_researcher("Bear", seen, barrier), "Bear", "Bull"))
+    graph.add_node(INVEST_JOIN_NODE, create_invest_debate_join())
+    graph.add_node("Research Manager", lambda state: {"investment_plan": "done"})
+    graph.add_edge(START, "Bull Researcher")
+    graph.add_edge(START, "Bear Researcher")
+    graph.add_edge(["Bull Researcher", "Bear Researcher"], INVEST_JOIN_NODE)
+    graph.add_conditional_edges(INVEST_JOIN_NODE, logic.should_continue_debate_parallel,
+                                ["Bull Researcher", "Bear Researcher", "Research Manager"])
+    graph.add_edge("Research Manager", END)
+
+    state = graph.compile().invoke({
+        "messages": [],
+        "investment_debate_state": {"history": "", "current_response": "", "count": 0},
+    })
+
+    debate = state["investment_debate_state"]
+    assert debate["count"] == 4 and state["investment_plan"] == "done"
+    assert debate["history"] == "\nBull Analyst: r1\nBear Analyst: r1\nBull Analyst: r2\nBear Analyst: r2"
+    assert debate["bull_history"] == "\nBull Analyst: r1\nBull Analyst: r2"
+    assert debate["current_response"] == "Bear Analyst: r2"
+    #Second round: each side answers the opponent's first-round argument
+    assert sorted(seen) == [("Bear", 0, ""), ("Bear", 2, "Bull Analyst: r1"),
+                            ("Bull", 0, ""), ("Bull", 2, "Bear Analyst: r1")]
+
+
+def test_parallel_risk_routing_fans_out_until_round_limit():
+    logic = ConditionalLogic(max_risk_discuss_rounds=2)
+    assert logic.should_continue_risk_analysis_parallel({"risk_debate_state": {"count": 3}}) == [
+        "Risky Analyst", "Safe Analyst", "Neutral Analyst"]
+    assert logic.should_continue_risk_analysis_parallel({"risk_debate_state": {"count": 6}}) == "Risk Judge"
+
+
+def test_join_counts_a_full_round_even_with_empty_replies():
+    join = create_invest_debate_join()
+    state = {
+        "investment_debate_state": {"history": "", "current_response": "Bull Analyst: r1", "count": 2},
+        "investment_debate_round": {"Bull": "", "Bear": "Bear Analyst: r2"},
+    }
+    merged = join(state)["investment_debate_state"]
+    assert merged["count"] == 4 and merged["history"] == "\nBear Analyst: r2"
+
+    #A round with no replies at all still moves the debate towards the judge
+    state["investment_debate_round"] = {}
+    assert join(state)["investment_debate_state"]["count"] == 4
+    assert ConditionalLogic(max_debate_rounds=2).should_continue_debate_parallel(
+        {"investment_debate_state": {"count": 4}}) == "Research Manager"
@@ -0,0 +1,51 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from tradingagents.utils import process_pool
+from tradingagents.utils.process_pool import CPUPool, run_cpu_bound
+
+
+def test_cpu_pool_runs_in_warm_worker_processes():
+    pool = CPUPool(1, warm_modules=())
+    try:
+        assert pool.warm_up()
+        assert pool.run(os.getpid) != os.getpid()
+        assert pool.run(divmod, 7, 2) == (3, 1)
+        assert asyncio.run(pool.arun(divmod, 9, 4)) == (2, 1)
+
+        #Errors of the function itself propagate unchanged, without an inline retry
+        with pytest.raises(ValueError):
+            pool.run(int, "not a number")
+        stats = pool.stats()
+        assert stats["inline_fallbacks"] == 0 and stats["completed"] == 3
+    finally:
+        pool.shutdown()
+
+
+def _lock_state(lock):
+    return lock.locked()
+
+
+def test_unpicklable_arguments_fall_back_inline():
+    pool = CPUPool(1, warm_modules=())
+    try:
+        #Locks cannot be pickled (TypeError), lambdas neither (PicklingError/AttributeError)
+        assert pool.run(_lock_state, threading.Lock()) is False
+        assert asyncio.run(pool.arun(_lock_state, threading.Lock())) is False
+        assert pool.run(lambda: os.getpid()) == os.getpid()
+
+        #A TypeError raised by the function itself is not retried inline
+        with pytest.raises(TypeError):
+            pool.run(divmod, "a", 2)
+        assert pool.stats()["inline_fallbacks"] == 3
+    finally:
+        pool.shutdown()
+
+
+def test_disabled_pool_runs_inline(monkeypatch):
+    monkeypatch.setenv("PROCESS_POOL_ENABLED", "false")
+    assert process_pool.get_cpu_pool() is None
+    assert run_cpu_bound(os.getpid) == os.getpid()
@@ -0,0 +1,73 @@
+from typing import Annotated
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.agents.utils.tool_memo import memoize_tool, normalize_ticker, tool_memo_scope
+
+
+def test_memo_normalizes_arguments_and_contains_date_ranges():
+    calls = []
+
+    @memoize_tool(range_start_arg="start_date")
+    def market_data(ticker, start_date, end_date):
+        calls.append((ticker, start_date, end_date))
+        return "获取失败" if ticker == "BAD" else f"{ticker} {start_date}~{end_date}"
+
+    #No scope: plain pass-through
+    market_data("AAPL", "2025-01-01", "2025-06-30")
+    market_data("AAPL", "2025-01-01", "2025-06-30")
+    assert len(calls) == 2
+
+    calls.clear()
+    with tool_memo_scope() as memo:
+        first = market_data("0700.HK", "2025-01-01", "2025-06-30")
+        #Same stock spelled differently, narrower range ending on the same day
+        assert market_data(" 00700 ", "20250301", "2025/06/30") == first
+        #Wider range or another end date must be fetched
+        market_data("0700.HK", "2024-12-01", "2025-06-30")
+        market_data("0700.HK", "2025-01-01", "2025-07-01")
+        #Failures are retried
+        market_data("BAD", "2025-01-01", "2025-06-30")
+        market_data("BAD", "2025-01-01", "2025-06-30")
+
+    assert len(calls) == 5
+    stats = memo.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 5)
+    assert stats["tools"]["market_data"]["hits"] == 1
+    assert normalize_ticker("09988.hk") == "9988.HK" and normalize_ticker(" aapl") == "AAPL"
+
+
+def test_memo_is_shared_by_tool_node_threads():
+    calls = []
+
+    @tool
+    @memoize_tool()
+    def news(ticker: Annotated[str, "股票代码"], curr_date: Annotated[str, "日期"]) -> str:
+        """Fake news tool"""
+        calls.append(ticker)
+        return f"{ticker} news"
+
+    def analyst(state):
+        return {"messages": [AIMessage(content="", tool_calls=[
+            {"name": "news", "args": {"ticker": "0700.HK", "curr_date": "2025-06-30"}, "id": "a"},
+            {"name": "news", "args": {"ticker": "00700", "curr_date": "2025-06-30"}, "id": "b"},
+        ])]}
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("analyst", analyst)
+    graph.add_node("tools", ToolNode([news]))
+    graph.add_edge(START, "analyst")
+    graph.add_edge("analyst", "tools")
+    graph.add_edge("tools", END)
+    app = graph.compile()
+
+    with tool_memo_scope() as memo:
+        app.invoke({"messages": []})
+        app.invoke({"messages": []})
+
+    #Four tool calls across two runs of the graph, one real fetch (the first pair may race)
+    assert 1 <= len(calls) <= 2
+    assert memo.stats()["hits"] + memo.stats()["misses"] == 4
@@ -12,85 +12,14 @@ from tradingagents.utils.tool_logging import log_analyst_module
 from tradingagents.utils.logging_init import get_logger
 logger = get_logger("default")
 
+from tradingagents.agents.utils.company_profile import get_company_profile, resolve_company_name
 #Import Google Tool Call Processing Device
 from tradingagents.agents.utils.google_tool_handler import GoogleToolCallHandler
 
 
 def _get_company_name_for_fundamentals(ticker: str, market_info: dict) -> str:
-    """Get company names for basic face analysts
-
-    Args:
-        ticker: Stock code
-        market info: market information dictionary
-
-    Returns:
-        str: Company name
-    """
-    try:
-        if market_info['is_china']:
-            #China Unit A: Access to stock information using a unified interface
-            from tradingagents.dataflows.interface import get_china_stock_info_unified
-            stock_info = get_china_stock_info_unified(ticker)
-
-            logger.debug(f"📊 [BASIC ANALYSISER]{stock_info[:200] if stock_info else 'None'}...")
-
-            #Parsing stock name
-            if stock_info and "股票名称:" in stock_info:
-                company_name = stock_info.split("股票名称:")[1].split("\n")[0].strip()
-                logger.info(f"✅ [Basic Face Analyst] Successfully obtained Chinese stock names:{ticker} -> {company_name}")
-                return company_name
-            else:
-                #Downscaling: attempt to obtain directly from the data source manager
-                logger.warning(f"⚠️ [basic profiler] cannot decipher stock names from the unified interface:{ticker}, try to downgrade")
-                try:
-                    from tradingagents.dataflows.data_source_manager import get_china_stock_info_unified as get_info_dict
-                    info_dict = get_info_dict(ticker)
-                    if info_dict and info_dict.get('name'):
-                        company_name = info_dict['name']
-                        logger.info(f"✅ [basic face analyst] The downgrading program successfully obtained the name of the stock:{ticker} -> {company_name}")
-                        return company_name
-                except Exception as e:
-                    logger.error(f"The downgrading programme has also failed:{e}")
-
-                logger.error(f"All options are not available:{ticker}")
-                return f"股票代码{ticker}"
-
-        elif market_info['is_hk']:
-            #Port Unit: use of improved Port Unit tools
-            try:
-                from tradingagents.dataflows.providers.hk.improved_hk import get_hk_company_name_improved
-                company_name = get_hk_company_name_improved(ticker)
-                logger.debug(f"[Basic Profile Analyst]{ticker} -> {company_name}")
-                return company_name
-            except Exception as e:
-                logger.debug(f"📊 [basic analyst] failed to improve the Hong Kong stock tool to get a name:{e}")
-                #Downscaling scheme: Generate friendly default names
-                clean_ticker = ticker.replace('.HK', '').replace('.hk', '')
-                return f"港股{clean_ticker}"
-
-        elif market_info['is_us']:
-            #US share: use simple mapping or return code
-            us_stock_names = {
-                'AAPL': '苹果公司',
-                'TSLA': '特斯拉',
-                'NVDA': '英伟达',
-                'MSFT': '微软',
-                'GOOGL': '谷歌',
-                'AMZN': '亚马逊',
-                'META': 'Meta',
-                'NFLX': '奈飞'
-            }
-
-            company_name = us_stock_names.get(ticker.upper(), f"美股{ticker}")
-            logger.debug(f"[BASIC ANALYSISER]{ticker} -> {company_name}")
-            return company_name
-
-        else:
-            return f"股票{ticker}"
-
-    except Exception as e:
-        logger.error(f"❌ [Basic Face Analyst] Failed to get company name:{e}")
-        return f"股票{ticker}"
+    """Get company names by stock code (shared resolver, cached per process)"""
+    return resolve_company_name(ticker, market_info)
 
 
 def create_fundamentals_analyst(llm, toolkit):
@@ -135,8 +64,6 @@ def create_fundamentals_analyst(llm, toolkit):
         logger.debug(f"The number of messages in the current state:{len(state.get('messages', []))}")
         logger.debug(f"[DEBUG]{state.get('fundamentals_report', 'None')}")
 
-        #Access to stock market information
-        from tradingagents.utils.stock_utils import StockUtils
         logger.info(f"📊 [basic face analyst] is analysing stocks:{ticker}")
 
         #Add detailed stock code tracking log
@@ -144,15 +71,16 @@ def create_fundamentals_analyst(llm, toolkit):
         logger.info(f"[Equal code tracking]{len(str(ticker))}")
         logger.info(f"[Equal code tracking]{list(str(ticker))}")
 
-        market_info = StockUtils.get_market_info(ticker)
-        logger.info(f"[StockUtils.get market info]{market_info}")
+        #Company profile resolved once per run by propagate
+        market_info = get_company_profile(state)
+        logger.info(f"[Company profile]{market_info}")
 
         logger.debug(f"[DBUG] Stock type checks:{ticker} -> {market_info['market_name']} ({market_info['currency_name']}")
         logger.debug(f"[DEBUG]{market_info['is_china']}, is_hk={market_info['is_hk']}, is_us={market_info['is_us']}")
         logger.debug(f"[DBUG] Tool configuration check: online tools={toolkit.config['online_tools']}")
 
         #Get company names
-        company_name = _get_company_name_for_fundamentals(ticker, market_info)
+        company_name = market_info['name']
         logger.debug(f"[DEBUG]{ticker} -> {company_name}")
 
         #Unifiedly use get stock fundamentals unified tools
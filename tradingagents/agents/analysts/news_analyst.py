@@ -8,8 +8,8 @@ from tradingagents.utils.logging_init import get_logger
 from tradingagents.utils.tool_logging import log_analyst_module
 #Import Unified News Tool
 from tradingagents.tools.unified_news_tool import create_unified_news_tool
-#Import Stock Tool Class
-from tradingagents.utils.stock_utils import StockUtils
+#Import Company Profile Reader
+from tradingagents.agents.utils.company_profile import get_company_profile
 #Import Google Tool Call Processing Device
 from tradingagents.agents.utils.google_tool_handler import GoogleToolCallHandler
 
@@ -33,66 +33,10 @@ def create_news_analyst(llm, toolkit):
         session_id = state.get("session_id", "未知会话")
         logger.info(f"[Press Analyst ] Session ID:{session_id}, start time:{start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        #Access to market information
-        market_info = StockUtils.get_market_info(ticker)
+        #Company profile resolved once per run by propagate
+        market_info = get_company_profile(state)
         logger.info(f"[news analyst] Stock type:{market_info['market_name']}")
-        
-        #Get company names
-        def _get_company_name(ticker: str, market_info: dict) -> str:
-            """Get company names by stock code"""
-            try:
-                if market_info['is_china']:
-                    #China Unit A: Access to stock information using a unified interface
-                    from tradingagents.dataflows.interface import get_china_stock_info_unified
-                    stock_info = get_china_stock_info_unified(ticker)
-                    
-                    #Parsing stock name
-                    if "股票名称:" in stock_info:
-                        company_name = stock_info.split("股票名称:")[1].split("\n")[0].strip()
-                        logger.debug(f"📊 [DBUG] Gets the Chinese stock name from the unified interface:{ticker} -> {company_name}")
-                        return company_name
-                    else:
-                        logger.warning(f"⚠️ [DEBUG] cannot decipher stock names from the unified interface:{ticker}")
-                        return f"股票代码{ticker}"
-                        
-                elif market_info['is_hk']:
-                    #Port Unit: use of improved Port Unit tools
-                    try:
-                        from tradingagents.dataflows.providers.hk.improved_hk import get_hk_company_name_improved
-                        company_name = get_hk_company_name_improved(ticker)
-                        logger.debug(f"📊 [DBUG] Use of the Port Improvement Unit tool to obtain names:{ticker} -> {company_name}")
-                        return company_name
-                    except Exception as e:
-                        logger.debug(f"📊 [DBUG] Improvements to the Port Unit Tool to get names failed:{e}")
-                        #Downscaling scheme: Generate friendly default names
-                        clean_ticker = ticker.replace('.HK', '').replace('.hk', '')
-                        return f"港股{clean_ticker}"
-                        
-                elif market_info['is_us']:
-                    #US share: use simple mapping or return code
-                    us_stock_names = {
-                        'AAPL': '苹果公司',
-                        'TSLA': '特斯拉',
-                        'NVDA': '英伟达',
-                        'MSFT': '微软',
-                        'GOOGL': '谷歌',
-                        'AMZN': '亚马逊',
-                        'META': 'Meta',
-                        'NFLX': '奈飞'
-                    }
-                    
-                    company_name = us_stock_names.get(ticker.upper(), f"美股{ticker}")
-                    logger.debug(f"[DEBUG] U.S. stock name map:{ticker} -> {company_name}")
-                    return company_name
-                    
-                else:
-                    return f"股票{ticker}"
-                    
-            except Exception as e:
-                logger.error(f"[DEBUG]{e}")
-                return f"股票{ticker}"
-        
-        company_name = _get_company_name(ticker, market_info)
+        company_name = market_info['name']
         logger.info(f"[news analyst] Company name:{company_name}")
         
         #🔧Use a unified public information tool to simplify its use
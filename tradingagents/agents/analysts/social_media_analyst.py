@@ -7,85 +7,14 @@ from tradingagents.utils.logging_init import get_logger
 from tradingagents.utils.tool_logging import log_analyst_module
 logger = get_logger("analysts.social_media")
 
+from tradingagents.agents.utils.company_profile import get_company_profile, resolve_company_name
 #Import Google Tool Call Processing Device
 from tradingagents.agents.utils.google_tool_handler import GoogleToolCallHandler
 
 
 def _get_company_name_for_social_media(ticker: str, market_info: dict) -> str:
-    """Get company names for social media analysts
-
-    Args:
-        ticker: Stock code
-        market info: market information dictionary
-
-    Returns:
-        str: Company name
-    """
-    try:
-        if market_info['is_china']:
-            #China Unit A: Access to stock information using a unified interface
-            from tradingagents.dataflows.interface import get_china_stock_info_unified
-            stock_info = get_china_stock_info_unified(ticker)
-
-            logger.debug(f"[Social Media Analyst ]{stock_info[:200] if stock_info else 'None'}...")
-
-            #Parsing stock name
-            if stock_info and "股票名称:" in stock_info:
-                company_name = stock_info.split("股票名称:")[1].split("\n")[0].strip()
-                logger.info(f"[Social Media Analyst ]{ticker} -> {company_name}")
-                return company_name
-            else:
-                #Downscaling: attempt to obtain directly from the data source manager
-                logger.warning(f"[Social Media Analyst]{ticker}, try to downgrade")
-                try:
-                    from tradingagents.dataflows.data_source_manager import get_china_stock_info_unified as get_info_dict
-                    info_dict = get_info_dict(ticker)
-                    if info_dict and info_dict.get('name'):
-                        company_name = info_dict['name']
-                        logger.info(f"✅ [Social Media Analyst] The downgrading program succeeded in obtaining stock names:{ticker} -> {company_name}")
-                        return company_name
-                except Exception as e:
-                    logger.error(f"The downgrading programme also failed:{e}")
-
-                logger.error(f"[Social Media Analyst] None of the programs can get stock names:{ticker}")
-                return f"股票代码{ticker}"
-
-        elif market_info['is_hk']:
-            #Port Unit: use of improved Port Unit tools
-            try:
-                from tradingagents.dataflows.providers.hk.improved_hk import get_hk_company_name_improved
-                company_name = get_hk_company_name_improved(ticker)
-                logger.debug(f"[Social Media Analyst]{ticker} -> {company_name}")
-                return company_name
-            except Exception as e:
-                logger.debug(f"📊 [Social Media Analyst] failed to improve the Hong Kong Unit tool to get a name:{e}")
-                #Downscaling scheme: Generate friendly default names
-                clean_ticker = ticker.replace('.HK', '').replace('.hk', '')
-                return f"港股{clean_ticker}"
-
-        elif market_info['is_us']:
-            #US share: use simple mapping or return code
-            us_stock_names = {
-                'AAPL': '苹果公司',
-                'TSLA': '特斯拉',
-                'NVDA': '英伟达',
-                'MSFT': '微软',
-                'GOOGL': '谷歌',
-                'AMZN': '亚马逊',
-                'META': 'Meta',
-                'NFLX': '奈飞'
-            }
-
-            company_name = us_stock_names.get(ticker.upper(), f"美股{ticker}")
-            logger.debug(f"[Social Media Analyst ] America name map:{ticker} -> {company_name}")
-            return company_name
-
-        else:
-            return f"股票{ticker}"
-
-    except Exception as e:
-        logger.error(f"[Social Media Analyst ]{e}")
-        return f"股票{ticker}"
+    """Get company names by stock code (shared resolver, cached per process)"""
+    return resolve_company_name(ticker, market_info)
 
 
 def create_social_media_analyst(llm, toolkit):
@@ -99,12 +28,11 @@ def create_social_media_analyst(llm, toolkit):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
-        #Access to stock market information
-        from tradingagents.utils.stock_utils import StockUtils
-        market_info = StockUtils.get_market_info(ticker)
+        #Company profile resolved once per run by propagate
+        market_info = get_company_profile(state)
 
         #Get company names
-        company_name = _get_company_name_for_social_media(ticker, market_info)
+        company_name = market_info['name']
         logger.info(f"[Social Media Analyst] Company name:{company_name}")
 
         #Get stock sentation unified tool
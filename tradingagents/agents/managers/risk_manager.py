@@ -1,12 +1,15 @@
 import time
 import json
 
+from tradingagents.agents.utils.context_budget import prompt_context
+from tradingagents.agents.utils.llm_node import LLMNode
+
 #Import Unified Log System
 from tradingagents.utils.logging_init import get_logger
 logger = get_logger("default")
 
 
-def create_risk_manager(llm, memory):
+def create_risk_manager(llm, memory, context_budget=None):
     def risk_manager_node(state) -> dict:
 
         company_name = state["company_of_interest"]
@@ -32,6 +35,10 @@ def create_risk_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        #Bounded prompt context: a rolling summary of the debate
+        context = prompt_context(context_budget, state, history, reserved=(trader_plan, past_memory_str),
+                                 include_reports=False)
+
         prompt = f"""作为风险管理委员会主席和辩论主持人，您的目标是评估三位风险分析师——激进、中性和安全/保守——之间的辩论，并确定交易员的最佳行动方案。您的决策必须产生明确的建议：买入、卖出或持有。只有在有具体论据强烈支持时才选择持有，而不是在所有方面都似乎有效时作为后备选择。力求清晰和果断。
 
 决策指导原则：
@@ -47,7 +54,7 @@ def create_risk_manager(llm, memory):
 ---
 
 **分析师辩论历史：**
-{history}
+{context['history']}
 
 ---
 
@@ -77,7 +84,7 @@ def create_risk_manager(llm, memory):
                 #Record time
                 start_time = time.time()
 
-                response = llm.invoke(prompt)
+                response = yield llm, prompt
 
                 #End of record
                 elapsed_time = time.time() - start_time
@@ -160,4 +167,4 @@ def create_risk_manager(llm, memory):
             "final_trade_decision": response_content,
         }
 
-    return risk_manager_node
+    return LLMNode(risk_manager_node)
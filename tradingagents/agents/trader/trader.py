@@ -2,6 +2,9 @@ import functools
 import time
 import json
 
+from tradingagents.agents.utils.company_profile import get_company_profile
+from tradingagents.agents.utils.llm_node import LLMNode
+
 #Import Unified Log System
 from tradingagents.utils.logging_init import get_logger
 logger = get_logger("default")
@@ -16,9 +19,8 @@ def create_trader(llm, memory):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        #Use common stock type testing
-        from tradingagents.utils.stock_utils import StockUtils
-        market_info = StockUtils.get_market_info(company_name)
+        #Company profile resolved once per run by propagate
+        market_info = get_company_profile(state)
         is_china = market_info['is_china']
         is_hk = market_info['is_hk']
         is_us = market_info['is_us']
@@ -100,7 +102,7 @@ def create_trader(llm, memory):
         logger.debug(f"[DEBUG] Ready to call LLM, system hint containing currency:{currency}")
         logger.debug(f"💰 [DEBUG] Key part of the system alert: Target price (){currency})")
 
-        result = llm.invoke(messages)
+        result = yield llm, messages
 
         logger.debug(f"[DBUG] LLM call complete.")
         logger.debug(f"[DBUG] Trader response length:{len(result.content)}")
@@ -113,4 +115,4 @@ def create_trader(llm, memory):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return LLMNode(functools.partial(trader_node, name="Trader"), name="trader_node")
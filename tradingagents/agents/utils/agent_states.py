@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence
+from typing import Annotated, Any, Dict, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
 from langchain_openai import ChatOpenAI
@@ -51,9 +51,18 @@ class RiskDebateState(TypedDict):
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
 
 
+def merge_debate_round(left: Dict[str, str], right: Dict[str, str]) -> Dict[str, str]:
+    """Reducer for parallel debate rounds: debaters of one round write concurrently,
+    each under its own speaker key; the next round overwrites the same keys."""
+    return {**(left or {}), **(right or {})}
+
+
 class AgentState(MessagesState):
     company_of_interest: Annotated[str, "Company that we are interested in trading"]
     trade_date: Annotated[str, "What date we are trading at"]
+    company_profile: Annotated[
+        Dict[str, Any], "Name, market, currency and exchange of the company, resolved once per run"
+    ]
 
     sender: Annotated[str, "Agent that sent this message"]
 
@@ -84,3 +93,7 @@ class AgentState(MessagesState):
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
+
+    # parallel debate mode: responses of the current round, keyed by speaker
+    investment_debate_round: Annotated[Dict[str, str], merge_debate_round]
+    risk_debate_round: Annotated[Dict[str, str], merge_debate_round]
@@ -17,6 +17,7 @@ from langchain_core.messages import HumanMessage
 #Import Unified Log System and Tool Log Decorator
 from tradingagents.utils.logging_init import get_logger
 from tradingagents.utils.tool_logging import log_tool_call, log_analysis_step
+from tradingagents.agents.utils.tool_memo import memoize_tool
 
 #Import Log Module
 from tradingagents.utils.logging_manager import get_logger
@@ -457,6 +458,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @memoize_tool(ticker_arg="query")
     def get_google_news(
         query: Annotated[str, "Query to search with"],
         curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -477,6 +479,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @memoize_tool()
     def get_realtime_stock_news(
         ticker: Annotated[str, "Ticker of a company. e.g. AAPL, TSM"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -497,6 +500,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @memoize_tool()
     def get_stock_news_openai(
         ticker: Annotated[str, "the company's ticker"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -516,6 +520,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @memoize_tool()
     def get_global_news_openai(
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     ):
@@ -686,6 +691,7 @@ class Toolkit:
     @staticmethod
     @tool
     @log_tool_call(tool_name="get_stock_fundamentals_unified", log_args=True)
+    @memoize_tool(tool_name="get_stock_fundamentals_unified", range_start_arg="start_date")
     def get_stock_fundamentals_unified(
         ticker: Annotated[str, "股票代码（支持A股、港股、美股）"],
         start_date: Annotated[str, "开始日期，格式：YYYY-MM-DD"] = None,
@@ -1034,6 +1040,7 @@ class Toolkit:
     @staticmethod
     @tool
     @log_tool_call(tool_name="get_stock_market_data_unified", log_args=True)
+    @memoize_tool(tool_name="get_stock_market_data_unified", range_start_arg="start_date")
     def get_stock_market_data_unified(
         ticker: Annotated[str, "股票代码（支持A股、港股、美股）"],
         start_date: Annotated[str, "开始日期，格式：YYYY-MM-DD。注意：系统会自动扩展到配置的回溯天数（通常为365天），你只需要传递分析日期即可"],
@@ -1145,6 +1152,7 @@ class Toolkit:
     @staticmethod
     @tool
     @log_tool_call(tool_name="get_stock_news_unified", log_args=True)
+    @memoize_tool(tool_name="get_stock_news_unified")
     def get_stock_news_unified(
         ticker: Annotated[str, "股票代码（支持A股、港股、美股）"],
         curr_date: Annotated[str, "当前日期，格式：YYYY-MM-DD"]
@@ -1278,6 +1286,7 @@ class Toolkit:
     @staticmethod
     @tool
     @log_tool_call(tool_name="get_stock_sentiment_unified", log_args=True)
+    @memoize_tool(tool_name="get_stock_sentiment_unified")
     def get_stock_sentiment_unified(
         ticker: Annotated[str, "股票代码（支持A股、港股、美股）"],
         curr_date: Annotated[str, "当前日期，格式：YYYY-MM-DD"]
@@ -0,0 +1,178 @@
+"""Company profile resolved once per analysis run
+
+Analysts, researchers, the trader and the signal processor all need the
+company name, market, currency and exchange of the analysed stock. Each used to
+resolve them on its own (``get_china_stock_info_unified`` plus parsing of the
+formatted "股票名称:" line, ``get_hk_company_name_improved``...), i.e. several
+data-layer calls per node. ``TradingAgentsGraph.propagate`` now resolves the
+profile once into ``state["company_profile"]`` and nodes read it with
+``get_company_profile(state)``.
+
+Lookups prefer the ``stock_basic_info`` collection (one indexed read) and fall
+back to the data sources; resolved profiles are kept in a process-level cache.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from tradingagents.utils.stock_utils import StockUtils
+
+#Import Unified Log System
+from tradingagents.utils.logging_init import get_logger
+logger = get_logger("default")
+
+#Names only change on renames; a few hours is fresh enough
+PROFILE_TTL_SECONDS = 6 * 3600
+
+_US_STOCK_NAMES = {
+    'AAPL': '苹果公司',
+    'TSLA': '特斯拉',
+    'NVDA': '英伟达',
+    'MSFT': '微软',
+    'GOOGL': '谷歌',
+    'AMZN': '亚马逊',
+    'META': 'Meta',
+    'NFLX': '奈飞'
+}
+
+#Prefixes of the placeholder names the data sources return when they do not know a stock
+#("港股0700", "股票代码000001", "股票000001"); such names count as unresolved
+_PLACEHOLDER_PREFIXES = ("股票代码", "港股", "美股", "股票")
+_CODE_RE = re.compile(r"^[:：\s]*[A-Za-z0-9.]+$")
+
+_profile_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def _exchange_name(ticker: str, market_info: Dict[str, Any]) -> str:
+    if market_info['is_china']:
+        code = str(ticker).strip()
+        if code.startswith(('60', '68', '90')):
+            return "上海证券交易所"
+        if code.startswith(('00', '30', '20')):
+            return "深圳证券交易所"
+        if code.startswith(('4', '8', '92')):
+            return "北京证券交易所"
+        return "未知交易所"
+    if market_info['is_hk']:
+        return "香港联合交易所"
+    if market_info['is_us']:
+        return "美国证券交易所"
+    return "未知交易所"
+
+
+def _china_name_from_basics(ticker: str) -> Optional[str]:
+    """Name from the stock_basic_info collection synced by the app"""
+    try:
+        from tradingagents.dataflows.cache.app_adapter import get_basics_from_cache
+        doc = get_basics_from_cache(ticker)
+        if doc:
+            return doc.get('name') or doc.get('stock_name') or None
+    except Exception as e:
+        logger.debug(f"[Company profile] stock_basic_info lookup failed:{e}")
+    return None
+
+
+def _fallback_name(ticker: str, market_info: Dict[str, Any]) -> str:
+    if market_info['is_china']:
+        return f"股票代码{ticker}"
+    if market_info['is_hk']:
+        return f"港股{ticker.replace('.HK', '').replace('.hk', '')}"
+    if market_info['is_us']:
+        return f"美股{ticker}"
+    return f"股票{ticker}"
+
+
+def _is_placeholder_name(name: str) -> bool:
+    name = name.strip()
+    if not name or name.startswith("未知"):
+        return True
+    return any(name.startswith(prefix) and _CODE_RE.match(name[len(prefix):]) for prefix in _PLACEHOLDER_PREFIXES)
+
+
+def _lookup_company_name(ticker: str, market_info: Dict[str, Any]) -> Optional[str]:
+    """Company name from the data layer; None when no source knows it"""
+    if market_info['is_china']:
+        name = _china_name_from_basics(ticker)
+        if name:
+            return name
+
+        #China Unit A: Access to stock information using a unified interface
+        from tradingagents.dataflows.interface import get_china_stock_info_unified
+        stock_info = get_china_stock_info_unified(ticker)
+        if stock_info and "股票名称:" in stock_info:
+            return stock_info.split("股票名称:")[1].split("\n")[0].strip() or None
+
+        #Downscaling: attempt to obtain directly from the data source manager
+        logger.warning(f"[Company profile] Unable to parse stock name from unified interface:{ticker}, try to downgrade")
+        from tradingagents.dataflows.data_source_manager import get_china_stock_info_unified as get_info_dict
+        info_dict = get_info_dict(ticker)
+        if info_dict and info_dict.get('name'):
+            return info_dict['name']
+        return None
+
+    if market_info['is_hk']:
+        from tradingagents.dataflows.providers.hk.improved_hk import get_hk_company_name_improved
+        return get_hk_company_name_improved(ticker)
+
+    if market_info['is_us']:
+        return _US_STOCK_NAMES.get(ticker.upper())
+
+    return None
+
+
+def resolve_company_name(ticker: str, market_info: Optional[Dict[str, Any]] = None) -> str:
+    """Company name for a stock code (a friendly placeholder when it cannot be resolved)"""
+    return resolve_company_profile(ticker, market_info)['name']
+
+
+def resolve_company_profile(ticker: str, market_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Name, market, currency and exchange of a stock, cached per process
+
+    Args:
+        ticker: Stock code
+        market_info: result of ``StockUtils.get_market_info`` if already known
+
+    Returns:
+        Dict: the market info fields plus ``name`` and ``exchange``
+    """
+    ticker = str(ticker).strip()
+    cache_key = ticker.upper()
+    now = time.time()
+    with _cache_lock:
+        cached = _profile_cache.get(cache_key)
+        if cached and now - cached[0] < PROFILE_TTL_SECONDS:
+            return dict(cached[1])
+
+    market_info = market_info or StockUtils.get_market_info(ticker)
+    try:
+        name = _lookup_company_name(ticker, market_info)
+    except Exception as e:
+        logger.error(f"❌ [Company profile] Failed to get company name:{ticker}: {e}")
+        name = None
+
+    profile = dict(market_info)
+    profile['name'] = name or _fallback_name(ticker, market_info)
+    profile['exchange'] = _exchange_name(ticker, market_info)
+
+    #Placeholder names (ours or the data source's) are not cached so that the next run tries again
+    if name and not _is_placeholder_name(name):
+        with _cache_lock:
+            _profile_cache[cache_key] = (now, profile)
+    logger.info(f"[Company profile] {ticker} -> {profile['name']} ({profile['market_name']}, {profile['exchange']}, {profile['currency_name']})")
+    return dict(profile)
+
+
+def get_company_profile(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Profile of the analysed company, from graph state when propagate resolved it"""
+    profile = state.get("company_profile")
+    if profile:
+        return profile
+    return resolve_company_profile(state["company_of_interest"])
+
+
+def clear_company_profile_cache() -> None:
+    with _cache_lock:
+        _profile_cache.clear()
@@ -0,0 +1,211 @@
+"""Bounded prompt context for downstream agents
+
+Researchers, risk debaters and managers used to inline all four analyst reports
+plus the whole debate transcript, so prompts (and latency) grew with every
+debate round. ``ContextBudget`` keeps that context under a token budget:
+
+- analyst reports are reduced to extractive digests (headings, figures and
+  conclusions are kept first); the report share of the budget is fixed, so a
+  digest is computed once per run and served from cache to every node;
+- the debate history becomes a rolling summary: the latest turns stay verbatim,
+  older turns are compacted (results are cached) and the oldest are dropped last.
+
+No LLM calls are involved, so compaction costs milliseconds.
+"""
+
+import functools
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+#Import Unified Log System
+from tradingagents.utils.logging_init import get_logger
+logger = get_logger("default")
+
+REPORT_FIELDS: Tuple[str, ...] = ("market_report", "sentiment_report", "news_report", "fundamentals_report")
+
+COMPACTED_MARKER = "…（内容已压缩）"
+
+_CJK_RE = re.compile(r"[\u3000-\u303f\u3400-\u9fff\uff00-\uffef]")
+_SENTENCE_RE = re.compile(r"(?<=[。！？；!?;])")
+_TURN_RE = re.compile(r"\n(?=(?:Bull|Bear|Risky|Safe|Neutral) Analyst: )")
+_SPEAKER_RE = re.compile(r"^((?:Bull|Bear|Risky|Safe|Neutral) Analyst: )")
+_TABLE_RULE_RE = re.compile(r"^\s*\|?\s*:?-{3,}")
+_DIGIT_RE = re.compile(r"\d")
+_KEY_TERMS_RE = re.compile(
+    r"结论|建议|总结|综合|评级|目标价|止损|风险|买入|卖出|持有|增持|减持|预计|预期|支撑|阻力|估值|"
+    r"市盈率|市净率|PE|PB|ROE|营收|净利润|同比|环比|趋势"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: about one token per CJK character, four characters per token otherwise"""
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _split_units(text: str, max_unit_tokens: int) -> List[str]:
+    """Lines, with overlong paragraphs split into sentences"""
+    units: List[str] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or _TABLE_RULE_RE.match(line):
+            continue
+        if estimate_tokens(line) <= max_unit_tokens:
+            units.append(line)
+            continue
+        units.extend(s.strip() for s in _SENTENCE_RE.split(line) if s.strip())
+    return units
+
+
+def _score(unit: str, index: int, total: int) -> int:
+    score = 0
+    if unit.startswith("#") or unit.startswith("【") or (len(unit) <= 30 and unit.endswith(("：", ":"))):
+        score += 3
+    if _KEY_TERMS_RE.search(unit):
+        score += 3
+    if _DIGIT_RE.search(unit):
+        score += 2
+    #Openings state the subject, endings usually hold the conclusion
+    if index < 3 or index >= total - 5:
+        score += 2
+    if unit.startswith("|"):
+        score += 1
+    return score
+
+
+@functools.lru_cache(maxsize=256)
+def compact_text(text: str, max_tokens: int) -> str:
+    """Extractive digest of ``text`` within ``max_tokens`` (returned unchanged when it fits)"""
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text or ""
+    budget = max(1, max_tokens - estimate_tokens(COMPACTED_MARKER))
+    units = _split_units(text, max(16, budget // 4))
+    ranked = sorted(range(len(units)), key=lambda i: (-_score(units[i], i, len(units)), i))
+    chosen, used = set(), 0
+    for i in ranked:
+        cost = estimate_tokens(units[i]) + 1
+        if used + cost > budget:
+            continue
+        chosen.add(i)
+        used += cost
+    if not chosen and units:
+        #Not even one unit fits: hard-cut the first one
+        head = units[0]
+        while head and estimate_tokens(head) > budget:
+            head = head[: max(1, len(head) * 3 // 4)]
+        return head + COMPACTED_MARKER
+    return "\n".join(units[i] for i in sorted(chosen)) + "\n" + COMPACTED_MARKER
+
+
+def _compact_turn(turn: str, max_tokens: int) -> str:
+    """Compact one debate turn, keeping its speaker label"""
+    match = _SPEAKER_RE.match(turn)
+    if not match:
+        return compact_text(turn, max_tokens)
+    label = match.group(1)
+    return label + compact_text(turn[len(label):], max(1, max_tokens - estimate_tokens(label)))
+
+
+def _allocate(sizes: Dict[str, int], budget: int) -> Dict[str, int]:
+    """Water-filling: small items keep their size, the rest share what is left equally"""
+    allocation: Dict[str, int] = {}
+    remaining = dict(sizes)
+    left = budget
+    while remaining:
+        share = left // len(remaining)
+        fitting = {k: v for k, v in remaining.items() if v <= share}
+        if not fitting:
+            allocation.update({k: share for k in remaining})
+            break
+        for key, size in fitting.items():
+            allocation[key] = size
+            left -= size
+            del remaining[key]
+    return allocation
+
+
+class ContextBudget:
+    """Keeps downstream prompts under ``max_tokens`` of report + debate context"""
+
+    def __init__(self, max_tokens: int = 24000, history_share: float = 0.4, recent_turns: int = 3):
+        self.max_tokens = max_tokens
+        self.history_share = history_share
+        self.recent_turns = recent_turns
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["ContextBudget"]:
+        """``prompt_token_budget`` <= 0 disables compaction"""
+        max_tokens = int((config or {}).get("prompt_token_budget") or 0)
+        if max_tokens <= 0:
+            return None
+        return cls(max_tokens=max_tokens)
+
+    @property
+    def report_budget(self) -> int:
+        return int(self.max_tokens * (1 - self.history_share))
+
+    def report_digests(self, state: Dict) -> Dict[str, str]:
+        reports = {field: state.get(field) or "" for field in REPORT_FIELDS}
+        allocation = _allocate({k: estimate_tokens(v) for k, v in reports.items()}, self.report_budget)
+        return {field: compact_text(text, allocation[field]) for field, text in reports.items()}
+
+    def history_digest(self, history: str, max_tokens: int) -> str:
+        """Rolling debate summary: latest turns verbatim, older turns compacted, oldest dropped"""
+        if not history or estimate_tokens(history) <= max_tokens:
+            return history or ""
+        turns = [t for t in _TURN_RE.split(history) if t.strip()]
+        recent: List[str] = []
+        used = 0
+        #Latest turns verbatim, up to 60% of the history budget
+        for turn in reversed(turns[-self.recent_turns:]):
+            cost = estimate_tokens(turn)
+            if recent and used + cost > max_tokens * 0.6:
+                break
+            recent.insert(0, turn if cost <= max_tokens * 0.6 else _compact_turn(turn, int(max_tokens * 0.6)))
+            used += estimate_tokens(recent[0])
+        older = turns[: len(turns) - len(recent)]
+        summaries: List[str] = []
+        if older:
+            per_turn = max(60, (max_tokens - used) // len(older))
+            for turn in reversed(older):
+                summary = _compact_turn(turn, per_turn)
+                cost = estimate_tokens(summary)
+                if used + cost > max_tokens:
+                    break
+                summaries.insert(0, summary)
+                used += cost
+        dropped = len(older) - len(summaries)
+        parts = ([f"（更早的 {dropped} 条发言已省略）"] if dropped else []) + summaries + recent
+        return "\n" + "\n".join(parts)
+
+    def prompt_context(self, state: Dict, history: str = "", reserved: Iterable[str] = (),
+                       include_reports: bool = True) -> Dict[str, str]:
+        """Report digests plus the debate history, fitted to the remaining budget
+
+        ``reserved`` are prompt parts kept verbatim (trader plan, latest responses);
+        they are taken out of the history share.
+        """
+        context = self.report_digests(state) if include_reports else {}
+        report_tokens = sum(estimate_tokens(v) for v in context.values())
+        reserved_tokens = sum(estimate_tokens(text or "") for text in reserved)
+        history_budget = max(int(self.max_tokens * 0.1), self.max_tokens - report_tokens - reserved_tokens)
+        context["history"] = self.history_digest(history, history_budget)
+        return context
+
+
+def prompt_context(budget: Optional[ContextBudget], state: Dict, history: str = "",
+                   reserved: Iterable[str] = (), include_reports: bool = True) -> Dict[str, str]:
+    """Prompt inputs for a downstream node; the raw state values when no budget is configured"""
+    fields = REPORT_FIELDS if include_reports else ()
+    if budget is None:
+        context = {field: state.get(field) or "" for field in fields}
+        context["history"] = history or ""
+        return context
+    context = budget.prompt_context(state, history, reserved, include_reports)
+    original = sum(estimate_tokens(state.get(f) or "") for f in fields) + estimate_tokens(history or "")
+    compacted = sum(estimate_tokens(v) for v in context.values())
+    if compacted < original:
+        logger.info(f"[Context budget] Prompt context compacted: ~{original:,} -> ~{compacted:,} tokens")
+    return context
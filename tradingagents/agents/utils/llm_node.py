@@ -0,0 +1,89 @@
+"""Graph nodes that run their LLM calls natively async
+
+Node bodies are written as generators: each LLM call is expressed as
+``response = yield llm, prompt`` instead of ``response = llm.invoke(prompt)``.
+``LLMNode`` drives the generator in two ways:
+
+- ``graph.invoke`` / ``graph.stream`` (and a direct ``node(state)`` call) use
+  ``runnable.invoke`` exactly as before;
+- ``graph.ainvoke`` / ``graph.astream`` await ``runnable.ainvoke`` on the event
+  loop, so no thread is held while waiting for the model. The synchronous parts
+  of the body (prompt building, memory lookups) run in a worker thread between
+  the calls.
+
+Exceptions raised by the LLM are thrown back into the generator, so
+``try/except`` around a ``yield`` behaves like it did around ``invoke``.
+Bodies compose with ``yield from``, which is how wrappers such as the parallel
+debate nodes keep the async path.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+#A body yields (runnable, input) pairs and returns the state update
+NodeSteps = Callable[[Dict[str, Any]], Generator[Tuple[Runnable, Any], Any, Dict[str, Any]]]
+
+_DONE = object()
+
+
+def _advance(steps: Generator, value: Any = None, error: Optional[BaseException] = None) -> Tuple[Any, Any]:
+    """Run the body up to its next LLM call; returns (request, _DONE) or (_DONE, update)
+
+    StopIteration must not escape a worker thread (asyncio refuses to put it in a
+    future), so the end of the body is reported as a value instead.
+    """
+    try:
+        if error is not None:
+            request = steps.throw(error)
+        else:
+            request = steps.send(value)
+    except StopIteration as stop:
+        return _DONE, stop.value
+    return request, _DONE
+
+
+class LLMNode(RunnableLambda):
+    """A graph node with a synchronous and a native async execution path"""
+
+    def __init__(self, steps: NodeSteps, name: Optional[str] = None):
+        self.steps = steps
+        super().__init__(self._run, afunc=self._arun,
+                         name=name or getattr(steps, "__name__", None) or "llm_node")
+
+    def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run(state)
+
+    def _run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        steps = self.steps(state)
+        request, update = _advance(steps)
+        while update is _DONE:
+            runnable, payload = request
+            try:
+                result = runnable.invoke(payload)
+            except Exception as e:
+                request, update = _advance(steps, error=e)
+                continue
+            request, update = _advance(steps, result)
+        return update
+
+    async def _arun(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        steps = self.steps(state)
+        request, update = await asyncio.to_thread(_advance, steps)
+        while update is _DONE:
+            runnable, payload = request
+            try:
+                result = await runnable.ainvoke(payload)
+            except Exception as e:
+                request, update = await asyncio.to_thread(_advance, steps, None, e)
+                continue
+            request, update = await asyncio.to_thread(_advance, steps, result)
+        return update
+
+
+def run_node_steps(node: Callable, state: Dict[str, Any]) -> Generator:
+    """Body of ``node`` for use with ``yield from``; plain functions run synchronously"""
+    if isinstance(node, LLMNode):
+        return (yield from node.steps(state))
+    return node(state)
@@ -0,0 +1,173 @@
+"""Run-scoped memoization of Toolkit data tools
+
+Within one analysis the same data is often requested several times: an
+analyst's tool loop retries, or the LLM asks again for the same ticker with
+slightly different arguments ("0700.HK" vs "00700", a shorter date range...).
+``TradingAgentsGraph.propagate`` opens a ``tool_memo_scope()``; inside it the
+tools decorated with ``memoize_tool`` answer repeated requests from memory.
+
+- tickers are normalized (case, whitespace, Hong Kong code padding);
+- dates are normalized to YYYY-MM-DD;
+- for tools with a date range, a cached result for the same end date and an
+  earlier (or equal) start date covers the request (range containment);
+- results that report a failure are not cached, so a retry really retries.
+
+The scope lives in a ContextVar: LangGraph and ToolNode copy the context into
+their worker threads, so every analyst of the run shares one memo, while
+concurrent runs in the same process stay isolated. Outside a scope the tools
+behave exactly as before.
+"""
+
+import contextvars
+import functools
+import inspect
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+#Import Unified Log System
+from tradingagents.utils.logging_manager import get_logger
+logger = get_logger('agents')
+
+_current_memo: contextvars.ContextVar[Optional["ToolMemo"]] = contextvars.ContextVar("tool_memo", default=None)
+
+#Tool results containing these markers describe a failure and are not reused
+_FAILURE_MARKERS = ("获取失败", "执行失败", "❌")
+
+_HK_RE = re.compile(r"^0*(\d{1,5})(?:\.HK)?$")
+_DATE_FORMATS = ("%Y-%m-%d", "%Y%m%d", "%Y/%m/%d")
+
+
+def normalize_ticker(ticker: Any) -> Any:
+    """Canonical form of equivalent ticker spellings (only those the tools treat identically)"""
+    if not isinstance(ticker, str):
+        return ticker
+    value = ticker.strip().upper()
+    if re.match(r"^\d{4,5}(\.HK)?$", value):
+        digits = _HK_RE.match(value).group(1)
+        return f"{digits.zfill(4)}.HK"
+    return value
+
+
+def normalize_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return text
+
+
+class ToolMemo:
+    """Results of one analysis run, keyed by tool and normalized arguments"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        #(tool, key) -> list of (start, result); start is None for exact-key tools
+        self._entries: Dict[Tuple[str, Tuple], list] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, tool: str, field: str) -> None:
+        stats = self._stats.setdefault(tool, {"hits": 0, "misses": 0})
+        stats[field] += 1
+
+    def lookup(self, tool: str, key: Tuple, start: Optional[str] = None) -> Tuple[bool, Any]:
+        with self._lock:
+            for cached_start, result in self._entries.get((tool, key), ()):
+                if cached_start == start or (start is not None and cached_start is not None and cached_start <= start):
+                    self._count(tool, "hits")
+                    return True, result
+            self._count(tool, "misses")
+            return False, None
+
+    def store(self, tool: str, key: Tuple, result: Any, start: Optional[str] = None) -> None:
+        with self._lock:
+            entries = self._entries.setdefault((tool, key), [])
+            if all(cached_start != start for cached_start, _ in entries):
+                entries.append((start, result))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tools = {name: dict(values) for name, values in self._stats.items()}
+        hits = sum(v["hits"] for v in tools.values())
+        misses = sum(v["misses"] for v in tools.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "tools": tools,
+        }
+
+
+def get_current_tool_memo() -> Optional[ToolMemo]:
+    return _current_memo.get()
+
+
+@contextmanager
+def tool_memo_scope() -> Iterator[ToolMemo]:
+    """Share one memo among all tool calls of the enclosed analysis run"""
+    memo = ToolMemo()
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+
+
+def _is_failure(result: Any) -> bool:
+    if not isinstance(result, str) or not result.strip():
+        return True
+    return any(marker in result for marker in _FAILURE_MARKERS)
+
+
+def memoize_tool(tool_name: Optional[str] = None, ticker_arg: str = "ticker",
+                 range_start_arg: Optional[str] = None) -> Callable:
+    """Serve repeated calls of a data tool from the run-scoped memo
+
+    Args:
+        tool_name: name used for the statistics (defaults to the function name)
+        ticker_arg: argument holding the stock code
+        range_start_arg: start of a date range; a cached result whose start is
+            not later covers the request (all other arguments must match)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = tool_name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            memo = _current_memo.get()
+            if memo is None:
+                return func(*args, **kwargs)
+
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+            except TypeError:
+                return func(*args, **kwargs)
+            arguments = {}
+            for arg, value in bound.arguments.items():
+                if arg == ticker_arg:
+                    value = normalize_ticker(value)
+                elif arg.endswith("date"):
+                    value = normalize_date(value)
+                arguments[arg] = value
+            start = arguments.pop(range_start_arg, None) if range_start_arg else None
+            key = tuple(sorted((k, repr(v)) for k, v in arguments.items()))
+
+            hit, result = memo.lookup(name, key, start)
+            if hit:
+                logger.info(f"[Tool memo] {name} served from run cache: {arguments.get(ticker_arg)}")
+                return result
+            result = func(*args, **kwargs)
+            if not _is_failure(result):
+                memo.store(name, key, result, start)
+            return result
+
+        return wrapper
+    return decorator
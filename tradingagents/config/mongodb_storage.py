@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Optional, Any
 from dataclasses import asdict
-from .usage_models import UsageRecord
+from .usage_models import ROLLUP_COLLECTION, UsageRecord, build_rollup_update
 
 #Import Log Module
 from tradingagents.utils.logging_manager import get_logger
@@ -46,6 +46,8 @@ class MongoDBStorage:
         
         self.database_name = database_name
         self.collection_name = "token_usage"
+        #Daily rollups, read by app/services/usage_statistics_service.py
+        self.rollup_collection_name = ROLLUP_COLLECTION
         
         self.client = None
         self.db = None
@@ -134,6 +136,7 @@ class MongoDBStorage:
             result = self.collection.insert_one(record_dict)
 
             if result.inserted_id:
+                self._update_daily_rollup(record_dict)
                 logger.info(f"[MongoDB Storage] Record saved: ID={result.inserted_id}, {record.provider}/{record.model_name}, ¥{record.cost:.4f}")
                 return True
             else:
@@ -146,6 +149,14 @@ class MongoDBStorage:
             logger.error(f"Stack:{traceback.format_exc()}")
             return False
     
+    def _update_daily_rollup(self, record_dict: Dict[str, Any]):
+        """Add the record to its daily rollup (read by the web usage statistics service)"""
+        try:
+            rollup_filter, rollup_update = build_rollup_update(record_dict)
+            self.db[self.rollup_collection_name].update_one(rollup_filter, rollup_update, upsert=True)
+        except Exception as e:
+            logger.warning(f"[MongoDB Storage] Daily rollup update failed:{e}")
+
     def load_usage_records(self, limit: int = 10000, days: int = None) -> List[UsageRecord]:
         """Loading logs from MongoDB"""
         if not self._connected:
@@ -293,6 +304,10 @@ class MongoDBStorage:
             })
             
             deleted_count = result.deleted_count
+            #Rollups of days that are now entirely outside the retention window
+            self.db[self.rollup_collection_name].delete_many({
+                'date': {'$lt': cutoff_date.date().isoformat()}
+            })
             if deleted_count > 0:
                 logger.info(f"It's clean.{deleted_count}Article above{days}Day records")
             
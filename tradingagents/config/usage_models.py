@@ -4,7 +4,8 @@ Use statistics and cost tracking for Token
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
 
 @dataclass
@@ -42,3 +43,28 @@ class PricingConfig:
     output_price_per_1k: float  #Output token price (per 1,000 tokens)
     currency: str = "CNY"  #Currency units
 
+
+
+#Daily rollups of token_usage, one document per (date, provider, model_name, currency)
+ROLLUP_COLLECTION = "token_usage_daily"
+ROLLUP_KEY_FIELDS = ("date", "provider", "model_name", "currency")
+
+
+def build_rollup_update(record: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Filter and $inc update adding one usage record to its daily rollup"""
+    rollup_filter = {
+        "date": str(record.get("timestamp", ""))[:10],
+        "provider": record.get("provider") or "unknown",
+        "model_name": record.get("model_name") or "unknown",
+        "currency": record.get("currency") or "CNY",
+    }
+    rollup_update = {
+        "$inc": {
+            "requests": 1,
+            "input_tokens": record.get("input_tokens", 0) or 0,
+            "output_tokens": record.get("output_tokens", 0) or 0,
+            "cost": record.get("cost", 0.0) or 0.0,
+        },
+        "$set": {"updated_at": datetime.now()},
+    }
+    return rollup_filter, rollup_update
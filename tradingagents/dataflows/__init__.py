@@ -84,6 +84,9 @@ from .interface import (
     get_stock_data_by_market,
 )
 
+# Structured data results
+from .data_result import StockDataResult
+
 __all__ = [
     # News and sentiment functions
     "get_finnhub_news",
@@ -114,4 +117,6 @@ __all__ = [
     "get_hk_stock_data_unified",
     "get_hk_stock_info_unified",
     "get_stock_data_by_market",
+    # Structured data results
+    "StockDataResult",
 ]
@@ -3,17 +3,63 @@
 Automatically select the best cache policy based on database availability
 """
 
+import io
 import os
 import json
+import zlib
 import pickle
 import hashlib
 import logging
+import threading
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import pandas as pd
 
 from tradingagents.config.database_manager import get_database_manager
+from tradingagents.config.runtime_settings import get_int
+
+#Compressed payloads start with this marker and a one-byte codec id; plain pickles start with b"\x80"
+_PAYLOAD_MAGIC = b"TAC1"
+
+
+def _available_codecs() -> Dict[str, Tuple[bytes, Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """Codec name -> (id, compress, decompress); zstd/lz4 are optional, zlib always works"""
+    codecs = {"zlib": (b"d", lambda raw: zlib.compress(raw, 1), zlib.decompress)}
+    try:
+        import lz4.frame
+        codecs["lz4"] = (b"l", lz4.frame.compress, lz4.frame.decompress)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        codecs["zstd"] = (b"z", lambda raw: zstandard.ZstdCompressor(level=1).compress(raw),
+                          lambda blob: zstandard.ZstdDecompressor().decompress(blob))
+    except ImportError:
+        pass
+    return codecs
+
+
+_CODECS = _available_codecs()
+_DECOMPRESSORS = {codec_id: decompress for codec_id, _, decompress in _CODECS.values()}
+
+
+def _select_codec(name: str) -> Optional[str]:
+    """Configured codec, or the fastest available one for "auto"; None disables compression
+
+    "auto" only picks zstd/lz4: zlib costs more CPU than it saves on a local Redis,
+    so it is used only when configured explicitly.
+    """
+    name = (name or "auto").strip().lower()
+    if name in ("none", "off", "false", "0"):
+        return None
+    if name in _CODECS:
+        return name
+    for candidate in ("zstd", "lz4"):
+        if candidate in _CODECS:
+            return candidate
+    return None
 
 class AdaptiveCacheSystem:
     """Self-adapted Cache System"""
@@ -39,7 +85,25 @@ class AdaptiveCacheSystem:
         self.primary_backend = self.cache_config["primary_backend"]
         self.fallback_enabled = self.cache_config["fallback_enabled"]
         
-        self.logger.info(f"Initialization of the self-adapted cache system - Main backend:{self.primary_backend}")
+        #Payload compression: TA_CACHE_COMPRESSION=auto|zstd|lz4|zlib|none, only above the size threshold
+        self.compression = _select_codec(os.getenv("TA_CACHE_COMPRESSION", "auto"))
+        self.compress_min_bytes = get_int("TA_CACHE_COMPRESS_MIN_BYTES", None, 4096)
+        #File cache size budget in MB (0 = unlimited), enforced by clear_expired_cache
+        self.max_file_cache_mb = get_int("TA_CACHE_FILE_MAX_MB", None, 0)
+        self._size_stats = {
+            'writes': 0,
+            'compressed_writes': 0,
+            'raw_bytes': 0,
+            'stored_bytes': 0,
+            'expired_removed': 0,
+            'size_evicted': 0,
+            'size_evicted_bytes': 0,
+        }
+        #The cache is shared by concurrent analyses, and += on a dict entry is not atomic
+        self._size_stats_lock = threading.Lock()
+
+        self.logger.info(f"Initialization of the self-adapted cache system - Main backend:{self.primary_backend}, "
+                         f"compression: {self.compression or 'none'}")
     
     def _get_cache_key(self, symbol: str, start_date: str = "", end_date: str = "", 
                       data_source: str = "default", data_type: str = "stock_data") -> str:
@@ -68,6 +132,46 @@ class AdaptiveCacheSystem:
         expiry_time = cache_time + timedelta(seconds=ttl_seconds)
         return datetime.now() < expiry_time
     
+    def _count_sizes(self, **deltas: int) -> None:
+        with self._size_stats_lock:
+            for field, delta in deltas.items():
+                self._size_stats[field] += delta
+
+    def _encode_payload(self, obj: Any) -> bytes:
+        """Pickle ``obj`` and compress it when it is larger than the threshold"""
+        raw = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        payload = raw
+        if self.compression and len(raw) >= self.compress_min_bytes:
+            codec_id, compress, _ = _CODECS[self.compression]
+            compressed = compress(raw)
+            #Incompressible payloads are kept as they are
+            if len(compressed) + len(_PAYLOAD_MAGIC) + 1 < len(raw):
+                payload = _PAYLOAD_MAGIC + codec_id + compressed
+        self._count_sizes(writes=1, compressed_writes=int(payload is not raw),
+                          raw_bytes=len(raw), stored_bytes=len(payload))
+        return payload
+
+    @staticmethod
+    def _decode_payload(payload: bytes) -> Any:
+        """Inverse of ``_encode_payload``; also reads plain pickles written before compression"""
+        if payload[:len(_PAYLOAD_MAGIC)] == _PAYLOAD_MAGIC:
+            codec_id = payload[len(_PAYLOAD_MAGIC):len(_PAYLOAD_MAGIC) + 1]
+            decompress = _DECOMPRESSORS.get(codec_id)
+            if decompress is None:
+                raise ValueError(f"Cache payload codec {codec_id!r} is not installed")
+            payload = decompress(payload[len(_PAYLOAD_MAGIC) + 1:])
+        return pickle.loads(payload)
+
+    def _build_metadata(self, symbol: str, start_date: str, end_date: str,
+                        data_source: str, data_type: str) -> Dict[str, str]:
+        return {
+            'symbol': symbol,
+            'start_date': start_date,
+            'end_date': end_date,
+            'data_source': data_source,
+            'data_type': data_type
+        }
+
     def _save_to_file(self, cache_key: str, data: Any, metadata: Dict) -> bool:
         """Save to File Cache"""
         try:
@@ -80,7 +184,7 @@ class AdaptiveCacheSystem:
             }
             
             with open(cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
+                f.write(self._encode_payload(cache_data))
             
             self.logger.debug(f"File cache successfully saved:{cache_key}")
             return True
@@ -97,7 +201,7 @@ class AdaptiveCacheSystem:
                 return None
             
             with open(cache_file, 'rb') as f:
-                cache_data = pickle.load(f)
+                cache_data = self._decode_payload(f.read())
             
             self.logger.debug(f"File cache loaded successfully:{cache_key}")
             return cache_data
@@ -113,15 +217,7 @@ class AdaptiveCacheSystem:
             return False
         
         try:
-            cache_data = {
-                'data': data,
-                'metadata': metadata,
-                'timestamp': datetime.now().isoformat(),
-                'backend': 'redis'
-            }
-            
-            serialized_data = pickle.dumps(cache_data)
-            redis_client.setex(cache_key, ttl_seconds, serialized_data)
+            redis_client.setex(cache_key, ttl_seconds, self._redis_payload(data, metadata))
             
             self.logger.debug(f"Redis cache saved successfully:{cache_key}")
             return True
@@ -130,6 +226,22 @@ class AdaptiveCacheSystem:
             self.logger.error(f"Redis cache failed:{e}")
             return False
     
+    def _redis_payload(self, data: Any, metadata: Dict) -> bytes:
+        return self._encode_payload({
+            'data': data,
+            'metadata': metadata,
+            'timestamp': datetime.now().isoformat(),
+            'backend': 'redis'
+        })
+
+    def _redis_cache_data(self, serialized_data: bytes) -> Dict:
+        cache_data = self._decode_payload(serialized_data)
+
+        #Convert Timetamp
+        if isinstance(cache_data['timestamp'], str):
+            cache_data['timestamp'] = datetime.fromisoformat(cache_data['timestamp'])
+        return cache_data
+
     def _load_from_redis(self, cache_key: str) -> Optional[Dict]:
         """Load from Redis cache"""
         redis_client = self.db_manager.get_redis_client()
@@ -141,11 +253,7 @@ class AdaptiveCacheSystem:
             if not serialized_data:
                 return None
             
-            cache_data = pickle.loads(serialized_data)
-            
-            #Convert Timetamp
-            if isinstance(cache_data['timestamp'], str):
-                cache_data['timestamp'] = datetime.fromisoformat(cache_data['timestamp'])
+            cache_data = self._redis_cache_data(serialized_data)
             
             self.logger.debug(f"Redis cache loaded successfully:{cache_key}")
             return cache_data
@@ -161,28 +269,9 @@ class AdaptiveCacheSystem:
             return False
         
         try:
-            db = mongodb_client.tradingagents
-            collection = db.cache
-            
-            #Sequenced Data
-            if isinstance(data, pd.DataFrame):
-                serialized_data = data.to_json()
-                data_type = 'dataframe'
-            else:
-                serialized_data = pickle.dumps(data).hex()
-                data_type = 'pickle'
-            
-            cache_doc = {
-                '_id': cache_key,
-                'data': serialized_data,
-                'data_type': data_type,
-                'metadata': metadata,
-                'timestamp': datetime.now(),
-                'expires_at': datetime.now() + timedelta(seconds=ttl_seconds),
-                'backend': 'mongodb'
-            }
-            
-            collection.replace_one({'_id': cache_key}, cache_doc, upsert=True)
+            collection = mongodb_client.tradingagents.cache
+            collection.replace_one({'_id': cache_key}, self._mongodb_doc(cache_key, data, metadata, ttl_seconds),
+                                   upsert=True)
             
             self.logger.debug(f"MongoDB cache saved successfully:{cache_key}")
             return True
@@ -191,6 +280,36 @@ class AdaptiveCacheSystem:
             self.logger.error(f"MongoDB cache failed:{e}")
             return False
     
+    def _mongodb_doc(self, cache_key: str, data: Any, metadata: Dict, ttl_seconds: int) -> Dict:
+        payload = self._encode_payload(data)
+        now = datetime.now()
+        return {
+            '_id': cache_key,
+            'data': payload,
+            'data_type': 'payload',
+            'size': len(payload),
+            'metadata': metadata,
+            'timestamp': now,
+            'expires_at': now + timedelta(seconds=ttl_seconds),
+            'backend': 'mongodb'
+        }
+
+    def _mongodb_cache_data(self, doc: Dict) -> Dict:
+        #Inverse sequenced data ("dataframe"/"pickle" documents predate the binary payload format)
+        if doc['data_type'] == 'payload':
+            data = self._decode_payload(bytes(doc['data']))
+        elif doc['data_type'] == 'dataframe':
+            data = pd.read_json(io.StringIO(doc["data"]))
+        else:
+            data = pickle.loads(bytes.fromhex(doc['data']))
+
+        return {
+            'data': data,
+            'metadata': doc['metadata'],
+            'timestamp': doc['timestamp'],
+            'backend': 'mongodb'
+        }
+
     def _load_from_mongodb(self, cache_key: str) -> Optional[Dict]:
         """Load from MongoDB cache"""
         mongodb_client = self.db_manager.get_mongodb_client()
@@ -210,24 +329,13 @@ class AdaptiveCacheSystem:
                 collection.delete_one({'_id': cache_key})
                 return None
             
-            #Inverse sequenced data
-            if doc['data_type'] == 'dataframe':
-                data = pd.read_json(doc['data'])
-            else:
-                data = pickle.loads(bytes.fromhex(doc['data']))
-            
-            cache_data = {
-                'data': data,
-                'metadata': doc['metadata'],
-                'timestamp': doc['timestamp'],
-                'backend': 'mongodb'
-            }
+            cache_data = self._mongodb_cache_data(doc)
             
             self.logger.debug(f"MongoDB cache loaded successfully:{cache_key}")
             return cache_data
             
         except Exception as e:
-            self.logger.error(f"Could not close temporary folder: %s{e}")
+            self.logger.error(f"MongoDB cache loading failed:{e}")
             return None
     
     def save_data(self, symbol: str, data: Any, start_date: str = "", end_date: str = "", 
@@ -237,13 +345,7 @@ class AdaptiveCacheSystem:
         cache_key = self._get_cache_key(symbol, start_date, end_date, data_source, data_type)
         
         #Prepare metadata
-        metadata = {
-            'symbol': symbol,
-            'start_date': start_date,
-            'end_date': end_date,
-            'data_source': data_source,
-            'data_type': data_type
-        }
+        metadata = self._build_metadata(symbol, start_date, end_date, data_source, data_type)
         
         #Get TTL
         ttl_seconds = self._get_ttl_seconds(symbol, data_type)
@@ -290,7 +392,13 @@ class AdaptiveCacheSystem:
         if not cache_data:
             return None
         
-        #Check whether the cache is effective (only for file cache, database cache has its own TTL mechanism)
+        if not self._is_entry_valid(cache_key, cache_data):
+            return None
+        
+        return cache_data['data']
+
+    def _is_entry_valid(self, cache_key: str, cache_data: Dict) -> bool:
+        """Check whether the cache is effective (only for file cache, database cache has its own TTL mechanism)"""
         if cache_data.get('backend') == 'file':
             symbol = cache_data['metadata'].get('symbol', '')
             data_type = cache_data['metadata'].get('data_type', 'stock_data')
@@ -298,9 +406,159 @@ class AdaptiveCacheSystem:
             
             if not self._is_cache_valid(cache_data['timestamp'], ttl_seconds):
                 self.logger.debug(f"File cache expired:{cache_key}")
-                return None
-        
-        return cache_data['data']
+                return False
+        return True
+
+    def save_many(self, items: Union[Mapping, Iterable[Tuple[str, Any]]], start_date: str = "", end_date: str = "",
+                  data_source: str = "default", data_type: str = "stock_data") -> List[str]:
+        """Save several symbols' data in one round-trip (Redis pipeline / MongoDB bulk write)
+
+        Args:
+            items: {symbol: data} or (symbol, data) pairs sharing the same date range and type
+
+        Returns:
+            Cache keys in input order
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        entries = []
+        for symbol, data in items:
+            cache_key = self._get_cache_key(symbol, start_date, end_date, data_source, data_type)
+            metadata = self._build_metadata(symbol, start_date, end_date, data_source, data_type)
+            entries.append((cache_key, data, metadata, self._get_ttl_seconds(symbol, data_type)))
+        if not entries:
+            return []
+
+        saved = set()
+        if self.primary_backend == "redis":
+            saved = self._save_many_to_redis(entries)
+        elif self.primary_backend == "mongodb":
+            saved = self._save_many_to_mongodb(entries)
+
+        failed = [entry for entry in entries if entry[0] not in saved]
+        if failed and (self.primary_backend == "file" or self.fallback_enabled):
+            if self.primary_backend != "file":
+                self.logger.warning(f"Main Backend{self.primary_backend}Batch save failed for {len(failed)} entries, "
+                                    f"file cache downgraded")
+            for cache_key, data, metadata, _ in failed:
+                if self._save_to_file(cache_key, data, metadata):
+                    saved.add(cache_key)
+
+        self.logger.info(f"Batch data cache: {len(saved)}/{len(entries)} saved (backend:{self.primary_backend})")
+        return [entry[0] for entry in entries]
+
+    def load_many(self, cache_keys: Iterable[str]) -> Dict[str, Any]:
+        """Load several cache keys at once (Redis MGET / MongoDB $in query)
+
+        Returns:
+            {cache_key: data} for the keys found and still valid; misses are left out
+        """
+        cache_keys = list(dict.fromkeys(cache_keys))
+        if not cache_keys:
+            return {}
+
+        found: Dict[str, Dict] = {}
+        if self.primary_backend == "redis":
+            found = self._load_many_from_redis(cache_keys)
+        elif self.primary_backend == "mongodb":
+            found = self._load_many_from_mongodb(cache_keys)
+
+        if self.primary_backend == "file" or self.fallback_enabled:
+            for cache_key in cache_keys:
+                if cache_key not in found:
+                    cache_data = self._load_from_file(cache_key)
+                    if cache_data:
+                        found[cache_key] = cache_data
+
+        return {
+            cache_key: cache_data['data']
+            for cache_key, cache_data in found.items()
+            if self._is_entry_valid(cache_key, cache_data)
+        }
+
+    def _save_many_to_redis(self, entries: List[Tuple[str, Any, Dict, int]]) -> set:
+        redis_client = self.db_manager.get_redis_client()
+        if not redis_client:
+            return set()
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for cache_key, data, metadata, ttl_seconds in entries:
+                pipe.setex(cache_key, ttl_seconds, self._redis_payload(data, metadata))
+            results = pipe.execute()
+            return {entry[0] for entry, ok in zip(entries, results) if ok}
+        except Exception as e:
+            self.logger.error(f"Redis batch cache failed:{e}")
+            return set()
+
+    def _load_many_from_redis(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        redis_client = self.db_manager.get_redis_client()
+        if not redis_client:
+            return {}
+
+        try:
+            values = redis_client.mget(cache_keys)
+        except Exception as e:
+            self.logger.error(f"Redis batch cache loading failed:{e}")
+            return {}
+
+        found = {}
+        for cache_key, serialized_data in zip(cache_keys, values):
+            if not serialized_data:
+                continue
+            try:
+                found[cache_key] = self._redis_cache_data(serialized_data)
+            except Exception as e:
+                self.logger.error(f"Redis cache loading failed:{cache_key}: {e}")
+        return found
+
+    def _save_many_to_mongodb(self, entries: List[Tuple[str, Any, Dict, int]]) -> set:
+        mongodb_client = self.db_manager.get_mongodb_client()
+        if not mongodb_client:
+            return set()
+
+        try:
+            from pymongo import ReplaceOne
+
+            collection = mongodb_client.tradingagents.cache
+            requests = [
+                ReplaceOne({'_id': cache_key}, self._mongodb_doc(cache_key, data, metadata, ttl_seconds), upsert=True)
+                for cache_key, data, metadata, ttl_seconds in entries
+            ]
+            collection.bulk_write(requests, ordered=False)
+            return {entry[0] for entry in entries}
+        except Exception as e:
+            self.logger.error(f"MongoDB batch cache failed:{e}")
+            return set()
+
+    def _load_many_from_mongodb(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        mongodb_client = self.db_manager.get_mongodb_client()
+        if not mongodb_client:
+            return {}
+
+        try:
+            collection = mongodb_client.tradingagents.cache
+            docs = list(collection.find({'_id': {'$in': cache_keys}}))
+        except Exception as e:
+            self.logger.error(f"MongoDB batch cache loading failed:{e}")
+            return {}
+
+        now = datetime.now()
+        found, expired = {}, []
+        for doc in docs:
+            if doc.get('expires_at') and doc['expires_at'] < now:
+                expired.append(doc['_id'])
+                continue
+            try:
+                found[doc['_id']] = self._mongodb_cache_data(doc)
+            except Exception as e:
+                self.logger.error(f"MongoDB cache loading failed:{doc['_id']}: {e}")
+        if expired:
+            try:
+                collection.delete_many({'_id': {'$in': expired}})
+            except Exception as e:
+                self.logger.debug(f"MongoDB expired cache cleanup failed:{e}")
+        return found
     
     def find_cached_data(self, symbol: str, start_date: str = "", end_date: str = "", 
                         data_source: str = "default", data_type: str = "stock_data") -> Optional[str]:
@@ -370,6 +628,17 @@ class AdaptiveCacheSystem:
                             stats['fundamentals_count'] += count
 
                 backend_info['mongodb_cache_count'] = stats['total_files']
+
+                #Entries written by this cache system
+                if "cache" in db.list_collection_names():
+                    try:
+                        cache_stats = db.command("collStats", "cache")
+                        backend_info['mongodb_cache_entries'] = cache_stats.get("count", 0)
+                        backend_info['mongodb_cache_bytes'] = cache_stats.get("size", 0)
+                        backend_info['mongodb_cache_avg_entry_bytes'] = cache_stats.get("avgObjSize", 0)
+                        total_size_bytes += cache_stats.get("size", 0)
+                    except:
+                        pass
             except:
                 backend_info['mongodb_status'] = 'Error'
 
@@ -379,22 +648,55 @@ class AdaptiveCacheSystem:
             try:
                 redis_info = redis_client.info()
                 backend_info['redis_memory_used'] = redis_info.get('used_memory_human', 'N/A')
+                backend_info['redis_memory_bytes'] = redis_info.get('used_memory', 0)
                 backend_info['redis_keys'] = redis_client.dbsize()
             except:
                 backend_info['redis_status'] = 'Error'
 
         #File cache statistics
+        file_cache_bytes = 0
+        largest_files = []
         if self.primary_backend == 'file' or self.fallback_enabled:
             for pkl_file in self.cache_dir.glob("*.pkl"):
                 try:
-                    total_size_bytes += pkl_file.stat().st_size
+                    size = pkl_file.stat().st_size
                 except:
-                    pass
+                    continue
+                file_cache_bytes += size
+                largest_files.append((size, pkl_file.stem))
+            total_size_bytes += file_cache_bytes
+        largest_files.sort(reverse=True)
 
         #Set Total Size
         stats['total_size'] = total_size_bytes
         stats['total_size_mb'] = round(total_size_bytes / (1024 * 1024), 2)
 
+        #Payload sizes written by this process (before/after compression)
+        with self._size_stats_lock:
+            size_stats = dict(self._size_stats)
+        raw_bytes, stored_bytes = size_stats['raw_bytes'], size_stats['stored_bytes']
+        stats['compression'] = {
+            'codec': self.compression or 'none',
+            'available_codecs': sorted(_CODECS),
+            'min_bytes': self.compress_min_bytes,
+            'writes': size_stats['writes'],
+            'compressed_writes': size_stats['compressed_writes'],
+            'raw_bytes': raw_bytes,
+            'stored_bytes': stored_bytes,
+            'ratio': round(stored_bytes / raw_bytes, 3) if raw_bytes else None,
+        }
+
+        #Size figures used by eviction: file cache budget, largest entries, what was removed so far
+        stats['eviction'] = {
+            'file_cache_bytes': file_cache_bytes,
+            'max_file_cache_mb': self.max_file_cache_mb,
+            'over_budget': bool(self.max_file_cache_mb) and file_cache_bytes > self.max_file_cache_mb * 1024 * 1024,
+            'largest_entries': [{'key': key, 'size': size} for size, key in largest_files[:5]],
+            'expired_removed': size_stats['expired_removed'],
+            'size_evicted': size_stats['size_evicted'],
+            'size_evicted_bytes': size_stats['size_evicted_bytes'],
+        }
+
         #Add Backend Details
         stats['backend_info'] = backend_info
 
@@ -406,10 +708,11 @@ class AdaptiveCacheSystem:
         
         #Clear File Cache
         cleared_files = 0
+        remaining = []
         for cache_file in self.cache_dir.glob("*.pkl"):
             try:
                 with open(cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
+                    cache_data = self._decode_payload(f.read())
                 
                 symbol = cache_data['metadata'].get('symbol', '')
                 data_type = cache_data['metadata'].get('data_type', 'stock_data')
@@ -418,11 +721,35 @@ class AdaptiveCacheSystem:
                 if not self._is_cache_valid(cache_data['timestamp'], ttl_seconds):
                     cache_file.unlink()
                     cleared_files += 1
+                else:
+                    stat = cache_file.stat()
+                    remaining.append((stat.st_mtime, stat.st_size, cache_file))
                     
             except Exception as e:
                 self.logger.error(f"Failed to clear cache file{cache_file}: {e}")
         
+        self._count_sizes(expired_removed=cleared_files)
         self.logger.info(f"File cache cleanup complete, delete{cleared_files}Expiry file")
+
+        #Keep the file cache within its size budget, oldest entries first
+        if self.max_file_cache_mb > 0:
+            budget = self.max_file_cache_mb * 1024 * 1024
+            total = sum(size for _, size, _ in remaining)
+            evicted = 0
+            for _, size, cache_file in sorted(remaining, key=lambda item: item[0]):
+                if total <= budget:
+                    break
+                try:
+                    cache_file.unlink()
+                except OSError as e:
+                    self.logger.error(f"Failed to clear cache file{cache_file}: {e}")
+                    continue
+                total -= size
+                evicted += 1
+                self._count_sizes(size_evicted=1, size_evicted_bytes=size)
+            if evicted:
+                self.logger.info(f"File cache evicted {evicted} files, size after eviction: {round(total / (1024 * 1024), 2)}MB "
+                                 f"(budget {self.max_file_cache_mb}MB)")
         
         #MongoDB automatically cleans out expired documents (through extires at fields)
         #Redis automatically cleans out expired keys.
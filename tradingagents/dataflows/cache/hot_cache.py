@@ -0,0 +1,272 @@
+"""In-process hot cache tier
+
+A least-recently-used store of recently loaded or saved cache entries, kept in
+front of IntegratedCacheManager so repeated lookups skip the file/Redis/MongoDB
+round-trip and deserialization. It is bounded by the estimated memory size of
+its values rather than by entry count.
+
+Expiry follows the trading session of the symbol's market instead of fixed hours:
+
+- while a session is running (the last one extended by a close buffer), entries
+  expire at the next bar boundary counted from the session open, so intraday
+  data is at most one bar old;
+- outside sessions (lunch break, after the close, weekends, holidays) prices do
+  not move, so entries stay valid until the next session opens;
+- news does not follow the session and expires at wall-clock boundaries.
+
+Entries filled from a lower tier may have been written before the close, so
+they are also re-read from that tier at least every ``fill_ttl_minutes``.
+"""
+
+import math
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from tradingagents.config.runtime_settings import get_bool, get_int
+from tradingagents.dataflows.trading_calendar import MARKETS, TradingCalendar, get_trading_calendar
+from tradingagents.utils.logging_manager import get_logger
+from tradingagents.utils.stock_utils import StockMarket, StockUtils
+
+logger = get_logger('agents')
+
+#Data types whose freshness does not depend on the trading session
+SESSION_INDEPENDENT_TYPES = frozenset({"news_data"})
+
+_MARKET_CODES = {StockMarket.CHINA_A: "CN", StockMarket.HONG_KONG: "HK"}
+
+
+def market_of(symbol: str) -> str:
+    """Trading calendar market of a symbol (unknown formats count as US, like the file cache)"""
+    return _MARKET_CODES.get(StockUtils.identify_stock_market(symbol), "US")
+
+
+def _next_boundary(moment: datetime, anchor: datetime, minutes: int) -> datetime:
+    step = max(1, minutes) * 60
+    elapsed = (moment - anchor).total_seconds()
+    return anchor + timedelta(seconds=(math.floor(elapsed / step) + 1) * step)
+
+
+class SessionTTLPolicy:
+    """Expiry times of hot cache entries derived from market sessions"""
+
+    def __init__(self, bar_minutes: int = 5, close_buffer_minutes: int = 30, news_minutes: int = 30,
+                 calendar: Optional[TradingCalendar] = None):
+        self.bar_minutes = bar_minutes
+        self.close_buffer_minutes = close_buffer_minutes
+        self.news_minutes = news_minutes
+        self._calendar = calendar
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        return self._calendar or get_trading_calendar()
+
+    def expires_at(self, market: str, data_type: str = "stock_data", now: Optional[datetime] = None) -> datetime:
+        """When an entry of ``market``/``data_type`` stored at ``now`` stops being valid (market-local time)"""
+        calendar = self.calendar
+        local = calendar.local_now(market, now)
+        if data_type in SESSION_INDEPENDENT_TYPES:
+            midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+            return _next_boundary(local, midnight, self.news_minutes)
+
+        sessions = MARKETS[market].sessions
+        day = local.date()
+        if calendar.is_trading_day(day, market):
+            for index, (begin, finish) in enumerate(sessions):
+                start = datetime.combine(day, begin, local.tzinfo)
+                end = datetime.combine(day, finish, local.tzinfo)
+                if index == len(sessions) - 1:
+                    end += timedelta(minutes=self.close_buffer_minutes)
+                if local < start:
+                    #Before the open or during the lunch break: nothing trades until this session starts
+                    return start
+                if local < end:
+                    return min(_next_boundary(local, start, self.bar_minutes), end)
+        next_day = calendar.next_trading_day(day, market)
+        return datetime.combine(next_day, sessions[0][0], local.tzinfo)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+@dataclass
+class _HotEntry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class HotCache:
+    """Byte-bounded LRU of cache entries with session-driven expiry"""
+
+    #Lookup aliases and metadata of keys seen but not loaded yet are kept for this many keys
+    MAX_KEYS_TRACKED = 8192
+
+    def __init__(self, max_bytes: int, policy: Optional[SessionTTLPolicy] = None,
+                 fill_ttl_minutes: int = 60, max_entry_fraction: float = 0.25):
+        self.max_bytes = max_bytes
+        self.policy = policy or SessionTTLPolicy()
+        self.fill_ttl_seconds = fill_ttl_minutes * 60
+        #A single value may not take more than this share of the budget, so one large frame cannot flush the tier
+        self.max_entry_bytes = int(max_bytes * max_entry_fraction)
+        self._entries: "OrderedDict[str, _HotEntry]" = OrderedDict()
+        self._known: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._aliases: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'puts': 0, 'rejected': 0,
+                       'evictions': 0, 'evicted_bytes': 0}
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        #Callers are free to modify the frames they get back
+        return value.copy() if isinstance(value, pd.DataFrame) else value
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        """Cached value, or None when missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            if entry.expires_at <= now:
+                self._drop(cache_key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self._stats['hits'] += 1
+            value = entry.value
+        return self._copy(value)
+
+    def put(self, cache_key: str, value: Any, symbol: str, data_type: str = "stock_data",
+            lookup: Optional[Hashable] = None, max_ttl_seconds: Optional[float] = None,
+            now: Optional[datetime] = None) -> bool:
+        """Store a value whose expiry follows the session of ``symbol``'s market"""
+        if value is None or cache_key is None:
+            return False
+        expires_at = self.policy.expires_at(market_of(symbol), data_type, now).timestamp()
+        if max_ttl_seconds is not None:
+            expires_at = min(expires_at, (now.timestamp() if now else time.time()) + max_ttl_seconds)
+        size = estimate_size(value)
+
+        with self._lock:
+            self._remember(cache_key, symbol, data_type, lookup)
+            if size > self.max_entry_bytes:
+                self._stats['rejected'] += 1
+                return False
+            self._drop(cache_key)
+            self._entries[cache_key] = _HotEntry(self._copy(value), size, expires_at)
+            self._bytes += size
+            self._stats['puts'] += 1
+            self._evict()
+        return True
+
+    def remember(self, cache_key: str, symbol: str, data_type: str = "stock_data",
+                 lookup: Optional[Hashable] = None) -> None:
+        """Record what ``cache_key`` holds (and the lookup that found it) before its value is loaded"""
+        with self._lock:
+            self._remember(cache_key, symbol, data_type, lookup)
+
+    def fill(self, cache_key: str, value: Any) -> bool:
+        """Store a value loaded from a lower tier, when its symbol is known"""
+        with self._lock:
+            known = self._known.get(cache_key)
+        if known is None:
+            return False
+        symbol, data_type = known
+        return self.put(cache_key, value, symbol, data_type, max_ttl_seconds=self.fill_ttl_seconds)
+
+    def find(self, lookup: Hashable) -> Optional[str]:
+        """Cache key previously found for ``lookup``, when its value is still hot"""
+        now = time.time()
+        with self._lock:
+            cache_key = self._aliases.get(lookup)
+            entry = self._entries.get(cache_key) if cache_key is not None else None
+            if entry is None or entry.expires_at <= now:
+                return None
+            return cache_key
+
+    def _remember(self, cache_key: str, symbol: str, data_type: str, lookup: Optional[Hashable]) -> None:
+        self._known[cache_key] = (symbol, data_type)
+        self._known.move_to_end(cache_key)
+        if len(self._known) > self.MAX_KEYS_TRACKED:
+            self._known.popitem(last=False)
+        if lookup is not None:
+            self._aliases[lookup] = cache_key
+            self._aliases.move_to_end(lookup)
+            if len(self._aliases) > self.MAX_KEYS_TRACKED:
+                self._aliases.popitem(last=False)
+
+    def _drop(self, cache_key: str) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats['evictions'] += 1
+            self._stats['evicted_bytes'] += entry.size
+
+    def invalidate(self, cache_key: str) -> None:
+        with self._lock:
+            self._drop(cache_key)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries now instead of on their next lookup"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+            for key in expired:
+                self._drop(key)
+            self._stats['expired'] += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._known.clear()
+            self._aliases.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else None
+        stats['bar_minutes'] = self.policy.bar_minutes
+        return stats
+
+
+def create_hot_cache() -> Optional[HotCache]:
+    """Hot tier configured from the environment, or None when TA_HOT_CACHE_ENABLED is off"""
+    if not get_bool("TA_HOT_CACHE_ENABLED", None, True):
+        return None
+    policy = SessionTTLPolicy(
+        bar_minutes=get_int("TA_HOT_CACHE_BAR_MINUTES", None, 5),
+        close_buffer_minutes=get_int("TA_HOT_CACHE_CLOSE_BUFFER_MINUTES", None, 30),
+        news_minutes=get_int("TA_HOT_CACHE_NEWS_MINUTES", None, 30),
+    )
+    max_bytes = get_int("TA_HOT_CACHE_MAX_MB", None, 128) * 1024 * 1024
+    logger.info(f"[Hot cache] enabled: {max_bytes // (1024 * 1024)}MB, bar {policy.bar_minutes} min")
+    return HotCache(max_bytes, policy, fill_ttl_minutes=get_int("TA_HOT_CACHE_FILL_TTL_MINUTES", None, 60))
@@ -7,7 +7,7 @@ Provide backward compatible interfaces
 import os
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 
 #Import Unified Log System
@@ -15,6 +15,7 @@ from tradingagents.utils.logging_init import setup_dataflow_logging
 
 #Import old cache system
 from .file_cache import StockDataCache
+from .hot_cache import HotCache, create_hot_cache
 
 #Import self-adapted cache system
 try:
@@ -50,6 +51,9 @@ class IntegratedCacheManager:
                 self.use_adaptive = False
         else:
             self.logger.info("Self-adapted cache system not available, use traditional file cache")
+
+        #In-process hot tier in front of both systems (None when disabled)
+        self.hot_cache: Optional[HotCache] = create_hot_cache()
         
         #Show Current Configuration
         self._log_cache_status()
@@ -68,6 +72,33 @@ class IntegratedCacheManager:
             self.logger.info(f"Deduction support:{'Enabled' if self.adaptive_cache.fallback_enabled else 'Disable'}")
         else:
             self.logger.info("Use the traditional file cache system")
+
+    def _put_hot(self, cache_key: Optional[str], data: Any, symbol: str, data_type: str, lookup=None) -> None:
+        if self.hot_cache is not None and cache_key:
+            self.hot_cache.put(cache_key, data, symbol, data_type, lookup=lookup)
+
+    def _load_through_hot(self, cache_key: str, loader) -> Optional[Any]:
+        """Serve ``cache_key`` from the hot tier, or load it with ``loader`` and keep it there"""
+        if self.hot_cache is None or not cache_key:
+            return loader(cache_key)
+        data = self.hot_cache.get(cache_key)
+        if data is not None:
+            return data
+        data = loader(cache_key)
+        if data is not None:
+            self.hot_cache.fill(cache_key, data)
+        return data
+
+    def _find_through_hot(self, lookup, symbol: str, data_type: str, finder) -> Optional[str]:
+        """Cache key of a hot entry matching ``lookup``, or the one ``finder`` returns"""
+        if self.hot_cache is not None:
+            cache_key = self.hot_cache.find(lookup)
+            if cache_key:
+                return cache_key
+        cache_key = finder()
+        if cache_key and self.hot_cache is not None:
+            self.hot_cache.remember(cache_key, symbol, data_type, lookup)
+        return cache_key
     
     def save_stock_data(self, symbol: str, data: Any, start_date: str = None, 
                        end_date: str = None, data_source: str = "default") -> str:
@@ -85,7 +116,7 @@ class IntegratedCacheManager:
         """
         if self.use_adaptive:
             #Use self-adapted cache system
-            return self.adaptive_cache.save_data(
+            cache_key = self.adaptive_cache.save_data(
                 symbol=symbol,
                 data=data,
                 start_date=start_date or "",
@@ -95,13 +126,16 @@ class IntegratedCacheManager:
             )
         else:
             #Use of traditional cache systems
-            return self.legacy_cache.save_stock_data(
+            cache_key = self.legacy_cache.save_stock_data(
                 symbol=symbol,
                 data=data,
                 start_date=start_date,
                 end_date=end_date,
                 data_source=data_source
             )
+        self._put_hot(cache_key, data, symbol, "stock_data",
+                      lookup=("stock_data", symbol, start_date or "", end_date or "", data_source))
+        return cache_key
     
     def load_stock_data(self, cache_key: str) -> Optional[Any]:
         """Loading stock data from cache
@@ -114,11 +148,66 @@ class IntegratedCacheManager:
         """
         if self.use_adaptive:
             #Use self-adapted cache system
-            return self.adaptive_cache.load_data(cache_key)
+            return self._load_through_hot(cache_key, self.adaptive_cache.load_data)
         else:
             #Use of traditional cache systems
-            return self.legacy_cache.load_stock_data(cache_key)
+            return self._load_through_hot(cache_key, self.legacy_cache.load_stock_data)
     
+    def save_stock_data_many(self, items: Dict[str, Any], start_date: str = None,
+                             end_date: str = None, data_source: str = "default") -> List[str]:
+        """Save stock data of several symbols sharing one date range
+
+        Args:
+            items: {symbol: data}
+
+        Returns:
+            Cache keys in input order
+        """
+        if self.use_adaptive:
+            cache_keys = self.adaptive_cache.save_many(
+                items,
+                start_date=start_date or "",
+                end_date=end_date or "",
+                data_source=data_source,
+                data_type="stock_data"
+            )
+        else:
+            cache_keys = [
+                self.legacy_cache.save_stock_data(symbol=symbol, data=data, start_date=start_date,
+                                                  end_date=end_date, data_source=data_source)
+                for symbol, data in items.items()
+            ]
+        for cache_key, (symbol, data) in zip(cache_keys, items.items()):
+            self._put_hot(cache_key, data, symbol, "stock_data",
+                          lookup=("stock_data", symbol, start_date or "", end_date or "", data_source))
+        return cache_keys
+
+    def load_stock_data_many(self, cache_keys: List[str]) -> Dict[str, Any]:
+        """Load several cache keys at once; misses are left out of the result"""
+        loaded = {}
+        if self.hot_cache is not None:
+            for cache_key in cache_keys:
+                data = self.hot_cache.get(cache_key)
+                if data is not None:
+                    loaded[cache_key] = data
+        missing = [cache_key for cache_key in cache_keys if cache_key not in loaded]
+        if not missing:
+            return loaded
+
+        if self.use_adaptive:
+            fetched = self.adaptive_cache.load_many(missing)
+        else:
+            fetched = {}
+            for cache_key in missing:
+                data = self.legacy_cache.load_stock_data(cache_key)
+                if data is not None:
+                    fetched[cache_key] = data
+        if self.hot_cache is not None:
+            for cache_key, data in fetched.items():
+                self.hot_cache.fill(cache_key, data)
+        loaded.update(fetched)
+        return loaded
+
     def find_cached_stock_data(self, symbol: str, start_date: str = None, 
                               end_date: str = None, data_source: str = "default") -> Optional[str]:
         """Find cached stock data
@@ -132,61 +221,69 @@ class IntegratedCacheManager:
         Returns:
             Cache keys or None
         """
-        if self.use_adaptive:
-            #Use self-adapted cache system
-            return self.adaptive_cache.find_cached_data(
-                symbol=symbol,
-                start_date=start_date or "",
-                end_date=end_date or "",
-                data_source=data_source,
-                data_type="stock_data"
-            )
-        else:
-            #Use of traditional cache systems
-            return self.legacy_cache.find_cached_stock_data(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                data_source=data_source
-            )
+        def find() -> Optional[str]:
+            if self.use_adaptive:
+                #Use self-adapted cache system
+                return self.adaptive_cache.find_cached_data(
+                    symbol=symbol,
+                    start_date=start_date or "",
+                    end_date=end_date or "",
+                    data_source=data_source,
+                    data_type="stock_data"
+                )
+            else:
+                #Use of traditional cache systems
+                return self.legacy_cache.find_cached_stock_data(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    data_source=data_source
+                )
+
+        lookup = ("stock_data", symbol, start_date or "", end_date or "", data_source)
+        return self._find_through_hot(lookup, symbol, "stock_data", find)
     
     def save_news_data(self, symbol: str, data: Any, data_source: str = "default") -> str:
         """Preservation of news data"""
         if self.use_adaptive:
-            return self.adaptive_cache.save_data(
+            cache_key = self.adaptive_cache.save_data(
                 symbol=symbol,
                 data=data,
                 data_source=data_source,
                 data_type="news_data"
             )
         else:
-            return self.legacy_cache.save_news_data(symbol, data, data_source)
+            cache_key = self.legacy_cache.save_news_data(symbol, data, data_source)
+        self._put_hot(cache_key, data, symbol, "news_data")
+        return cache_key
     
     def load_news_data(self, cache_key: str) -> Optional[Any]:
         """Loading news data"""
         if self.use_adaptive:
-            return self.adaptive_cache.load_data(cache_key)
+            return self._load_through_hot(cache_key, self.adaptive_cache.load_data)
         else:
-            return self.legacy_cache.load_news_data(cache_key)
+            return self._load_through_hot(cache_key, self.legacy_cache.load_news_data)
     
     def save_fundamentals_data(self, symbol: str, data: Any, data_source: str = "default") -> str:
         """Save base face data"""
         if self.use_adaptive:
-            return self.adaptive_cache.save_data(
+            cache_key = self.adaptive_cache.save_data(
                 symbol=symbol,
                 data=data,
                 data_source=data_source,
                 data_type="fundamentals_data"
             )
         else:
-            return self.legacy_cache.save_fundamentals_data(symbol, data, data_source)
+            cache_key = self.legacy_cache.save_fundamentals_data(symbol, data, data_source)
+        self._put_hot(cache_key, data, symbol, "fundamentals_data", lookup=("fundamentals_data", symbol, data_source))
+        return cache_key
     
     def load_fundamentals_data(self, cache_key: str) -> Optional[Any]:
         """Load Basic Face Data"""
         if self.use_adaptive:
-            return self.adaptive_cache.load_data(cache_key)
+            return self._load_through_hot(cache_key, self.adaptive_cache.load_data)
         else:
-            return self.legacy_cache.load_fundamentals_data(cache_key)
+            return self._load_through_hot(cache_key, self.legacy_cache.load_fundamentals_data)
 
     def find_cached_fundamentals_data(self, symbol: str, data_source: str = None,
                                      max_age_hours: int = None) -> Optional[str]:
@@ -200,11 +297,14 @@ class IntegratedCacheManager:
         Returns:
             Cache key: return the cache key if a valid cache is found, otherwise return the None
         """
-        if self.use_adaptive:
+        def find() -> Optional[str]:
             #Unsupported search function for custom cache, downgraded to file cache
             return self.legacy_cache.find_cached_fundamentals_data(symbol, data_source, max_age_hours)
-        else:
-            return self.legacy_cache.find_cached_fundamentals_data(symbol, data_source, max_age_hours)
+
+        #An explicit maximum age is checked against the lower tier, which knows when the data was written
+        if max_age_hours is not None:
+            return find()
+        return self._find_through_hot(("fundamentals_data", symbol, data_source), symbol, "fundamentals_data", find)
 
     def is_fundamentals_cache_valid(self, symbol: str, data_source: str = None,
                                    max_age_hours: int = None) -> bool:
@@ -237,6 +337,7 @@ class IntegratedCacheManager:
             stats['backend_info']['database_available'] = self.db_manager.is_database_available()
             stats['backend_info']['mongodb_available'] = self.db_manager.is_mongodb_available()
             stats['backend_info']['redis_available'] = self.db_manager.is_redis_available()
+            stats['hot_cache'] = self.hot_cache.stats() if self.hot_cache is not None else None
 
             return stats
         else:
@@ -253,11 +354,14 @@ class IntegratedCacheManager:
             stats['backend_info']['database_available'] = False
             stats['backend_info']['mongodb_available'] = False
             stats['backend_info']['redis_available'] = False
+            stats['hot_cache'] = self.hot_cache.stats() if self.hot_cache is not None else None
 
             return stats
     
     def clear_expired_cache(self):
         """Clear Expired Cache"""
+        if self.hot_cache is not None:
+            self.hot_cache.purge_expired()
         if self.use_adaptive:
             self.adaptive_cache.clear_expired_cache()
 
@@ -275,6 +379,10 @@ class IntegratedCacheManager:
         """
         cleared_count = 0
 
+        #Hot entries may be copies of the records removed below
+        if self.hot_cache is not None:
+            self.hot_cache.clear()
+
         #1. Clean-up of the Redis cache
         if self.use_adaptive and self.db_manager.is_redis_available():
             try:
@@ -0,0 +1,168 @@
+"""Keyed on-disk cache store (SQLite)
+
+One row per key instead of one JSON document for the whole cache:
+
+- ``set`` writes a single row in its own transaction (atomic, no full rewrite);
+- entries carry their own expiry (TTL) and are evicted least-recently-used
+  once the store holds more than ``max_entries``;
+- the database runs in WAL mode with a busy timeout, so the API process and the
+  worker processes can read and write the same file concurrently.
+
+Values are pickled, so DataFrames can be stored as well as plain data. When the
+file cannot be opened (read-only or broken disk) the store degrades to an
+in-memory database and the caller keeps working without persistence.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+#Import Log Module
+from tradingagents.utils.logging_manager import get_logger
+logger = get_logger('agents')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class KeyValueStore:
+    """SQLite-backed key/value cache with TTL and LRU eviction"""
+
+    #Reads refresh the LRU timestamp at most this often per key, to keep reads mostly write-free
+    TOUCH_INTERVAL_SECONDS = 60
+    #Eviction runs every N writes rather than on each one
+    EVICT_EVERY_WRITES = 32
+
+    def __init__(self, path: str, default_ttl: float = 3600, max_entries: int = 10000,
+                 busy_timeout: float = 10.0):
+        self.path = path
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = self._connect(path, busy_timeout)
+
+    def _connect(self, path: str, busy_timeout: float) -> sqlite3.Connection:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            return conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[KV cache] {path} unavailable, using an in-memory store: {e}")
+            conn = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value, or ``default`` when missing or expired"""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return default
+                value, expires_at, accessed_at = row
+                if expires_at <= now:
+                    self._conn.execute("DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now))
+                    return default
+                if now - accessed_at > self.TOUCH_INTERVAL_SECONDS:
+                    self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return pickle.loads(value)
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.debug(f"[KV cache] Reading {key} failed: {e}")
+            return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (the store default when None)"""
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, payload, expires_at, now),
+                )
+                self._writes += 1
+                if self._writes % self.EVICT_EVERY_WRITES == 0:
+                    self._evict(now)
+            return True
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"[KV cache] Writing {key} failed: {e}")
+            return False
+
+    def set_many(self, items: Iterable[Tuple[str, Any, Optional[float]]]) -> int:
+        """Store several (key, value, ttl) entries in one transaction"""
+        now = time.time()
+        rows = [
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+             now + (self.default_ttl if ttl is None else ttl), now)
+            for key, value, ttl in items
+        ]
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._evict(now)
+            return len(rows)
+        except sqlite3.Error as e:
+            logger.debug(f"[KV cache] Batch write failed: {e}")
+            return 0
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond ``max_entries``"""
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM entries WHERE key IN ("
+            " SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            total, expired = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at <= ?), 0) FROM entries", (now,)
+            ).fetchone()
+        return {"path": self.path, "entries": total, "expired": expired, "max_entries": self.max_entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,9 +5,11 @@ To check the completeness of historical data, to include the latest transaction
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
 import pandas as pd
 
+from tradingagents.dataflows.data_result import StockDataResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,7 @@ class DataCompletenessChecker:
     def check_data_completeness(
         self,
         symbol: str,
-        data: str,
+        data: Union[str, pd.DataFrame, StockDataResult],
         start_date: str,
         end_date: str,
         market: str = "CN"
@@ -29,7 +31,7 @@ class DataCompletenessChecker:
 
         Args:
             symbol: stock code
-            Data: Data string
+            Data: StockDataResult / DataFrame (preferred) or legacy data string
             Start date: Start date (YYYYY-MM-DD)
             End date: End Date (YYYYY-MM-DD)
             Market type (CN/HK/US)
@@ -54,19 +56,28 @@ class DataCompletenessChecker:
             "completeness_ratio": 0.0
         }
         
-        #1. Check for empty or erroneous data
-        if not data or "❌" in data or "错误" in data or "获取失败" in data:
+        #1. Check for empty or erroneous data (structured results carry their status)
+        if isinstance(data, StockDataResult):
+            if not data.ok:
+                return False, "数据为空或包含错误", details
+            data = data.data
+        elif isinstance(data, str):
+            if not data or "❌" in data or "错误" in data or "获取失败" in data:
+                return False, "数据为空或包含错误", details
+        elif data is None:
             return False, "数据为空或包含错误", details
         
-        #2. Attempt to interpret data
+        #2. Use the DataFrame directly; only legacy strings need parsing
         try:
-            df = self._parse_data_to_dataframe(data)
+            df = data.copy() if isinstance(data, pd.DataFrame) else self._parse_data_to_dataframe(data)
             if df is None or df.empty:
                 return False, "无法解析数据或数据为空", details
             
             details["data_rows"] = len(df)
             
             #3. Date range in data acquisition
+            if isinstance(df.index, pd.DatetimeIndex) and 'date' not in df.columns and 'trade_date' not in df.columns:
+                df = df.rename_axis('date').reset_index()
             if 'date' in df.columns:
                 date_col = 'date'
             elif 'trade_date' in df.columns:
@@ -187,32 +198,11 @@ class DataCompletenessChecker:
     def _get_latest_trade_date(self, market: str = "CN") -> Optional[str]:
         """Get the latest transaction date"""
         try:
-            if market == "CN":
-                #Unit A: use Tushare to find the latest transaction date
-                from tradingagents.dataflows.providers.china.tushare import TushareProvider
-                import asyncio
-                
-                provider = TushareProvider()
-                if provider.is_available():
-                    loop = asyncio.get_event_loop()
-                    if loop.is_closed():
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                    
-                    latest_date = loop.run_until_complete(provider.find_latest_trade_date())
-                    if latest_date:
-                        return latest_date
-            
-            #Alternative scenario: assuming the latest trading date is today or yesterday (in the case of the weekend, push forward)
-            today = datetime.now()
-            for delta in range(0, 5):  #Five days at most.
-                check_date = today - timedelta(days=delta)
-                #Skip weekend
-                if check_date.weekday() < 5:  #0-4 is Monday to Friday.
-                    return check_date.strftime('%Y-%m-%d')
-            
-            return None
-            
+            #Local trading calendar: no provider or event loop per call, holidays included
+            from tradingagents.dataflows.trading_calendar import get_trading_calendar
+
+            return get_trading_calendar().latest_trade_date(market).strftime('%Y-%m-%d')
+
         except Exception as e:
             self.logger.error(f"The latest trading day failed:{e}")
             return None
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Structured data results
+The data layer returns the DataFrame together with its source, range and error status;
+text for the LLM is rendered only when asked for (``to_text()`` / ``str()``).
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+@dataclass
+class StockDataResult:
+    """Historical quotes of one symbol as returned by the data layer"""
+
+    symbol: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    period: str = "daily"
+    data: Optional[pd.DataFrame] = None
+    source: Optional[str] = None
+    stock_name: Optional[str] = None
+    error: Optional[str] = None
+    #Renders the report for the LLM; called at most once
+    renderer: Optional[Callable[["StockDataResult"], str]] = field(default=None, repr=False, compare=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the result carries usable data"""
+        return self.error is None and self.data is not None and not self.data.empty
+
+    @property
+    def rows(self) -> int:
+        return 0 if self.data is None else len(self.data)
+
+    @classmethod
+    def failure(cls, symbol: str, error: str, **kwargs) -> "StockDataResult":
+        return cls(symbol=symbol, error=error, **kwargs)
+
+    def to_text(self) -> str:
+        """Formatted report (or the error line) for the LLM boundary"""
+        if self._text is None:
+            if not self.ok:
+                self._text = f"❌ {self.error or f'未获取到{self.symbol}的有效数据'}"
+            elif self.renderer is not None:
+                self._text = self.renderer(self)
+            else:
+                self._text = self.data.to_string(index=False)
+        return self._text
+
+    def __str__(self) -> str:
+        return self.to_text()
@@ -22,6 +22,8 @@ logger = setup_dataflow_logging()
 
 #Import Unified Data Source Encoding
 from tradingagents.constants import DataSourceCode
+from tradingagents.dataflows.data_result import StockDataResult
+from tradingagents.utils.process_pool import run_cpu_bound
 
 
 class ChinaDataSource(Enum):
@@ -680,7 +682,8 @@ class DataSourceManager:
         except Exception:
             return 0
 
-    def _format_stock_data_response(self, data: pd.DataFrame, symbol: str, stock_name: str,
+    @staticmethod
+    def _format_stock_data_response(data: pd.DataFrame, symbol: str, stock_name: str,
                                     start_date: str, end_date: str) -> str:
         """Formatting of stock data responses (including technical indicators)
         Args:
@@ -898,7 +901,7 @@ class DataSourceManager:
             result += f"   平均价: ¥{display_data['close'].mean():.2f}\n"
 
             #Defensive access to traffic data
-            volume_value = self._get_volume_safely(display_data)
+            volume_value = DataSourceManager._get_volume_safely(display_data)
             result += f"   平均成交量: {volume_value:,.0f}股\n"
 
             return result
@@ -1033,9 +1036,17 @@ class DataSourceManager:
             period: data cycle (daily/weekly/monthly), default is Daily
 
         Returns:
-            str: Formatted Stock Data
+            str: Formatted Stock Data (rendered from get_stock_data_result)
+        """
+        return self.get_stock_data_result(symbol, start_date, end_date, period).to_text()
+
+    def get_stock_data_result(self, symbol: str, start_date: str = None, end_date: str = None,
+                              period: str = "daily") -> StockDataResult:
+        """Structured variant of get_stock_data: DataFrame, source, range and error status
+
+        Text is only rendered when the caller asks for it (result.to_text()), so consumers that
+        need the DataFrame never go through a DataFrame→string→DataFrame round trip.
         """
-        #Record detailed input parameters
         logger.info(f"[Data source:{self.current_source.value}Start acquisition{period}Data:{symbol}",
                    extra={
                        'symbol': symbol,
@@ -1046,305 +1057,189 @@ class DataSourceManager:
                        'event_type': 'data_fetch_start'
                    })
 
-        #Add detailed stock code tracking log
-        logger.info(f"DataSurceManager.get stock data received stock code: '{symbol}' (type:{type(symbol)})")
-        logger.info(f"[Equal code tracking]{len(str(symbol))}")
-        logger.info(f"[Equal code tracking]{list(str(symbol))}")
-        logger.info(f"Current data source:{self.current_source.value}")
-
         start_time = time.time()
-
-        try:
-            #Call for appropriate acquisition methods based on data sources
-            actual_source = None  #Data sources actually used
-
-            if self.current_source == ChinaDataSource.MONGODB:
-                result, actual_source = self._get_mongodb_data(symbol, start_date, end_date, period)
-            elif self.current_source == ChinaDataSource.TUSHARE:
-                logger.info(f"[Equal code tracking]{symbol}', period='{period}'")
-                result = self._get_tushare_data(symbol, start_date, end_date, period)
-                actual_source = "tushare"
-            elif self.current_source == ChinaDataSource.AKSHARE:
-                result = self._get_akshare_data(symbol, start_date, end_date, period)
-                actual_source = "akshare"
-            elif self.current_source == ChinaDataSource.BAOSTOCK:
-                result = self._get_baostock_data(symbol, start_date, end_date, period)
-                actual_source = "baostock"
-            #TDX removed
-            else:
-                result = f"❌ 不支持的数据源: {self.current_source.value}"
-                actual_source = None
-
-            #Record detailed output results
-            duration = time.time() - start_time
-            result_length = len(result) if result else 0
-            is_success = result and "❌" not in result and "错误" not in result
-
-            #Use the actual data source name or, if not, the current source
-            display_source = actual_source or self.current_source.value
-
-            if is_success:
-                logger.info(f"[Data source:{display_source}Successful access to stock data:{symbol} ({result_length}Character, time-consuming{duration:.2f}sec)",
-                           extra={
-                               'symbol': symbol,
-                               'start_date': start_date,
-                               'end_date': end_date,
-                               'data_source': display_source,
-                               'actual_source': actual_source,
-                               'requested_source': self.current_source.value,
-                               'duration': duration,
-                               'result_length': result_length,
-                               'result_preview': result[:200] + '...' if result_length > 200 else result,
-                               'event_type': 'data_fetch_success'
-                           })
-                return result
-            else:
-                logger.warning(f"[Data source:{self.current_source.value}Failed] Data quality abnormal, trying to downgrade to other data sources:{symbol}",
-                              extra={
-                                  'symbol': symbol,
-                                  'start_date': start_date,
-                                  'end_date': end_date,
-                                  'data_source': self.current_source.value,
-                                  'duration': duration,
-                                  'result_length': result_length,
-                                  'result_preview': result[:200] + '...' if result_length > 200 else result,
-                                  'event_type': 'data_fetch_warning'
-                              })
-
-                #When data quality is abnormal, attempts are made to downgrade to other data sources.
-                fallback_result = self._try_fallback_sources(symbol, start_date, end_date)
-                if fallback_result and "❌" not in fallback_result and "错误" not in fallback_result:
-                    logger.info(f"✅ [data source: secondary data source]{symbol}")
-                    return fallback_result
-                else:
-                    logger.error(f"All data sources are unable to obtain valid data:{symbol}")
-                    return result  #Returns original result (includes error information)
-
-        except Exception as e:
+        result = self._fetch_stock_result(self.current_source, symbol, start_date, end_date, period)
+        duration = time.time() - start_time
+
+        if not result.ok:
+            logger.warning(f"[Data source:{self.current_source.value}Failed] Data quality abnormal, trying to downgrade to other data sources:{symbol}",
+                          extra={
+                              'symbol': symbol,
+                              'start_date': start_date,
+                              'end_date': end_date,
+                              'data_source': self.current_source.value,
+                              'duration': duration,
+                              'error': result.error,
+                              'event_type': 'data_fetch_warning'
+                          })
+            fallback = self._try_fallback_results(symbol, start_date, end_date, period)
+            if not fallback.ok:
+                logger.error(f"All data sources are unable to obtain valid data:{symbol}")
+                #MongoDB only reports a cache miss, the fallback error is more useful
+                return fallback if self.current_source == ChinaDataSource.MONGODB else result
+            result = fallback
             duration = time.time() - start_time
-            logger.error(f"[data acquisition]{e}",
-                        extra={
-                            'symbol': symbol,
-                            'start_date': start_date,
-                            'end_date': end_date,
-                            'data_source': self.current_source.value,
-                            'duration': duration,
-                            'error': str(e),
-                            'event_type': 'data_fetch_exception'
-                        }, exc_info=True)
-            return self._try_fallback_sources(symbol, start_date, end_date)
-
-    def _get_mongodb_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> tuple[str, str | None]:
-        """Obtain multi-cycle data from MongoDB - with calculation of technical indicators
-        Returns:
-            tuple[str, str|None]: (result string, actual data source name)
-        """
-        logger.debug(f"[MongoDB] Call parameters: symbol={symbol}, start_date={start_date}, end_date={end_date}, period={period}")
 
+        logger.info(f"[Data source:{result.source}Successful access to stock data:{symbol} ({result.rows}rows, time-consuming{duration:.2f}sec)",
+                   extra={
+                       'symbol': symbol,
+                       'start_date': start_date,
+                       'end_date': end_date,
+                       'data_source': result.source,
+                       'actual_source': result.source,
+                       'requested_source': self.current_source.value,
+                       'duration': duration,
+                       'rows': result.rows,
+                       'event_type': 'data_fetch_success'
+                   })
+        return result
+
+    def _fetch_stock_result(self, source: ChinaDataSource, symbol: str, start_date: str, end_date: str,
+                            period: str = "daily") -> StockDataResult:
+        """Fetch one source as a StockDataResult, never raising"""
+        fetchers = {
+            ChinaDataSource.MONGODB: self._fetch_mongodb_result,
+            ChinaDataSource.TUSHARE: self._fetch_tushare_result,
+            ChinaDataSource.AKSHARE: self._fetch_akshare_result,
+            ChinaDataSource.BAOSTOCK: self._fetch_baostock_result,
+        }
+        fetcher = fetchers.get(source)
+        if fetcher is None:
+            return StockDataResult.failure(symbol, f"不支持的数据源: {source.value}", start_date=start_date,
+                                           end_date=end_date, period=period)
         try:
-            from tradingagents.dataflows.cache.mongodb_cache_adapter import get_mongodb_cache_adapter
-            adapter = get_mongodb_cache_adapter()
-
-            #Get historical data from MongoDB for the specified cycle
-            df = adapter.get_historical_data(symbol, start_date, end_date, period=period)
-
-            if df is not None and not df.empty:
-                logger.info(f"✅ [Data source: MongoDB cache]{period}Data:{symbol} ({len(df)}(on file)")
-
-                #🔧 fixation: using a uniform format, including technical indicators
-                #Obtain stock names (draw or use default values from DataFrame)
-                stock_name = f'股票{symbol}'
-                if 'name' in df.columns and not df['name'].empty:
-                    stock_name = df['name'].iloc[0]
-
-                #Call for harmonized formatting (including technical indicator calculations)
-                result = self._format_stock_data_response(df, symbol, stock_name, start_date, end_date)
-
-                logger.info(f"[MongoDB] Calculated technical indicators: MA5/10/20/60, MACD, RSI, BOLL")
-                return result, "mongodb"
-            else:
-                #MongoDB does not have data (detailed data sources are recorded internally) and downgrades to other data sources
-                logger.info(f"[MongoDB]{period}Data:{symbol}Start trying the backup data source.")
-                return self._try_fallback_sources(symbol, start_date, end_date, period)
-
+            return fetcher(symbol, start_date, end_date, period)
         except Exception as e:
-            logger.error(f"❌{period}Data failed:{symbol}, Error:{e}")
-            #MongoDB anomaly down to other data sources
-            return self._try_fallback_sources(symbol, start_date, end_date, period)
-
-    def _get_tushare_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
-        """Get multi-cycle data using Tushare - use programr+ unified cache"""
-        logger.debug(f"[Tushare] Call parameter: symbol={symbol}, start_date={start_date}, end_date={end_date}, period={period}")
-
-        #Add detailed stock code tracking log
-        logger.info(f"🔍 [Securities Code Tracking]  get tushare data received stock codes: '{symbol}' (type:{type(symbol)})")
-        logger.info(f"[Equal code tracking]{len(str(symbol))}")
-        logger.info(f"[Equal code tracking]{list(str(symbol))}")
-        logger.info(f"get tushare data")
-        logger.info(f"Current data source:{self.current_source.value}")
-
-        start_time = time.time()
+            logger.error(f"[{source.value}] Call failed:{symbol}, Error:{e}", exc_info=True)
+            return StockDataResult.failure(symbol, f"{source.value}获取{symbol}数据失败: {e}", start_date=start_date,
+                                           end_date=end_date, period=period, source=source.value)
+
+    def _stock_result(self, data: Optional[pd.DataFrame], symbol: str, start_date: str, end_date: str, period: str,
+                      source: str, stock_name: Optional[str] = None, error: Optional[str] = None) -> StockDataResult:
+        """Wrap a provider DataFrame; the report is rendered lazily with technical indicators"""
+        if data is None or data.empty:
+            return StockDataResult.failure(symbol, error or f"未获取到{symbol}的有效数据", start_date=start_date,
+                                           end_date=end_date, period=period, source=source)
+        return StockDataResult(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            data=data,
+            source=source,
+            stock_name=stock_name or f'股票{symbol}',
+            #Indicator computation is CPU-bound: runs in the process pool when enabled
+            renderer=lambda r: run_cpu_bound(self._format_stock_data_response,
+                                             r.data, r.symbol, r.stock_name, r.start_date, r.end_date),
+        )
+
+    @staticmethod
+    def _sync_event_loop():
+        """Event loop for running provider coroutines from synchronous code"""
+        import asyncio
         try:
-            #First try to get from the cache
-            cached_data = self._get_cached_data(symbol, start_date, end_date, max_age_hours=24)
-            if cached_data is not None and not cached_data.empty:
-                logger.info(f"Get it from the cache.{symbol}Data")
-                #Access to basic stock information
-                provider = self._get_tushare_adapter()
-                if provider:
-                    import asyncio
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_closed():
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                    except RuntimeError:
-                        #There is no cycle of events in the online pool. Create new
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-
-                    stock_info = loop.run_until_complete(provider.get_stock_basic_info(symbol))
-                    stock_name = stock_info.get('name', f'股票{symbol}') if stock_info else f'股票{symbol}'
-                else:
-                    stock_name = f'股票{symbol}'
-
-                #Format Return
-                return self._format_stock_data_response(cached_data, symbol, stock_name, start_date, end_date)
-
-            #Cache outstanding, obtained from provider
-            logger.info(f"[Share code tracking]{symbol}'")
-            logger.info(f"[DatasourceManager Detailed Log]")
-
-            provider = self._get_tushare_adapter()
-            if not provider:
-                return f"❌ Tushare提供器不可用"
-
-            #Access to historical data using a walk method
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                #There is no cycle of events in the online pool. Create new
+            loop = asyncio.get_event_loop()
+            if loop.is_closed():
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
+        except RuntimeError:
+            #There is no cycle of events in the online pool. Create new
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        return loop
 
-            data = loop.run_until_complete(provider.get_historical_data(symbol, start_date, end_date))
-
-            if data is not None and not data.empty:
-                #Save to Cache
-                self._save_to_cache(symbol, data, start_date, end_date)
-
-                #Access to basic stock information (shows)
-                stock_info = loop.run_until_complete(provider.get_stock_basic_info(symbol))
-                stock_name = stock_info.get('name', f'股票{symbol}') if stock_info else f'股票{symbol}'
-
-                #Format Return
-                result = self._format_stock_data_response(data, symbol, stock_name, start_date, end_date)
-
-                duration = time.time() - start_time
-                logger.info(f"[DataSourceManager Detailed Log]{duration:.3f}sec")
-                logger.info(f"[Equal code tracking]{result[:200] if result else 'None'}")
-                logger.debug(f"[Tushare]{duration:.2f}s, result length={len(result) if result else 0}")
-
-                return result
-            else:
-                result = f"❌ 未获取到{symbol}的有效数据"
-                duration = time.time() - start_time
-                logger.warning(f"[Tushare] Data not available, time-consuming={duration:.2f}s")
-                return result
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"[Tushare] Call failed:{e}time ={duration:.2f}s", exc_info=True)
-            logger.error(f"[DataSourceManager Detailed Log]{type(e).__name__}")
-            logger.error(f"[DataSourceManager Detailed Log]{str(e)}")
-            import traceback
-            logger.error(f"[DataSourceManager Detailed Log]{traceback.format_exc()}")
-            raise
-
-    def _get_akshare_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
-        """Using AKShare to access multi-cycle data - including technical indicators"""
-        logger.debug(f"[AKShare] Call parameter: symbol={symbol}, start_date={start_date}, end_date={end_date}, period={period}")
-
-        start_time = time.time()
-        try:
-            #Use an AKShare unified interface
-            from .providers.china.akshare import get_akshare_provider
-            provider = get_akshare_provider()
-
-            #Access to historical data using a walk method
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                #There is no cycle of events in the online pool. Create new
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+    def _provider_stock_name(self, loop, provider, symbol: str) -> str:
+        stock_info = loop.run_until_complete(provider.get_stock_basic_info(symbol))
+        return stock_info.get('name', f'股票{symbol}') if stock_info else f'股票{symbol}'
 
-            data = loop.run_until_complete(provider.get_historical_data(symbol, start_date, end_date, period))
+    def _fetch_mongodb_result(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> StockDataResult:
+        """Obtain multi-cycle data from MongoDB"""
+        from tradingagents.dataflows.cache.mongodb_cache_adapter import get_mongodb_cache_adapter
+        adapter = get_mongodb_cache_adapter()
 
-            duration = time.time() - start_time
+        df = adapter.get_historical_data(symbol, start_date, end_date, period=period)
+        if df is None or df.empty:
+            logger.info(f"[MongoDB]{period}Data:{symbol}Start trying the backup data source.")
+            return StockDataResult.failure(symbol, f"MongoDB中没有{symbol}的{period}数据", start_date=start_date,
+                                           end_date=end_date, period=period, source="mongodb")
+
+        logger.info(f"✅ [Data source: MongoDB cache]{period}Data:{symbol} ({len(df)}(on file)")
+        stock_name = None
+        if 'name' in df.columns and not df['name'].empty:
+            stock_name = df['name'].iloc[0]
+        return self._stock_result(df, symbol, start_date, end_date, period, "mongodb", stock_name)
+
+    def _fetch_tushare_result(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> StockDataResult:
+        """Get multi-cycle data using Tushare - use provider + unified cache"""
+        provider = self._get_tushare_adapter()
+
+        #First try to get from the cache
+        data = self._get_cached_data(symbol, start_date, end_date, max_age_hours=24)
+        if data is not None and not data.empty:
+            logger.info(f"Get it from the cache.{symbol}Data")
+            stock_name = self._provider_stock_name(self._sync_event_loop(), provider, symbol) if provider else None
+            return self._stock_result(data, symbol, start_date, end_date, period, "tushare", stock_name)
 
-            if data is not None and not data.empty:
-                #🔧 fixation: using a uniform format, including technical indicators
-                #Access to basic stock information
-                stock_info = loop.run_until_complete(provider.get_stock_basic_info(symbol))
-                stock_name = stock_info.get('name', f'股票{symbol}') if stock_info else f'股票{symbol}'
+        if not provider:
+            return StockDataResult.failure(symbol, "Tushare提供器不可用", start_date=start_date, end_date=end_date,
+                                           period=period, source="tushare")
 
-                #Call for harmonized formatting (including technical indicator calculations)
-                result = self._format_stock_data_response(data, symbol, stock_name, start_date, end_date)
+        loop = self._sync_event_loop()
+        data = loop.run_until_complete(provider.get_historical_data(symbol, start_date, end_date))
+        if data is None or data.empty:
+            return self._stock_result(None, symbol, start_date, end_date, period, "tushare")
 
-                logger.debug(f"[AKShare] Call success: Time-consuming ={duration:.2f}s, data bar ={len(data)}, result length ={len(result)}")
-                logger.info(f"✅ [AKShare] Calculated technical indicators: MA5/10/20/60, MACD, RSI, BOLL")
-                return result
-            else:
-                result = f"❌ 未能获取{symbol}的股票数据"
-                logger.warning(f"[AKShare] Data is empty: time-consuming={duration:.2f}s")
-                return result
+        self._save_to_cache(symbol, data, start_date, end_date)
+        stock_name = self._provider_stock_name(loop, provider, symbol)
+        return self._stock_result(data, symbol, start_date, end_date, period, "tushare", stock_name)
 
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"[AKShare] Call failed:{e}time ={duration:.2f}s", exc_info=True)
-            return f"❌ AKShare获取{symbol}数据失败: {e}"
+    def _fetch_akshare_result(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> StockDataResult:
+        """Using AKShare to access multi-cycle data"""
+        from .providers.china.akshare import get_akshare_provider
+        provider = get_akshare_provider()
 
-    def _get_baostock_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
-        """Obtain multi-cycle data using BaoStock - with technical indicators"""
-        #Use the BaoStock unified interface
+        loop = self._sync_event_loop()
+        data = loop.run_until_complete(provider.get_historical_data(symbol, start_date, end_date, period))
+        if data is None or data.empty:
+            return self._stock_result(None, symbol, start_date, end_date, period, "akshare",
+                                      error=f"未能获取{symbol}的股票数据")
+        stock_name = self._provider_stock_name(loop, provider, symbol)
+        return self._stock_result(data, symbol, start_date, end_date, period, "akshare", stock_name)
+
+    def _fetch_baostock_result(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> StockDataResult:
+        """Obtain multi-cycle data using BaoStock"""
         from .providers.china.baostock import get_baostock_provider
         provider = get_baostock_provider()
 
-        #Access to historical data using a walk method
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            #There is no cycle of events in the online pool. Create new
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
+        loop = self._sync_event_loop()
         data = loop.run_until_complete(provider.get_historical_data(symbol, start_date, end_date, period))
+        if data is None or data.empty:
+            return self._stock_result(None, symbol, start_date, end_date, period, "baostock",
+                                      error=f"未能获取{symbol}的股票数据")
+        stock_name = self._provider_stock_name(loop, provider, symbol)
+        return self._stock_result(data, symbol, start_date, end_date, period, "baostock", stock_name)
 
-        if data is not None and not data.empty:
-            #🔧 fixation: using a uniform format, including technical indicators
-            #Access to basic stock information
-            stock_info = loop.run_until_complete(provider.get_stock_basic_info(symbol))
-            stock_name = stock_info.get('name', f'股票{symbol}') if stock_info else f'股票{symbol}'
+    def _get_mongodb_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> tuple[str, str | None]:
+        """Obtain multi-cycle data from MongoDB (text form, falls back to other sources)
+        Returns:
+            tuple[str, str|None]: (result string, actual data source name)
+        """
+        result = self._fetch_stock_result(ChinaDataSource.MONGODB, symbol, start_date, end_date, period)
+        if not result.ok:
+            return self._try_fallback_sources(symbol, start_date, end_date, period)
+        return result.to_text(), result.source
 
-            #Call for harmonized formatting (including technical indicator calculations)
-            result = self._format_stock_data_response(data, symbol, stock_name, start_date, end_date)
+    def _get_tushare_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
+        """Get multi-cycle data using Tushare (text form)"""
+        return self._fetch_stock_result(ChinaDataSource.TUSHARE, symbol, start_date, end_date, period).to_text()
 
-            logger.info(f"✅ [BaoStock] Calculated technical indicators: MA5/10/20/60, MACD, RSI, BOLL")
-            return result
-        else:
-            return f"❌ 未能获取{symbol}的股票数据"
+    def _get_akshare_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
+        """Using AKShare to access multi-cycle data (text form)"""
+        return self._fetch_stock_result(ChinaDataSource.AKSHARE, symbol, start_date, end_date, period).to_text()
+
+    def _get_baostock_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
+        """Obtain multi-cycle data using BaoStock (text form)"""
+        return self._fetch_stock_result(ChinaDataSource.BAOSTOCK, symbol, start_date, end_date, period).to_text()
 
     #TDX data acquisition method removed
     # def _get_tdx_data(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> str:
@@ -1352,7 +1247,8 @@ class DataSourceManager:
     #Logger.error (f "❌ TDX data source no longer supported")
     #Turn f "The TDX data source is no longer supported"
 
-    def _get_volume_safely(self, data) -> float:
+    @staticmethod
+    def _get_volume_safely(data) -> float:
         """Secure access to traffic data to support multiple listings"""
         try:
             #Support for multiple possible trade listings
@@ -1371,47 +1267,35 @@ class DataSourceManager:
             logger.error(f"Could not close temporary folder: %s{e}")
             return 0
 
-    def _try_fallback_sources(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> tuple[str, str | None]:
-        """Try backup data source - avoid recursive callback
-
-        Returns:
-            tuple[str, str|None]: (result string, actual data source name)
-        """
+    def _try_fallback_results(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> StockDataResult:
+        """Try backup data sources in priority order, judged on the result status rather than the text"""
         logger.info(f"🔄 [{self.current_source.value}Failure to attempt secondary data source acquisition{period}Data:{symbol}")
 
-        # Data source priority (identify market according to stock code)
         #Note: MongoDB is not included because MongoDB is the highest priority and does not try if it fails
-        fallback_order = self._get_data_source_priority_order(symbol)
-
-        for source in fallback_order:
-            if source != self.current_source and source in self.available_china_sources:
-                try:
-                    logger.info(f"[Reserve data source]{source.value}Access{period}Data:{symbol}")
-
-                    #Directly calls specific data source methods to avoid regression
-                    if source == ChinaDataSource.TUSHARE:
-                        result = self._get_tushare_data(symbol, start_date, end_date, period)
-                    elif source == ChinaDataSource.AKSHARE:
-                        result = self._get_akshare_data(symbol, start_date, end_date, period)
-                    elif source == ChinaDataSource.BAOSTOCK:
-                        result = self._get_baostock_data(symbol, start_date, end_date, period)
-                    #TDX removed
-                    else:
-                        logger.warning(f"Unknown data source:{source.value}")
-                        continue
+        for source in self._get_data_source_priority_order(symbol):
+            if source == self.current_source or source not in self.available_china_sources:
+                continue
+            if source == ChinaDataSource.MONGODB:
+                continue
+            logger.info(f"[Reserve data source]{source.value}Access{period}Data:{symbol}")
+            result = self._fetch_stock_result(source, symbol, start_date, end_date, period)
+            if result.ok:
+                logger.info(f"[Reserve data source--]{source.value}Successful access{period}Data:{symbol}")
+                return result
+            logger.warning(f"[Reserve data source--]{source.value}Return error result:{symbol}")
 
-                    if "❌" not in result:
-                        logger.info(f"[Reserve data source--]{source.value}Successful access{period}Data:{symbol}")
-                        return result, source.value  #Returns results and actual data sources used
-                    else:
-                        logger.warning(f"[Reserve data source--]{source.value}Return error result:{symbol}")
+        logger.error(f"[All data sources fail]{period}Data:{symbol}")
+        return StockDataResult.failure(symbol, f"所有数据源都无法获取{symbol}的{period}数据", start_date=start_date,
+                                       end_date=end_date, period=period)
 
-                except Exception as e:
-                    logger.error(f"[Reserve data source--]{source.value}Acquisition failure:{symbol}, Error:{e}")
-                    continue
+    def _try_fallback_sources(self, symbol: str, start_date: str, end_date: str, period: str = "daily") -> tuple[str, str | None]:
+        """Try backup data source - avoid recursive callback
 
-        logger.error(f"[All data sources fail]{period}Data:{symbol}")
-        return f"❌ 所有数据源都无法获取{symbol}的{period}数据", None
+        Returns:
+            tuple[str, str|None]: (result string, actual data source name)
+        """
+        result = self._try_fallback_results(symbol, start_date, end_date, period)
+        return result.to_text(), result.source if result.ok else None
 
     def get_stock_info(self, symbol: str) -> Dict:
         """Access to stock basic information to support multiple data sources and automatic downgrading
@@ -1693,7 +1577,7 @@ class DataSourceManager:
     def _get_baostock_stock_info(self, symbol: str) -> Dict:
         """Access to basic stock information using BaoStock"""
         try:
-            import baostock as bs
+            from .providers.china.baostock_session import BaoStockLoginError, get_baostock_session
 
             #Convert stock code format
             if symbol.startswith('6'):
@@ -1701,26 +1585,17 @@ class DataSourceManager:
             else:
                 bs_code = f"sz.{symbol}"
 
-            #Login BaoStock
-            lg = bs.login()
-            if lg.error_code != '0':
-                logger.error(f"BaoStock login failed:{lg.error_msg}")
+            #Search for stock base information on the shared BaoStock session
+            try:
+                rs = get_baostock_session().query("query_stock_basic", code=bs_code)
+            except BaoStockLoginError as e:
+                logger.error(f"BaoStock login failed:{e}")
                 return {'symbol': symbol, 'name': f'股票{symbol}', 'source': 'baostock'}
-
-            #Search for stock base information
-            rs = bs.query_stock_basic(code=bs_code)
-            if rs.error_code != '0':
-                bs.logout()
+            if not rs.ok:
                 logger.error(f"BaoStock failed:{rs.error_msg}")
                 return {'symbol': symbol, 'name': f'股票{symbol}', 'source': 'baostock'}
 
-            #Parsing Results
-            data_list = []
-            while (rs.error_code == '0') & rs.next():
-                data_list.append(rs.get_row_data())
-
-            #Logout
-            bs.logout()
+            data_list = rs.rows
 
             if data_list:
                 #BaoStock returns format: [code, code name, ipoDate, outDate, type, status]
@@ -2123,6 +1998,22 @@ def get_data_source_manager() -> DataSourceManager:
     return _data_source_manager
 
 
+def get_china_stock_data_result(symbol: str, start_date: str, end_date: str) -> StockDataResult:
+    """Unified Chinese stock access interface returning the structured result
+
+    Args:
+        symbol: stock code
+        Start date: Start date
+        End date: End date
+
+    Returns:
+        StockDataResult: DataFrame, source and status; call to_text() for the LLM report
+    """
+    manager = get_data_source_manager()
+    logger.info(f"Call manager.get stock data, input parameter: symbol='{symbol}', start_date='{start_date}', end_date='{end_date}'")
+    return manager.get_stock_data_result(symbol, start_date, end_date)
+
+
 def get_china_stock_data_unified(symbol: str, start_date: str, end_date: str) -> str:
     """Unified Chinese stock access interface
     Automatically use configured data sources to support backup data Source
@@ -2143,9 +2034,7 @@ def get_china_stock_data_unified(symbol: str, start_date: str, end_date: str) ->
     logger.info(f"[Equal code tracking]{len(str(symbol))}")
     logger.info(f"[Equal code tracking]{list(str(symbol))}")
 
-    manager = get_data_source_manager()
-    logger.info(f"Call manager.get stock data, input parameter: symbol='{symbol}', start_date='{start_date}', end_date='{end_date}'")
-    result = manager.get_stock_data(symbol, start_date, end_date)
+    result = get_china_stock_data_result(symbol, start_date, end_date).to_text()
     #Detailed information for analysis of return results
     if result:
         lines = result.split('\n')
@@ -0,0 +1,147 @@
+"""Derived financial metrics computed over statement history
+
+Income statements arrive as lists of dicts with year-to-date (cumulative)
+values per reporting period. This module lays them out as one columnar frame
+indexed by (symbol, end_date) and derives, for every symbol and period at once:
+
+- ``<field>_ttm``: trailing twelve months
+  (annual report: the value itself; otherwise
+  last annual report + current YTD - same period last year)
+- ``<field>_single``: single-quarter value (YTD minus the previous quarter's YTD)
+- ``<field>_yoy``: YTD growth against the same period last year (%)
+- ``<field>_qoq``: single-quarter growth against the previous quarter (%)
+- ``gross_margin_ttm`` / ``net_margin_ttm``: margins on TTM values (%)
+
+Every metric is a handful of index lookups and column arithmetic, so the cost
+does not grow with nested per-period searches. Financial sync stores the
+results with the statements; analyses read them instead of recomputing.
+"""
+
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+#Output name -> income statement column (Tushare naming)
+DEFAULT_FIELDS = {
+    "revenue": "revenue",
+    "net_profit": "n_income_attr_p",
+    "oper_cost": "oper_cost",
+}
+
+_PREVIOUS_QUARTER = {"0630": "0331", "0930": "0630", "1231": "0930"}
+
+
+def statements_frame(statements_by_symbol: Mapping[str, Iterable[Dict[str, Any]]],
+                     fields: Mapping[str, str] = DEFAULT_FIELDS) -> pd.DataFrame:
+    """Columnar statement history indexed by (symbol, end_date)
+
+    Duplicate periods of a symbol keep the first record, like the provider lists
+    (latest revision first). Non-numeric values become NaN.
+    """
+    records = []
+    for symbol, statements in statements_by_symbol.items():
+        for stmt in statements or []:
+            end_date = str(stmt.get("end_date") or "")
+            if len(end_date) != 8:
+                continue
+            row = {"symbol": symbol, "end_date": end_date}
+            for name, column in fields.items():
+                row[name] = stmt.get(column)
+            records.append(row)
+
+    frame = pd.DataFrame.from_records(records, columns=["symbol", "end_date", *fields])
+    frame = frame.drop_duplicates(["symbol", "end_date"], keep="first")
+    for name in fields:
+        frame[name] = pd.to_numeric(frame[name], errors="coerce").astype(float)
+    return frame.set_index(["symbol", "end_date"]).sort_index()
+
+
+def _positions(keys: pd.Index, symbols: np.ndarray, periods: pd.Series) -> np.ndarray:
+    """Row positions of (symbol, period) pairs; -1 where the period is missing"""
+    return keys.get_indexer(symbols + "|" + periods.to_numpy(dtype=object))
+
+
+def _take(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    taken = values[positions]
+    taken[positions < 0] = np.nan
+    return taken
+
+
+def _growth(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (current - previous) / np.abs(previous) * 100
+    return np.where(np.isfinite(growth), growth, np.nan)
+
+
+def compute_financial_metrics(frame: pd.DataFrame,
+                              fields: Iterable[str] = tuple(DEFAULT_FIELDS)) -> pd.DataFrame:
+    """TTM, single-quarter, YoY/QoQ growth and margins for every (symbol, end_date)"""
+    symbols = frame.index.get_level_values("symbol").to_numpy(dtype=object).astype(str).astype(object)
+    periods = pd.Series(frame.index.get_level_values("end_date"), dtype=str)
+    keys = pd.Index(symbols + "|" + periods.to_numpy(dtype=object))
+    years = periods.str[:4].astype(int)
+    month_day = periods.str[4:]
+
+    #Lookup positions are shared by all fields: same period last year, last annual report,
+    #previous quarter end (same year for Q2-Q4, last year's annual report for Q1)
+    last_annual = (years - 1).astype(str) + "1231"
+    previous_quarter = (years.astype(str) + month_day.map(_PREVIOUS_QUARTER).fillna("")).where(
+        month_day != "0331", last_annual)
+    same_last_year_pos = _positions(keys, symbols, (years - 1).astype(str) + month_day)
+    last_annual_pos = _positions(keys, symbols, last_annual)
+    previous_quarter_pos = _positions(keys, symbols, previous_quarter)
+    is_annual = (month_day == "1231").to_numpy()
+    is_first_quarter = (month_day == "0331").to_numpy()
+
+    result: Dict[str, np.ndarray] = {}
+    for name in fields:
+        if name not in frame:
+            continue
+        value = frame[name].to_numpy(dtype=float)
+        previous_ytd = _take(value, same_last_year_pos)
+        base = _take(value, last_annual_pos)
+        result[f"{name}_ttm"] = np.where(is_annual, value, base + value - previous_ytd)
+
+        #YTD values are cumulative: a quarter is its YTD minus the previous quarter's (Q1 is its own)
+        single = np.where(is_first_quarter, value, value - _take(value, previous_quarter_pos))
+        result[f"{name}_single"] = single
+        result[f"{name}_yoy"] = _growth(value, previous_ytd)
+        result[f"{name}_qoq"] = _growth(single, _take(single, previous_quarter_pos))
+
+    if "revenue_ttm" in result:
+        revenue_ttm = result["revenue_ttm"]
+        valid = revenue_ttm > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if "net_profit_ttm" in result:
+                margin = result["net_profit_ttm"] / revenue_ttm * 100
+                result["net_margin_ttm"] = np.where(valid, margin, np.nan)
+            if "oper_cost_ttm" in result:
+                margin = (revenue_ttm - result["oper_cost_ttm"]) / revenue_ttm * 100
+                result["gross_margin_ttm"] = np.where(valid, margin, np.nan)
+    return pd.DataFrame(result, index=frame.index)
+
+
+def latest_metrics(metrics: pd.DataFrame) -> Dict[str, Dict[str, Optional[float]]]:
+    """Metrics of each symbol's latest reporting period, NaN as None"""
+    if metrics.empty:
+        return {}
+    #Rows are sorted by (symbol, end_date): a symbol's latest period is its last row
+    symbols = metrics.index.get_level_values("symbol")
+    last_rows = np.flatnonzero(np.append(symbols[1:] != symbols[:-1], True))
+    names = list(metrics.columns)
+    values = metrics.to_numpy(dtype=float)[last_rows]
+
+    latest = {}
+    for row, position in zip(values, last_rows):
+        symbol, end_date = metrics.index[position]
+        latest[symbol] = {name: (None if np.isnan(value) else float(value)) for name, value in zip(names, row)}
+        latest[symbol]["metrics_period"] = end_date
+    return latest
+
+
+def compute_latest_metrics(statements_by_symbol: Mapping[str, Iterable[Dict[str, Any]]],
+                           fields: Mapping[str, str] = DEFAULT_FIELDS) -> Dict[str, Dict[str, Optional[float]]]:
+    """Latest-period metrics for many symbols in one vectorized pass"""
+    frame = statements_frame(statements_by_symbol, fields)
+    return latest_metrics(compute_financial_metrics(frame, fields.keys()))
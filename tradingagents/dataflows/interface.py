@@ -1565,14 +1565,16 @@ def get_china_stock_data_unified(
     start_time = time.time()
 
     try:
-        from .data_source_manager import get_china_stock_data_unified
+        from .data_source_manager import get_china_stock_data_result
 
-        result = get_china_stock_data_unified(ticker, start_date, end_date)
+        data_result = get_china_stock_data_result(ticker, start_date, end_date)
+        #Text is rendered only here, at the LLM boundary
+        result = data_result.to_text()
 
         #Record detailed output results
         duration = time.time() - start_time
         result_length = len(result) if result else 0
-        is_success = result and "❌" not in result and "错误" not in result
+        is_success = data_result.ok
 
         if is_success:
             logger.info(f"✅ [Unified interface] Chinese stock data acquisition success",
@@ -0,0 +1,301 @@
+"""CJK-aware full-text search for the news and social media collections
+
+MongoDB's default ``$text`` index does not segment Chinese, so a keyword such as
+"新能源" never matches "新能源汽车销量". Instead every document carries its own
+postings, written together with the document:
+
+- ``search_terms``: distinct terms (Chinese character bigrams, lower-cased Latin words / numbers)
+- ``search_tf``: field-weighted term frequencies, aligned with ``search_terms``
+- ``search_len``: weighted document length
+
+A multikey compound index on ``(search_terms, symbol, publish_time)`` turns this
+into an inverted index with symbol/time filters pushed into the same index scan.
+Ranked searches score the matching candidates with BM25; plain keyword filters
+(``query_news``) use ``$all`` over the keyword's terms.
+"""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS = ("search_terms", "search_tf", "search_len")
+SEARCH_INDEX_KEYS = [("search_terms", 1), ("symbol", 1), ("publish_time", -1)]
+SEARCH_INDEX_NAME = "search_terms_symbol_time"
+
+#(field, weight): titles and tags count more than body text
+NEWS_TEXT_FIELDS: Tuple[Tuple[str, int], ...] = (("title", 3), ("summary", 1), ("content", 1), ("keywords", 2))
+SOCIAL_TEXT_FIELDS: Tuple[Tuple[str, int], ...] = (("content", 1), ("hashtags", 2), ("keywords", 2), ("topics", 2))
+
+#Only the head of long bodies is indexed, which keeps the postings per document bounded
+MAX_FIELD_CHARS = 2000
+#Upper bound of candidates scored per query, shared between the query terms (most recent first)
+MAX_CANDIDATES = 2000
+#Corpus statistics (document count, average length) are refreshed at most this often
+STATS_TTL_SECONDS = 600
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[a-z0-9]+(?:[.\-][a-z0-9]+)*")
+_CJK_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+RESULT_PROJECTION = {field: 0 for field in SEARCH_FIELDS}
+SCORING_PROJECTION = {"search_terms": 1, "search_tf": 1, "search_len": 1, "publish_time": 1}
+
+_corpus_stats: Dict[str, Tuple[float, int, float]] = {}
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text into search terms: CJK runs become character bigrams, other runs stay whole words"""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple, set)):
+        text = " ".join(str(item) for item in text if item)
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall(str(text)[:MAX_FIELD_CHARS].lower()):
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif len(run) > 1 or run.isdigit():
+            tokens.append(run)
+    return tokens
+
+
+def tokenize_query(text: str) -> List[str]:
+    """Distinct query terms in their original order"""
+    return list(dict.fromkeys(tokenize(text)))
+
+
+def build_search_fields(doc: Dict[str, Any], text_fields: Sequence[Tuple[str, int]] = NEWS_TEXT_FIELDS) -> Dict[str, Any]:
+    """Postings to store on the document itself"""
+    counts: Counter = Counter()
+    for field, weight in text_fields:
+        for token in tokenize(doc.get(field)):
+            counts[token] += weight
+    terms = sorted(counts)
+    return {
+        "search_terms": terms,
+        "search_tf": [counts[t] for t in terms],
+        "search_len": sum(counts.values()),
+    }
+
+
+def strip_search_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    for field in SEARCH_FIELDS:
+        doc.pop(field, None)
+    return doc
+
+
+def keyword_filter(keywords: Iterable[str],
+                   text_fields: Sequence[Tuple[str, int]] = NEWS_TEXT_FIELDS) -> Optional[Dict[str, Any]]:
+    """Mongo condition matching any of the keywords (each keyword needs all of its terms)
+
+    Keywords without index terms (a single Latin letter, punctuation) fall back to a
+    case-insensitive substring match on the text fields instead of being dropped.
+    """
+    clauses = []
+    for keyword in keywords:
+        terms = tokenize_query(keyword)
+        if terms:
+            clauses.append({"search_terms": {"$all": terms}})
+        elif keyword and keyword.strip():
+            pattern = {"$regex": re.escape(keyword.strip()), "$options": "i"}
+            clauses.append({"$or": [{field: pattern} for field, _ in text_fields]})
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def bm25_rank(candidates: List[Dict[str, Any]], terms: Sequence[str], doc_freq: Dict[str, int],
+              total_docs: int, avg_len: float, k1: float = BM25_K1, b: float = BM25_B) -> List[Tuple[float, Dict[str, Any]]]:
+    """Score candidates with BM25, best first (newer first on ties)"""
+    total_docs = max(total_docs, len(candidates), 1)
+    avg_len = avg_len or 1.0
+    idf = {
+        t: math.log(1 + (total_docs - doc_freq.get(t, 0) + 0.5) / (doc_freq.get(t, 0) + 0.5))
+        for t in terms
+    }
+    ranked = []
+    for doc in candidates:
+        tf_map = dict(zip(doc.get("search_terms") or [], doc.get("search_tf") or []))
+        norm = k1 * (1 - b + b * (doc.get("search_len") or 1) / avg_len)
+        score = 0.0
+        for t in terms:
+            tf = tf_map.get(t)
+            if tf:
+                score += idf[t] * tf * (k1 + 1) / (tf + norm)
+        if score > 0:
+            ranked.append((score, doc))
+    ranked.sort(key=lambda item: (item[0], _sort_time(item[1])), reverse=True)
+    return ranked
+
+
+def _sort_time(doc: Dict[str, Any]) -> float:
+    value = doc.get("publish_time")
+    return value.timestamp() if hasattr(value, "timestamp") else 0.0
+
+
+def _stats_key(collection) -> str:
+    return getattr(collection, "full_name", None) or getattr(collection, "name", None) or str(id(collection))
+
+
+_STATS_PIPELINE = [
+    {"$match": {"search_len": {"$gt": 0}}},
+    {"$group": {"_id": None, "total": {"$sum": 1}, "avg_len": {"$avg": "$search_len"}}},
+]
+
+
+def _cached_stats(collection) -> Optional[Tuple[int, float]]:
+    cached = _corpus_stats.get(_stats_key(collection))
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    return None
+
+
+def _store_stats(collection, rows: List[Dict[str, Any]]) -> Tuple[int, float]:
+    row = rows[0] if rows else {}
+    total, avg_len = int(row.get("total") or 0), float(row.get("avg_len") or 1.0)
+    _corpus_stats[_stats_key(collection)] = (time.monotonic() + STATS_TTL_SECONDS, total, avg_len)
+    return total, avg_len
+
+
+def _terms_by_rarity(terms: Sequence[str], doc_freq: Dict[str, int]) -> List[str]:
+    """Terms that occur at all, rarest first
+
+    Candidates are selected per term, each term taking its share of the remaining
+    budget, so a common bigram cannot crowd the documents of a rare (high IDF) term
+    out of the candidate set. Rare terms usually need less than their share, which
+    leaves more for the common ones.
+    """
+    return sorted((t for t in terms if doc_freq.get(t)), key=lambda t: doc_freq[t])
+
+
+def _ranked_results(ranked: List[Tuple[float, Dict[str, Any]]], docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    by_id = {doc["_id"]: doc for doc in docs}
+    results = []
+    for score, candidate in ranked:
+        doc = by_id.get(candidate["_id"])
+        if doc is not None:
+            doc["score"] = round(score, 4)
+            results.append(doc)
+    return results
+
+
+def search_sync(collection, query_text: str, filters: Optional[Dict[str, Any]] = None, limit: int = 20,
+                skip: int = 0, candidate_limit: int = MAX_CANDIDATES,
+                match_all_if_empty: bool = False) -> List[Dict[str, Any]]:
+    """BM25 search on a pymongo collection
+
+    Without query terms nothing is returned, or with ``match_all_if_empty`` the newest
+    documents matching ``filters``.
+    """
+    filters = dict(filters or {})
+    terms = tokenize_query(query_text)
+    if not terms:
+        if not match_all_if_empty:
+            return []
+        cursor = collection.find(filters, RESULT_PROJECTION).sort("publish_time", -1).skip(skip).limit(limit)
+        return list(cursor)
+
+    doc_freq = {t: collection.count_documents({"search_terms": t}) for t in terms}
+    candidates: Dict[Any, Dict[str, Any]] = {}
+    ordered, budget = _terms_by_rarity(terms, doc_freq), candidate_limit
+    for index, term in enumerate(ordered):
+        if budget <= 0:
+            break
+        quota = max(1, budget // (len(ordered) - index))
+        cursor = collection.find({**filters, "search_terms": term}, SCORING_PROJECTION)
+        docs = list(cursor.sort("publish_time", -1).limit(quota))
+        for doc in docs:
+            candidates.setdefault(doc["_id"], doc)
+        budget -= len(docs)
+    if not candidates:
+        return []
+    stats = _cached_stats(collection) or _store_stats(collection, list(collection.aggregate(_STATS_PIPELINE)))
+    ranked = bm25_rank(list(candidates.values()), terms, doc_freq, *stats)[skip:skip + limit]
+    docs = list(collection.find({"_id": {"$in": [d["_id"] for _, d in ranked]}}, RESULT_PROJECTION))
+    return _ranked_results(ranked, docs)
+
+
+async def search_async(collection, query_text: str, filters: Optional[Dict[str, Any]] = None, limit: int = 20,
+                       skip: int = 0, candidate_limit: int = MAX_CANDIDATES,
+                       match_all_if_empty: bool = False) -> List[Dict[str, Any]]:
+    """BM25 search on a motor collection (same semantics as search_sync)"""
+    filters = dict(filters or {})
+    terms = tokenize_query(query_text)
+    if not terms:
+        if not match_all_if_empty:
+            return []
+        cursor = collection.find(filters, RESULT_PROJECTION).sort("publish_time", -1).skip(skip).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    doc_freq = {t: await collection.count_documents({"search_terms": t}) for t in terms}
+    candidates: Dict[Any, Dict[str, Any]] = {}
+    ordered, budget = _terms_by_rarity(terms, doc_freq), candidate_limit
+    for index, term in enumerate(ordered):
+        if budget <= 0:
+            break
+        quota = max(1, budget // (len(ordered) - index))
+        cursor = collection.find({**filters, "search_terms": term}, SCORING_PROJECTION)
+        docs = await cursor.sort("publish_time", -1).limit(quota).to_list(length=quota)
+        for doc in docs:
+            candidates.setdefault(doc["_id"], doc)
+        budget -= len(docs)
+    if not candidates:
+        return []
+    stats = _cached_stats(collection)
+    if stats is None:
+        stats = _store_stats(collection, await collection.aggregate(_STATS_PIPELINE).to_list(length=1))
+    ranked = bm25_rank(list(candidates.values()), terms, doc_freq, *stats)[skip:skip + limit]
+    ids = [d["_id"] for _, d in ranked]
+    docs = await collection.find({"_id": {"$in": ids}}, RESULT_PROJECTION).to_list(length=len(ids))
+    return _ranked_results(ranked, docs)
+
+
+async def backfill_search_fields_async(collection, text_fields: Sequence[Tuple[str, int]] = NEWS_TEXT_FIELDS,
+                                       batch_size: int = 500) -> int:
+    """Add postings to documents written before the search index existed"""
+    from pymongo import UpdateOne
+
+    projection = {field: 1 for field, _ in text_fields}
+    updated = 0
+    while True:
+        cursor = collection.find({"search_terms": {"$exists": False}}, projection).limit(batch_size)
+        docs = await cursor.to_list(length=batch_size)
+        if not docs:
+            break
+        await collection.bulk_write(
+            [UpdateOne({"_id": doc["_id"]}, {"$set": build_search_fields(doc, text_fields)}) for doc in docs],
+            ordered=False,
+        )
+        updated += len(docs)
+    if updated:
+        _corpus_stats.pop(_stats_key(collection), None)
+        logger.info(f"Search index backfilled:{_stats_key(collection)} {updated} documents")
+    return updated
+
+
+def _log_backfill_result(task: "asyncio.Task") -> None:
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.warning(f"Search index backfill failed:{error}")
+
+
+def schedule_backfill(collection, text_fields: Sequence[Tuple[str, int]] = NEWS_TEXT_FIELDS) -> "asyncio.Task":
+    """Run backfill_search_fields_async in the background, logging its failure
+
+    Callers must keep the returned task: the event loop only holds a weak reference to it.
+    """
+    task = asyncio.create_task(backfill_search_fields_async(collection, text_fields))
+    task.add_done_callback(_log_backfill_result)
+    return task
@@ -532,6 +532,12 @@ class OptimizedChinaDataProvider:
 - **毛利率**: {financial_estimates['gross_margin']}
 - **净利率**: {financial_estimates['net_margin']}
 
+### 成长能力指标
+- **营业收入同比增长**: {financial_estimates.get('revenue_yoy', 'N/A')}
+- **归母净利润同比增长**: {financial_estimates.get('net_profit_yoy', 'N/A')}
+- **单季营收环比增长**: {financial_estimates.get('revenue_qoq', 'N/A')}
+- **单季净利润环比增长**: {financial_estimates.get('net_profit_qoq', 'N/A')}
+
 ### 财务健康度
 - **资产负债率**: {financial_estimates['debt_ratio']}
 - **流动比率**: {financial_estimates['current_ratio']}
@@ -591,6 +597,12 @@ class OptimizedChinaDataProvider:
 - **毛利率**: {financial_estimates.get('gross_margin', 'N/A')}
 - **净利率**: {financial_estimates.get('net_margin', 'N/A')}
 
+### 成长能力指标
+- **营业收入同比增长**: {financial_estimates.get('revenue_yoy', 'N/A')}
+- **归母净利润同比增长**: {financial_estimates.get('net_profit_yoy', 'N/A')}
+- **单季营收环比增长**: {financial_estimates.get('revenue_qoq', 'N/A')}
+- **单季净利润环比增长**: {financial_estimates.get('net_profit_qoq', 'N/A')}
+
 ### 财务健康度
 - **资产负债率**: {financial_estimates['debt_ratio']}
 - **流动比率**: {financial_estimates['current_ratio']}
@@ -1000,7 +1012,10 @@ class OptimizedChinaDataProvider:
                 metrics["roa"] = "N/A"
 
             #Māori Rate - Add Range Validation
+            #Provider indicator first, then the TTM margin precomputed during financial sync
             gross_margin = latest_indicators.get('gross_margin')
+            if gross_margin is None:
+                gross_margin = latest_indicators.get('gross_margin_ttm')
             if gross_margin is not None and str(gross_margin) != 'nan' and gross_margin != '--':
                 try:
                     gross_margin_val = float(gross_margin)
@@ -1018,6 +1033,8 @@ class OptimizedChinaDataProvider:
 
             #Net interest rate - Add range authentication
             net_margin = latest_indicators.get('netprofit_margin')
+            if net_margin is None:
+                net_margin = latest_indicators.get('net_margin_ttm')
             if net_margin is not None and str(net_margin) != 'nan' and net_margin != '--':
                 try:
                     net_margin_val = float(net_margin)
@@ -1032,6 +1049,14 @@ class OptimizedChinaDataProvider:
             else:
                 metrics["net_margin"] = "N/A"
 
+            #Growth - read the YoY/QoQ figures precomputed during financial sync instead of recomputing them
+            for growth_key in ("revenue_yoy", "net_profit_yoy", "revenue_qoq", "net_profit_qoq"):
+                growth_value = latest_indicators.get(growth_key)
+                if isinstance(growth_value, (int, float)) and growth_value == growth_value:
+                    metrics[growth_key] = f"{growth_value:+.1f}%"
+                else:
+                    metrics[growth_key] = "N/A"
+
             #Calculate PE/PB - Prefer real-time calculations, downgrade to static data
             #Fetch both PE and PE TTM indicators
             pe_value = None
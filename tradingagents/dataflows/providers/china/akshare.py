@@ -3,6 +3,9 @@ Harmonized Data Synchronization Program based on AKShare SDK, providing standard
 """
 import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
@@ -29,6 +32,11 @@ class AKShareProvider(BaseStockDataProvider):
         self.connected = False
         self._stock_list_cache = None  #Cache list of shares to avoid duplication
         self._cache_time = None  #Cache Time
+        self._financial_cache: "OrderedDict[str, tuple]" = OrderedDict()  #code -> (cached_at, financial data)
+        self._financial_inflight: Dict[tuple, asyncio.Task] = {}  #Shared in-flight fetches
+        #The provider is a singleton used from several analysis threads
+        self._financial_lock = threading.Lock()
+        self._rate_limiter = None
         self._initialize_akshare()
     
     def _initialize_akshare(self):
@@ -987,11 +995,95 @@ class AKShareProvider(BaseStockDataProvider):
             logger.error(f"Standardization{code}Historical data listing failed:{e}")
             return df
 
-    async def get_financial_data(self, code: str) -> Dict[str, Any]:
+    #(result key, akshare function, description) of the statements fetched by get_financial_data
+    _FINANCIAL_STATEMENTS = (
+        ("main_indicators", "stock_financial_abstract", "key financial indicators"),
+        ("balance_sheet", "stock_balance_sheet_by_report_em", "balance sheet"),
+        ("income_statement", "stock_profit_sheet_by_report_em", "profit statement"),
+        ("cash_flow", "stock_cash_flow_sheet_by_report_em", "cash flow statement"),
+    )
+    _FINANCIAL_CACHE_TTL = 6 * 3600  #Statements change quarterly, 6 hours is safe
+    _FINANCIAL_CACHE_MAX_ENTRIES = 256
+
+    def _get_rate_limiter(self):
+        """Shared AKShare rate limiter (None when the app layer is not available)"""
+        if self._rate_limiter is None:
+            try:
+                from app.core.rate_limiter import get_akshare_rate_limiter
+                self._rate_limiter = get_akshare_rate_limiter()
+            except Exception:
+                self._rate_limiter = False
+        return self._rate_limiter or None
+
+    async def _fetch_financial_statement(self, code: str, func_name: str, description: str):
+        """Fetch one financial statement under the rate limiter"""
+        limiter = self._get_rate_limiter()
+        if limiter is not None:
+            await limiter.acquire()
+
+        try:
+            df = await asyncio.to_thread(getattr(self.ak, func_name), symbol=code)
+            if df is not None and not df.empty:
+                logger.debug(f"✅ {code}{description} successful")
+                return df.to_dict('records')
+        except Exception as e:
+            logger.debug(f"Access{code}{description} failed:{e}")
+        return None
+
+    async def _fetch_financial_data(self, code: str) -> Dict[str, Any]:
+        """Fetch all financial statements concurrently"""
+        results = await asyncio.gather(*[
+            self._fetch_financial_statement(code, func_name, description)
+            for _, func_name, description in self._FINANCIAL_STATEMENTS
+        ])
+
+        return {
+            key: records
+            for (key, _, _), records in zip(self._FINANCIAL_STATEMENTS, results)
+            if records
+        }
+
+    def _get_cached_financial_data(self, code: str) -> Optional[Dict[str, Any]]:
+        with self._financial_lock:
+            entry = self._financial_cache.get(code)
+            if entry is None:
+                return None
+            cached_at, data = entry
+            if time.time() - cached_at > self._FINANCIAL_CACHE_TTL:
+                self._financial_cache.pop(code, None)
+                return None
+            self._financial_cache.move_to_end(code)
+            return dict(data)
+
+    def _set_cached_financial_data(self, code: str, data: Dict[str, Any]):
+        with self._financial_lock:
+            self._financial_cache[code] = (time.time(), data)
+            self._financial_cache.move_to_end(code)
+            while len(self._financial_cache) > self._FINANCIAL_CACHE_MAX_ENTRIES:
+                self._financial_cache.popitem(last=False)
+
+    def clear_financial_cache(self, code: Optional[str] = None):
+        """Clear cached financial data (all codes when code is None)"""
+        with self._financial_lock:
+            if code is None:
+                self._financial_cache.clear()
+            else:
+                self._financial_cache.pop(code, None)
+
+    def _release_inflight(self, inflight_key: tuple):
+        with self._financial_lock:
+            self._financial_inflight.pop(inflight_key, None)
+
+    async def get_financial_data(self, code: str, use_cache: bool = True) -> Dict[str, Any]:
         """Access to financial data
 
+        The four statements are fetched concurrently under the AKShare rate limiter.
+        Results are kept in a keyed cache and concurrent requests for the same code
+        share a single fetch, so sync jobs and analyses do not download twice.
+
         Args:
             code: stock code
+            use_cache: whether to serve from / share the keyed cache
 
         Returns:
             Financial data dictionary
@@ -1000,64 +1092,31 @@ class AKShareProvider(BaseStockDataProvider):
             return {}
 
         try:
-            logger.debug(f"Access{code}Financial data...")
-
-            financial_data = {}
-
-            #1. Access to key financial indicators
-            try:
-                def fetch_financial_abstract():
-                    return self.ak.stock_financial_abstract(symbol=code)
-
-                main_indicators = await asyncio.to_thread(fetch_financial_abstract)
-                if main_indicators is not None and not main_indicators.empty:
-                    financial_data['main_indicators'] = main_indicators.to_dict('records')
-                    logger.debug(f"✅ {code}Success in obtaining key financial indicators")
-            except Exception as e:
-                logger.debug(f"Access{code}Key financial indicators failed:{e}")
-
-            #2. Access to balance sheets
-            try:
-                def fetch_balance_sheet():
-                    return self.ak.stock_balance_sheet_by_report_em(symbol=code)
-
-                balance_sheet = await asyncio.to_thread(fetch_balance_sheet)
-                if balance_sheet is not None and not balance_sheet.empty:
-                    financial_data['balance_sheet'] = balance_sheet.to_dict('records')
-                    logger.debug(f"✅ {code}Balance sheet successful")
-            except Exception as e:
-                logger.debug(f"Access{code}Balance sheet failure:{e}")
-
-            #3. Obtaining profit statements
-            try:
-                def fetch_income_statement():
-                    return self.ak.stock_profit_sheet_by_report_em(symbol=code)
-
-                income_statement = await asyncio.to_thread(fetch_income_statement)
-                if income_statement is not None and not income_statement.empty:
-                    financial_data['income_statement'] = income_statement.to_dict('records')
-                    logger.debug(f"✅ {code}The profit statement was successful.")
-            except Exception as e:
-                logger.debug(f"Access{code}Loss of profit statement:{e}")
-
-            #4. Access to cash flow statements
-            try:
-                def fetch_cash_flow():
-                    return self.ak.stock_cash_flow_sheet_by_report_em(symbol=code)
-
-                cash_flow = await asyncio.to_thread(fetch_cash_flow)
-                if cash_flow is not None and not cash_flow.empty:
-                    financial_data['cash_flow'] = cash_flow.to_dict('records')
-                    logger.debug(f"✅ {code}Successful cash flow statement")
-            except Exception as e:
-                logger.debug(f"Access{code}Loss of cash flow statement:{e}")
+            if use_cache:
+                cached = self._get_cached_financial_data(code)
+                if cached is not None:
+                    logger.debug(f"⚡ {code}Financial data served from cache")
+                    return cached
+
+            loop = asyncio.get_running_loop()
+            inflight_key = (id(loop), code)
+            with self._financial_lock:
+                task = self._financial_inflight.get(inflight_key)
+                if task is None:
+                    logger.debug(f"Access{code}Financial data...")
+                    task = loop.create_task(self._fetch_financial_data(code))
+                    self._financial_inflight[inflight_key] = task
+                    task.add_done_callback(lambda _: self._release_inflight(inflight_key))
+
+            financial_data = await asyncio.shield(task)
 
             if financial_data:
+                self._set_cached_financial_data(code, financial_data)
                 logger.debug(f"✅ {code}Financial data acquisition completed:{len(financial_data)}Data sets")
             else:
                 logger.warning(f"⚠️ {code}No financial data obtained")
 
-            return financial_data
+            return dict(financial_data)
 
         except Exception as e:
             logger.error(f"Access{code}Financial data failed:{e}")
@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional, Union
 import pandas as pd
 
 from ..base_provider import BaseStockDataProvider
+from .baostock_session import BaoStockLoginError, get_baostock_session
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,7 @@ class BaoStockProvider(BaseStockDataProvider):
         super().__init__("baostock")
         self.bs = None
         self.connected = False
+        self._session = None
         self._init_baostock()
     
     def _init_baostock(self):
@@ -28,6 +30,8 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             import baostock as bs
             self.bs = bs
+            #All providers share one logged-in session (baostock keeps login state globally)
+            self._session = get_baostock_session()
             logger.info("BaoStock module loaded successfully")
             self.connected = True
         except ImportError as e:
@@ -49,10 +53,7 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             #Step Test Login
             def test_login():
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-                self.bs.logout()
+                self._session.ensure_login()
                 return True
             
             await asyncio.to_thread(test_login)
@@ -70,37 +71,28 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             logger.info("Get the BaoStock List (Sync)...")
 
-            lg = self.bs.login()
-            if lg.error_code != '0':
-                logger.error(f"BaoStock login failed:{lg.error_msg}")
-                return None
-
             try:
-                rs = self.bs.query_stock_basic()
-                if rs.error_code != '0':
-                    logger.error(f"BaoStock query failed:{rs.error_msg}")
-                    return None
-
-                data_list = []
-                while (rs.error_code == '0') & rs.next():
-                    data_list.append(rs.get_row_data())
+                rs = self._session.query("query_stock_basic")
+            except BaoStockLoginError as e:
+                logger.error(f"BaoStock login failed:{e}")
+                return None
 
-                if not data_list:
-                    logger.warning("BaoStock list is empty")
-                    return None
+            if not rs.ok:
+                logger.error(f"BaoStock query failed:{rs.error_msg}")
+                return None
 
-                #Convert to DataFrame
-                import pandas as pd
-                df = pd.DataFrame(data_list, columns=rs.fields)
+            if not rs.rows:
+                logger.warning("BaoStock list is empty")
+                return None
 
-                #Stock type reserved only (type=1)
-                df = df[df['type'] == '1']
+            #Convert to DataFrame
+            df = pd.DataFrame(rs.rows, columns=rs.fields)
 
-                logger.info(f"BaoStock List was successful:{len(df)}Only stocks")
-                return df
+            #Stock type reserved only (type=1)
+            df = df[df['type'] == '1']
 
-            finally:
-                self.bs.logout()
+            logger.info(f"BaoStock List was successful:{len(df)}Only stocks")
+            return df
 
         except Exception as e:
             logger.error(f"BaoStock failed to access the list of shares:{e}")
@@ -119,22 +111,10 @@ class BaoStockProvider(BaseStockDataProvider):
             logger.info("Get the BaoStock list...")
             
             def fetch_stock_list():
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-                
-                try:
-                    rs = self.bs.query_stock_basic()
-                    if rs.error_code != '0':
-                        raise Exception(f"查询失败: {rs.error_msg}")
-                    
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-                    
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_stock_basic")
+                if not rs.ok:
+                    raise Exception(f"查询失败: {rs.error_msg}")
+                return rs.rows, rs.fields
             
             data_list, fields = await asyncio.to_thread(fetch_stock_list)
             
@@ -228,31 +208,21 @@ class BaoStockProvider(BaseStockDataProvider):
 
             def fetch_valuation_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    #Access to valuation indicators: pETTM, pbMRQ, psTTM, pcfNcfTTM
-                    rs = self.bs.query_history_k_data_plus(
-                        code=bs_code,
-                        fields="date,code,close,peTTM,pbMRQ,psTTM,pcfNcfTTM",
-                        start_date=start_date,
-                        end_date=end_date,
-                        frequency="d",
-                        adjustflag="3"  #Right of no restoration
-                    )
-
-                    if rs.error_code != '0':
-                        raise Exception(f"查询失败: {rs.error_msg}")
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                #Access to valuation indicators: pETTM, pbMRQ, psTTM, pcfNcfTTM
+                rs = self._session.query(
+                    "query_history_k_data_plus",
+                    code=bs_code,
+                    fields="date,code,close,peTTM,pbMRQ,psTTM,pcfNcfTTM",
+                    start_date=start_date,
+                    end_date=end_date,
+                    frequency="d",
+                    adjustflag="3"  #Right of no restoration
+                )
+
+                if not rs.ok:
+                    raise Exception(f"查询失败: {rs.error_msg}")
+
+                return rs.rows, rs.fields
 
             data_list, fields = await asyncio.to_thread(fetch_valuation_data)
 
@@ -286,32 +256,18 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_stock_info():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-                
-                try:
-                    rs = self.bs.query_stock_basic(code=bs_code)
-                    if rs.error_code != '0':
-                        return {"code": code, "name": f"股票{code}"}
-                    
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-                    
-                    if not data_list:
-                        return {"code": code, "name": f"股票{code}"}
-                    
-                    row = data_list[0]
-                    return {
-                        "code": code,
-                        "name": str(row[1]) if len(row) > 1 else f"股票{code}",  # code_name
-                        "list_date": str(row[2]) if len(row) > 2 else "",  # ipoDate
-                        "industry": "未知",  #BaoStock Basic Information does not cover industry
-                        "area": "未知"  #BaoStock Basic Information Does Not Contain Areas
-                    }
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_stock_basic", code=bs_code)
+                if not rs.ok or not rs.rows:
+                    return {"code": code, "name": f"股票{code}"}
+
+                row = rs.rows[0]
+                return {
+                    "code": code,
+                    "name": str(row[1]) if len(row) > 1 else f"股票{code}",  # code_name
+                    "list_date": str(row[2]) if len(row) > 2 else "",  # ipoDate
+                    "industry": "未知",  #BaoStock Basic Information does not cover industry
+                    "area": "未知"  #BaoStock Basic Information Does Not Contain Areas
+                }
             
             return await asyncio.to_thread(fetch_stock_info)
             
@@ -367,50 +323,37 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_latest_kline():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-                
-                try:
-                    #Access to data for the last 5 days
-                    end_date = datetime.now().strftime('%Y-%m-%d')
-                    start_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
-                    
-                    rs = self.bs.query_history_k_data_plus(
-                        code=bs_code,
-                        fields="date,code,open,high,low,close,preclose,volume,amount,pctChg",
-                        start_date=start_date,
-                        end_date=end_date,
-                        frequency="d",
-                        adjustflag="3"
-                    )
-                    
-                    if rs.error_code != '0':
-                        return {}
-                    
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-                    
-                    if not data_list:
-                        return {}
-                    
-                    #Get the latest data.
-                    latest_row = data_list[-1]
-                    return {
-                        "name": f"股票{code}",
-                        "open": self._safe_float(latest_row[2]),
-                        "high": self._safe_float(latest_row[3]),
-                        "low": self._safe_float(latest_row[4]),
-                        "close": self._safe_float(latest_row[5]),
-                        "preclose": self._safe_float(latest_row[6]),
-                        "volume": self._safe_int(latest_row[7]),
-                        "amount": self._safe_float(latest_row[8]),
-                        "change_percent": self._safe_float(latest_row[9]),
-                        "change": self._safe_float(latest_row[5]) - self._safe_float(latest_row[6])
-                    }
-                finally:
-                    self.bs.logout()
+                #Access to data for the last 5 days
+                end_date = datetime.now().strftime('%Y-%m-%d')
+                start_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+
+                rs = self._session.query(
+                    "query_history_k_data_plus",
+                    code=bs_code,
+                    fields="date,code,open,high,low,close,preclose,volume,amount,pctChg",
+                    start_date=start_date,
+                    end_date=end_date,
+                    frequency="d",
+                    adjustflag="3"
+                )
+
+                if not rs.ok or not rs.rows:
+                    return {}
+
+                #Get the latest data.
+                latest_row = rs.rows[-1]
+                return {
+                    "name": f"股票{code}",
+                    "open": self._safe_float(latest_row[2]),
+                    "high": self._safe_float(latest_row[3]),
+                    "low": self._safe_float(latest_row[4]),
+                    "close": self._safe_float(latest_row[5]),
+                    "preclose": self._safe_float(latest_row[6]),
+                    "volume": self._safe_int(latest_row[7]),
+                    "amount": self._safe_float(latest_row[8]),
+                    "change_percent": self._safe_float(latest_row[9]),
+                    "change": self._safe_float(latest_row[5]) - self._safe_float(latest_row[6])
+                }
             
             return await asyncio.to_thread(fetch_latest_kline)
             
@@ -560,37 +503,27 @@ class BaoStockProvider(BaseStockDataProvider):
 
             def fetch_historical_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    #Select different fields based on frequency (less supported by weeklines and moon lines)
-                    if bs_frequency == "d":
-                        fields_str = "date,code,open,high,low,close,preclose,volume,amount,adjustflag,turn,tradestatus,pctChg,isST"
-                    else:
-                        #The weekly and moon lines only support base fields
-                        fields_str = "date,code,open,high,low,close,volume,amount,pctChg"
-
-                    rs = self.bs.query_history_k_data_plus(
-                        code=bs_code,
-                        fields=fields_str,
-                        start_date=start_date,
-                        end_date=end_date,
-                        frequency=bs_frequency,
-                        adjustflag="2"  #Former right of reinstatement
-                    )
-
-                    if rs.error_code != '0':
-                        raise Exception(f"查询失败: {rs.error_msg}")
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                #Select different fields based on frequency (less supported by weeklines and moon lines)
+                if bs_frequency == "d":
+                    fields_str = "date,code,open,high,low,close,preclose,volume,amount,adjustflag,turn,tradestatus,pctChg,isST"
+                else:
+                    #The weekly and moon lines only support base fields
+                    fields_str = "date,code,open,high,low,close,volume,amount,pctChg"
+
+                rs = self._session.query(
+                    "query_history_k_data_plus",
+                    code=bs_code,
+                    fields=fields_str,
+                    start_date=start_date,
+                    end_date=end_date,
+                    frequency=bs_frequency,
+                    adjustflag="2"  #Former right of reinstatement
+                )
+
+                if not rs.ok:
+                    raise Exception(f"查询失败: {rs.error_msg}")
+
+                return rs.rows, rs.fields
 
             data_list, fields = await asyncio.to_thread(fetch_historical_data)
 
@@ -716,22 +649,10 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_profit_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    rs = self.bs.query_profit_data(code=bs_code, year=year, quarter=quarter)
-                    if rs.error_code != '0':
-                        return None
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_profit_data", code=bs_code, year=year, quarter=quarter)
+                if not rs.ok:
+                    return None
+                return rs.rows, rs.fields
 
             result = await asyncio.to_thread(fetch_profit_data)
             if not result or not result[0]:
@@ -750,22 +671,10 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_operation_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    rs = self.bs.query_operation_data(code=bs_code, year=year, quarter=quarter)
-                    if rs.error_code != '0':
-                        return None
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_operation_data", code=bs_code, year=year, quarter=quarter)
+                if not rs.ok:
+                    return None
+                return rs.rows, rs.fields
 
             result = await asyncio.to_thread(fetch_operation_data)
             if not result or not result[0]:
@@ -784,22 +693,10 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_growth_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    rs = self.bs.query_growth_data(code=bs_code, year=year, quarter=quarter)
-                    if rs.error_code != '0':
-                        return None
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_growth_data", code=bs_code, year=year, quarter=quarter)
+                if not rs.ok:
+                    return None
+                return rs.rows, rs.fields
 
             result = await asyncio.to_thread(fetch_growth_data)
             if not result or not result[0]:
@@ -818,22 +715,10 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_balance_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    rs = self.bs.query_balance_data(code=bs_code, year=year, quarter=quarter)
-                    if rs.error_code != '0':
-                        return None
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_balance_data", code=bs_code, year=year, quarter=quarter)
+                if not rs.ok:
+                    return None
+                return rs.rows, rs.fields
 
             result = await asyncio.to_thread(fetch_balance_data)
             if not result or not result[0]:
@@ -852,22 +737,10 @@ class BaoStockProvider(BaseStockDataProvider):
         try:
             def fetch_cash_flow_data():
                 bs_code = self._to_baostock_code(code)
-                lg = self.bs.login()
-                if lg.error_code != '0':
-                    raise Exception(f"登录失败: {lg.error_msg}")
-
-                try:
-                    rs = self.bs.query_cash_flow_data(code=bs_code, year=year, quarter=quarter)
-                    if rs.error_code != '0':
-                        return None
-
-                    data_list = []
-                    while (rs.error_code == '0') & rs.next():
-                        data_list.append(rs.get_row_data())
-
-                    return data_list, rs.fields
-                finally:
-                    self.bs.logout()
+                rs = self._session.query("query_cash_flow_data", code=bs_code, year=year, quarter=quarter)
+                if not rs.ok:
+                    return None
+                return rs.rows, rs.fields
 
             result = await asyncio.to_thread(fetch_cash_flow_data)
             if not result or not result[0]:
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""BaoStock Session Manager
+Keeps a logged-in BaoStock session alive and reuses it across queries
+
+The baostock library keeps its socket and login state in module-level globals and is
+not thread-safe, so every query issued from ``asyncio.to_thread`` workers must be
+serialized.  The manager logs in lazily, reuses the session for subsequent queries,
+re-logs in when the session has been idle for too long or when the server reports a
+login/network error, and logs out once at process exit.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+#BaoStock error codes that mean the session is no longer usable
+_NOT_LOGGED_IN_CODE = "10001001"
+_NETWORK_ERROR_PREFIX = "10002"
+
+#BaoStock server drops idle connections, re-login after this many seconds without a query
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("BAOSTOCK_SESSION_IDLE_TIMEOUT", "300"))
+#Upper bound of a session lifetime regardless of activity
+DEFAULT_MAX_AGE = float(os.getenv("BAOSTOCK_SESSION_MAX_AGE", "3600"))
+
+
+class BaoStockLoginError(Exception):
+    """BaoStock login failed"""
+
+
+@dataclass
+class BaoStockQueryResult:
+    """Fully drained BaoStock query result"""
+    error_code: str
+    error_msg: str
+    rows: List[List[str]] = field(default_factory=list)
+    fields: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_code == '0'
+
+
+class BaoStockSessionManager:
+    """Process-wide BaoStock session with serialized access"""
+
+    def __init__(self, bs_module=None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_age: float = DEFAULT_MAX_AGE, max_retries: int = 1):
+        self._bs = bs_module
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.max_retries = max_retries
+
+        self._lock = threading.RLock()
+        self._logged_in = False
+        self._login_at = 0.0
+        self._last_used_at = 0.0
+
+        self._stats = {
+            "logins": 0,
+            "relogins": 0,
+            "queries": 0,
+            "session_errors": 0,
+        }
+
+    @property
+    def bs(self):
+        if self._bs is None:
+            import baostock as bs
+            self._bs = bs
+        return self._bs
+
+    # ------------------------------------------------------------------
+    #Session lifecycle
+    # ------------------------------------------------------------------
+
+    def _is_expired(self, now: float) -> bool:
+        if not self._logged_in:
+            return True
+        if self.max_age and now - self._login_at > self.max_age:
+            return True
+        if self.idle_timeout and now - self._last_used_at > self.idle_timeout:
+            return True
+        return False
+
+    def _login(self):
+        lg = self.bs.login()
+        if lg.error_code != '0':
+            self._logged_in = False
+            raise BaoStockLoginError(f"登录失败: {lg.error_msg}")
+
+        now = time.monotonic()
+        if self._stats["logins"] > 0:
+            self._stats["relogins"] += 1
+        self._stats["logins"] += 1
+        self._logged_in = True
+        self._login_at = now
+        self._last_used_at = now
+        logger.debug("BaoStock session logged in")
+
+    def _logout_quietly(self):
+        if not self._logged_in:
+            return
+        self._logged_in = False
+        try:
+            self.bs.logout()
+        except Exception as e:
+            logger.debug(f"BaoStock logout failed (ignored):{e}")
+
+    def ensure_login(self):
+        """Log in if there is no live session"""
+        with self._lock:
+            if self._is_expired(time.monotonic()):
+                self._logout_quietly()
+                self._login()
+
+    def invalidate(self):
+        """Drop the current session so that the next query logs in again"""
+        with self._lock:
+            self._logout_quietly()
+
+    def close(self):
+        """Log out (called at process exit)"""
+        with self._lock:
+            self._logout_quietly()
+
+    # ------------------------------------------------------------------
+    #Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_session_error(error_code: str) -> bool:
+        return error_code == _NOT_LOGGED_IN_CODE or str(error_code).startswith(_NETWORK_ERROR_PREFIX)
+
+    def query(self, method: str, **kwargs) -> BaoStockQueryResult:
+        """Run ``bs.<method>(**kwargs)`` on the shared session and drain all rows
+
+        Rows are drained while holding the lock because ``rs.next()`` pages over the
+        same socket.  Session errors trigger a re-login and a retry; other error codes
+        are returned to the caller unchanged.
+        """
+        with self._lock:
+            attempt = 0
+            while True:
+                self.ensure_login()
+                self._stats["queries"] += 1
+                try:
+                    rs = getattr(self.bs, method)(**kwargs)
+                    rows = []
+                    while (rs.error_code == '0') & rs.next():
+                        rows.append(rs.get_row_data())
+                    result = BaoStockQueryResult(
+                        error_code=rs.error_code,
+                        error_msg=rs.error_msg,
+                        rows=rows,
+                        fields=list(rs.fields or []),
+                    )
+                except (OSError, ConnectionError) as e:
+                    result = BaoStockQueryResult(error_code=_NETWORK_ERROR_PREFIX, error_msg=str(e))
+
+                self._last_used_at = time.monotonic()
+                if not self._is_session_error(result.error_code) or attempt >= self.max_retries:
+                    if self._is_session_error(result.error_code):
+                        self._stats["session_errors"] += 1
+                        self._logout_quietly()
+                    return result
+
+                attempt += 1
+                self._stats["session_errors"] += 1
+                logger.info(f"BaoStock session error ({result.error_code}:{result.error_msg}), logging in again")
+                self._logout_quietly()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "logged_in": self._logged_in}
+
+
+_session_manager: Optional[BaoStockSessionManager] = None
+_session_manager_lock = threading.Lock()
+
+
+def get_baostock_session() -> BaoStockSessionManager:
+    """Get the process-wide BaoStock session manager"""
+    global _session_manager
+    if _session_manager is None:
+        with _session_manager_lock:
+            if _session_manager is None:
+                _session_manager = BaoStockSessionManager()
+                atexit.register(_session_manager.close)
+    return _session_manager
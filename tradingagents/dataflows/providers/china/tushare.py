@@ -9,6 +9,7 @@ import logging
 
 from ..base_provider import BaseStockDataProvider
 from tradingagents.config.providers_config import get_provider_config
+from tradingagents.dataflows.financial_metrics import compute_latest_metrics
 
 #Try importing tushare
 try:
@@ -1331,10 +1332,11 @@ class TushareProvider(BaseStockDataProvider):
             report_period = latest_income.get('end_date') or latest_balance.get('end_date') or latest_cashflow.get('end_date')
             ann_date = latest_income.get('ann_date') or latest_balance.get('ann_date') or latest_cashflow.get('ann_date')
 
-            #Compute TTM data
+            #Compute TTM, growth and margins over the whole statement history in one vectorized pass
             income_statements = financial_data.get('income_statement', [])
-            revenue_ttm = self._calculate_ttm_from_tushare(income_statements, 'revenue')
-            net_profit_ttm = self._calculate_ttm_from_tushare(income_statements, 'n_income_attr_p')
+            derived = compute_latest_metrics({symbol: income_statements}).get(symbol, {})
+            revenue_ttm = derived.get('revenue_ttm')
+            net_profit_ttm = derived.get('net_profit_ttm')
 
             standardized_data = {
                 #Basic information
@@ -1359,6 +1361,15 @@ class TushareProvider(BaseStockDataProvider):
                 "fin_exp": self._safe_float(latest_income.get('fin_exp')),  #Financial costs
                 "rd_exp": self._safe_float(latest_income.get('rd_exp')),  #R & D costs
 
+                #Derived metrics precomputed at sync time (see financial_metrics)
+                "revenue_yoy": derived.get('revenue_yoy'),  #Operating income YTD growth (%)
+                "net_profit_yoy": derived.get('net_profit_yoy'),  #Net profit attributable to parent YTD growth (%)
+                "revenue_qoq": derived.get('revenue_qoq'),  #Single-quarter operating income growth (%)
+                "net_profit_qoq": derived.get('net_profit_qoq'),  #Single-quarter net profit growth (%)
+                "gross_margin_ttm": derived.get('gross_margin_ttm'),  #Gross margin on TTM values (%)
+                "net_margin_ttm": derived.get('net_margin_ttm'),  #Net margin on TTM values (%)
+                "metrics_period": derived.get('metrics_period'),  #Reporting period the derived metrics refer to
+
                 #Core balance sheet indicators
                 "total_assets": self._safe_float(latest_balance.get('total_assets')),  #Total assets
                 "total_liab": self._safe_float(latest_balance.get('total_liab')),  #Total liabilities
@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from tradingagents.config.runtime_settings import get_int
+from tradingagents.dataflows.cache.kv_store import KeyValueStore
 #Import Unified Log System
 from tradingagents.utils.logging_init import get_logger
 logger = get_logger("default")
@@ -34,13 +35,17 @@ class ImprovedHKStockProvider:
     
     def __init__(self):
         #Write cache files to a unified data cache directory to avoid contamination of the root directory
-        hk_cache_dir = get_cache_dir('hk')
-        if hasattr(hk_cache_dir, 'joinpath'):  # Path
-            self.cache_file = str(hk_cache_dir.joinpath('hk_stock_cache.json'))
-        else:  # str
-            self.cache_file = os.path.join(hk_cache_dir, 'hk_stock_cache.json')
+        hk_cache_dir = str(get_cache_dir('hk'))
+        #Legacy single-document cache, imported once into the keyed store
+        self.cache_file = os.path.join(hk_cache_dir, 'hk_stock_cache.json')
 
         self.cache_ttl = get_int("TA_HK_CACHE_TTL_SECONDS", "ta_hk_cache_ttl_seconds", 3600 * 24)
+        #Keyed store shared by the API and worker processes (one row per name/indicator lookup)
+        self.store = KeyValueStore(
+            os.path.join(hk_cache_dir, 'hk_stock_cache.sqlite3'),
+            default_ttl=self.cache_ttl,
+            max_entries=get_int("TA_HK_CACHE_MAX_ENTRIES", "ta_hk_cache_max_entries", 20000),
+        )
         self.rate_limit_wait = get_int("TA_HK_RATE_LIMIT_WAIT_SECONDS", "ta_hk_rate_limit_wait_seconds", 5)
         self.last_request_time = 0
 
@@ -103,37 +108,33 @@ class ImprovedHKStockProvider:
             '0991.HK': '大唐发电', '0991': '大唐发电', '00991': '大唐发电'
         }
         
-        self._load_cache()
-    
-    def _load_cache(self):
-        """Load Cache"""
-        try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.cache = json.load(f)
-            else:
-                self.cache = {}
-        except Exception as e:
-            logger.debug(f"[Port Cache] Loading cache failed:{e}")
-            self.cache = {}
-    
-    def _save_cache(self):
-        """Save Cache"""
+        self._migrate_legacy_cache()
+
+    def _migrate_legacy_cache(self):
+        """Import the old hk_stock_cache.json (whole cache in one file) into the keyed store once"""
+        if not os.path.exists(self.cache_file):
+            return
         try:
-            #Ensure directory exists
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            now = time.time()
+            items = []
+            for key, entry in legacy.items():
+                remaining = entry.get('timestamp', 0) + self.cache_ttl - now
+                if remaining > 0 and 'data' in entry:
+                    items.append((key, entry['data'], remaining))
+            imported = self.store.set_many(items)
+            os.replace(self.cache_file, self.cache_file + '.migrated')
+            logger.info(f"[Hong Kong Stock Cache] Imported {imported} entries from {self.cache_file}")
         except Exception as e:
-            logger.debug(f"[Hong Kong Stock Cache]{e}")
-    
-    def _is_cache_valid(self, key: str) -> bool:
-        """Check if the cache is valid"""
-        if key not in self.cache:
-            return False
+            logger.debug(f"[Hong Kong Stock Cache] Legacy cache import failed:{e}")
+
+    def _cache_get(self, key: str) -> Any:
+        """Cached value, None when missing or expired"""
+        return self.store.get(key)
 
-        cache_time = self.cache[key].get('timestamp', 0)
-        return (time.time() - cache_time) < self.cache_ttl
+    def _cache_set(self, key: str, data: Any, ttl: Optional[float] = None):
+        self.store.set(key, data, ttl=ttl)
 
     def _rate_limit(self):
         """Speed limit: ensure sufficient spacing between requests"""
@@ -176,8 +177,8 @@ class ImprovedHKStockProvider:
         try:
             #Check Cache
             cache_key = f"name_{symbol}"
-            if self._is_cache_valid(cache_key):
-                cached_name = self.cache[cache_key]['data']
+            cached_name = self._cache_get(cache_key)
+            if cached_name is not None:
                 logger.debug(f"[Hong Kong Stock Cache]{symbol} -> {cached_name}")
                 return cached_name
             
@@ -190,12 +191,7 @@ class ImprovedHKStockProvider:
                     company_name = self.hk_stock_names[format_symbol]
                     
                     #Cache Result
-                    self.cache[cache_key] = {
-                        'data': company_name,
-                        'timestamp': time.time(),
-                        'source': 'builtin_mapping'
-                    }
-                    self._save_cache()
+                    self._cache_set(cache_key, company_name)
                     
                     logger.debug(f"[Hong Kong Stock Mapping]{symbol} -> {company_name}")
                     return company_name
@@ -222,8 +218,8 @@ class ImprovedHKStockProvider:
 
                     #Attempt to obtain real-time information (includes name) on the Port Unit
                     try:
-                        #Use of the New Wave financial interface (more stable)
-                        df = ak.stock_hk_spot()
+                        #Use of the New Wave financial interface (more stable), through the shared spot cache
+                        df = _get_akshare_hk_spot(self)
                         if df is not None and not df.empty:
                             #Find a matching stock
                             matched = df[df['代码'] == normalized_symbol]
@@ -232,12 +228,7 @@ class ImprovedHKStockProvider:
                                 akshare_name = matched.iloc[0]['中文名称']
                                 if akshare_name and not str(akshare_name).startswith('港股'):
                                     #Cache AKShare Results
-                                    self.cache[cache_key] = {
-                                        'data': akshare_name,
-                                        'timestamp': time.time(),
-                                        'source': 'akshare_sina'
-                                    }
-                                    self._save_cache()
+                                    self._cache_set(cache_key, akshare_name)
 
                                     logger.debug(f"📊 [Hong Kong shares AKshare - New Wave]{symbol} -> {akshare_name}")
                                     return akshare_name
@@ -255,12 +246,7 @@ class ImprovedHKStockProvider:
                     api_name = hk_info['name']
                     if not api_name.startswith('港股'):
                         #Cache API Results
-                        self.cache[cache_key] = {
-                            'data': api_name,
-                            'timestamp': time.time(),
-                            'source': 'unified_api'
-                        }
-                        self._save_cache()
+                        self._cache_set(cache_key, api_name)
 
                         logger.debug(f"📊 [UAPI]{symbol} -> {api_name}")
                         return api_name
@@ -272,13 +258,8 @@ class ImprovedHKStockProvider:
             clean_symbol = self._normalize_hk_symbol(symbol)
             default_name = f"港股{clean_symbol}"
             
-            #Cache default result (shorter TTL)
-            self.cache[cache_key] = {
-                'data': default_name,
-                'timestamp': time.time() - self.cache_ttl + 3600,  #Expired in 1 hour
-                'source': 'default'
-            }
-            self._save_cache()
+            #Cache default result (shorter TTL: expires in 1 hour)
+            self._cache_set(cache_key, default_name, ttl=3600)
             
             logger.debug(f"Use the default name:{symbol} -> {default_name}")
             return default_name
@@ -308,9 +289,10 @@ class ImprovedHKStockProvider:
 
             #Check Cache
             cache_key = f"financial_{normalized_symbol}"
-            if self._is_cache_valid(cache_key):
+            cached_indicators = self._cache_get(cache_key)
+            if cached_indicators is not None:
                 logger.debug(f"[Port Unit Financial Indicators]{normalized_symbol}")
-                return self.cache[cache_key]['data']
+                return cached_indicators
 
             #Rate limit
             self._rate_limit()
@@ -370,11 +352,7 @@ class ImprovedHKStockProvider:
             }
 
             #Cache Data
-            self.cache[cache_key] = {
-                'data': indicators,
-                'timestamp': time.time()
-            }
-            self._save_cache()
+            self._cache_set(cache_key, indicators)
 
             logger.info(f"✅ [Hong Kong Unit Financial Indicators]{normalized_symbol}reporting period:{indicators['report_date']}")
             return indicators
@@ -646,18 +624,59 @@ def get_hk_stock_data_akshare(symbol: str, start_date: str = None, end_date: str
         return f"❌ 港股{symbol}历史数据获取失败: {str(e)}"
 
 
-#Global Cache: Cache All Port Unit Data of AKShare
-_akshare_hk_spot_cache = {
-    'data': None,
-    'timestamp': None,
-    'ttl': 600  #Cache 10 Minutes (Reference U.S. Real Time Cache Time)
-}
+#Cache of all AKShare HK spot quotes, kept in the provider's keyed store so that processes share it
+_AKSHARE_HK_SPOT_KEY = "akshare_hk_spot"
+_AKSHARE_HK_SPOT_TTL = 600  #Cache 10 Minutes (Reference U.S. Real Time Cache Time)
 
 #Linelock: Prevent multiple threads from calling AKshare API
 import threading
 _akshare_hk_spot_lock = threading.Lock()
 
 
+def _get_akshare_hk_spot(provider: "ImprovedHKStockProvider"):
+    """All AKShare HK spot quotes, from the shared keyed cache or one locked API call"""
+    import akshare as ak
+
+    #🔥 to protect the AKShare API call (prevents and leads to closure)
+    #Policy:
+    #1. Attempt to obtain locks (up to 60 seconds)
+    #2. Check whether the cache has been updated by other threads after the lock has been retrieved
+    #3. Direct if cache is valid; otherwise call API
+
+    thread_id = threading.current_thread().name
+    logger.info(f"[Akshare Locks]{thread_id}Try to get the lock...")
+
+    #Try to get the lock and wait up to 60 seconds
+    lock_acquired = _akshare_hk_spot_lock.acquire(timeout=60)
+
+    if not lock_acquired:
+        #Timeout, return error
+        logger.error(f"[Akshare Locks]{thread_id}:: Obtain lock timeout (60 seconds), relinquish")
+        raise Exception("AKShare API 调用超时（其他线程占用）")
+
+    try:
+        logger.info(f"[Akshare Locks]{thread_id} Retrieved lock")
+
+        #Check if the cache has been updated by other threads (or processes) after accessing the lock
+        df = provider.store.get(_AKSHARE_HK_SPOT_KEY)
+        if df is not None:
+            logger.info(f"[Akshare Cache]{thread_id}Use of cache data")
+        else:
+            #Cache empty or expired. Call API required
+            logger.info(f"[Akshare Cache]{thread_id}Cache empty or expired, Call API Refresh")
+            df = ak.stock_hk_spot()
+            if df is not None and not df.empty:
+                provider.store.set(_AKSHARE_HK_SPOT_KEY, df, ttl=_AKSHARE_HK_SPOT_TTL)
+                logger.info(f"[Akshare Cache]{thread_id}Cached{len(df)}Port-only data")
+
+    finally:
+        #Release the lock.
+        _akshare_hk_spot_lock.release()
+        logger.info(f"[Akshare Locks]{thread_id}Locks released")
+
+    return df
+
+
 def get_hk_stock_info_akshare(symbol: str) -> Dict[str, Any]:
     """Compatibility function: directly use akshare to obtain information about the port stock (avoid recycling calls)
     Use global cache + thread lock to avoid repetition of calls for ak.stock hk spot()
@@ -678,55 +697,7 @@ def get_hk_stock_info_akshare(symbol: str) -> Dict[str, Any]:
 
         #Try to get real-time lines from kshare
         try:
-            #🔥 to protect the AKShare API call (prevents and leads to closure)
-            #Policy:
-            #1. Attempt to obtain locks (up to 60 seconds)
-            #2. Check whether the cache has been updated by other threads after the lock has been retrieved
-            #3. Direct if cache is valid; otherwise call API
-
-            thread_id = threading.current_thread().name
-            logger.info(f"[Akshare Locks]{thread_id}Try to get the lock...")
-
-            #Try to get the lock and wait up to 60 seconds
-            lock_acquired = _akshare_hk_spot_lock.acquire(timeout=60)
-
-            if not lock_acquired:
-                #Timeout, return error
-                logger.error(f"[Akshare Locks]{thread_id}:: Obtain lock timeout (60 seconds), relinquish")
-                raise Exception("AKShare API 调用超时（其他线程占用）")
-
-            try:
-                logger.info(f"[Akshare Locks]{thread_id} Retrieved lock")
-
-                #Check if the cache has been updated by other threads after accessing the lock
-                now = datetime.now()
-                cache = _akshare_hk_spot_cache
-
-                if cache['data'] is not None and cache['timestamp'] is not None:
-                    elapsed = (now - cache['timestamp']).total_seconds()
-                    if elapsed <= cache['ttl']:
-                        #Cache is effective (possibly other threads have just been updated)
-                        logger.info(f"[Akshare Cache]{thread_id}Use of cache data (){elapsed:.1f}2 seconds ago, possibly updated by another thread)")
-                        df = cache['data']
-                    else:
-                        #Cache expired. Call API required
-                        logger.info(f"[Akshare Cache]{thread_id}Cache expired (%){elapsed:.1f}Second) , Call API Refresh")
-                        df = ak.stock_hk_spot()
-                        cache['data'] = df
-                        cache['timestamp'] = now
-                        logger.info(f"[Akshare Cache]{thread_id}Cached{len(df)}Port-only data")
-                else:
-                    #Cache empty, first call
-                    logger.info(f"[Akshare Cache]{thread_id}First-time acquisition of port unit data")
-                    df = ak.stock_hk_spot()
-                    cache['data'] = df
-                    cache['timestamp'] = now
-                    logger.info(f"[Akshare Cache]{thread_id}Cached{len(df)}Port-only data")
-
-            finally:
-                #Release the lock.
-                _akshare_hk_spot_lock.release()
-                logger.info(f"[Akshare Locks]{thread_id}Locks released")
+            df = _get_akshare_hk_spot(provider)
 
             #Find target stocks from cache data
             if df is not None and not df.empty:
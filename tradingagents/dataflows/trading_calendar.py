@@ -0,0 +1,527 @@
+"""Local trading calendar (CN / HK / US)
+
+Trading days are loaded once per market, kept as sorted day ordinals and
+persisted to a JSON file under the data directory, so that previous/next
+trading day, range and "is the market open" queries are O(log n) bisects
+without any network access. A scheduled job calls ``refresh()`` to pull
+the official calendars (Tushare, then AKShare); when no remote source is
+reachable the calendar falls back to weekdays (plus NYSE holiday rules for
+the US market).
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time as dtime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[date, datetime, str]
+
+CALENDAR_FILE_NAME = "trading_calendar.json"
+#Calendar window kept locally, relative to today
+HISTORY_YEARS = 5
+FUTURE_DAYS = 370
+#Persisted calendars older than this (or covering too little future) are refreshed
+MAX_AGE_DAYS = 7
+MIN_FUTURE_COVERAGE_DAYS = 30
+
+
+@dataclass(frozen=True)
+class MarketSpec:
+    """Trading sessions of a market in its local time zone"""
+
+    timezone: str
+    sessions: Tuple[Tuple[dtime, dtime], ...]
+
+    @property
+    def close_time(self) -> dtime:
+        return self.sessions[-1][1]
+
+
+MARKETS: Dict[str, MarketSpec] = {
+    "CN": MarketSpec("Asia/Shanghai", ((dtime(9, 30), dtime(11, 30)), (dtime(13, 0), dtime(15, 0)))),
+    "HK": MarketSpec("Asia/Hong_Kong", ((dtime(9, 30), dtime(12, 0)), (dtime(13, 0), dtime(16, 0)))),
+    "US": MarketSpec("America/New_York", ((dtime(9, 30), dtime(16, 0)),)),
+}
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    if len(text) == 8 and text.isdigit():
+        return datetime.strptime(text, "%Y%m%d").date()
+    return datetime.strptime(text[:10], "%Y-%m-%d").date()
+
+
+def _normalize_market(market: str) -> str:
+    market = (market or "CN").upper()
+    if market in ("A", "A股", "CHINA", "SH", "SZ", "BJ"):
+        return "CN"
+    if market in ("港股", "HKEX"):
+        return "HK"
+    if market in ("美股", "NYSE", "NASDAQ"):
+        return "US"
+    if market not in MARKETS:
+        raise ValueError(f"Unsupported market: {market}")
+    return market
+
+
+# ---------------------------------------------------------------------------
+#Offline rules
+# ---------------------------------------------------------------------------
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday of a month (n=-1 for the last one)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1))
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_market_holidays(year: int) -> set:
+    """Regular NYSE full-day holidays of a year"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),   #Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),   #Washington's Birthday
+        _easter(year) - timedelta(days=2),  #Good Friday
+        _nth_weekday(year, 5, 0, -1),  #Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),   #Labor Day
+        _nth_weekday(year, 11, 3, 4),  #Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    #New Year's Day on a Saturday is not observed on the previous Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  #Juneteenth
+    return holidays
+
+
+def rule_based_trading_days(market: str, start: date, end: date) -> List[date]:
+    """Weekdays between start and end, minus rule-based holidays where known"""
+    holidays: set = set()
+    if market == "US":
+        for year in range(start.year, end.year + 1):
+            holidays |= us_market_holidays(year)
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5 and day not in holidays:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+# ---------------------------------------------------------------------------
+#Remote loaders
+# ---------------------------------------------------------------------------
+
+def _tushare_api():
+    from tradingagents.dataflows.providers.china.tushare import get_tushare_provider
+
+    provider = get_tushare_provider()
+    if not provider.is_available() or getattr(provider, "api", None) is None:
+        return None
+    return provider.api
+
+
+def _dates_from_frame(df, column: str) -> List[date]:
+    if df is None or getattr(df, "empty", True) or column not in df.columns:
+        return []
+    return sorted({_to_date(v) for v in df[column].tolist() if v})
+
+
+def _fetch_cn_tushare(start: date, end: date) -> List[date]:
+    api = _tushare_api()
+    if api is None:
+        return []
+    df = api.trade_cal(
+        exchange="SSE", start_date=start.strftime("%Y%m%d"), end_date=end.strftime("%Y%m%d"), is_open="1"
+    )
+    return _dates_from_frame(df, "cal_date")
+
+
+def _fetch_cn_akshare(start: date, end: date) -> List[date]:
+    import akshare as ak
+
+    days = _dates_from_frame(ak.tool_trade_date_hist_sina(), "trade_date")
+    return [d for d in days if start <= d <= end]
+
+
+def _fetch_hk_tushare(start: date, end: date) -> List[date]:
+    api = _tushare_api()
+    if api is None:
+        return []
+    df = api.hk_tradecal(start_date=start.strftime("%Y%m%d"), end_date=end.strftime("%Y%m%d"), is_open="1")
+    return _dates_from_frame(df, "cal_date")
+
+
+def _fetch_us_tushare(start: date, end: date) -> List[date]:
+    api = _tushare_api()
+    if api is None:
+        return []
+    df = api.us_tradecal(start_date=start.strftime("%Y%m%d"), end_date=end.strftime("%Y%m%d"), is_open="1")
+    return _dates_from_frame(df, "cal_date")
+
+
+REMOTE_LOADERS = {
+    "CN": (("tushare", _fetch_cn_tushare), ("akshare", _fetch_cn_akshare)),
+    "HK": (("tushare", _fetch_hk_tushare),),
+    "US": (("tushare", _fetch_us_tushare),),
+}
+
+
+# ---------------------------------------------------------------------------
+#Calendar
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _MarketDays:
+    ordinals: List[int]
+    start: int
+    end: int
+    source: str
+    updated_at: str
+
+    def covers(self, ordinal: int) -> bool:
+        return self.start <= ordinal <= self.end
+
+
+def default_calendar_path() -> Path:
+    data_dir = os.getenv("TRADINGAGENTS_DATA_DIR") or "./data"
+    return Path(data_dir) / CALENDAR_FILE_NAME
+
+
+class TradingCalendar:
+    """Multi-market trading calendar backed by sorted day ordinals"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else default_calendar_path()
+        self._markets: Dict[str, _MarketDays] = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+
+    # ----- loading / persistence -----
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._load_file()
+            self._loaded = True
+
+    def _load_file(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            for market, item in (payload.get("markets") or {}).items():
+                if market not in MARKETS:
+                    continue
+                self._markets[market] = _MarketDays(
+                    ordinals=sorted(_to_date(d).toordinal() for d in item["days"]),
+                    start=_to_date(item["start"]).toordinal(),
+                    end=_to_date(item["end"]).toordinal(),
+                    source=item.get("source", "unknown"),
+                    updated_at=item.get("updated_at", ""),
+                )
+            logger.info(f"📅 交易日历已加载: {self.path} ({', '.join(sorted(self._markets))})")
+        except Exception as e:
+            logger.warning(f"⚠️ 交易日历文件读取失败，使用规则日历: {e}")
+            self._markets.clear()
+
+    def _save_file(self) -> None:
+        payload = {
+            "version": 1,
+            "markets": {
+                market: {
+                    "source": item.source,
+                    "updated_at": item.updated_at,
+                    "start": date.fromordinal(item.start).isoformat(),
+                    "end": date.fromordinal(item.end).isoformat(),
+                    "days": [date.fromordinal(o).strftime("%Y%m%d") for o in item.ordinals],
+                }
+                for market, item in self._markets.items()
+                #Rule-based fallbacks are cheap to rebuild and must not mask a later remote load
+                if item.source != "rules"
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def set_trading_days(self, market: str, days: Iterable[DateLike], start: DateLike, end: DateLike,
+                         source: str = "manual") -> None:
+        """Replace the calendar of a market for [start, end]"""
+        market = _normalize_market(market)
+        self._ensure_loaded()
+        item = _MarketDays(
+            ordinals=sorted({_to_date(d).toordinal() for d in days}),
+            start=_to_date(start).toordinal(),
+            end=_to_date(end).toordinal(),
+            source=source,
+            updated_at=datetime.now().isoformat(timespec="seconds"),
+        )
+        with self._lock:
+            self._markets[market] = item
+
+    def _market_days(self, market: str) -> _MarketDays:
+        self._ensure_loaded()
+        item = self._markets.get(market)
+        if item is None:
+            with self._lock:
+                item = self._markets.get(market)
+                if item is None:
+                    today = date.today()
+                    start = date(today.year - HISTORY_YEARS, 1, 1)
+                    end = today + timedelta(days=FUTURE_DAYS)
+                    item = _MarketDays(
+                        ordinals=[d.toordinal() for d in rule_based_trading_days(market, start, end)],
+                        start=start.toordinal(),
+                        end=end.toordinal(),
+                        source="rules",
+                        updated_at=datetime.now().isoformat(timespec="seconds"),
+                    )
+                    self._markets[market] = item
+        return item
+
+    def needs_refresh(self, market: str, today: Optional[date] = None) -> bool:
+        market = _normalize_market(market)
+        item = self._market_days(market)
+        if item.source == "rules":
+            return True
+        today = today or date.today()
+        if item.end - today.toordinal() < MIN_FUTURE_COVERAGE_DAYS:
+            return True
+        try:
+            updated = datetime.fromisoformat(item.updated_at).date()
+        except ValueError:
+            return True
+        return (today - updated).days >= MAX_AGE_DAYS
+
+    def refresh(self, markets: Optional[Sequence[str]] = None, force: bool = False) -> Dict[str, str]:
+        """Reload calendars from the remote sources and persist them
+
+        Returns the source used per market ("cached" when still fresh, "rules" when
+        every remote source failed).
+        """
+        markets = [_normalize_market(m) for m in (markets or MARKETS)]
+        today = date.today()
+        start = date(today.year - HISTORY_YEARS, 1, 1)
+        end = today + timedelta(days=FUTURE_DAYS)
+        result: Dict[str, str] = {}
+        changed = False
+
+        for market in markets:
+            if not force and not self.needs_refresh(market, today):
+                result[market] = "cached"
+                continue
+            days: List[date] = []
+            source = "rules"
+            for name, loader in REMOTE_LOADERS.get(market, ()):
+                try:
+                    days = loader(start, end)
+                except Exception as e:
+                    logger.warning(f"⚠️ [{market}] 交易日历加载失败 ({name}): {e}")
+                    days = []
+                if days:
+                    source = name
+                    break
+            if days:
+                #Remote calendars may not span our whole window (e.g. Sina only lists up to this year)
+                self.set_trading_days(market, days, max(start, min(days)), min(end, max(days)), source=source)
+                changed = True
+                logger.info(f"📅 [{market}] 交易日历已更新: {len(days)} 个交易日 (来源: {source})")
+            else:
+                self.set_trading_days(market, rule_based_trading_days(market, start, end), start, end,
+                                      source="rules")
+            result[market] = source
+
+        if changed:
+            with self._lock:
+                try:
+                    self._save_file()
+                except Exception as e:
+                    logger.warning(f"⚠️ 交易日历保存失败: {e}")
+        return result
+
+    # ----- queries -----
+
+    def is_trading_day(self, day: DateLike, market: str = "CN") -> bool:
+        market = _normalize_market(market)
+        ordinal = _to_date(day).toordinal()
+        item = self._market_days(market)
+        if not item.covers(ordinal):
+            return self._rule_day(market, ordinal)
+        index = bisect.bisect_left(item.ordinals, ordinal)
+        return index < len(item.ordinals) and item.ordinals[index] == ordinal
+
+    def previous_trading_day(self, day: Optional[DateLike] = None, market: str = "CN",
+                             inclusive: bool = False) -> date:
+        """Latest trading day before ``day`` (or on it when ``inclusive``)"""
+        market = _normalize_market(market)
+        ordinal = _to_date(day or date.today()).toordinal()
+        item = self._market_days(market)
+        if item.covers(ordinal):
+            index = bisect.bisect_right(item.ordinals, ordinal) if inclusive else bisect.bisect_left(
+                item.ordinals, ordinal)
+            if index > 0:
+                return date.fromordinal(item.ordinals[index - 1])
+        return self._scan(market, ordinal if inclusive else ordinal - 1, -1)
+
+    def next_trading_day(self, day: Optional[DateLike] = None, market: str = "CN",
+                         inclusive: bool = False) -> date:
+        """First trading day after ``day`` (or on it when ``inclusive``)"""
+        market = _normalize_market(market)
+        ordinal = _to_date(day or date.today()).toordinal()
+        item = self._market_days(market)
+        if item.covers(ordinal):
+            index = bisect.bisect_left(item.ordinals, ordinal) if inclusive else bisect.bisect_right(
+                item.ordinals, ordinal)
+            if index < len(item.ordinals) and item.covers(item.ordinals[index]):
+                return date.fromordinal(item.ordinals[index])
+        return self._scan(market, ordinal if inclusive else ordinal + 1, 1)
+
+    def trading_days_between(self, start: DateLike, end: DateLike, market: str = "CN") -> List[date]:
+        """Trading days in [start, end]"""
+        market = _normalize_market(market)
+        lo, hi = _to_date(start).toordinal(), _to_date(end).toordinal()
+        if lo > hi:
+            return []
+        item = self._market_days(market)
+        days: List[date] = []
+        if lo < item.start:
+            days.extend(rule_based_trading_days(market, date.fromordinal(lo),
+                                                date.fromordinal(min(hi, item.start - 1))))
+        left = bisect.bisect_left(item.ordinals, max(lo, item.start))
+        right = bisect.bisect_right(item.ordinals, min(hi, item.end))
+        days.extend(date.fromordinal(o) for o in item.ordinals[left:right])
+        if hi > item.end:
+            days.extend(rule_based_trading_days(market, date.fromordinal(max(lo, item.end + 1)),
+                                                date.fromordinal(hi)))
+        return days
+
+    def count_trading_days(self, start: DateLike, end: DateLike, market: str = "CN") -> int:
+        market = _normalize_market(market)
+        lo, hi = _to_date(start).toordinal(), _to_date(end).toordinal()
+        item = self._market_days(market)
+        if lo > hi:
+            return 0
+        if item.start <= lo and hi <= item.end:
+            return bisect.bisect_right(item.ordinals, hi) - bisect.bisect_left(item.ordinals, lo)
+        return len(self.trading_days_between(start, end, market))
+
+    def local_now(self, market: str = "CN", now: Optional[datetime] = None) -> datetime:
+        """``now`` converted to the market's time zone (naive values are taken as market-local)"""
+        tz = ZoneInfo(MARKETS[_normalize_market(market)].timezone)
+        if now is None:
+            return datetime.now(tz)
+        if now.tzinfo is None:
+            return now.replace(tzinfo=tz)
+        return now.astimezone(tz)
+
+    def latest_trade_date(self, market: str = "CN", now: Optional[datetime] = None) -> date:
+        """Most recent trading day whose session has closed"""
+        market = _normalize_market(market)
+        local = self.local_now(market, now)
+        today = local.date()
+        if self.is_trading_day(today, market) and local.time() >= MARKETS[market].close_time:
+            return today
+        return self.previous_trading_day(today, market)
+
+    def is_open(self, now: Optional[datetime] = None, market: str = "CN", close_buffer_minutes: int = 0) -> bool:
+        """Whether the market is in a trading session (optionally extending the last one)"""
+        market = _normalize_market(market)
+        local = self.local_now(market, now)
+        if not self.is_trading_day(local.date(), market):
+            return False
+        t = local.time()
+        sessions = MARKETS[market].sessions
+        for index, (begin, finish) in enumerate(sessions):
+            if index == len(sessions) - 1 and close_buffer_minutes:
+                finish = (datetime.combine(local.date(), finish) + timedelta(minutes=close_buffer_minutes)).time()
+            if begin <= t <= finish:
+                return True
+        return False
+
+    def get_status(self) -> Dict[str, Dict[str, str]]:
+        self._ensure_loaded()
+        return {
+            market: {
+                "source": item.source,
+                "updated_at": item.updated_at,
+                "start": date.fromordinal(item.start).isoformat(),
+                "end": date.fromordinal(item.end).isoformat(),
+                "trading_days": str(len(item.ordinals)),
+            }
+            for market, item in self._markets.items()
+        }
+
+    # ----- fallbacks outside the loaded window -----
+
+    @staticmethod
+    def _rule_day(market: str, ordinal: int) -> bool:
+        day = date.fromordinal(ordinal)
+        if day.weekday() >= 5:
+            return False
+        return market != "US" or day not in us_market_holidays(day.year)
+
+    def _scan(self, market: str, ordinal: int, step: int) -> date:
+        for _ in range(31):
+            if self.is_trading_day(date.fromordinal(ordinal), market):
+                return date.fromordinal(ordinal)
+            ordinal += step
+        return date.fromordinal(ordinal)
+
+
+_trading_calendar: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """Get the global trading calendar instance"""
+    global _trading_calendar
+    if _trading_calendar is None:
+        with _calendar_lock:
+            if _trading_calendar is None:
+                _trading_calendar = TradingCalendar()
+    return _trading_calendar
@@ -17,6 +17,10 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    #Debaters of one round answer concurrently (saves several LLM round trips per round)
+    "parallel_debate": os.getenv("PARALLEL_DEBATE_ENABLED", "false").lower() == "true",
+    #Token budget for analyst reports + debate history in researcher/debater/manager prompts (0 = unbounded)
+    "prompt_token_budget": int(os.getenv("PROMPT_TOKEN_BUDGET", "24000")),
     #Tool settings - Read from environment variables, provide defaults
     "online_tools": os.getenv("ONLINE_TOOLS_ENABLED", "false").lower() == "true",
     "online_news": os.getenv("ONLINE_NEWS_ENABLED", "true").lower() == "true", 
@@ -216,6 +216,26 @@ class ConditionalLogic:
         logger.info(f"[Investment debate controls]{next_speaker}")
         return next_speaker
 
+    def should_continue_debate_parallel(self, state: AgentState):
+        """Parallel mode: start another round with both researchers, or hand over to the manager."""
+        current_count = state["investment_debate_state"]["count"]
+        max_count = 2 * self.max_debate_rounds
+        logger.info(f"[Parallel debate] Number of statements:{current_count}, Max:{max_count}")
+
+        if current_count >= max_count:
+            return "Research Manager"
+        return ["Bull Researcher", "Bear Researcher"]
+
+    def should_continue_risk_analysis_parallel(self, state: AgentState):
+        """Parallel mode: start another round with all three risk analysts, or hand over to the judge."""
+        current_count = state["risk_debate_state"]["count"]
+        max_count = 3 * self.max_risk_discuss_rounds
+        logger.info(f"[Parallel risk discussion] Number of statements:{current_count}, Max:{max_count}")
+
+        if current_count >= max_count:
+            return "Risk Judge"
+        return ["Risky Analyst", "Safe Analyst", "Neutral Analyst"]
+
     def should_continue_risk_analysis(self, state: AgentState) -> str:
         """Determine if risk analysis should continue."""
         current_count = state["risk_debate_state"]["count"]
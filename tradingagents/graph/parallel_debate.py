@@ -0,0 +1,108 @@
+# TradingAgents/graph/parallel_debate.py
+"""Concurrent debate rounds
+
+In the default (sequential) mode debaters speak one after another, each reacting
+to the speaker right before them. In parallel mode every debater of a round
+answers the previous round's transcript at the same time; their responses are
+collected in a round channel (``investment_debate_round`` / ``risk_debate_round``)
+and a join node appends them to the debate state in a fixed speaker order before
+the next round or the judge.
+
+The debater nodes themselves are unchanged: the wrappers below only adjust the
+state they see and redirect their output to the round channel. They delegate to
+the debater body with ``yield from``, so debaters keep their async LLM path.
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from tradingagents.agents.utils.llm_node import LLMNode, run_node_steps
+
+#Import Unified Log System
+from tradingagents.utils.logging_init import get_logger
+logger = get_logger("default")
+
+#(speaker, graph node, history field) in transcript order
+INVEST_DEBATERS: Tuple[Tuple[str, str, str], ...] = (
+    ("Bull", "Bull Researcher", "bull_history"),
+    ("Bear", "Bear Researcher", "bear_history"),
+)
+RISK_DEBATERS: Tuple[Tuple[str, str, str], ...] = (
+    ("Risky", "Risky Analyst", "risky_history"),
+    ("Safe", "Safe Analyst", "safe_history"),
+    ("Neutral", "Neutral Analyst", "neutral_history"),
+)
+
+INVEST_JOIN_NODE = "Investment Debate Join"
+RISK_JOIN_NODE = "Risk Debate Join"
+
+
+def create_parallel_invest_debater(node: Callable, speaker: str, opponent: str) -> Callable:
+    """Wrap a bull/bear researcher so it can run concurrently with its opponent
+
+    The researcher prompts treat ``current_response`` as the opponent's last
+    argument, so it is taken from the opponent's entry of the previous round.
+    """
+    def parallel_invest_node(state) -> dict:
+        debate_state = dict(state["investment_debate_state"])
+        previous_round = state.get("investment_debate_round") or {}
+        debate_state["current_response"] = previous_round.get(opponent, "")
+        result = yield from run_node_steps(node, {**state, "investment_debate_state": debate_state})
+        argument = result["investment_debate_state"]["current_response"]
+        return {"investment_debate_round": {speaker: argument}}
+
+    return LLMNode(parallel_invest_node)
+
+
+def create_parallel_risk_debater(node: Callable, speaker: str) -> Callable:
+    """Wrap a risk debater; its prompt already reads the others' ``current_*_response``"""
+    response_key = f"current_{speaker.lower()}_response"
+
+    def parallel_risk_node(state) -> dict:
+        result = yield from run_node_steps(node, state)
+        return {"risk_debate_round": {speaker: result["risk_debate_state"][response_key]}}
+
+    return LLMNode(parallel_risk_node)
+
+
+def _append_round(debate_state: Dict, responses: Dict[str, str],
+                  debaters: Sequence[Tuple[str, str, str]]) -> Tuple[Dict, Optional[str]]:
+    #A completed round counts every debater even if some replies are empty, otherwise the
+    #round limit in ConditionalLogic is never reached and the debate loops forever
+    merged = {"history": debate_state.get("history", ""), "count": debate_state.get("count", 0) + len(debaters)}
+    last_speaker = None
+    for speaker, _node, history_field in debaters:
+        merged[history_field] = debate_state.get(history_field, "")
+        argument = responses.get(speaker)
+        if not argument:
+            continue
+        merged["history"] += "\n" + argument
+        merged[history_field] += "\n" + argument
+        last_speaker = speaker
+    return merged, last_speaker
+
+
+def create_invest_debate_join() -> Callable:
+    def invest_debate_join_node(state) -> dict:
+        debate_state = state["investment_debate_state"]
+        responses = state.get("investment_debate_round") or {}
+        merged, last_speaker = _append_round(debate_state, responses, INVEST_DEBATERS)
+        merged["current_response"] = responses.get(last_speaker, "") if last_speaker else debate_state.get("current_response", "")
+        logger.info(f"[Parallel debate] Investment round merged:{debate_state.get('count', 0)} -> {merged['count']}")
+        return {"investment_debate_state": merged}
+
+    return invest_debate_join_node
+
+
+def create_risk_debate_join() -> Callable:
+    def risk_debate_join_node(state) -> dict:
+        debate_state = state["risk_debate_state"]
+        responses = state.get("risk_debate_round") or {}
+        merged, last_speaker = _append_round(debate_state, responses, RISK_DEBATERS)
+        for speaker, _node, _field in RISK_DEBATERS:
+            key = f"current_{speaker.lower()}_response"
+            merged[key] = responses.get(speaker) or debate_state.get(key, "")
+        merged["latest_speaker"] = last_speaker or debate_state.get("latest_speaker", "")
+        logger.info(f"[Parallel debate] Risk round merged:{debate_state.get('count', 0)} -> {merged['count']}")
+        return {"risk_debate_state": merged}
+
+    return risk_debate_join_node
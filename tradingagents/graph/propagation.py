@@ -1,6 +1,6 @@
 # TradingAgents/graph/propagation.py
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 #Import Unified Log System
 from tradingagents.utils.logging_init import get_logger
@@ -20,7 +20,7 @@ class Propagator:
         self.max_recur_limit = max_recur_limit
 
     def create_initial_state(
-        self, company_name: str, trade_date: str
+        self, company_name: str, trade_date: str, company_profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Create the initial state for the agent graph."""
         from langchain_core.messages import HumanMessage
@@ -29,7 +29,7 @@ class Propagator:
         #This will ensure that all LLMs understand the mission.
         analysis_request = f"请对股票 {company_name} 进行全面分析，交易日期为 {trade_date}。"
 
-        return {
+        state = {
             "messages": [HumanMessage(content=analysis_request)],
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
@@ -50,6 +50,9 @@ class Propagator:
             "sentiment_report": "",
             "news_report": "",
         }
+        if company_profile:
+            state["company_profile"] = company_profile
+        return state
 
     def get_graph_args(self, use_progress_callback: bool = False) -> Dict[str, Any]:
         """Get arguments for the graph invocation.
@@ -0,0 +1,301 @@
+# TradingAgents/graph/run_metrics.py
+"""Per-node LLM / tool instrumentation for one analysis run
+
+``NodeMetricsCallback`` is a LangChain callback handler attached to the graph
+config. Every callback event carries LangGraph's ``langgraph_node`` metadata, so
+LLM latency, token usage, tool durations and retries are attributed to the node
+that caused them. Each run keeps its own summary (stored with the task under
+``performance_metrics.node_metrics``) and also feeds the process-wide registry
+exported on ``/metrics``.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tradingagents.utils.logging_manager import get_logger
+from tradingagents.utils.metrics_registry import MetricsRegistry, get_metrics_registry
+
+logger = get_logger('agents')
+
+#Label used for events that cannot be attributed to a graph node
+UNATTRIBUTED_NODE = "other"
+
+_COUNTER_FIELDS = ("llm_calls", "llm_errors", "input_tokens", "output_tokens",
+                   "tool_calls", "tool_errors", "retries", "node_runs")
+_TIME_FIELDS = ("llm_time", "tool_time", "node_time")
+
+
+class _GraphMetrics:
+    """Metric families shared by every run in the process"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.llm_requests = registry.counter(
+            "tradingagents_llm_requests_total", "LLM calls by graph node, model and outcome",
+            ("node", "provider", "model", "status"))
+        self.llm_latency = registry.histogram(
+            "tradingagents_llm_latency_seconds", "LLM call latency by graph node and model",
+            ("node", "provider", "model"))
+        self.llm_tokens = registry.counter(
+            "tradingagents_llm_tokens_total", "LLM tokens by graph node, model and direction",
+            ("node", "provider", "model", "direction"))
+        self.llm_retries = registry.counter(
+            "tradingagents_llm_retries_total", "Retried LLM / tool attempts by graph node", ("node",))
+        self.tool_calls = registry.counter(
+            "tradingagents_tool_calls_total", "Tool calls by graph node, tool and outcome",
+            ("node", "tool", "status"))
+        self.tool_latency = registry.histogram(
+            "tradingagents_tool_latency_seconds", "Tool call duration by graph node and tool", ("node", "tool"))
+        self.node_duration = registry.histogram(
+            "tradingagents_node_duration_seconds", "Graph node wall time per execution", ("node",))
+
+
+_graph_metrics: Optional[_GraphMetrics] = None
+_graph_metrics_lock = threading.Lock()
+
+
+def get_graph_metrics() -> _GraphMetrics:
+    global _graph_metrics
+    if _graph_metrics is None:
+        with _graph_metrics_lock:
+            if _graph_metrics is None:
+                _graph_metrics = _GraphMetrics(get_metrics_registry())
+    return _graph_metrics
+
+
+def _new_stats() -> Dict[str, float]:
+    stats: Dict[str, float] = {field: 0 for field in _COUNTER_FIELDS}
+    stats.update({field: 0.0 for field in _TIME_FIELDS})
+    return stats
+
+
+def _extract_token_usage(response: Any) -> Dict[str, int]:
+    """Input/output tokens from an LLMResult
+
+    Prefers ``usage_metadata`` on the generated messages (set by the chat model
+    integrations), falling back to the provider's ``llm_output["token_usage"]``.
+    """
+    input_tokens = output_tokens = 0
+    found = False
+    for generations in getattr(response, "generations", None) or []:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                found = True
+                input_tokens += int(usage.get("input_tokens") or 0)
+                output_tokens += int(usage.get("output_tokens") or 0)
+    if not found:
+        llm_output = getattr(response, "llm_output", None) or {}
+        usage = llm_output.get("token_usage") or llm_output.get("usage") or {}
+        input_tokens = int(usage.get("prompt_tokens") or usage.get("input_tokens") or 0)
+        output_tokens = int(usage.get("completion_tokens") or usage.get("output_tokens") or 0)
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens}
+
+
+class NodeMetricsCallback(BaseCallbackHandler):
+    """Collects per-node LLM/tool metrics for one graph run (thread-safe)"""
+
+    #Never let instrumentation break an analysis
+    raise_error = False
+
+    def __init__(self, provider: Optional[str] = None, model_providers: Optional[Dict[str, str]] = None,
+                 metrics: Optional[_GraphMetrics] = None):
+        """
+        Args:
+            provider: configured LLM provider, used when a model is not in ``model_providers``
+            model_providers: model name -> provider (quick/deep models may come from different vendors)
+            metrics: metric families to feed (defaults to the process-wide registry)
+        """
+        super().__init__()
+        #The OpenAI-compatible adapters report ls_provider="openai", so configured names win
+        self.default_provider = provider.lower() if provider else None
+        self.model_providers = {m: p.lower() for m, p in (model_providers or {}).items() if m and p}
+        self._metrics = metrics or get_graph_metrics()
+        self._lock = threading.Lock()
+        #run id -> graph node the run belongs to
+        self._run_nodes: Dict[UUID, str] = {}
+        #run id -> (node, provider, model, start) for in-flight LLM calls
+        self._llm_runs: Dict[UUID, tuple] = {}
+        #run id -> (node, tool, start) for in-flight tool calls
+        self._tool_runs: Dict[UUID, tuple] = {}
+        #run id -> (node, start) for node-level chain runs
+        self._node_runs: Dict[UUID, tuple] = {}
+        self._nodes: Dict[str, Dict[str, float]] = {}
+        self._tools: Dict[str, Dict[str, float]] = {}
+
+    # ---- attribution ----
+
+    def _resolve_node(self, run_id: UUID, parent_run_id: Optional[UUID], metadata: Optional[Dict[str, Any]]) -> str:
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            if not node and parent_run_id is not None:
+                node = self._run_nodes.get(parent_run_id)
+            node = node or UNATTRIBUTED_NODE
+            self._run_nodes[run_id] = node
+        return node
+
+    def _node_stats(self, node: str) -> Dict[str, float]:
+        stats = self._nodes.get(node)
+        if stats is None:
+            stats = self._nodes[node] = _new_stats()
+        return stats
+
+    # ---- graph nodes ----
+
+    def on_chain_start(self, serialized: Optional[Dict[str, Any]], inputs: Any, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                       **kwargs: Any) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            parent_node = self._run_nodes.get(parent_run_id) if parent_run_id is not None else None
+            if node:
+                self._run_nodes[run_id] = node
+                #The outermost run tagged with a node is the node execution itself
+                if parent_node != node:
+                    self._node_runs[run_id] = (node, time.perf_counter())
+            elif parent_node:
+                self._run_nodes[run_id] = parent_node
+
+    def _finish_chain(self, run_id: UUID) -> None:
+        with self._lock:
+            self._run_nodes.pop(run_id, None)
+            entry = self._node_runs.pop(run_id, None)
+            if entry is None:
+                return
+            node, start = entry
+            elapsed = time.perf_counter() - start
+            stats = self._node_stats(node)
+            stats["node_runs"] += 1
+            stats["node_time"] += elapsed
+        self._metrics.node_duration.observe(elapsed, node=node)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_chain(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_chain(run_id)
+
+    # ---- LLM calls ----
+
+    def _start_llm(self, serialized: Optional[Dict[str, Any]], run_id: UUID, parent_run_id: Optional[UUID],
+                   metadata: Optional[Dict[str, Any]], invocation_params: Optional[Dict[str, Any]]) -> None:
+        node = self._resolve_node(run_id, parent_run_id, metadata)
+        metadata = metadata or {}
+        params = invocation_params or {}
+        model = str(metadata.get("ls_model_name") or params.get("model") or params.get("model_name")
+                    or ((serialized or {}).get("kwargs") or {}).get("model_name") or "unknown")
+        provider = (self.model_providers.get(model) or self.default_provider
+                    or str(metadata.get("ls_provider") or "unknown").lower())
+        with self._lock:
+            self._llm_runs[run_id] = (node, provider, model, time.perf_counter())
+
+    def on_chat_model_start(self, serialized: Optional[Dict[str, Any]], messages: List[List[Any]], *,
+                            run_id: UUID, parent_run_id: Optional[UUID] = None,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        self._start_llm(serialized, run_id, parent_run_id, metadata, kwargs.get("invocation_params"))
+
+    def on_llm_start(self, serialized: Optional[Dict[str, Any]], prompts: List[str], *, run_id: UUID,
+                     parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                     **kwargs: Any) -> None:
+        self._start_llm(serialized, run_id, parent_run_id, metadata, kwargs.get("invocation_params"))
+
+    def _finish_llm(self, run_id: UUID, response: Any = None, failed: bool = False) -> None:
+        with self._lock:
+            entry = self._llm_runs.pop(run_id, None)
+            self._run_nodes.pop(run_id, None)
+        if entry is None:
+            return
+        node, provider, model, start = entry
+        elapsed = time.perf_counter() - start
+        usage = _extract_token_usage(response) if response is not None else {"input_tokens": 0, "output_tokens": 0}
+        with self._lock:
+            stats = self._node_stats(node)
+            stats["llm_calls"] += 1
+            stats["llm_time"] += elapsed
+            stats["input_tokens"] += usage["input_tokens"]
+            stats["output_tokens"] += usage["output_tokens"]
+            if failed:
+                stats["llm_errors"] += 1
+        labels = {"node": node, "provider": provider, "model": model}
+        self._metrics.llm_requests.inc(status="error" if failed else "success", **labels)
+        self._metrics.llm_latency.observe(elapsed, **labels)
+        if usage["input_tokens"]:
+            self._metrics.llm_tokens.inc(usage["input_tokens"], direction="input", **labels)
+        if usage["output_tokens"]:
+            self._metrics.llm_tokens.inc(usage["output_tokens"], direction="output", **labels)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_llm(run_id, response)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_llm(run_id, failed=True)
+
+    # ---- tools ----
+
+    def on_tool_start(self, serialized: Optional[Dict[str, Any]], input_str: str, *, run_id: UUID,
+                      parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                      **kwargs: Any) -> None:
+        node = self._resolve_node(run_id, parent_run_id, metadata)
+        tool = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        with self._lock:
+            self._tool_runs[run_id] = (node, str(tool), time.perf_counter())
+
+    def _finish_tool(self, run_id: UUID, failed: bool = False) -> None:
+        with self._lock:
+            entry = self._tool_runs.pop(run_id, None)
+            self._run_nodes.pop(run_id, None)
+            if entry is None:
+                return
+            node, tool, start = entry
+            elapsed = time.perf_counter() - start
+            stats = self._node_stats(node)
+            stats["tool_calls"] += 1
+            stats["tool_time"] += elapsed
+            tool_stats = self._tools.setdefault(tool, {"calls": 0, "errors": 0, "time": 0.0})
+            tool_stats["calls"] += 1
+            tool_stats["time"] += elapsed
+            if failed:
+                stats["tool_errors"] += 1
+                tool_stats["errors"] += 1
+        self._metrics.tool_calls.inc(node=node, tool=tool, status="error" if failed else "success")
+        self._metrics.tool_latency.observe(elapsed, node=node, tool=tool)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool(run_id, failed=True)
+
+    # ---- retries ----
+
+    def on_retry(self, retry_state: Any, *, run_id: UUID, parent_run_id: Optional[UUID] = None,
+                 **kwargs: Any) -> None:
+        with self._lock:
+            node = self._run_nodes.get(run_id) or (self._run_nodes.get(parent_run_id) if parent_run_id else None)
+            node = node or UNATTRIBUTED_NODE
+            self._node_stats(node)["retries"] += 1
+        self._metrics.llm_retries.inc(node=node)
+
+    # ---- results ----
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-node, per-tool and total statistics of this run (JSON-serialisable)"""
+
+        def _rounded(stats: Dict[str, float]) -> Dict[str, Any]:
+            return {k: round(v, 3) if isinstance(v, float) else int(v) for k, v in stats.items()}
+
+        with self._lock:
+            nodes = {node: dict(stats) for node, stats in self._nodes.items()}
+            tools = {tool: dict(stats) for tool, stats in self._tools.items()}
+        totals = _new_stats()
+        for stats in nodes.values():
+            for field, value in stats.items():
+                totals[field] += value
+        return {
+            "nodes": {node: _rounded(stats) for node, stats in nodes.items()},
+            "tools": {tool: _rounded(stats) for tool, stats in tools.items()},
+            "totals": _rounded(totals),
+        }
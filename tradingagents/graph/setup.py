@@ -8,8 +8,19 @@ from langgraph.prebuilt import ToolNode
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
+from tradingagents.agents.utils.context_budget import ContextBudget
 
 from .conditional_logic import ConditionalLogic
+from .parallel_debate import (
+    INVEST_DEBATERS,
+    INVEST_JOIN_NODE,
+    RISK_DEBATERS,
+    RISK_JOIN_NODE,
+    create_invest_debate_join,
+    create_parallel_invest_debater,
+    create_parallel_risk_debater,
+    create_risk_debate_join,
+)
 
 #Import Unified Log System
 from tradingagents.utils.logging_init import get_logger
@@ -47,6 +58,8 @@ class GraphSetup:
         self.conditional_logic = conditional_logic
         self.config = config or {}
         self.react_llm = react_llm
+        #Token budget for report/debate context in downstream prompts (None = unbounded)
+        self.context_budget = ContextBudget.from_config(self.config)
 
     def setup_graph(
         self, selected_analysts=["market", "social", "news", "fundamentals"]
@@ -138,24 +151,36 @@ class GraphSetup:
 
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self.quick_thinking_llm, self.bull_memory, self.context_budget
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self.quick_thinking_llm, self.bear_memory, self.context_budget
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
+            self.deep_thinking_llm, self.invest_judge_memory, self.context_budget
         )
         trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
+        risky_analyst = create_risky_debator(self.quick_thinking_llm, self.context_budget)
+        neutral_analyst = create_neutral_debator(self.quick_thinking_llm, self.context_budget)
+        safe_analyst = create_safe_debator(self.quick_thinking_llm, self.context_budget)
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
+            self.deep_thinking_llm, self.risk_manager_memory, self.context_budget
         )
 
+        #Parallel debate mode: debaters of one round answer concurrently, a join node merges them
+        parallel_debate = bool(self.config.get("parallel_debate", False))
+        if parallel_debate:
+            logger.info("[Parallel debate] Debate rounds run concurrently")
+            bull_researcher_node = create_parallel_invest_debater(bull_researcher_node, "Bull", "Bear")
+            bear_researcher_node = create_parallel_invest_debater(bear_researcher_node, "Bear", "Bull")
+            risky_analyst = create_parallel_risk_debater(risky_analyst, "Risky")
+            safe_analyst = create_parallel_risk_debater(safe_analyst, "Safe")
+            neutral_analyst = create_parallel_risk_debater(neutral_analyst, "Neutral")
+        researcher_nodes = [node for _speaker, node, _field in INVEST_DEBATERS]
+        risk_debater_nodes = [node for _speaker, node, _field in RISK_DEBATERS]
+
         # Create workflow
         workflow = StateGraph(AgentState)
 
@@ -176,6 +201,9 @@ class GraphSetup:
         workflow.add_node("Neutral Analyst", neutral_analyst)
         workflow.add_node("Safe Analyst", safe_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
+        if parallel_debate:
+            workflow.add_node(INVEST_JOIN_NODE, create_invest_debate_join())
+            workflow.add_node(RISK_JOIN_NODE, create_risk_debate_join())
 
         # Define edges
         # Start with the first analyst
@@ -200,9 +228,17 @@ class GraphSetup:
             if i < len(selected_analysts) - 1:
                 next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
                 workflow.add_edge(current_clear, next_analyst)
+            elif parallel_debate:
+                for researcher in researcher_nodes:
+                    workflow.add_edge(current_clear, researcher)
             else:
                 workflow.add_edge(current_clear, "Bull Researcher")
 
+        if parallel_debate:
+            self._add_parallel_debate_edges(workflow, researcher_nodes, risk_debater_nodes)
+            workflow.add_edge("Risk Judge", END)
+            return workflow.compile()
+
         # Add remaining edges
         workflow.add_conditional_edges(
             "Bull Researcher",
@@ -251,3 +287,22 @@ class GraphSetup:
 
         # Compile and return
         return workflow.compile()
+
+    def _add_parallel_debate_edges(self, workflow: StateGraph, researcher_nodes, risk_debater_nodes):
+        """Fan out each debate round and join it before the next round or the judge."""
+        #A join node waits for every debater of the round
+        workflow.add_edge(researcher_nodes, INVEST_JOIN_NODE)
+        workflow.add_conditional_edges(
+            INVEST_JOIN_NODE,
+            self.conditional_logic.should_continue_debate_parallel,
+            researcher_nodes + ["Research Manager"],
+        )
+        workflow.add_edge("Research Manager", "Trader")
+        for debater in risk_debater_nodes:
+            workflow.add_edge("Trader", debater)
+        workflow.add_edge(risk_debater_nodes, RISK_JOIN_NODE)
+        workflow.add_conditional_edges(
+            RISK_JOIN_NODE,
+            self.conditional_logic.should_continue_risk_analysis_parallel,
+            risk_debater_nodes + ["Risk Judge"],
+        )
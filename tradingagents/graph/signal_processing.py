@@ -16,13 +16,14 @@ class SignalProcessor:
         self.quick_thinking_llm = quick_thinking_llm
 
     @log_graph_module("signal_processing")
-    def process_signal(self, full_signal: str, stock_symbol: str = None) -> dict:
+    def process_signal(self, full_signal: str, stock_symbol: str = None, company_profile: dict = None) -> dict:
         """
         Process a full trading signal to extract structured decision information.
 
         Args:
             full_signal: Complete trading signal text
             stock_symbol: Stock symbol to determine currency type
+            company_profile: Company profile resolved by propagate (market and currency are read from it)
 
         Returns:
             Dictionary containing extracted decision information
@@ -52,9 +53,11 @@ class SignalProcessor:
             }
 
         #Test stock type and currency
-        from tradingagents.utils.stock_utils import StockUtils
-
-        market_info = StockUtils.get_market_info(stock_symbol)
+        if company_profile:
+            market_info = company_profile
+        else:
+            from tradingagents.utils.stock_utils import StockUtils
+            market_info = StockUtils.get_market_info(stock_symbol)
         is_china = market_info['is_china']
         is_hk = market_info['is_hk']
         currency = market_info['currency_name']
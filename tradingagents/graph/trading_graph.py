@@ -1,5 +1,6 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
 from pathlib import Path
 import json
@@ -36,6 +37,9 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .run_metrics import NodeMetricsCallback
+from tradingagents.agents.utils.tool_memo import tool_memo_scope
+from tradingagents.agents.utils.company_profile import resolve_company_profile
 
 
 def create_llm_by_provider(provider: str, model: str, backend_url: str, temperature: float, max_tokens: int, timeout: int, api_key: str = None):
@@ -884,16 +888,9 @@ class TradingAgentsGraph:
         logger.debug(f"[GRAPH DEBUG]{trade_date}' (type:{type(trade_date)})")
         logger.debug(f"[GRAPH DEBUG]{task_id}'")
 
-        self.ticker = company_name
-        logger.debug(f"[GRAPH DEBUG] Sets self.ticker: '{self.ticker}'")
-
-        # Initialize state
-        logger.debug(f"🔍 [GRAPH DEBUG] Creates initial state, transport parameters: company name='{company_name}', trade_date='{trade_date}'")
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
+        init_agent_state, args, metrics_callback = self._start_run(
+            company_name, trade_date, task_id, use_progress_callback=bool(progress_callback)
         )
-        logger.debug(f"[GRAPH DEBUG] Commany of interest: '{init_agent_state.get('company_of_interest', 'NOT_FOUND')}'")
-        logger.debug(f"[GRAPH DEBUG]{init_agent_state.get('trade_date', 'NOT_FOUND')}'")
 
         #Initializing Timer
         node_timings = {}  #Record the execution time for each node
@@ -901,58 +898,10 @@ class TradingAgentsGraph:
         current_node_start = None  #Current node start time
         current_node_name = None  #Current Node Name
 
-        #Save tax id for subsequent preservation of performance data
-        self._current_task_id = task_id
-
-        #Choose a different sstream mode depending on whether there is progress
-        args = self.propagator.get_graph_args(use_progress_callback=bool(progress_callback))
-
-        if self.debug:
-            # Debug mode with tracing and progress updates
-            trace = []
-            final_state = None
-            for chunk in self.graph.stream(init_agent_state, **args):
-                #Record Node Timing
-                for node_name in chunk.keys():
-                    if not node_name.startswith('__'):
-                        #If you have the last node, record the end of it.
-                        if current_node_name and current_node_start:
-                            elapsed = time.time() - current_node_start
-                            node_timings[current_node_name] = elapsed
-                            logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
-
-                        #Start new node timer
-                        current_node_name = node_name
-                        current_node_start = time.time()
-                        break
-
-                #In updates mode, chunk format is   FT 0 
-                #In Values mode, chunk format is full state
-                if progress_callback and args.get("stream_mode") == "updates":
-                    #FMT 0}
-                    self._send_progress_update(chunk, progress_callback)
-                    #Cumulative status update
-                    if final_state is None:
-                        final_state = init_agent_state.copy()
-                    for node_name, node_update in chunk.items():
-                        if not node_name.startswith('__'):
-                            final_state.update(node_update)
-                else:
-                    #Values mode: chunk = FMT 0 
-                    if len(chunk.get("messages", [])) > 0:
-                        chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
-                    final_state = chunk
-
-            if not trace and final_state:
-                #Use cumulative status in updates mode
-                pass
-            elif trace:
-                final_state = trace[-1]
-        else:
-            # Standard mode without tracing but with progress updates
-            if progress_callback:
-                #Use updates mode to get progress at node level
+        #Run-scoped memo for data tools: repeated requests within this run are served from memory
+        with tool_memo_scope() as tool_memo:
+            if self.debug:
+                # Debug mode with tracing and progress updates
                 trace = []
                 final_state = None
                 for chunk in self.graph.stream(init_agent_state, **args):
@@ -964,48 +913,92 @@ class TradingAgentsGraph:
                                 elapsed = time.time() - current_node_start
                                 node_timings[current_node_name] = elapsed
                                 logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
-                                logger.info(f"[TIMING] Switch:{current_node_name} → {node_name}")
 
                             #Start new node timer
                             current_node_name = node_name
                             current_node_start = time.time()
-                            logger.info(f"[Timing]{node_name}")
                             break
 
-                    self._send_progress_update(chunk, progress_callback)
-                    #Cumulative status update
-                    if final_state is None:
-                        final_state = init_agent_state.copy()
-                    for node_name, node_update in chunk.items():
-                        if not node_name.startswith('__'):
-                            final_state.update(node_update)
+                    #In updates mode, chunk format is   FT 0 
+                    #In Values mode, chunk format is full state
+                    if progress_callback and args.get("stream_mode") == "updates":
+                        #FMT 0}
+                        self._send_progress_update(chunk, progress_callback)
+                        #Cumulative status update
+                        if final_state is None:
+                            final_state = init_agent_state.copy()
+                        for node_name, node_update in chunk.items():
+                            if not node_name.startswith('__'):
+                                final_state.update(node_update)
+                    else:
+                        #Values mode: chunk = FMT 0 
+                        if len(chunk.get("messages", [])) > 0:
+                            chunk["messages"][-1].pretty_print()
+                        trace.append(chunk)
+                        final_state = chunk
+
+                if not trace and final_state:
+                    #Use cumulative status in updates mode
+                    pass
+                elif trace:
+                    final_state = trace[-1]
             else:
-                #The old invoke mode.
-                logger.info("⏱️Perform analysis using invoke mode (no progress echo)")
-                #Use sstream mode for timing, but do not send progress updates
-                trace = []
-                final_state = None
-                for chunk in self.graph.stream(init_agent_state, **args):
-                    #Record Node Timing
-                    for node_name in chunk.keys():
-                        if not node_name.startswith('__'):
-                            #If you have the last node, record the end of it.
-                            if current_node_name and current_node_start:
-                                elapsed = time.time() - current_node_start
-                                node_timings[current_node_name] = elapsed
-                                logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
-
-                            #Start new node timer
-                            current_node_name = node_name
-                            current_node_start = time.time()
-                            break
-
-                    #Cumulative status update
-                    if final_state is None:
-                        final_state = init_agent_state.copy()
-                    for node_name, node_update in chunk.items():
-                        if not node_name.startswith('__'):
-                            final_state.update(node_update)
+                # Standard mode without tracing but with progress updates
+                if progress_callback:
+                    #Use updates mode to get progress at node level
+                    trace = []
+                    final_state = None
+                    for chunk in self.graph.stream(init_agent_state, **args):
+                        #Record Node Timing
+                        for node_name in chunk.keys():
+                            if not node_name.startswith('__'):
+                                #If you have the last node, record the end of it.
+                                if current_node_name and current_node_start:
+                                    elapsed = time.time() - current_node_start
+                                    node_timings[current_node_name] = elapsed
+                                    logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
+                                    logger.info(f"[TIMING] Switch:{current_node_name} → {node_name}")
+
+                                #Start new node timer
+                                current_node_name = node_name
+                                current_node_start = time.time()
+                                logger.info(f"[Timing]{node_name}")
+                                break
+
+                        self._send_progress_update(chunk, progress_callback)
+                        #Cumulative status update
+                        if final_state is None:
+                            final_state = init_agent_state.copy()
+                        for node_name, node_update in chunk.items():
+                            if not node_name.startswith('__'):
+                                final_state.update(node_update)
+                else:
+                    #The old invoke mode.
+                    logger.info("⏱️Perform analysis using invoke mode (no progress echo)")
+                    #Use sstream mode for timing, but do not send progress updates
+                    trace = []
+                    final_state = None
+                    for chunk in self.graph.stream(init_agent_state, **args):
+                        #Record Node Timing
+                        for node_name in chunk.keys():
+                            if not node_name.startswith('__'):
+                                #If you have the last node, record the end of it.
+                                if current_node_name and current_node_start:
+                                    elapsed = time.time() - current_node_start
+                                    node_timings[current_node_name] = elapsed
+                                    logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
+
+                                #Start new node timer
+                                current_node_name = node_name
+                                current_node_start = time.time()
+                                break
+
+                        #Cumulative status update
+                        if final_state is None:
+                            final_state = init_agent_state.copy()
+                        for node_name, node_update in chunk.items():
+                            if not node_name.startswith('__'):
+                                final_state.update(node_update)
 
         #Record the last node
         if current_node_name and current_node_start:
@@ -1021,6 +1014,102 @@ class TradingAgentsGraph:
         logger.info(f"[TIMING DEBUG]{total_elapsed:.2f}sec")
         logger.info(f"List of nodes:{list(node_timings.keys())}")
 
+        return self._finish_run(final_state, trade_date, company_name, node_timings, total_elapsed,
+                                metrics_callback, tool_memo)
+
+    async def apropagate(self, company_name, trade_date, progress_callback=None, task_id=None):
+        """Async counterpart of ``propagate`` built on ``graph.astream``
+
+        Researchers, managers, the trader and the risk debaters await their LLM
+        calls on the event loop (see ``LLMNode``); analysts and data tools still
+        run in worker threads. One event loop can therefore drive many analyses
+        without dedicating a thread to each of them.
+        """
+        init_agent_state, args, metrics_callback = await asyncio.to_thread(
+            self._start_run, company_name, trade_date, task_id, True
+        )
+
+        node_timings = {}
+        total_start_time = time.time()
+        current_node_start = None
+        current_node_name = None
+
+        with tool_memo_scope() as tool_memo:
+            final_state = init_agent_state.copy()
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                #Record Node Timing
+                for node_name in chunk.keys():
+                    if not node_name.startswith('__'):
+                        #If you have the last node, record the end of it.
+                        if current_node_name and current_node_start:
+                            elapsed = time.time() - current_node_start
+                            node_timings[current_node_name] = elapsed
+                            logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
+                            logger.info(f"[TIMING] Switch:{current_node_name} → {node_name}")
+
+                        #Start new node timer
+                        current_node_name = node_name
+                        current_node_start = time.time()
+                        logger.info(f"[Timing]{node_name}")
+                        break
+
+                if progress_callback:
+                    #The callback may reach sync Redis/Mongo writers, so keep it off the event loop
+                    await asyncio.to_thread(self._send_progress_update, chunk, progress_callback)
+                for node_name, node_update in chunk.items():
+                    if not node_name.startswith('__'):
+                        final_state.update(node_update)
+
+        #Record the last node
+        if current_node_name and current_node_start:
+            elapsed = time.time() - current_node_start
+            node_timings[current_node_name] = elapsed
+            logger.info(f"⏱️ [{current_node_name}Time-consuming:{elapsed:.2f}sec")
+
+        total_elapsed = time.time() - total_start_time
+        logger.info(f"[TIMING DEBUG]{total_elapsed:.2f}sec (async)")
+
+        return await asyncio.to_thread(
+            self._finish_run, final_state, trade_date, company_name, node_timings, total_elapsed,
+            metrics_callback, tool_memo
+        )
+
+    def _start_run(self, company_name, trade_date, task_id=None, use_progress_callback=False):
+        """Initial state, stream arguments and metrics callback of one analysis run"""
+        self.ticker = company_name
+        logger.debug(f"[GRAPH DEBUG] Sets self.ticker: '{self.ticker}'")
+
+        #Resolve name, market, currency and exchange once; every node reads them from state
+        company_profile = resolve_company_profile(company_name)
+
+        # Initialize state
+        logger.debug(f"🔍 [GRAPH DEBUG] Creates initial state, transport parameters: company name='{company_name}', trade_date='{trade_date}'")
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date, company_profile
+        )
+        logger.debug(f"[GRAPH DEBUG] Commany of interest: '{init_agent_state.get('company_of_interest', 'NOT_FOUND')}'")
+        logger.debug(f"[GRAPH DEBUG]{init_agent_state.get('trade_date', 'NOT_FOUND')}'")
+
+        #Save tax id for subsequent preservation of performance data
+        self._current_task_id = task_id
+
+        #Choose a different sstream mode depending on whether there is progress
+        args = self.propagator.get_graph_args(use_progress_callback=use_progress_callback)
+
+        #Per-node LLM/tool metrics (latency, tokens, retries) via LangChain callbacks
+        metrics_callback = NodeMetricsCallback(
+            provider=self.config.get("llm_provider"),
+            model_providers={
+                self.config.get("quick_think_llm"): self.config.get("quick_provider"),
+                self.config.get("deep_think_llm"): self.config.get("deep_provider"),
+            },
+        )
+        args["config"].setdefault("callbacks", []).append(metrics_callback)
+        return init_agent_state, args, metrics_callback
+
+    def _finish_run(self, final_state, trade_date, company_name, node_timings, total_elapsed,
+                    metrics_callback, tool_memo):
+        """Performance data, state logging and signal processing after the graph finished"""
         #Print detailed time statistics
         logger.info("[TIMING DEBUG]")
         self._print_timing_summary(node_timings, total_elapsed)
@@ -1028,6 +1117,8 @@ class TradingAgentsGraph:
 
         #Build Performance Data
         performance_data = self._build_performance_data(node_timings, total_elapsed)
+        performance_data["node_metrics"] = metrics_callback.summary()
+        performance_data["tool_cache"] = tool_memo.stats()
 
         #Add Performance Data to Status
         final_state['performance_metrics'] = performance_data
@@ -1049,7 +1140,8 @@ class TradingAgentsGraph:
             model_info = "Unknown"
 
         #Process decision-making and add model information
-        decision = self.process_signal(final_state["final_trade_decision"], company_name)
+        decision = self.process_signal(final_state["final_trade_decision"], company_name,
+                                       final_state.get("company_profile"))
         decision['model_info'] = model_info
 
         # Return decision and processed signal
@@ -1118,6 +1210,9 @@ class TradingAgentsGraph:
                 'Safe Analyst': "🛡️ 保守风险评估",
                 'Neutral Analyst': "⚖️ 中性风险评估",
                 'Risk Judge': "🎯 风险经理",
+                #Parallel debate join nodes (no progress update sent)
+                'Investment Debate Join': None,
+                'Risk Debate Join': None,
             }
 
             #Find Map Messages
@@ -1391,6 +1486,6 @@ class TradingAgentsGraph:
             self.curr_state, returns_losses, self.risk_manager_memory
         )
 
-    def process_signal(self, full_signal, stock_symbol=None):
+    def process_signal(self, full_signal, stock_symbol=None, company_profile=None):
         """Process a signal to extract the core decision."""
-        return self.signal_processor.process_signal(full_signal, stock_symbol)
+        return self.signal_processor.process_signal(full_signal, stock_symbol, company_profile)
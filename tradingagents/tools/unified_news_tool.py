@@ -88,18 +88,20 @@ class UnifiedNewsAnalyzer:
         else:
             return "A股"
 
-    def _get_news_from_database(self, stock_code: str, max_news: int = 10) -> str:
+    def _get_news_from_database(self, stock_code: str, max_news: int = 10, query_text: str = "") -> str:
         """Get news from the database
 
         Args:
             Stock code: Stock code
             Max news: Maximum number of news
+            query text: optional keywords; matching news of the stock are ranked by BM25
 
         Returns:
             str: formatted news content, return empty string if no news
         """
         try:
             from tradingagents.dataflows.cache.app_adapter import get_mongodb_client
+            from tradingagents.dataflows.news.search_index import search_sync
             from datetime import timedelta
 
             #Make sure max news is the integer.
@@ -119,23 +121,23 @@ class UnifiedNewsAnalyzer:
 
             #Queries for the last 30 days (expanded time frame)
             thirty_days_ago = datetime.now() - timedelta(days=30)
+            symbol_filter = {'symbol': {'$in': list(dict.fromkeys([clean_code, stock_code]))}}
 
-            #Try multiple queries (using symbol fields)
-            query_list = [
-                {'symbol': clean_code, 'publish_time': {'$gte': thirty_days_ago}},
-                {'symbol': stock_code, 'publish_time': {'$gte': thirty_days_ago}},
+            #Symbol/time filters go through the search index; without query text the newest news come first
+            filter_list = [
+                {**symbol_filter, 'publish_time': {'$gte': thirty_days_ago}},
                 {'symbols': clean_code, 'publish_time': {'$gte': thirty_days_ago}},
                 #If there is no news for the last 30 days, check all news (open-ended)
-                {'symbol': clean_code},
+                symbol_filter,
                 {'symbols': clean_code},
             ]
 
             news_items = []
-            for query in query_list:
-                cursor = collection.find(query).sort('publish_time', -1).limit(max_news)
-                news_items = list(cursor)
+            for filters in filter_list:
+                news_items = search_sync(collection, query_text, filters, limit=max_news,
+                                         match_all_if_empty=True)
                 if news_items:
-                    logger.info(f"[Uniform News Tool] 📊{query}Found it.{len(news_items)}News")
+                    logger.info(f"[Uniform News Tool] 📊{filters}Found it.{len(news_items)}News")
                     break
 
             if not news_items:
@@ -11,29 +11,55 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 import json
-import inspect
+import atexit
+import queue
 import toml
 
 #Note: You can't import yourself here. This can cause circular import.
 #Use a standard library self-starter to avoid undefined references before the log system is initiated
 _bootstrap_logger = logging.getLogger("tradingagents.logging_manager")
 
-_CLASSNAME_FACTORY_INSTALLED = False
-_ORIGINAL_RECORD_FACTORY = logging.getLogRecordFactory()
+_CLASSNAME_FACTORY_MARKER = "_tradingagents_classname_factory"
+
+#Per code object: None for frames that never carry a class (logging internals,
+#plain functions), otherwise the name of the first argument ('self' / 'cls')
+_FRAME_KIND_CACHE: Dict[Any, Optional[str]] = {}
+_FRAME_KIND_CACHE_LIMIT = 20000
+
+
+def _classify_code(frame) -> Optional[str]:
+    code = frame.f_code
+    try:
+        return _FRAME_KIND_CACHE[code]
+    except KeyError:
+        pass
+    kind = None
+    if not frame.f_globals.get("__name__", "").startswith("logging"):
+        if code.co_argcount > 0 and code.co_varnames[0] in ("self", "cls"):
+            kind = code.co_varnames[0]
+    if len(_FRAME_KIND_CACHE) >= _FRAME_KIND_CACHE_LIMIT:
+        _FRAME_KIND_CACHE.clear()
+    _FRAME_KIND_CACHE[code] = kind
+    return kind
 
 
 def _find_classname_from_stack() -> str:
-    frame = inspect.currentframe()
+    """Return the class of the nearest method frame on the stack.
+
+    Frames are classified once per code object, so the common case (plain
+    functions and logging internals) is a dict lookup instead of materialising
+    ``f_locals`` for every frame.
+    """
+    frame = sys._getframe(1)
     try:
         while frame:
-            module_name = frame.f_globals.get("__name__", "")
-            if module_name.startswith("logging"):
-                frame = frame.f_back
-                continue
-            if "self" in frame.f_locals:
-                return frame.f_locals["self"].__class__.__name__
-            if "cls" in frame.f_locals and isinstance(frame.f_locals["cls"], type):
-                return frame.f_locals["cls"].__name__
+            kind = _classify_code(frame)
+            if kind is not None:
+                owner = frame.f_locals.get(kind)
+                if kind == "cls" and isinstance(owner, type):
+                    return owner.__name__
+                if kind == "self" and owner is not None:
+                    return owner.__class__.__name__
             frame = frame.f_back
     finally:
         del frame
@@ -41,18 +67,24 @@ def _find_classname_from_stack() -> str:
 
 
 def _install_classname_record_factory() -> None:
-    global _CLASSNAME_FACTORY_INSTALLED
-    if _CLASSNAME_FACTORY_INSTALLED:
+    """Install the ``classname`` record factory once per process.
+
+    The wrapped factory is captured in the closure and the installed factory is
+    tagged, so re-importing or reloading this module (or ``app.core.logging_config``)
+    never wraps our own factory again.
+    """
+    current = logging.getLogRecordFactory()
+    if getattr(current, _CLASSNAME_FACTORY_MARKER, False):
         return
 
     def record_factory(*args, **kwargs):
-        record = _ORIGINAL_RECORD_FACTORY(*args, **kwargs)
+        record = current(*args, **kwargs)
         if not hasattr(record, "classname"):
             record.classname = _find_classname_from_stack()
         return record
 
+    setattr(record_factory, _CLASSNAME_FACTORY_MARKER, True)
     logging.setLogRecordFactory(record_factory)
-    _CLASSNAME_FACTORY_INSTALLED = True
 
 
 class ColoredFormatter(logging.Formatter):
@@ -69,11 +101,14 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
-        #Add Colour
-        if hasattr(record, 'levelname') and record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
-        
-        return super().format(record)
+        #Add Colour; the record is shared with the other handlers, so restore the level name afterwards
+        original_levelname = record.levelname
+        if original_levelname in self.COLORS:
+            record.levelname = f"{self.COLORS[original_levelname]}{original_levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
 
 
 class StructuredFormatter(logging.Formatter):
@@ -170,6 +205,10 @@ class TradingAgentsLogger:
             'docker': {
                 'enabled': os.getenv('DOCKER_CONTAINER', 'false').lower() == 'true',
                 'stdout_only': True  #Docker environment only output to stdout
+            },
+            'queue': {
+                #Hand records to a background listener thread instead of writing on the caller thread
+                'enabled': os.getenv('TRADINGAGENTS_LOG_ASYNC', 'true').lower() == 'true'
             }
         }
 
@@ -215,6 +254,12 @@ class TradingAgentsLogger:
                 'enabled': is_docker,
                 'stdout_only': logging_config.get('docker', {}).get('stdout_only', True)
             },
+            'queue': {
+                'enabled': os.getenv(
+                    'TRADINGAGENTS_LOG_ASYNC',
+                    str(logging_config.get('queue', {}).get('enabled', True))
+                ).lower() == 'true'
+            },
             'performance': logging_config.get('performance', {}),
             'security': logging_config.get('security', {}),
             'business': logging_config.get('business', {})
@@ -232,7 +277,8 @@ class TradingAgentsLogger:
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, self.config['level']))
         
-        #Clear existing processor
+        #Clear existing processor (and drain the listener of a previous configuration)
+        shutdown_logging()
         root_logger.handlers.clear()
         
         #Add Processor
@@ -243,9 +289,30 @@ class TradingAgentsLogger:
             self._add_error_handler(root_logger)  #Add Error Log Processor
             if self.config['handlers']['structured']['enabled']:
                 self._add_structured_handler(root_logger)
+
+        if self.config.get('queue', {}).get('enabled', False):
+            self._enable_queue(root_logger)
         
         #Configure Specific Logs
         self._configure_specific_loggers()
+
+    def _enable_queue(self, logger: logging.Logger):
+        """Move the configured handlers behind a QueueHandler served by a listener thread"""
+        global _queue_listener
+        handlers = list(logger.handlers)
+        if not handlers:
+            return
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        #Drop records no handler would accept before they are queued
+        queue_handler.setLevel(min(h.level for h in handlers))
+
+        logger.handlers.clear()
+        logger.addHandler(queue_handler)
+
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
     
     def _add_console_handler(self, logger: logging.Logger):
         """Add Console Processor"""
@@ -464,6 +531,27 @@ class TradingAgentsLogger:
 
 #Examples of global log manager
 _logger_manager: Optional[TradingAgentsLogger] = None
+#Listener thread of the queue mode (None when handlers run on the caller thread)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def shutdown_logging():
+    """Stop the queue listener, writing out every record still queued"""
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+        for handler in listener.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger_manager() -> TradingAgentsLogger:
@@ -0,0 +1,209 @@
+"""Optional process pool for CPU-bound analysis stages
+
+Indicator computation, report rendering and similar pure-Python/pandas work
+runs under the GIL, so the threads serving analyses compete for one core.
+With ``PROCESS_POOL_ENABLED=true`` such stages are dispatched to a pool of
+worker processes instead:
+
+- workers are started with the ``spawn`` method (safe next to threads and
+  event loops in the parent) and pre-warmed: heavy modules are imported and
+  logging is configured once per worker, and ``warm_up()`` starts all workers
+  before the first analysis needs them;
+- ``run_cpu_bound`` calls the function inline when the pool is disabled,
+  inside a worker, or when the pool is broken, so callers never need a second
+  code path. Exceptions raised by the function itself propagate unchanged.
+
+``PROCESS_POOL_WORKERS`` sets the pool size (default: number of CPUs - 1).
+Functions and arguments must be picklable (module-level functions, DataFrames,
+plain data).
+"""
+
+import asyncio
+import functools
+import importlib
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from tradingagents.config.runtime_settings import get_bool, get_int
+
+#Import Unified Log System
+from tradingagents.utils.logging_init import get_logger
+logger = get_logger("default")
+
+#Imported by every worker at start-up so that the first task does not pay for them
+DEFAULT_WARM_MODULES = (
+    "numpy",
+    "pandas",
+    "tradingagents.dataflows.data_source_manager",
+)
+
+#Set in worker processes: stages already running in a worker execute inline
+_in_worker = False
+
+
+def _warm_worker(modules: Iterable[str]) -> None:
+    global _in_worker
+    _in_worker = True
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.warning(f"[Process pool] Worker {os.getpid()} could not preload {name}: {e}")
+    try:
+        from tradingagents.utils.logging_init import init_logging
+        init_logging()
+    except Exception:
+        pass
+
+
+def _unpicklable(func: Callable, args: tuple, kwargs: dict) -> bool:
+    #Pickling raises TypeError/AttributeError for locks, lambdas, local classes etc.,
+    #which cannot be told apart from the same errors raised by the function itself
+    try:
+        pickle.dumps((func, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return True
+    return False
+
+
+def _worker_ready(delay: float) -> int:
+    #Keeps the worker busy briefly so that warm_up spreads over all workers
+    time.sleep(delay)
+    return os.getpid()
+
+
+class CPUPool:
+    """Process pool with pre-warmed workers and inline fallback"""
+
+    def __init__(self, max_workers: int, warm_modules: Iterable[str] = DEFAULT_WARM_MODULES,
+                 start_method: str = "spawn"):
+        self.max_workers = max(1, int(max_workers))
+        self.warm_modules = tuple(warm_modules)
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._stats = {"dispatched": 0, "completed": 0, "inline_fallbacks": 0}
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._broken:
+                return None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._context,
+                    initializer=_warm_worker,
+                    initargs=(self.warm_modules,),
+                )
+                logger.info(f"[Process pool] Started with {self.max_workers} workers")
+            return self._executor
+
+    def warm_up(self, timeout: float = 120.0) -> List[int]:
+        """Start every worker now (imports included); returns the worker pids"""
+        executor = self._get_executor()
+        if executor is None:
+            return []
+        start = time.perf_counter()
+        futures = [executor.submit(_worker_ready, 0.2) for _ in range(self.max_workers)]
+        pids = sorted({future.result(timeout=timeout) for future in futures})
+        logger.info(f"[Process pool] {len(pids)} workers warm in {time.perf_counter() - start:.2f}s")
+        return pids
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def _fallback(self, func: Callable, error: BaseException) -> None:
+        if isinstance(error, BrokenProcessPool):
+            with self._lock:
+                self._broken = True
+            logger.error(f"[Process pool] Pool is broken, running CPU stages inline from now on: {error}")
+        else:
+            logger.warning(f"[Process pool] {getattr(func, '__name__', func)} cannot be dispatched, running inline: {error}")
+        self._count("inline_fallbacks")
+
+    def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        executor = self._get_executor()
+        if executor is None:
+            return func(*args, **kwargs)
+        try:
+            self._count("dispatched")
+            result = executor.submit(func, *args, **kwargs).result()
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            self._fallback(func, e)
+            return func(*args, **kwargs)
+        except (TypeError, AttributeError) as e:
+            if not _unpicklable(func, args, kwargs):
+                raise
+            self._fallback(func, e)
+            return func(*args, **kwargs)
+        self._count("completed")
+        return result
+
+    async def arun(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        executor = self._get_executor()
+        call = functools.partial(func, *args, **kwargs)
+        if executor is None:
+            return await asyncio.to_thread(call)
+        try:
+            self._count("dispatched")
+            result = await asyncio.get_running_loop().run_in_executor(executor, call)
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            self._fallback(func, e)
+            return await asyncio.to_thread(call)
+        except (TypeError, AttributeError) as e:
+            if not _unpicklable(func, args, kwargs):
+                raise
+            self._fallback(func, e)
+            return await asyncio.to_thread(call)
+        self._count("completed")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"workers": self.max_workers, "broken": self._broken, **self._stats}
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_cpu_pool: Optional[CPUPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_cpu_pool() -> Optional[CPUPool]:
+    """The process-wide pool, or None when disabled (or inside a worker)"""
+    global _cpu_pool
+    if _in_worker or not get_bool("PROCESS_POOL_ENABLED", None, False):
+        return None
+    with _pool_lock:
+        if _cpu_pool is None:
+            workers = get_int("PROCESS_POOL_WORKERS", None, max(1, (os.cpu_count() or 2) - 1))
+            _cpu_pool = CPUPool(workers)
+        return _cpu_pool
+
+
+def run_cpu_bound(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run ``func`` in the process pool when enabled, inline otherwise"""
+    pool = get_cpu_pool()
+    if pool is None:
+        return func(*args, **kwargs)
+    return pool.run(func, *args, **kwargs)
+
+
+def shutdown_cpu_pool() -> None:
+    global _cpu_pool
+    with _pool_lock:
+        pool, _cpu_pool = _cpu_pool, None
+    if pool is not None:
+        pool.shutdown()